@@ -73,6 +73,10 @@ Module to provide native Python equivalent to HEC Java classes.
         <td><a href="timeseries.html#TimeSeriesException">TimeSeriesException</a></td>
         <td>Holds information and provides operations for single time series values</td>
     </tr>
+    <tr><td><a href="timeseries.html#LazyTimeSeries">LazyTimeSeries</a></td>
+        <td><a href="timeseries.html#TimeSeriesException">TimeSeriesException</a></td>
+        <td>Records time series operations to be performed together on a single copy</td>
+    </tr>
     <tr style="background-color: #f0f0f0;"><th colspan="3">Data Stores</th></tr>
     <tr style="background-color: #f0f0f0;"><th>Class</th><th>Exception</th><th>Description</th></tr>
     <tr><td><a href="datastore.html#AbstractDataStore">AbstractDataStore</a></td>
@@ -106,6 +110,7 @@ __all__ = [
     "HecTimeException",
     "Interval",
     "IntervalException",
+    "LazyTimeSeries",
     "Location",
     "LocationException",
     "Parameter",
@@ -166,7 +171,12 @@ from .parameter import (
 )
 from .quality import Quality, QualityException
 from .rounding import UsgsRounder
-from .timeseries import TimeSeries, TimeSeriesException, TimeSeriesValue
+from .timeseries import (
+    LazyTimeSeries,
+    TimeSeries,
+    TimeSeriesException,
+    TimeSeriesValue,
+)
 from .timespan import TimeSpan, TimeSpanException
 from .unit import UnitException, UnitQuantity
 
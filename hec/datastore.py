@@ -1523,6 +1523,8 @@ class DssDataStore(AbstractDataStore):
                 if not cast(pd.DatetimeIndex, ts._data.index).tzinfo:
                     ts._data.tz_localize(obj.time_zone_name)
                 ts._timezone = str(cast(pd.DatetimeIndex, ts._data.index).tzinfo)
+            if TimeSeries._default_compact:
+                ts.compact = True
             return ts
         elif isinstance(obj, (hecdss.PairedData)):
             hecpd = hec.rating.paired_data.PairedData(obj)
@@ -1578,7 +1580,7 @@ class DssDataStore(AbstractDataStore):
             # ----------------- #
             # store time series #
             # ----------------- #
-            if obj.data is None or obj.data.empty:
+            if obj._data is None or obj._data.empty:
                 raise DataStoreException(f"Cannot store empty time series {obj.name}")
             if obj.parameter_type is None:
                 raise DataStoreException(
@@ -1592,7 +1594,7 @@ class DssDataStore(AbstractDataStore):
             else:
                 ts = hecdss.IrregularTimeSeries()
             ts.id = obj.name
-            data = cast(pd.DataFrame, obj.data)
+            data = cast(pd.DataFrame, obj._data)
             ts.times = pd.to_datetime(data.index).tz_localize(None).tolist()
             ts.time_zone_name = obj.time_zone if obj.time_zone else ""
             ts.values = data["value"].fillna(UNDEFINED).tolist()
@@ -2045,6 +2047,7 @@ class CwmsDataStore(AbstractDataStore):
         time_window = self._time_window
         trim = self._trim
         unit_system = self._unit_system
+        validate = True
         version_time = None
         vertical_datum = self._vertical_datum
         if kwargs:
@@ -2102,6 +2105,17 @@ class CwmsDataStore(AbstractDataStore):
                     raise ValueError(
                         f"Expected 'EN', 'English', 'SI', or 'metric' for units, got '{argval}'"
                     )
+            # -------- #
+            # validate #
+            # -------- #
+            if "validate" in kwargs:
+                argval = kwargs["validate"]
+                if isinstance(argval, bool):
+                    validate = argval
+                else:
+                    raise TypeError(
+                        f"Expected bool for 'validate', got {argval.__class__.__name__}"
+                    )
             # ------------ #
             # version_time #
             # ------------ #
@@ -2174,12 +2188,13 @@ class CwmsDataStore(AbstractDataStore):
                 Parameter(timeseries.parameter.name, props["units"])
             )
         if df is not None and len(df):
-            timeseries._data = data.df.rename(
-                columns={"date-time": "time", "quality-code": "quality"}
-            ).set_index("time")
-            timeseries._validate()
+            timeseries._data = TimeSeries._cwms_data(data.df)
+            if validate:
+                timeseries._validate()
         timeseries.expand()
         timeseries.iconvert_to_time_zone(self._time_zone)
+        if TimeSeries._default_compact:
+            timeseries.compact = True
         return timeseries
 
     def _store_location(self, obj: object, **kwargs: Any) -> None:
@@ -2446,13 +2461,13 @@ class CwmsDataStore(AbstractDataStore):
                 f"Cannot store to {self._name}, data store is set to read-only"
             )
         if isinstance(obj, TimeSeries):
-            if obj.data is None or obj.data.empty:
+            if obj._data is None or obj._data.empty:
                 raise DataStoreException(f"Cannot store empty time series {obj.name}")
             if obj.context == DSS:
                 obj = obj.copy()
                 obj.context = CWMS
             df = (
-                cast(pd.DataFrame, obj.data)
+                cast(pd.DataFrame, obj._data)
                 .reset_index()
                 .rename(columns={"time": "date-time", "quality": "quality-code"})
             )
@@ -3897,6 +3912,8 @@ class CwmsDataStore(AbstractDataStore):
                     * **trim (bool):** Specifies whether to trim missing values from the beginning and end of any regular time series data set retrieved.
                         Defaults to the data store's trim setting.
                     * **units (str):** `"EN"` or `"SI"`, specifying to retrieve data in English or metric units. Defaults to None, which uses the default unit system for the data store
+                    * **validate (bool):** Specifies whether to verify that the times of a regular time series are consistent with its interval. Specify `False` only when the times are
+                        known to be consistent (e.g., bulk retrievals of long regular time series) to skip the verification. Defaults to True.
                     * **version_time (Any)):** Specifies the version date/time of the data to retrieve (time series types only). Must be an [`HecTime`](hectime.html#HecTime) object or a valid input to the `HecTime` constructor.
                         Defaults to the None, which uses the data store's default vertical datum.
                     * **vertical_datum (str):** `"NGVD29"`, `"NAVD88"`, or `"NATIVE"`, specifying the vertical datum to retrieve elevation data for. Defaults to None, which uses the data store's default vertical datum
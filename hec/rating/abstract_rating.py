@@ -893,14 +893,12 @@ class AbstractRating(ABC):
             raise ValueError(
                 f"Expected {expected_ts_count} time series in ts, got {ts_count}"
             )
-        time_strs = ts_list[0].times
         for i in range(1, ts_count):
-            if ts_list[i].times != time_strs:
+            if not ts_list[i].has_same_times(ts_list[0]):
                 raise ValueError(
                     f"Times for {ts[i].name} aren't the same as for {ts[0].name}"
                 )
         values = [t.values for t in ts_list]
-        times = [datetime.fromisoformat(t) for t in time_strs]
         dep_unit = (
             unit
             if unit
@@ -121,14 +121,12 @@ class AbstractRatingSet(ABC):
             raise ValueError(
                 f"Expected {expected_ts_count} time series in ts, got {ts_count}"
             )
-        time_strs = ts_list[0].times
         for i in range(1, ts_count):
-            if ts_list[i].times != time_strs:
+            if not ts_list[i].has_same_times(ts_list[0]):
                 raise ValueError(
                     f"Times for {ts[i].name} aren't the same as for {ts[0].name}"
                 )
         values = [t.values for t in ts_list]
-        times = [datetime.fromisoformat(t) for t in time_strs]
         dep_unit = (
             unit
             if unit
@@ -142,7 +140,7 @@ class AbstractRatingSet(ABC):
             units = f"{','.join([t.unit for t in ts_list])};{dep_unit}"
             rated_values = self._rate_values(
                 ind_values=values,
-                value_times=times,
+                value_times=list(cast(Any, ts_list[0]._data).index.to_pydatetime()),
                 units=units,
                 vertical_datum=vertical_datum,
                 rating_time=rating_time,
@@ -204,7 +202,7 @@ class AbstractRatingSet(ABC):
             units = f"{ind_unit};{ts.unit}"
             rated_values = self._reverse_rate_values(
                 dep_values=ts.values,
-                value_times=[datetime.fromisoformat(s) for s in ts.times],
+                value_times=list(cast(Any, ts._data).index.to_pydatetime()),
                 units=units,
                 vertical_datum=vertical_datum,
                 rating_time=rating_time,
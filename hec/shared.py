@@ -7,8 +7,10 @@ from enum import Enum
 
 dss_imported = False
 cwms_imported = False
+pyarrow_imported = False
 required_cwms_version = ">= '0.8.2'"
 required_dss_version = ">= '0.1.28'"
+required_pyarrow_version = ">= '14.0.0'"
 
 
 class RatingSetRetrievalMethod(Enum):
@@ -56,6 +58,23 @@ def import_hecdss() -> types.ModuleType:
     return hecdss  # type: ignore
 
 
+def import_pyarrow() -> types.ModuleType:
+    global pyarrow_imported
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.parquet  # type: ignore
+
+        pyarrow_version = importlib.metadata.version("pyarrow")
+        pyarrow_imported = eval(f"'{pyarrow_version}' {required_pyarrow_version}")
+    except ImportError:
+        pyarrow_imported = False
+    if not pyarrow_imported:
+        raise ImportError(
+            f"Cannot import module pyarrow. Please install or upgrade to {required_pyarrow_version}"
+        )
+    return pyarrow  # type: ignore
+
+
 def is_leap(y: int) -> bool:
     """
     Return whether the specified year is a leap year
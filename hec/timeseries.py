@@ -2,7 +2,8 @@
 Provides time series types and operations
 """
 
-import bisect
+import inspect
+import json
 import math
 import statistics as stat
 import types
@@ -12,10 +13,21 @@ from datetime import datetime, timedelta
 from functools import total_ordering
 from itertools import cycle, islice
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 from zoneinfo import ZoneInfo
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import tzlocal
 from pint import Unit
@@ -79,6 +91,65 @@ _resample_before = (_RESAMPLE_FIRST, _RESAMPLE_MISSING)
 
 _resample_after = (_RESAMPLE_LAST, _RESAMPLE_MISSING)
 
+_unit_conversions: Dict[tuple[str, str, str], Optional[tuple[float, float]]] = {}
+
+_arrow_metadata_key = b"hec.timeseries"
+
+_chunked_operations = (
+    "accum",
+    "centered_moving_average",
+    "diff",
+    "estimate_missing_values",
+    "forward_moving_average",
+    "olympic_moving_average",
+    "resample",
+    "screen_with_constant_value",
+    "screen_with_duration_magnitude",
+    "screen_with_forward_moving_average",
+    "screen_with_value_change_rate",
+    "screen_with_value_range",
+    "screen_with_value_range_or_change",
+    "time_derivative",
+)
+
+_native_aggregations: Dict[Any, Callable[[npt.NDArray[np.float64]], Any]] = {
+    key: reduction
+    for keys, reduction in (
+        (("all", all), lambda a: np.where(np.isnan(a), True, a != 0).all(axis=1)),
+        (("any", any), lambda a: ((a != 0) & ~np.isnan(a)).any(axis=1)),
+        (("count",), lambda a: np.count_nonzero(~np.isnan(a), axis=1)),
+        (("max", max, np.nanmax), lambda a: np.nanmax(a, axis=1)),
+        (("mean", np.nanmean), lambda a: np.nanmean(a, axis=1)),
+        (("median", np.nanmedian), lambda a: np.nanmedian(a, axis=1)),
+        (("min", min, np.nanmin), lambda a: np.nanmin(a, axis=1)),
+        (("prod", np.nanprod), lambda a: np.nanprod(a, axis=1)),
+        (("std",), lambda a: np.nanstd(a, axis=1, ddof=1)),
+        (("sum", sum, np.nansum), lambda a: np.nansum(a, axis=1)),
+        (("var",), lambda a: np.nanvar(a, axis=1, ddof=1)),
+    )
+    for key in keys
+}
+
+_row_aggregations = (
+    len,
+    math.prod,
+    stat.fmean,
+    stat.geometric_mean,
+    stat.harmonic_mean,
+    stat.mean,
+    stat.median,
+    stat.median_grouped,
+    stat.median_high,
+    stat.median_low,
+    stat.mode,
+    stat.multimode,
+    stat.pstdev,
+    stat.pvariance,
+    stat.quantiles,
+    stat.stdev,
+    stat.variance,
+)
+
 pd.set_option("future.no_silent_downcasting", True)
 
 
@@ -344,6 +415,8 @@ class TimeSeries:
     * `values`: The data values as a list of floats
     * `qualities`: The quality codes of the data values as a list of integers
     * `slice_stop_exclusive`: Controls slicing behavior
+    * `compact`: Whether the data is stored in the compact layout
+    * `compact_values`: How the values are stored in the compact layout
 
     ### Indexing and slicing
     In addition to operations available on the `data` DataFrame, TimeSeries objects may also be indexed by
@@ -368,6 +441,31 @@ class TimeSeries:
 
     Note that slicing of the `data` object will always use DataFrame behavior.
 
+    ### Compact storage
+    By default, the `data` DataFrame holds float64 values and int64 quality codes (24 bytes per value including the
+    time). To reduce the memory used by time series that are held for a long time, the data may be stored in a compact
+    layout with the quality codes as int32:
+    * call `TimeSeries.set_default_compact()` to store the data of new and retrieved TimeSeries objects compactly
+    * set the `compact` property to True on existing TimeSeries objects.
+
+    The values stay float64 unless every value is exactly representable as a float32, which ordinary decimal data
+    (e.g., 0.1) is not, so compacting usually saves 4 of the 24 bytes per value. Setting the `compact_values` property
+    of a TimeSeries object (or calling `TimeSeries.set_default_compact(values="float32")` for all new objects) to
+    "float32" opts in to storing compacted values as float32 regardless, rounding them to about 7 significant digits,
+    which saves 8 of the 24 bytes per value.
+
+    The compact layout is a storage-only mode. Operations that modify the data of a compact time series, including
+    in-place operations, first restore the float64/int64 layout, so their results are not compact; set `compact` to
+    True again to re-compact them. Accessing the `data` DataFrame also restores the float64/int64 layout, so the values
+    and quality codes written through it are never narrowed. Use `memory_usage()` to see the memory held by the data.
+
+    ### Chunked processing
+    Long time series (e.g., decades of minute data) may be processed in chunks so that only a chunk and the context
+    around it are held in memory:
+    * `iter_chunks()` and `read_parquet_chunks()` generate consecutive chunks of a time series
+    * `process_chunks()` performs an operation on each chunk with the same results as on the entire time series
+    * `from_chunks()` and `to_parquet_chunks()` combine the resulting chunks into a time series or a Parquet file.
+
     ### In-Place Methods
 
     All methods that return a time series have an optional parameter named `in_place` that defaults to `False`:
@@ -382,6 +480,8 @@ class TimeSeries:
     """
 
     _default_slice_stop_exclusive: bool = True
+    _default_compact: bool = False
+    _default_compact_values: Optional[str] = None
 
     def __init__(
         self,
@@ -443,6 +543,7 @@ class TimeSeries:
                 </table>
         """
         self._slice_stop_exclusive = TimeSeries._default_slice_stop_exclusive
+        self._compact_values = TimeSeries._default_compact_values
         self._context: Optional[str] = None
         self._watershed: Optional[str] = None
         self._location: Location
@@ -454,10 +555,12 @@ class TimeSeries:
         self._version_time: Optional[HecTime] = None
         self._timezone: Optional[str] = None
         self._data: Optional[pd.DataFrame] = None
+        self._times_cache: Optional[tuple[pd.Index, list[str]]] = None
         self._midnight_as_2400: bool = False
         self._selection_state: SelectionState = SelectionState.TRANSIENT
         self._expanded = False
         self._skip_validation = False
+        self._data_shared = False
 
         self.name = name.strip()
         if times is None:
@@ -549,6 +652,8 @@ class TimeSeries:
             },
             index=l_indx,
         )
+        if TimeSeries._default_compact:
+            self.compact = True
 
     def __abs__(self) -> "TimeSeries":
         if self._data is None or self._data.empty:
@@ -569,7 +674,7 @@ class TimeSeries:
             # ------------------------------------ #
             # add a unitless scalar to time series #
             # ------------------------------------ #
-            other = self.copy()
+            other = self._target(False)
             data = cast(pd.DataFrame, other._data)
             if other.has_selection:
                 data.loc[data["selected"], ["value"]] += amount
@@ -597,24 +702,12 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
             if UnitQuantity(1, amount.unit).unit.dimensionless:
-                that = cast(pd.DataFrame, amount.to("n/a")._data)
+                to_unit = "n/a"
             else:
-                that = cast(pd.DataFrame, amount.to(self.unit)._data)
+                to_unit = self.unit
             other = self.copy(include_data=False)
-            other._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            other._data["value"] = other._data["value_1"] + other._data["value_2"]
-            other._data["quality"] = 0
-            other._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            other._data = self._combine_data(amount, to_unit, np.add)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -637,7 +730,7 @@ class TimeSeries:
             # ------------------------------------- #
             # divide time series by unitless scalar #
             # ------------------------------------- #
-            other = self.copy()
+            other = self._target(False)
             data = cast(pd.DataFrame, other._data)
             if other.has_selection:
                 data.loc[data["selected"], ["value"]] //= amount
@@ -717,21 +810,8 @@ class TimeSeries:
                         f"\n==> Cannot automtically determine conversion to divide '{self.unit}' by '{amount.unit}'."
                         "\n==> Use the '.to()' method to convert one of the operands to a unit compatible with the other."
                     ) from None
-            this = self._data
-            that = cast(pd.DataFrame, amount.to(to_unit)._data)
             other = self.copy(include_data=False)
-            other._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            other._data["value"] = other._data["value_1"] // other._data["value_2"]
-            other._data["quality"] = 0
-            other._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            other._data = self._combine_data(amount, to_unit, np.floor_divide)
             other.iset_parameter(new_parameter)
             # ------------------------------ #
             # reset any transient selections #
@@ -750,30 +830,9 @@ class TimeSeries:
             )
         other = self.copy(include_data=False)
         if isinstance(key, slice):
-            start, stop, step = key.start, key.stop, key.step
-            if start:
-                try:
-                    start = self.index_of(start, "next")
-                except IndexError as ie:
-                    if ie.args and ie.args[0] == "list index out of range":
-                        stop = None
-                    else:
-                        raise
-            if stop:
-                try:
-                    stop = self.index_of(stop, "stop")
-                    if self._slice_stop_exclusive:
-                        t = HecTime(hec.hectime.SECOND_GRANULARITY)
-                        t.set(stop)
-                        stop = str(t - timedelta(seconds=1)).replace("T", " ")
-                except IndexError as ie:
-                    if ie.args and ie.args[0] == "list index out of range":
-                        stop = None
-                    else:
-                        raise
-            other._data = self._data.loc[start:stop:step]
+            other._data = self._data.iloc[self._slice_positions(key)]
         else:
-            other._data = cast(pd.DataFrame, self._data.loc[self.index_of(key)])
+            other._data = cast(pd.DataFrame, self._data.iloc[self._position_of(key)])
         return other
 
     def __iadd__(
@@ -788,7 +847,7 @@ class TimeSeries:
             # ------------------------------------ #
             # add a unitless scalar to time series #
             # ------------------------------------ #
-            data = self._data
+            data = cast(pd.DataFrame, self._target(True)._data)
             if self.has_selection:
                 data.loc[data["selected"], ["value"]] += amount
                 if self.selection_state == SelectionState.TRANSIENT:
@@ -813,23 +872,11 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
             if UnitQuantity(1, amount.unit).unit.dimensionless:
-                that = cast(pd.DataFrame, amount.to("n/a")._data)
+                to_unit = "n/a"
             else:
-                that = cast(pd.DataFrame, amount.to(self.unit)._data)
-            self._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            self._data["value"] = self._data["value_1"] + self._data["value_2"]
-            self._data["quality"] = 0
-            self._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+                to_unit = self.unit
+            self._data = self._combine_data(amount, to_unit, np.add)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -852,7 +899,7 @@ class TimeSeries:
             # ------------------------------------- #
             # divide time series by unitless scalar #
             # ------------------------------------- #
-            data = self._data
+            data = cast(pd.DataFrame, self._target(True)._data)
             if self.has_selection:
                 data.loc[data["selected"], ["value"]] //= amount
                 if self.selection_state == SelectionState.TRANSIENT:
@@ -929,20 +976,7 @@ class TimeSeries:
                         f"\n==> Cannot automtically determine conversion to divide '{self.unit}' by '{amount.unit}'."
                         "\n==> Use the '.to()' method to convert one of the operands to a unit compatible with the other."
                     ) from None
-            this = self._data
-            that = cast(pd.DataFrame, amount.to(to_unit)._data)
-            self._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            self._data["value"] = self._data["value_1"] // self._data["value_2"]
-            self._data["quality"] = 0
-            self._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            self._data = self._combine_data(amount, to_unit, np.floor_divide)
             self.iset_parameter(new_parameter)
             # ------------------------------ #
             # reset any transient selections #
@@ -992,7 +1026,7 @@ class TimeSeries:
             # -------------------------------------- #
             # mod time series with a unitless scalar #
             # -------------------------------------- #
-            data = self._data
+            data = cast(pd.DataFrame, self._target(True)._data)
             if self.has_selection:
                 data.loc[data["selected"], ["value"]] %= amount
                 if self.selection_state == SelectionState.TRANSIENT:
@@ -1017,23 +1051,11 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
             if UnitQuantity(1, amount.unit).unit.dimensionless:
-                that = cast(pd.DataFrame, amount.to("n/a")._data)
+                to_unit = "n/a"
             else:
-                that = cast(pd.DataFrame, amount.to(self.unit)._data)
-            self._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            self._data["value"] = self._data["value_1"] % self._data["value_2"]
-            self._data["quality"] = 0
-            self._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+                to_unit = self.unit
+            self._data = self._combine_data(amount, to_unit, np.mod)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -1056,7 +1078,7 @@ class TimeSeries:
             # --------------------------------------- #
             # multiply time series by unitless scalar #
             # --------------------------------------- #
-            data = self._data
+            data = cast(pd.DataFrame, self._target(True)._data)
             if self.has_selection:
                 data.loc[data["selected"], ["value"]] *= amount
                 if self.selection_state == SelectionState.TRANSIENT:
@@ -1133,20 +1155,7 @@ class TimeSeries:
                         f"\n==> Cannot automtically determine conversion to multiply '{self.unit}' by '{amount.unit}'."
                         "\n==> Use the '.to()' method to convert one of the operands to a unit compatible with the other."
                     ) from None
-            this = self._data
-            that = cast(pd.DataFrame, amount.to(to_unit)._data)
-            self._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            self._data["value"] = self._data["value_1"] * self._data["value_2"]
-            self._data["quality"] = 0
-            self._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            self._data = self._combine_data(amount, to_unit, np.multiply)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -1170,7 +1179,7 @@ class TimeSeries:
             # ------------------------------------ #
             # raise time series by unitless scalar #
             # ------------------------------------ #
-            data = self._data
+            data = cast(pd.DataFrame, self._target(True)._data)
             if self.has_selection:
                 data.loc[data["selected"], ["value"]] **= amount
                 if self.selection_state == SelectionState.TRANSIENT:
@@ -1194,20 +1203,7 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
-            that = cast(pd.DataFrame, amount.to("n/a")._data)
-            self._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            self._data["value"] = self._data["value_1"] ** self._data["value_2"]
-            self._data["quality"] = 0
-            self._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            self._data = self._combine_data(amount, "n/a", np.power)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -1256,7 +1252,7 @@ class TimeSeries:
             # ------------------------------------------- #
             # subtract a unitless scalar from time series #
             # ------------------------------------------- #
-            data = self._data
+            data = cast(pd.DataFrame, self._target(True)._data)
             if self.has_selection:
                 data.loc[data["selected"], ["value"]] -= amount
                 if self.selection_state == SelectionState.TRANSIENT:
@@ -1281,23 +1277,11 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
             if UnitQuantity(1, amount.unit).unit.dimensionless:
-                that = cast(pd.DataFrame, amount.to("n/a")._data)
+                to_unit = "n/a"
             else:
-                that = cast(pd.DataFrame, amount.to(self.unit)._data)
-            self._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            self._data["value"] = self._data["value_1"] - self._data["value_2"]
-            self._data["quality"] = 0
-            self._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+                to_unit = self.unit
+            self._data = self._combine_data(amount, to_unit, np.subtract)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -1320,7 +1304,7 @@ class TimeSeries:
             # ------------------------------------- #
             # divide time series by unitless scalar #
             # ------------------------------------- #
-            data = self._data
+            data = cast(pd.DataFrame, self._target(True)._data)
             if self.has_selection:
                 data.loc[data["selected"], ["value"]] /= amount
                 if self.selection_state == SelectionState.TRANSIENT:
@@ -1397,20 +1381,7 @@ class TimeSeries:
                         f"\n==> Cannot automtically determine conversion to divide '{self.unit}' by '{amount.unit}'."
                         "\n==> Use the '.to()' method to convert one of the operands to a unit compatible with the other."
                     ) from None
-            this = self._data
-            that = cast(pd.DataFrame, amount.to(to_unit)._data)
-            self._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            self._data["value"] = self._data["value_1"] / self._data["value_2"]
-            self._data["quality"] = 0
-            self._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            self._data = self._combine_data(amount, to_unit, np.true_divide)
             self.iset_parameter(new_parameter)
             # ------------------------------ #
             # reset any transient selections #
@@ -1473,7 +1444,7 @@ class TimeSeries:
             # -------------------------------------- #
             # mod time series with a unitless scalar #
             # -------------------------------------- #
-            other = self.copy()
+            other = self._target(False)
             data = cast(pd.DataFrame, other._data)
             if other.has_selection:
                 data.loc[data["selected"], ["value"]] %= amount
@@ -1501,24 +1472,12 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
             if UnitQuantity(1, amount.unit).unit.dimensionless:
-                that = cast(pd.DataFrame, amount.to("n/a")._data)
+                to_unit = "n/a"
             else:
-                that = cast(pd.DataFrame, amount.to(self.unit)._data)
+                to_unit = self.unit
             other = self.copy(include_data=False)
-            other._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            other._data["value"] = other._data["value_1"] % other._data["value_2"]
-            other._data["quality"] = 0
-            other._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            other._data = self._combine_data(amount, to_unit, np.mod)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -1541,7 +1500,7 @@ class TimeSeries:
             # --------------------------------------- #
             # multiply time series by unitless scalar #
             # --------------------------------------- #
-            other = self.copy()
+            other = self._target(False)
             data = cast(pd.DataFrame, other._data)
             if other.has_selection:
                 data.loc[data["selected"], ["value"]] *= amount
@@ -1621,21 +1580,8 @@ class TimeSeries:
                         f"\n==> Cannot automtically determine conversion to multiply '{self.unit}' by '{amount.unit}'."
                         "\n==> Use the '.to()' method to convert one of the operands to a unit compatible with the other."
                     ) from None
-            this = self._data
-            that = cast(pd.DataFrame, amount.to(to_unit)._data)
             other = self.copy(include_data=False)
-            other._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            other._data["value"] = other._data["value_1"] * other._data["value_2"]
-            other._data["quality"] = 0
-            other._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            other._data = self._combine_data(amount, to_unit, np.multiply)
             other.iset_parameter(new_parameter)
             # ------------------------------ #
             # reset any transient selections #
@@ -1653,7 +1599,7 @@ class TimeSeries:
         # ------------- #
         if self._data is None:
             raise TimeSeriesException("Operation is invalid with empty time series.")
-        other = self.copy()
+        other = self._target(False)
         data = cast(pd.DataFrame, other._data)
         if other.has_selection:
             data.loc[data["selected"], ["value"]] *= -1
@@ -1677,7 +1623,7 @@ class TimeSeries:
             # ------------------------------------ #
             # raise time series by unitless scalar #
             # ------------------------------------ #
-            other = self.copy()
+            other = self._target(False)
             data = cast(pd.DataFrame, other._data)
             if other.has_selection:
                 data.loc[data["selected"], ["value"]] **= amount
@@ -1704,21 +1650,8 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
-            that = cast(pd.DataFrame, amount.to("n/a")._data)
             other = self.copy(include_data=False)
-            other._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            other._data["value"] = other._data["value_1"] ** other._data["value_2"]
-            other._data["quality"] = 0
-            other._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            other._data = self._combine_data(amount, "n/a", np.power)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -1780,7 +1713,7 @@ class TimeSeries:
             # ------------------------------------------- #
             # subtract a unitless scalar from time series #
             # ------------------------------------------- #
-            other = self.copy()
+            other = self._target(False)
             data = cast(pd.DataFrame, other._data)
             if other.has_selection:
                 data.loc[data["selected"], ["value"]] -= amount
@@ -1808,24 +1741,12 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
             if UnitQuantity(1, amount.unit).unit.dimensionless:
-                that = cast(pd.DataFrame, amount.to("n/a")._data)
+                to_unit = "n/a"
             else:
-                that = cast(pd.DataFrame, amount.to(self.unit)._data)
+                to_unit = self.unit
             other = self.copy(include_data=False)
-            other._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            other._data["value"] = other._data["value_1"] - other._data["value_2"]
-            other._data["quality"] = 0
-            other._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            other._data = self._combine_data(amount, to_unit, np.subtract)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -1848,7 +1769,7 @@ class TimeSeries:
             # ------------------------------------- #
             # divide time series by unitless scalar #
             # ------------------------------------- #
-            other = self.copy()
+            other = self._target(False)
             data = cast(pd.DataFrame, other._data)
             if other.has_selection:
                 data.loc[data["selected"], ["value"]] /= amount
@@ -1928,21 +1849,8 @@ class TimeSeries:
                         f"\n==> Cannot automtically determine conversion to divide '{self.unit}' by '{amount.unit}'."
                         "\n==> Use the '.to()' method to convert one of the operands to a unit compatible with the other."
                     ) from None
-            this = self._data
-            that = cast(pd.DataFrame, amount.to(to_unit)._data)
             other = self.copy(include_data=False)
-            other._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            other._data["value"] = other._data["value_1"] / other._data["value_2"]
-            other._data["quality"] = 0
-            other._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            other._data = self._combine_data(amount, to_unit, np.true_divide)
             other.iset_parameter(new_parameter)
             # ------------------------------ #
             # reset any transient selections #
@@ -1954,6 +1862,65 @@ class TimeSeries:
         else:
             return NotImplemented
 
+    @staticmethod
+    def _aligned_values(
+        timeseries: list["TimeSeries"], selected_only: bool
+    ) -> tuple[pd.DatetimeIndex, npt.NDArray[np.float64]]:
+        # ------------------------------------------------------------------ #
+        # the values of the time series at the times common to all of them,  #
+        # as one (times x time series) array in a single allocation. If      #
+        # selected_only is True, non-selected values are NaN                 #
+        # ------------------------------------------------------------------ #
+        frames = [cast(pd.DataFrame, ts._data) for ts in timeseries]
+        common_index = cast(pd.DatetimeIndex, frames[0].index)
+        for df in frames[1:]:
+            common_index = common_index.intersection(cast(pd.DatetimeIndex, df.index))
+            if len(common_index) == 0:
+                raise TimeSeriesException("Time series do not include common times")
+        common_index = common_index.rename("time")
+        block = np.empty((len(common_index), len(frames)), dtype=np.float64)
+        for i, df in enumerate(frames):
+            values = df["value"].to_numpy(dtype=np.float64)
+            if selected_only and timeseries[i].has_selection:
+                values = np.where(df["selected"].to_numpy(dtype=bool), values, np.nan)
+            if len(df.index) == len(common_index) and df.index.equals(common_index):
+                block[:, i] = values
+            else:
+                block[:, i] = values[df.index.get_indexer(common_index)]
+        return common_index, block
+
+    @staticmethod
+    def _apply_masked(
+        data: pd.DataFrame,
+        values: Union[npt.NDArray[np.float64], pd.Series],
+        qualities: Union[npt.NDArray[np.int64], pd.Series],
+        selected: Optional[npt.NDArray[np.bool_]] = None,
+        protected: Optional[npt.NDArray[np.bool_]] = None,
+    ) -> None:
+        # ----------------------------------------------------------------------- #
+        # write values and qualities back into the value and quality columns of   #
+        # data with one positional assignment per column. values and qualities    #
+        # are for the selected rows of data in order (all rows if selected is     #
+        # None) and positions where protected (aligned with values) is True keep  #
+        # their current values and qualities in data                              #
+        # ----------------------------------------------------------------------- #
+        new_values = np.asarray(values, dtype=np.float64)
+        new_qualities = np.asarray(qualities)
+        positions = (
+            np.arange(len(data)) if selected is None else np.flatnonzero(selected)
+        )
+        if len(positions) != len(new_values) or len(positions) != len(new_qualities):
+            raise TimeSeriesException(
+                f"Expected {len(positions)} values and qualities, got {len(new_values)} and {len(new_qualities)}"
+            )
+        if protected is not None:
+            unprotected = ~np.asarray(protected, dtype=bool)
+            positions = positions[unprotected]
+            new_values = new_values[unprotected]
+            new_qualities = new_qualities[unprotected]
+        data.iloc[positions, cast(int, data.columns.get_loc("value"))] = new_values
+        data.iloc[positions, cast(int, data.columns.get_loc("quality"))] = new_qualities
+
     def _convert_to_context(self, ctx: str) -> None:
         if ctx not in (CWMS, DSS):
             raise TimeSeriesException(f"Invalid context: {ctx}")
@@ -2022,17 +1989,15 @@ class TimeSeries:
             if self.is_irregular:
                 number_values = (
                     0
-                    if self.data is None or self.data.empty
-                    else 1 if len(self.data.shape) == 1 else self.data.shape[0]
+                    if self._data is None or self._data.empty
+                    else 1 if len(self._data.shape) == 1 else self._data.shape[0]
                 )
                 if number_values == 1:
                     intvl = Interval.get_any_dss(lambda i: i.name == "IR-Month")
                 else:
                     seconds_per_year = timedelta(days=365).total_seconds()
-                    time_range = (
-                        datetime.fromisoformat(self.times[-1])
-                        - datetime.fromisoformat(self.times[0])
-                    ).total_seconds()
+                    index = cast(pd.DatetimeIndex, cast(pd.DataFrame, self._data).index)
+                    time_range = (index[-1] - index[0]).total_seconds()
                     values_per_year = number_values / time_range * seconds_per_year
                     if values_per_year > 1000:
                         intvl = Interval.get_any_dss(lambda i: i.name == "IR-Decade")
@@ -2064,7 +2029,7 @@ class TimeSeries:
             self._validate()
 
     def _diff(self, time_based: bool, in_place: bool = False) -> "TimeSeries":
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         if target._data is None:
             raise TimeSeriesException("Operation is invalid with empty time series.")
         if target.has_selection:
@@ -2142,7 +2107,7 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         df = cast(pd.DataFrame, target._data)
         # --------------------------- #
         # first perform the averaging #
@@ -2151,42 +2116,31 @@ class TimeSeries:
             # -------------------------------------------- #
             # we have to roll our own function for Olympic #
             # -------------------------------------------- #
-            def olympic_average(vals: np.ndarray) -> Any:  # type: ignore
-                vals = vals[~np.isnan(vals)]
-                if len(vals) <= 2:
-                    return np.nan
-                return np.mean(np.sort(vals)[1:-1])
-
-            df["averaged"] = (
-                df["value"]
-                .rolling(window=window, min_periods=1, center=True)
-                .apply(olympic_average, raw=True)
+            df["averaged"] = TimeSeries._olympic_average(
+                df["value"].to_numpy(dtype=np.float64), window
             )
         else:
-            # --------------------------------------------------- #
-            # for Forward and Centered we can use built-in mean() #
-            # --------------------------------------------------- #
-            df["averaged"] = (
-                df["value"]
-                .rolling(window=window, min_periods=1, center=centered)
-                .mean()
+            # ------------------------------------------------------------ #
+            # Forward and Centered use block window sums, which give the   #
+            # same averages however the time series is split into chunks   #
+            # (see _process_chunks())                                      #
+            # ------------------------------------------------------------ #
+            df["averaged"] = TimeSeries._window_average(
+                df["value"].to_numpy(dtype=np.float64), window, centered
             )
         # ---------------------------------------------------------------------------------- #
         # next change any values that don't match only_valid and use_reduced criteria to NaN #
         # ---------------------------------------------------------------------------------- #
         if only_valid:
-            invalid_indices = TimeSeries._invalid_indices(df)
-            bad: set[np.datetime64] = set()
-            if centered:
-                for idx in invalid_indices:
-                    pos = cast(int, df.index.get_loc(idx))
-                    bad.update(df.index[pos - window // 2 : pos - window // 2 + window])
-            else:
-                for idx in invalid_indices:
-                    pos = cast(int, df.index.get_loc(idx))
-                    bad.update(df.index[pos : pos + window])
-            bad_indices = sorted(bad)
-            df.loc[bad_indices, "averaged"] = np.nan
+            # ----------------------------------------------------------------- #
+            # dilate the invalid positions to every window that contains one by #
+            # convolving with the window and taking the slice for the alignment #
+            # ----------------------------------------------------------------- #
+            invalid = TimeSeries._invalid_mask(df).astype(np.int64)
+            covered = np.convolve(invalid, np.ones(window, dtype=np.int64))
+            offset = window // 2 if centered else 0
+            bad = covered[offset : offset + len(invalid)] > 0
+            df.loc[bad, "averaged"] = np.nan
         if centered:
             if not use_reduced:
                 df.loc[df.index[: window // 2], "averaged"] = np.nan
@@ -2205,40 +2159,1011 @@ class TimeSeries:
         df.loc[TimeSeries._invalid_indices(df), "quality"] = 5
         return target
 
+    @staticmethod
+    def _hectime_nanoseconds(times: List[HecTime]) -> npt.NDArray[np.int64]:
+        # --------------------------------------------------------- #
+        # HecTime objects as int64 nanoseconds since the epoch (UTC #
+        # for time zone aware times) to match _index_nanoseconds    #
+        # --------------------------------------------------------- #
+        return np.array(
+            [pd.Timestamp(cast(datetime, t.datetime())).value for t in times],
+            dtype=np.int64,
+        )
+
+    @staticmethod
+    def _index_key(index: pd.DatetimeIndex, item: Union[HecTime, datetime, str]) -> int:
+        # ---------------------------------------------------------------- #
+        # a time item (to the minute, as HecTime would) as nanoseconds     #
+        # comparable with _index_nanoseconds(): UTC for an aware index     #
+        # (naive items are in the index's zone), wall time for a naive     #
+        # index (aware items use their wall time)                          #
+        # ---------------------------------------------------------------- #
+        if isinstance(item, datetime):
+            timestamp = pd.Timestamp(item)
+        else:
+            ht = HecTime()
+            ht.set(item)
+            timestamp = pd.Timestamp(cast(datetime, ht.datetime()))
+        if index.tz is None:
+            timestamp = timestamp.tz_localize(None)
+        elif timestamp.tzinfo is None:
+            timestamp = timestamp.tz_localize(
+                index.tz, ambiguous=True, nonexistent="shift_forward"
+            )
+        value = int(timestamp.as_unit("ns").value)
+        return value - value % 60_000_000_000
+
+    @staticmethod
+    def _index_nanoseconds(index: pd.DatetimeIndex) -> npt.NDArray[np.int64]:
+        # ---------------------------------------------------------- #
+        # the index as int64 nanoseconds since the epoch (UTC if the #
+        # index is time zone aware), independent of the index's unit #
+        # ---------------------------------------------------------- #
+        if index.unit != "ns":
+            index = index.as_unit("ns")
+        return index.values.view(np.int64)
+
+    @staticmethod
+    def _interval_tops(
+        times: npt.NDArray[np.int64], interval: Interval
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        # ------------------------------------------------------------------- #
+        # the tops of the standard intervals that contain times (int64        #
+        # nanoseconds of wall-clock time) and the tops of the intervals that  #
+        # follow them, with the same interval boundaries as                   #
+        # HecTime.get_interval_offset()                                       #
+        # ------------------------------------------------------------------- #
+        minutes = interval.minutes
+        day = 86_400_000_000_000
+        if 0 < minutes <= Interval.MINUTES["1Day"]:
+            step = minutes * 60_000_000_000
+            tops = times - times % step
+            return tops, tops + step
+        if minutes in (
+            Interval.MINUTES["2Days"],
+            Interval.MINUTES["3Days"],
+            Interval.MINUTES["4Days"],
+            Interval.MINUTES["5Days"],
+            Interval.MINUTES["6Days"],
+            Interval.MINUTES["1Week"],
+        ):
+            # ------------------------------------------------- #
+            # multi-day intervals are aligned on HecTime julian #
+            # day numbers                                       #
+            # ------------------------------------------------- #
+            days = minutes // Interval.MINUTES["1Day"]
+            julian = times // day + hec.hectime.year_month_day_to_julian(1970, 1, 1)
+            tops = (times // day - julian % days) * day
+            return tops, tops + days * day
+        dates = times.view("datetime64[ns]")
+        if minutes == Interval.MINUTES["1Year"]:
+            years = dates.astype("datetime64[Y]")
+            return (
+                years.astype("datetime64[ns]").view(np.int64),
+                (years + 1).astype("datetime64[ns]").view(np.int64),
+            )
+        months = dates.astype("datetime64[M]")
+        month_tops = months.astype("datetime64[ns]").view(np.int64)
+        next_month_tops = (months + 1).astype("datetime64[ns]").view(np.int64)
+        if minutes == Interval.MINUTES["1Month"]:
+            return month_tops, next_month_tops
+        if minutes in (Interval.MINUTES["Semi-Month"], Interval.MINUTES["Tri-Month"]):
+            first_days = (
+                [1, 16] if minutes == Interval.MINUTES["Semi-Month"] else [1, 11, 21]
+            )
+            starts = np.array(first_days) - 1
+            day_of_month = (times - month_tops) // day
+            part = np.searchsorted(starts, day_of_month, side="right") - 1
+            tops = month_tops + starts[part] * day
+            following = np.where(
+                part + 1 < len(starts),
+                month_tops + starts[np.minimum(part + 1, len(starts) - 1)] * day,
+                next_month_tops,
+            )
+            return tops, following
+        raise TimeSeriesException(
+            f"Interval {interval.name} is not a standard interval"
+        )
+
     @staticmethod
     def _invalid_indices(df: pd.DataFrame) -> list[np.datetime64]:
+        return cast(list[np.datetime64], df.index[TimeSeries._invalid_mask(df)])
+
+    @staticmethod
+    def _invalid_mask(df: pd.DataFrame) -> npt.NDArray[np.bool_]:
         return cast(
-            list[np.datetime64],
-            df.index[
+            npt.NDArray[np.bool_],
+            (
                 (df["value"].isna())
                 | (np.isinf(df["value"]))
                 | (df["quality"] == 5)
                 | ((df["quality"].astype("int64") & 0b1_0000) != 0)
-            ],
+            ).to_numpy(dtype=bool),
         )
 
+    @staticmethod
+    def _olympic_average(
+        values: npt.NDArray[np.float64], window: int, block_size: int = 1 << 22
+    ) -> npt.NDArray[np.float64]:
+        # -------------------------------------------------------------------- #
+        # centered Olympic average (mean of the non-NaN values in each window  #
+        # after dropping the lowest and highest) with partial windows at the   #
+        # ends, equivalent to rolling(window, min_periods=1, center=True) with #
+        # a sorting callback (which also treats infinite values as NaN).       #
+        # Windows are sorted as rows of a strided view, and long series are    #
+        # processed in blocks of about block_size elements so the working      #
+        # memory does not grow with the length of the series                   #
+        # -------------------------------------------------------------------- #
+        count = len(values)
+        half = window // 2
+        padded = np.concatenate((np.full(half, np.nan), values, np.full(half, np.nan)))
+        padded[np.isinf(padded)] = np.nan
+        averaged = np.full(count, np.nan)
+        rows = max(block_size // window, 1)
+        middle = np.arange(window)
+        for start in range(0, count, rows):
+            stop = min(start + rows, count)
+            windows = np.sort(
+                np.lib.stride_tricks.sliding_window_view(
+                    padded[start : stop + window - 1], window
+                ),
+                axis=1,
+            )  # NaNs sort to the end of each row
+            valid_count = np.count_nonzero(~np.isnan(windows), axis=1)
+            keep = (middle >= 1) & (middle < valid_count[:, np.newaxis] - 1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                averaged[start:stop] = np.where(
+                    valid_count > 2,
+                    np.where(keep, windows, 0.0).sum(axis=1) / (valid_count - 2),
+                    np.nan,
+                )
+        return averaged
+
+    @staticmethod
+    def _window_average(
+        values: npt.NDArray[np.float64],
+        window: int,
+        centered: bool,
+        block_size: int = 1 << 22,
+    ) -> npt.NDArray[np.float64]:
+        # ------------------------------------------------------------------ #
+        # forward or centered average (mean of the finite values in each     #
+        # window) with partial windows at the ends, equivalent to            #
+        # rolling(window, min_periods=1, center=centered).mean(). The values #
+        # are split into blocks of window values aligned on the first value, #
+        # and each window sum is the suffix sum of one block plus the prefix #
+        # sum of the next. Unlike a running sum, this makes the result for   #
+        # each value depend only on the values in its window, so processing  #
+        # any portion of the series that starts on a block boundary gives    #
+        # identical averages. Long series are processed in spans of about    #
+        # block_size values so the working memory does not grow with the     #
+        # length of the series                                               #
+        # ------------------------------------------------------------------ #
+        count = len(values)
+        before = window // 2 if centered else window - 1
+        after = window - 1 - before
+        valid = np.isfinite(values)
+        averaged = np.full(count, np.nan)
+        span = max(block_size // window, 1) * window
+        for start in range(0, count, span):
+            stop = min(start + span, count)
+            lo = max(start - before, 0) // window * window
+            hi = min(stop + after, count)
+            blocks = -(-(hi - lo) // window)
+            padded = np.zeros(blocks * window)
+            padded[: hi - lo] = np.where(valid[lo:hi], values[lo:hi], 0.0)
+            rows = padded.reshape(blocks, window)
+            prefix = np.cumsum(rows, axis=1).ravel()
+            suffix = np.cumsum(rows[:, ::-1], axis=1)[:, ::-1].ravel()
+            positions = np.arange(start, stop)
+            first = np.maximum(positions - before, 0) - lo
+            last = np.minimum(positions + after, count - 1) - lo
+            # ---------------------------------------------------------------- #
+            # a window within one block starts the block (use the prefix sum)  #
+            # or is cut off by the end of the series (use the suffix sum)      #
+            # ---------------------------------------------------------------- #
+            totals = np.where(
+                first // window != last // window,
+                suffix[first] + prefix[last],
+                np.where(first % window == 0, prefix[last], suffix[first]),
+            )
+            valid_count = np.concatenate(([0], np.cumsum(valid[lo:hi])))
+            counts = valid_count[last + 1] - valid_count[first]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                averaged[start:stop] = np.where(counts > 0, totals / counts, np.nan)
+        return averaged
+
     @staticmethod
     def _protected_indices(df: pd.DataFrame) -> list[np.datetime64]:
+        return cast(list[np.datetime64], df.index[TimeSeries._protected_mask(df)])
+
+    @staticmethod
+    def _protected_mask(df: pd.DataFrame) -> npt.NDArray[np.bool_]:
         return cast(
-            list[np.datetime64],
-            df[
+            npt.NDArray[np.bool_],
+            (
                 (
                     df["quality"].astype("int64")
                     & 0b1000_0000_0000_0000_0000_0000_0000_0000
                 )
                 != 0
-            ].index,
+            ).to_numpy(dtype=bool),
         )
 
-    def _resample_continuous(
-        self,
+    def _chunk(self, first: int, last: int) -> "TimeSeries":
+        # ------------------------------------------------------------ #
+        # a time series with the metadata of this one and a view of    #
+        # the rows [first, last)                                       #
+        # ------------------------------------------------------------ #
+        chunk = self.copy(include_data=False)
+        chunk._data = cast(pd.DataFrame, self._data).iloc[first:last]
+        return chunk
+
+    @staticmethod
+    def _chunk_extent(
         operation: str,
-        old_tsvs: List[TimeSeriesValue],
-        new_tsvs: List[TimeSeriesValue],
-        is_regular: bool,
-        bounds: List[Any],
-        max_missing_percent: float,
+        arguments: Dict[str, Any],
+        grid: tuple[Optional[npt.NDArray[np.int64]], int, int],
+        buffer: pd.DataFrame,
+        offset: int,
+        start: int,
+        stop: int,
+        final: bool,
+    ) -> Optional[tuple[int, int]]:
+        # ------------------------------------------------------------------- #
+        # the buffered rows [lo, hi) to process for the chunk in the buffered #
+        # rows [start, stop) so its results are the same as for the entire    #
+        # time series: the chunk plus the rows the operation uses before and  #
+        # after it. offset is the position of the first buffered row in the   #
+        # entire time series. Returns None if more rows must be buffered      #
+        # after the chunk (unless final, when there are no more rows)         #
+        # ------------------------------------------------------------------- #
+        count = len(buffer)
+        times = TimeSeries._index_nanoseconds(cast(pd.DatetimeIndex, buffer.index))
+        lo, hi = start, stop
+        if operation in (
+            "accum",
+            "diff",
+            "screen_with_value_change_rate",
+            "screen_with_value_range_or_change",
+            "time_derivative",
+        ):
+            # ------------------ #
+            # the previous value #
+            # ------------------ #
+            lo = max(start - 1, 0)
+        elif operation.endswith("moving_average"):
+            # ---------------------------------------------------------------- #
+            # the rest of the first window and the rest of the last window,    #
+            # starting on a multiple of the window from the first value of the #
+            # entire time series so the window sums are the same (see          #
+            # _window_average())                                               #
+            # ---------------------------------------------------------------- #
+            window = arguments["window"]
+            forward = operation.endswith("forward_moving_average")
+            before = window - 1 if forward else window // 2
+            lo = max(offset + start - before, 0) // window * window - offset
+            hi = stop + (0 if forward else window // 2)
+        elif operation == "estimate_missing_values":
+            # ------------------------------------------------------------------ #
+            # every gap that overlaps the chunk, including the bounding values - #
+            # for non-accumulations, gaps longer than max_missing_count are not  #
+            # estimated, so seeing that many missing values is enough            #
+            # ------------------------------------------------------------------ #
+            values = buffer["value"].to_numpy(dtype=np.float64)
+            missing = np.isnan(values)
+            if arguments["estimate_rejected"]:
+                qualities = buffer["quality"].to_numpy(dtype=np.int64)
+                missing |= (qualities & 0b1_1111) == 0b1_0001
+            present = np.flatnonzero(~missing)
+            previous = int(np.searchsorted(present, start)) - 1
+            following = int(np.searchsorted(present, stop))
+            lo = int(present[previous]) if previous >= 0 else 0
+            hi = int(present[following]) + 1 if following < len(present) else count + 1
+            if not arguments["accumulation"]:
+                limit = arguments["max_missing_count"] + 1
+                lo = max(lo, start - limit)
+                hi = min(hi, stop + limit)
+        elif operation in (
+            "screen_with_constant_value",
+            "screen_with_duration_magnitude",
+        ):
+            # ------------------------------------------------------------------ #
+            # back to the last value at least the duration before the chunk      #
+            # start, plus the next value after a chunk of one value without any  #
+            # before it since these screenings require more than one value (the  #
+            # screening of each value uses only the values before it)            #
+            # ------------------------------------------------------------------ #
+            duration = arguments["duration"]
+            minutes = (
+                Duration(duration) if isinstance(duration, str) else duration
+            ).minutes
+            lo = max(
+                int(
+                    np.searchsorted(
+                        times, times[start] - minutes * 60_000_000_000, side="right"
+                    )
+                )
+                - 1,
+                0,
+            )
+            hi = max(hi, lo + 2)
+        elif operation == "resample":
+            # -------------------------------------------------------------------- #
+            # the old values around the new times for the new intervals before     #
+            # the chunk that set up the first new interval in the chunk, and after #
+            # the chunk through the first valid value past the time that exceeds   #
+            # max_missing_percent of the new interval, where the interpolation at  #
+            # each new time in the chunk stops looking for a valid value           #
+            # -------------------------------------------------------------------- #
+            lead = min(
+                TimeSeries._chunk_lead_time(grid, times, offset, times[start], 4),
+                times[start],
+            )
+            lo = max(int(np.searchsorted(times, lead, side="right")) - 2, 0)
+            if stop < count:
+                step = TimeSeries._chunk_step(grid, times, lead, times[stop])
+                missing_factor = 1.0 + max(arguments["max_missing_percent"], 0.0) / 100
+                reach = int(
+                    np.searchsorted(times, times[stop] + int(step * missing_factor))
+                )
+                valid = np.flatnonzero(
+                    ~TimeSeries._unusable_mask(
+                        buffer["value"].to_numpy(dtype=np.float64)[reach:],
+                        buffer["quality"].to_numpy(dtype=np.int64)[reach:],
+                    )
+                )
+                hi = reach + int(valid[0]) + 1 if len(valid) else count + 1
+            if not offset + start:
+                # ---------------------------------------------------------- #
+                # through the second new time, which sets the length of the  #
+                # first new interval                                         #
+                # ---------------------------------------------------------- #
+                pattern, origin, spacing = grid
+                if spacing:
+                    second = origin + spacing
+                elif pattern is not None:
+                    second = int(pattern[min(1, len(pattern) - 1)])
+                else:
+                    second = int(times[min(1, count - 1)]) + origin
+                hi = max(hi, 2, int(np.searchsorted(times, second)) + 1)
+        if hi > count:
+            if not final:
+                return None
+            hi = count
+        return max(lo, 0), hi
+
+    @staticmethod
+    def _chunk_lead_time(
+        grid: tuple[Optional[npt.NDArray[np.int64]], int, int],
+        times: npt.NDArray[np.int64],
+        offset: int,
+        time: int,
+        count: int,
+    ) -> int:
+        # ------------------------------------------------------------------ #
+        # the new time count new times before the first new time at or after #
+        # time for the grid returned by _chunk_resample_grid(), where times  #
+        # are the buffered old times starting at position offset. Returns    #
+        # the minimum time if that is before the first new time, since the   #
+        # first new interval extends back over the old times before it       #
+        # ------------------------------------------------------------------ #
+        pattern, origin, step = grid
+        minimum = int(np.iinfo(np.int64).min)
+        if step:
+            index = -((origin - time) // step) - count
+            return origin + index * step if index >= 0 else minimum
+        first = 0
+        if pattern is None:
+            pattern = times + origin
+            first = offset
+        index = int(np.searchsorted(pattern, time)) - count
+        if index + first < 0 or not len(pattern):
+            return minimum
+        return int(pattern[max(index, 0)])
+
+    @staticmethod
+    def _chunk_new_times(
+        grid: tuple[Optional[npt.NDArray[np.int64]], int, int],
+        times: npt.NDArray[np.int64],
+        first: int,
+        last: int,
+    ) -> npt.NDArray[np.int64]:
+        # ----------------------------------------------------------------- #
+        # the new times in [first, last] for the grid returned by           #
+        # _chunk_resample_grid(), as int64 nanoseconds                      #
+        # ----------------------------------------------------------------- #
+        pattern, origin, step = grid
+        if step:
+            return origin + step * np.arange(
+                max(-((origin - first) // step), 0),
+                (last - origin) // step + 1,
+                dtype=np.int64,
+            )
+        if pattern is None:
+            pattern = times + origin
+        return pattern[
+            np.searchsorted(pattern, first) : np.searchsorted(
+                pattern, last, side="right"
+            )
+        ]
+
+    @staticmethod
+    def _chunk_resample_grid(
+        arguments: Dict[str, Any], template: "TimeSeries", index: pd.DatetimeIndex
+    ) -> tuple[Optional[npt.NDArray[np.int64]], int, int]:
+        # -------------------------------------------------------------------- #
+        # the new times of a chunked resample as (pattern, origin, step): each #
+        # step from origin if step is not zero, otherwise the pattern times or #
+        # (if pattern is None) the old times plus origin. index is that of the #
+        # first chunk                                                          #
+        # -------------------------------------------------------------------- #
+        interval = arguments["interval"]
+        interval_offset = TimeSeries._resample_offset(arguments["offset"])
+        offset = TimeSeries._span_nanoseconds(interval_offset)
+        if [
+            o
+            for o in _resample_operations
+            if o.startswith(arguments["operation"].upper())
+        ] == [_RESAMPLE_OP_AVERAGE] and (
+            template.parameter_type is not None
+            and template.parameter_type.get_raw_name() == "Total"
+        ):
+            # ------------------------------------------------------------- #
+            # averaging Total values depends on the last valid value of all #
+            # the new intervals before                                      #
+            # ------------------------------------------------------------- #
+            raise TimeSeriesException(
+                "Cannot resample a Total time series to Average in chunks"
+            )
+        if offset is None:
+            raise TimeSeriesException(
+                f"Cannot resample in chunks with an offset of {interval_offset}, whose length depends on the calendar"
+            )
+        if interval is None:
+            return None, offset, 0
+        if isinstance(interval, TimeSeries):
+            if interval._data is None or interval._data.empty:
+                raise TimeSeriesException(
+                    "Operation is invalid with empty pattern time series."
+                )
+            pattern = (
+                TimeSeries._index_nanoseconds(
+                    cast(pd.DatetimeIndex, interval._data.index)
+                )
+                + offset
+            )
+            if interval.has_selection:
+                pattern = pattern[interval._data["selected"].to_numpy(dtype=bool)]
+                if interval.selection_state == SelectionState.TRANSIENT:
+                    interval.iselect(Select.ALL)
+            return pattern, 0, 0
+        if not isinstance(interval, (TimeSpan, timedelta)):
+            raise TypeError(
+                f"Expected Optional[Union[TimeSeries, TimeSpan, timedelta]] for interval parameter, got {type(interval)}"
+            )
+        start_time = arguments["start_time"]
+        timespan, first = TimeSeries._resample_start(
+            interval,
+            interval_offset,
+            HecTime(start_time if start_time else TimeSeries._time_string(index[0])),
+        )
+        step = TimeSeries._span_nanoseconds(timespan)
+        if not step:
+            raise TimeSeriesException(
+                f"Cannot resample in chunks onto {timespan}, whose length depends on the calendar or local time"
+            )
+        return None, int(TimeSeries._hectime_nanoseconds([first])[0]), int(step)
+
+    @staticmethod
+    def _chunk_step(
+        grid: tuple[Optional[npt.NDArray[np.int64]], int, int],
+        times: npt.NDArray[np.int64],
+        first: int,
+        last: int,
+    ) -> int:
+        # --------------------------------------------------------------- #
+        # the longest new interval that ends in [first, last] or ends the #
+        # next new time after last, for the grid returned by              #
+        # _chunk_resample_grid()                                          #
+        # --------------------------------------------------------------- #
+        pattern, origin, step = grid
+        if step:
+            return step
+        if pattern is None:
+            pattern = times + origin
+        segment = pattern[
+            np.searchsorted(pattern, first) : np.searchsorted(
+                pattern, last, side="right"
+            )
+            + 2
+        ]
+        return int(np.diff(segment).max()) if len(segment) > 1 else 0
+
+    @staticmethod
+    def _process_chunks(
+        chunks: Iterator["TimeSeries"], operation: str, arguments: Dict[str, Any]
+    ) -> Iterator["TimeSeries"]:
+        # ----------------------------------------------------------------- #
+        # buffer the chunks and process each one once the rows it needs     #
+        # after it are buffered, dropping the rows no later chunk needs.    #
+        # offset is the position of the first buffered row in the entire    #
+        # time series, starts holds the buffered positions of the chunks    #
+        # not yet processed, carry is the last accumulation of the previous #
+        # chunk, and total is the running total of the valid values before  #
+        # the first buffered row                                            #
+        # ----------------------------------------------------------------- #
+        template: Optional[TimeSeries] = None
+        buffer: Optional[pd.DataFrame] = None
+        grid: tuple[Optional[npt.NDArray[np.int64]], int, int] = (None, 0, 0)
+        offset = 0
+        starts: List[int] = []
+        carry = math.nan
+        total = 0.0
+        exhausted = False
+        while not exhausted:
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+            elif chunk._data is not None and not chunk._data.empty:
+                if chunk.has_selection:
+                    raise TimeSeriesException("Cannot process chunks with selections")
+                data = TimeSeries._working_data(chunk._data)
+                if buffer is None:
+                    template = chunk.copy(include_data=False)
+                    if operation == "resample":
+                        grid = TimeSeries._chunk_resample_grid(
+                            arguments, template, cast(pd.DatetimeIndex, data.index)
+                        )
+                    buffer = data
+                    starts.append(0)
+                else:
+                    if data.index[0] <= buffer.index[-1]:
+                        raise TimeSeriesException(
+                            "Chunks must be in increasing time order without overlap"
+                        )
+                    starts.append(len(buffer))
+                    buffer = pd.concat([buffer, data])
+            while (
+                buffer is not None
+                and template is not None
+                and starts
+                and (exhausted or len(starts) > 1)
+            ):
+                start = starts[0]
+                stop = starts[1] if len(starts) > 1 else len(buffer)
+                extent = TimeSeries._chunk_extent(
+                    operation, arguments, grid, buffer, offset, start, stop, exhausted
+                )
+                if extent is None:
+                    break
+                lo, hi = extent
+                if lo:
+                    if operation == "screen_with_duration_magnitude":
+                        total = TimeSeries._running_total(total, buffer.iloc[:lo])
+                    buffer = buffer.iloc[lo:]
+                    offset += lo
+                    starts = [s - lo for s in starts]
+                    start, stop, hi = start - lo, stop - lo, hi - lo
+                times = TimeSeries._index_nanoseconds(
+                    cast(pd.DatetimeIndex, buffer.index)
+                )
+                data = buffer.iloc[:hi]
+                if (operation == "accum" and offset + start) or (
+                    operation == "screen_with_duration_magnitude" and offset
+                ):
+                    # ---------------------------------------------------------- #
+                    # the first row carries the state of the rows before it: the #
+                    # accumulation for accum or the running total of the valid   #
+                    # values for screen_with_duration_magnitude                  #
+                    # ---------------------------------------------------------- #
+                    values = data["value"].to_numpy(dtype=np.float64, copy=True)
+                    qualities = data["quality"].to_numpy(copy=True)
+                    if operation == "accum":
+                        values[0] = carry
+                    else:
+                        values[0] = TimeSeries._running_total(total, data.iloc[:1])
+                        qualities[0] = 0
+                    data = data.assign(value=values, quality=qualities)
+                lower = times[start] if offset + start else np.iinfo(np.int64).min
+                upper = times[stop] if stop < len(buffer) else np.iinfo(np.int64).max
+                ts = template.copy(include_data=False)
+                ts._data = data
+                if operation == "resample":
+                    # --------------------------------------------------------- #
+                    # from the new times that set up the first new interval in  #
+                    # the chunk to the last new time the buffered rows reach    #
+                    # --------------------------------------------------------- #
+                    step = grid[2]
+                    last = (
+                        times[hi - 1] if stop < len(buffer) else np.iinfo(np.int64).max
+                    )
+                    if step and (stop == len(buffer) or arguments["end_time"]):
+                        end_time = arguments["end_time"] or TimeSeries._time_string(
+                            buffer.index[-1]
+                        )
+                        last = min(
+                            last,
+                            int(
+                                TimeSeries._hectime_nanoseconds([HecTime(end_time)])[0]
+                            ),
+                        )
+                    first = (
+                        TimeSeries._chunk_lead_time(
+                            grid, times, offset, times[start], 3
+                        )
+                        if offset + start
+                        else np.iinfo(np.int64).min
+                    )
+                    new_times = TimeSeries._chunk_new_times(grid, times, first, last)
+                    if not ((new_times >= lower) & (new_times < upper)).any():
+                        starts.pop(0)
+                        continue
+                    result = ts._resample(
+                        [arguments["operation"]],
+                        arguments["interval"],
+                        arguments["offset"],
+                        arguments["start_time"],
+                        arguments["end_time"],
+                        arguments["max_missing_percent"],
+                        arguments["entire_interval"],
+                        arguments["before"],
+                        arguments["after"],
+                        False,
+                        new_times,
+                    )[0]
+                else:
+                    result = getattr(ts, operation)(**arguments)
+                starts.pop(0)
+                if result._data is None:
+                    continue
+                result_times = TimeSeries._index_nanoseconds(
+                    cast(pd.DatetimeIndex, result._data.index)
+                )
+                first_row, last_row = np.searchsorted(result_times, [lower, upper])
+                if last_row > first_row:
+                    result._data = result._data.iloc[first_row:last_row]
+                    if operation == "accum":
+                        carry = float(result._data["value"].iloc[-1])
+                    yield result
+
+    @staticmethod
+    def _running_total(total: float, df: pd.DataFrame) -> float:
+        # -------------------------------------------------------------- #
+        # the running total of the valid values (as summed for duration  #
+        # magnitude screening) continued over the rows of df             #
+        # -------------------------------------------------------------- #
+        values = df["value"].to_numpy(dtype=np.float64)
+        valid = ~TimeSeries._unusable_mask(
+            values, df["quality"].to_numpy(dtype=np.int64)
+        )
+        return float(
+            np.cumsum(np.concatenate(([total], np.where(valid, values, 0.0))))[-1]
+        )
+
+    def _combine_data(
+        self,
+        amount: "TimeSeries",
+        to_unit: str,
+        operation: Callable[
+            [npt.NDArray[np.float64], npt.NDArray[np.float64]],
+            npt.NDArray[np.float64],
+        ],
+    ) -> pd.DataFrame:
+        # ------------------------------------------------------------------ #
+        # apply a binary operation to the (selected) values of this object   #
+        # and of amount converted to to_unit, at the times they have in      #
+        # common; the times only need to be aligned if they are not the same #
+        # ------------------------------------------------------------------ #
+        this = cast(pd.DataFrame, self._data)
+        that = cast(pd.DataFrame, amount._data)
+        if "selected" in this.columns:
+            this = this[this["selected"]]
+        if "selected" in that.columns:
+            that = that[that["selected"]]
+        index = this.index
+        values1 = this["value"].to_numpy(dtype=np.float64)
+        values2 = that["value"].to_numpy(dtype=np.float64)
+        if not index.equals(that.index):
+            positions = that.index.get_indexer(index)
+            common = positions >= 0
+            index = index[common]
+            values1 = values1[common]
+            values2 = values2[positions[common]]
+        if amount.unit != to_unit:
+            values2 = TimeSeries._convert_values(values2, amount.parameter, to_unit)
+        with np.errstate(all="ignore"):
+            values = operation(values1, values2)
+        data = pd.DataFrame({"value": values, "quality": 0}, index=index)
+        if ("selected" in this.columns) != ("selected" in that.columns):
+            # ------------------------------------------------------- #
+            # a selection on only one operand is kept (all selected), #
+            # as it was when the operands were merged on their index  #
+            # ------------------------------------------------------- #
+            data["selected"] = True
+        return data
+
+    @staticmethod
+    def _convert_values(
+        values: npt.NDArray[np.float64], parameter: Parameter, to_unit: str
+    ) -> npt.NDArray[np.float64]:
+        # -------------------------------------------------------------------- #
+        # convert an array of values of a parameter to another unit as to()    #
+        # does, but without copying a time series and with the conversion (and #
+        # the check that the parameter allows the unit) looked up only once    #
+        # -------------------------------------------------------------------- #
+        from_unit = parameter.unit_name
+        key = (parameter.name, from_unit, to_unit)
+        if key not in _unit_conversions:
+            parameter.to(to_unit)
+            conv_1 = hec.unit.convert_units(1, from_unit, to_unit)
+            conv_10 = hec.unit.convert_units(10, from_unit, to_unit)
+            if conv_10 == 10 * conv_1:
+                _unit_conversions[key] = (conv_1, 0.0)
+            elif (conv_10 - 10) == (conv_1 - 1):
+                _unit_conversions[key] = (1.0, conv_1 - 1)
+            else:
+                _unit_conversions[key] = None
+        conversion = _unit_conversions[key]
+        if conversion is None:
+            return np.array(
+                hec.unit.convert_units(values.tolist(), from_unit, to_unit),
+                dtype=np.float64,
+            )
+        factor, offset = conversion
+        if offset:
+            return values + offset
+        if factor != 1:
+            return values * factor
+        return values
+
+    @staticmethod
+    def _combine_selection(
+        data: pd.DataFrame, mask: npt.NDArray[np.bool_], combination: Combine
     ) -> None:
+        # -------------------------------------------------------------- #
+        # set the selected column from a mask and the current selection, #
+        # with the same combination rules as function selections         #
+        # -------------------------------------------------------------- #
+        if "selected" not in data.columns:
+            if combination in (Combine.REPLACE, Combine.AND, Combine.OR):
+                selected = mask
+            elif combination == Combine.XOR:
+                selected = ~mask
+            else:
+                raise ValueError(f"Invalid combination: {combination}")
+        else:
+            current = data["selected"].to_numpy(dtype=bool)
+            if combination == Combine.REPLACE:
+                selected = mask
+            elif combination == Combine.AND:
+                selected = current & mask
+            elif combination == Combine.OR:
+                selected = current | mask
+            elif combination == Combine.XOR:
+                selected = current ^ mask
+            else:
+                raise ValueError(f"Invalid combination: {combination}")
+        data.loc[:, "selected"] = selected
+
+    def _arrow_metadata(self) -> dict[str, Any]:
+        # ---------------------------------------------------------------- #
+        # the metadata stored with the data in Arrow tables and Parquet    #
+        # files; the name alone restores most of it, the rest is stored so #
+        # other readers don't have to parse the name                       #
+        # ---------------------------------------------------------------- #
+        return {
+            "name": self.name,
+            "context": self._context,
+            "office": self._location.office,
+            "parameter": self._parameter.name,
+            "unit": self.unit,
+            "parameter_type": (
+                None
+                if self._parameter_type is None
+                else self._parameter_type.get_raw_name()
+            ),
+            "interval": self._interval.name,
+            "duration": None if self._duration is None else self._duration.name,
+            "version": self._version,
+            "version_time": (
+                None if self._version_time is None else str(self._version_time)
+            ),
+            "time_zone": self._timezone,
+            "vertical_datum_info": self.vertical_datum_info_xml,
+            "vertical_datum": (
+                None
+                if self.vertical_datum_info is None
+                else self.vertical_datum_info.current_datum
+            ),
+        }
+
+    @staticmethod
+    def _arrow_table(timeseries: "TimeSeries") -> Any:
+        # ------------------------------------------------------------- #
+        # the time, value, and quality columns of a time series without #
+        # its metadata, sharing the data buffers                        #
+        # ------------------------------------------------------------- #
+        pa = hec.shared.import_pyarrow()
+        if timeseries._data is None:
+            data = pd.DataFrame(
+                {"value": np.zeros(0), "quality": np.zeros(0, dtype=np.int64)},
+                index=pd.DatetimeIndex([], name="time"),
+            )
+        else:
+            data = timeseries._data
+        index = cast(pd.DatetimeIndex, data.index)
+        return pa.table(
+            {
+                "time": pa.array(index.as_unit("ns") if index.unit != "ns" else index),
+                "value": pa.array(data["value"].to_numpy()),
+                "quality": pa.array(data["quality"].to_numpy()),
+            }
+        )
+
+    def _arrow_export(self) -> Any:
+        # ---------------------------------------------------------------- #
+        # the table of to_arrow() without marking the data as shared, for  #
+        # writers that don't keep the table                                #
+        # ---------------------------------------------------------------- #
+        return TimeSeries._arrow_table(self).replace_schema_metadata(
+            {_arrow_metadata_key: json.dumps(self._arrow_metadata())}
+        )
+
+    @staticmethod
+    def _arrow_export_many(timeseries: List["TimeSeries"]) -> Any:
+        # --------------------------------------------------------------- #
+        # the table of to_arrow_many() without marking the data as shared #
+        # --------------------------------------------------------------- #
+        pa = hec.shared.import_pyarrow()
+        metadata: list[dict[str, Any]] = []
+        tables = []
+        for ts in timeseries:
+            table = TimeSeries._arrow_table(ts)
+            time_type = table.schema.field("time").type
+            table = table.set_column(
+                0, "time", table.column("time").cast(pa.timestamp("ns", tz="UTC"))
+            )
+            metadata.append(
+                ts._arrow_metadata()
+                | {"rows": table.num_rows, "time_zone_aware": time_type.tz is not None}
+            )
+            tables.append(table)
+        series = np.repeat(
+            np.arange(len(metadata), dtype=np.int32),
+            [item["rows"] for item in metadata],
+        )
+        if tables:
+            table = pa.concat_tables(tables, promote_options="permissive")
+        else:
+            table = TimeSeries._arrow_table(TimeSeries("Loc.Flow.Inst.0.0.Empty"))
+        return table.add_column(0, "series", pa.array(series)).replace_schema_metadata(
+            {_arrow_metadata_key: json.dumps(metadata)}
+        )
+
+    @staticmethod
+    def _from_arrow_table(
+        metadata: dict[str, Any], table: Any, aware: bool, validate: bool
+    ) -> "TimeSeries":
+        # ----------------------------------------------------------------- #
+        # the time series for one set of metadata and its rows of a table,  #
+        # wrapping the column buffers when each column is a single chunk    #
+        # ----------------------------------------------------------------- #
+        pa = hec.shared.import_pyarrow()
+        column = table.column("time")
+        if column.type.unit != "ns":
+            column = column.cast(pa.timestamp("ns", tz=column.type.tz))
+        times = column.to_numpy()
+        ts = TimeSeries.from_arrays(
+            metadata["name"],
+            times.view(np.int64) if aware else times,
+            table.column("value").to_numpy(),
+            table.column("quality").to_numpy(),
+            metadata["time_zone"] if aware else None,
+            validate=False,
+        )
+        # ----------------------------------------------------------------- #
+        # the data wraps the (read-only, possibly memory-mapped) buffers of #
+        # the table, so it is copied before it is first modified            #
+        # ----------------------------------------------------------------- #
+        ts._data_shared = True
+        ts._timezone = metadata["time_zone"]
+        ts._location.office = metadata["office"]
+        if metadata["vertical_datum_info"]:
+            # ------------------------------------------------------------ #
+            # the values are already in the stored current datum, so it is #
+            # set without converting them                                  #
+            # ------------------------------------------------------------ #
+            elev_parameter = ElevParameter(
+                metadata["parameter"], metadata["vertical_datum_info"]
+            )
+            elev_parameter.current_datum = metadata["vertical_datum"]
+            ts.iset_parameter(elev_parameter)
+        else:
+            ts.iset_parameter(Parameter(metadata["parameter"], metadata["unit"]))
+        if ts.unit != metadata["unit"]:
+            ts.iset_unit(metadata["unit"])
+        parameter_type = ts._parameter_type
+        if metadata["parameter_type"] is not None and (
+            parameter_type is None
+            or parameter_type.get_raw_name() != metadata["parameter_type"]
+        ):
+            ts.iset_parameter_type(
+                ParameterType(
+                    metadata["parameter_type"],
+                    None if parameter_type is None else parameter_type.context,
+                )
+            )
+        if metadata["version_time"] is not None:
+            ts.version_time = metadata["version_time"]
+        if validate:
+            ts._validate()
+        return ts
+
+    @staticmethod
+    def _compact_data(df: pd.DataFrame, values_type: Optional[str]) -> pd.DataFrame:
+        # ------------------------------------------------------------------ #
+        # the data in the compact layout: float32 values if requested or if  #
+        # every value converts to float32 and back unchanged (otherwise the  #
+        # values stay float64), and the quality codes as int32 (the signed   #
+        # codes of Quality.code)                                             #
+        # ------------------------------------------------------------------ #
+        values = cast(npt.NDArray[np.floating[Any]], df["value"].to_numpy())
+        if values.dtype != np.float32:
+            with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+                compact = values.astype(np.float32)
+            restored = compact.astype(np.float64)
+            if (
+                values_type == "float32"
+                or (
+                    (restored == values) | (np.isnan(restored) & np.isnan(values))
+                ).all()
+            ):
+                values = compact
+        qualities = df["quality"].to_numpy()
+        if qualities.dtype != np.int32:
+            qualities = (
+                (qualities.astype(np.int64) & 0xFFFFFFFF)
+                .astype(np.uint32)
+                .view(np.int32)
+            )
+        return df.assign(value=values, quality=qualities)
+
+    @staticmethod
+    def _working_data(df: pd.DataFrame) -> pd.DataFrame:
+        # ------------------------------------------------------------------- #
+        # the data in the layout that operations modify: float64 values and   #
+        # int64 quality codes; frames without the value and quality columns   #
+        # (such as some aggregate_ts() results) are never compacted           #
+        # ------------------------------------------------------------------- #
+        if (
+            df.columns.nlevels > 1
+            or "value" not in df.columns
+            or "quality" not in df.columns
+            or (df["quality"].dtype != np.int32 and df["value"].dtype != np.float32)
+        ):
+            return df
+        return df.assign(
+            value=df["value"].astype(np.float64), quality=df["quality"].astype(np.int64)
+        )
+
+    @staticmethod
+    def _cwms_data(df: pd.DataFrame) -> pd.DataFrame:
+        # ------------------------------------------------------------------ #
+        # the time series data for a cwms-python values DataFrame (with      #
+        # date-time, value, and quality-code columns)                        #
+        # ------------------------------------------------------------------ #
+        return pd.DataFrame(
+            {"value": df["value"], "quality": df["quality-code"]}
+        ).set_axis(pd.DatetimeIndex(df["date-time"], name="time"), axis=0)
+
+    def _continuous_resample_units(
+        self, operation: str
+    ) -> tuple[Optional[Parameter], Any]:
+        # ------------------------------------------------------------------ #
+        # verify the continuous operation is valid for this time series and  #
+        # return the integration parameter (if any) and the computation unit #
+        # ------------------------------------------------------------------ #
         new_parameter = None
         new_unit = self.unit
         if operation in (_RESAMPLE_OP_INTEGRATE, _RESAMPLE_OP_VOLUME):
@@ -2302,544 +3227,337 @@ class TimeSeries:
                     f"Cannot perform ACCUMULATE resample operation on time series with unit of {self.unit}\n"
                     f"Unit dimensionality must be not be one of {sorted(set([str(Parameter(p).unit.dimensionality) for p in hec.parameter._integration_parameters]))}"
                 )
-        is_inst = (
-            cast(ParameterType, self.parameter_type).get_raw_name() == "Instantaneous"
-        )
-        is_total = cast(ParameterType, self.parameter_type).get_raw_name() == "Total"
-        is_accum = (
-            cast(ParameterType, self.parameter_type).name == "INST-CUM"
-            if self.context == DSS
-            else is_inst and self.parameter.base_parameter == "Precip"
-        )
-        prev_lo: Optional[int] = None
-        prev_hi: int
-        len_old = len(old_tsvs)
-        lo: int
-        hi: int
-        interpolated: TimeSeriesValue
-        prev_interpolated: Optional[TimeSeriesValue] = None
-        last_valid = 0.0
-        first_boundary = True
-        for i, boundary in [(i, b) for (i, b) in enumerate(bounds) if b is not None]:
-            missing_seconds = 0.0
-            t1, t2 = (0, 1) if i == 0 else (i - 1, i)
-            new_interval_seconds = (
-                cast(datetime, new_tsvs[t2].time.datetime())
-                - cast(datetime, new_tsvs[t1].time.datetime())
-            ).total_seconds()
-            max_missing_seconds = new_interval_seconds * max_missing_percent / 100.0
-            new_val = math.nan
-            if not first_boundary:
-                prev_lo, prev_hi = lo, hi
-                prev_interpolated = interpolated
-            first_boundary = False
-            lo, hi = boundary
-            if lo == hi:
-                t1, t2 = (lo, lo + 1) if lo < len_old - 1 else (hi - 1, hi)
-            else:
-                t1, t2 = (lo, hi)
-            old_interval_seconds = (
-                cast(datetime, old_tsvs[t2].time.datetime())
-                - cast(datetime, old_tsvs[t1].time.datetime())
-            ).total_seconds()
-            # ---------------------------------------------- #
-            # interpolate the value at the new interval time #
-            # ---------------------------------------------- #
-            interpolated = TimeSeriesValue(new_tsvs[i].time, new_tsvs[i].value, 0)
-            for interpolation_iteration in [1]:
-                # ---------------------------------------------------- #
-                # expand the interpolation window to valid value times #
-                # ---------------------------------------------------- #
-                while lo >= 0 and not old_tsvs[lo].is_valid:
-                    lo1, lo2 = (0, 1) if lo == 0 else (lo - 1, lo)
-                    lo = -1
-                    missing_seconds += (
-                        cast(datetime, old_tsvs[lo2].time.datetime())
-                        - cast(datetime, old_tsvs[lo1].time.datetime())
-                    ).total_seconds()
-                if lo < 0:
-                    # ------------------------------- #
-                    # can't interpolate this interval #
-                    # ------------------------------- #
-                    break
-                while hi < len_old and not old_tsvs[hi].is_valid:
-                    hi1, hi2 = (hi - 1, hi) if hi == len_old - 1 else (hi, hi + 1)
-                    hi += 1
-                    missing_seconds += (
-                        cast(datetime, old_tsvs[hi2].time.datetime())
-                        - cast(datetime, old_tsvs[hi1].time.datetime())
-                    ).total_seconds()
-                if hi == len_old:
-                    # ------------------------------- #
-                    # can't interpolate this interval #
-                    # ------------------------------- #
-                    break
-                # -------------------------------------------------------------------------- #
-                # can't interpolate this interval if expansion is wider than missing percent #
-                # -------------------------------------------------------------------------- #
-                if missing_seconds > max_missing_seconds:
-                    break
-                # ---------------------------------------------- #
-                # can't interpolate decreasing cumulative values #
-                # ---------------------------------------------- #
-                if (
-                    is_accum
-                    and old_tsvs[hi].value.magnitude < old_tsvs[lo].value.magnitude
-                ):
-                    break
-                # ------------------------ #
-                # perform the intepolation #
-                # ------------------------ #
-                if lo == hi or (not is_inst and not is_total):
-                    interpolated.value = old_tsvs[hi].value
-                else:
-                    fraction = float(
-                        (
-                            cast(datetime, new_tsvs[i].time.datetime())
-                            - cast(datetime, old_tsvs[lo].time.datetime())
-                        ).total_seconds()
-                    ) / float(
-                        (
-                            cast(datetime, old_tsvs[hi].time.datetime())
-                            - cast(datetime, old_tsvs[lo].time.datetime())
-                        ).total_seconds()
-                    )
-                    if (
-                        is_total
-                        and old_tsvs[lo].time <= new_tsvs[i].time < old_tsvs[hi].time
-                    ):
-                        interpolated.value = old_tsvs[hi].value * fraction
-                    else:
-                        interpolated.value = old_tsvs[lo].value + fraction * (
-                            old_tsvs[hi].value.magnitude - old_tsvs[lo].value.magnitude
-                        )
-            if operation == _RESAMPLE_OP_INTERPOLATE:
-                new_tsvs[i].value = interpolated.value
-            elif operation == _RESAMPLE_OP_ACCUMULATE and not is_total:
-                if prev_interpolated is not None:
-                    val = interpolated.value - prev_interpolated.value
-                    if val >= 0 or not is_accum:
-                        new_tsvs[i].value = val
+        return new_parameter, new_unit
+
+    def _resample(
+        self,
+        operations: List[str],
+        interval: Optional[Union["TimeSeries", TimeSpan, timedelta]],
+        offset: Optional[Union[int, TimeSpan, timedelta]],
+        start_time: Optional[Union[HecTime, datetime, str]],
+        end_time: Optional[Union[HecTime, datetime, str]],
+        max_missing_percent: float,
+        entire_interval: Optional[bool],
+        before: Union[str, float],
+        after: Union[str, float],
+        in_place: bool,
+        chunk_times: Optional[npt.NDArray[np.int64]] = None,
+    ) -> List["TimeSeries"]:
+        # ------------------------------------------------------------ #
+        # resample onto the same new times with each of the operations #
+        # ------------------------------------------------------------ #
+        # ------------- #
+        # sanity checks #
+        # ------------- #
+        if self._data is None or self._data.empty:
+            raise TimeSeriesException("Operation is invalid with empty time series.")
+        if self.parameter_type is None:
+            raise TimeSeriesException(
+                "Cannot resample a time series without a known parameter type."
+            )
+        resample_operations = []
+        for operation in operations:
+            matched_operations = [
+                o for o in _resample_operations if o.startswith(operation.upper())
+            ]
+            if not matched_operations:
+                raise TimeSeriesException(
+                    f"'{operation}' does not match any valid resample operation"
+                )
+            if len(matched_operations) > 1:
+                raise Exception(
+                    f"'{operation}' matches multiple operations: {', '.join(matched_operations)}"
+                )
+            resample_operations.append(matched_operations[0])
+        if isinstance(before, str):
+            matched_value = [
+                o for o in _resample_before if o.startswith(before.upper())
+            ]
+            if not matched_value:
+                raise TimeSeriesException(
+                    f"'{before}' doesn't match any valid before option"
+                )
+            if matched_value[0] == _RESAMPLE_FIRST:
+                before_value = -math.inf
+            elif matched_value[0] == _RESAMPLE_MISSING:
+                before_value = math.inf
             else:
-                # ---------------------------------- #
-                # gather the contributing components #
-                # ---------------------------------- #
-                intvl_tsvs: list[TimeSeriesValue] = []
-                partial_first_component = False
-
-                if i == 0:
-                    prev_new_time = new_tsvs[0].time - (
-                        new_tsvs[1].time - new_tsvs[0].time
-                    )
-                    prev_interpolated = TimeSeriesValue(
-                        cast(HecTime, prev_new_time).clone(),
-                        UnitQuantity(math.nan, self.unit),
-                        0,
+                raise TimeSeriesException(
+                    f"'{matched_value}' is unexpected before option"
+                )
+        else:
+            before_value = before
+        if isinstance(after, str):
+            matched_value = [o for o in _resample_after if o.startswith(after.upper())]
+            if not matched_value:
+                raise TimeSeriesException(
+                    f"'{after}' doesn't match any valid after option"
+                )
+            if matched_value[0] == _RESAMPLE_LAST:
+                after_value = -math.inf
+            elif matched_value[0] == _RESAMPLE_MISSING:
+                after_value = math.inf
+            else:
+                raise TimeSeriesException(
+                    f"'{matched_value}' is unexpected after option"
+                )
+        else:
+            after_value = after
+        # ---------------------------------------------- #
+        # Generate the new times as int64 ns since epoch #
+        # ---------------------------------------------- #
+        time_window = {
+            "start": HecTime(
+                start_time
+                if start_time
+                else TimeSeries._time_string(
+                    cast(pd.DatetimeIndex, self._data.index)[0]
+                )
+            ),
+            "end": HecTime(
+                end_time
+                if end_time
+                else TimeSeries._time_string(
+                    cast(pd.DatetimeIndex, self._data.index)[-1]
+                )
+            ),
+        }
+        new_times: npt.NDArray[np.int64]
+        interval_offset = TimeSeries._resample_offset(offset)
+        if chunk_times is not None:
+            # --------------------------------------------------- #
+            # new times of one chunk of a chunked resample, taken #
+            # from the new times of the entire time series        #
+            # --------------------------------------------------- #
+            new_times = chunk_times
+        elif interval is None or isinstance(interval, TimeSeries):
+            # --------------------------------- #
+            # use pattern time series for times #
+            # --------------------------------- #
+            timeseries = interval
+            if timeseries is None:
+                # ------------------------------------- #
+                # use same interval as this time series #
+                # ------------------------------------- #
+                timeseries = self
+            if timeseries._data is None or timeseries._data.empty:
+                raise TimeSeriesException(
+                    "Operation is invalid with empty pattern time series."
+                )
+            offset_nanoseconds = TimeSeries._span_nanoseconds(interval_offset)
+            if offset_nanoseconds is None:
+                new_times = TimeSeries._hectime_nanoseconds(
+                    [HecTime(t) + interval_offset for t in timeseries.times]
+                )
+            else:
+                new_times = (
+                    TimeSeries._index_nanoseconds(
+                        cast(pd.DatetimeIndex, timeseries._data.index)
                     )
-                    prev_hi = 0
-                if cast(TimeSeriesValue, prev_interpolated).time < old_tsvs[hi].time:
-                    intvl_tsvs.append(cast(TimeSeriesValue, prev_interpolated))
-                    if i == 0:
-                        if operation == _RESAMPLE_OP_ACCUMULATE and is_total:
-                            prev_new_time = cast(HecTime, intvl_tsvs[0].time.clone())
-                            td = timedelta(seconds=old_interval_seconds)
-                            while prev_new_time + td < old_tsvs[0].time:
-                                prev_new_time = prev_new_time + td
-                            if prev_new_time > intvl_tsvs[0].time:
-                                intvl_tsvs.append(
-                                    TimeSeriesValue(
-                                        prev_new_time.clone(),
-                                        UnitQuantity(math.nan, self.unit),
-                                        0,
-                                    )
-                                )
-                        elif (
-                            old_tsvs[0].time - timedelta(seconds=old_interval_seconds)
-                            > cast(TimeSeriesValue, prev_interpolated).time
-                        ):
-                            intvl_tsvs.append(
-                                TimeSeriesValue(
-                                    old_tsvs[0].time
-                                    - timedelta(seconds=old_interval_seconds),
-                                    UnitQuantity(math.nan, self.unit),
-                                    0,
-                                )
-                            )
-                        intvl_tsvs.sort()
-                        if is_total and is_regular:
-                            first_fraction = True
-                            for j in range(len(intvl_tsvs)):
-                                if math.isnan(
-                                    intvl_tsvs[j].value.magnitude
-                                ) and intvl_tsvs[j].time > old_tsvs[0].time - timedelta(
-                                    seconds=old_interval_seconds
-                                ):
-                                    fraction = (
-                                        1.0
-                                        - (
-                                            cast(datetime, old_tsvs[0].time.datetime())
-                                            - cast(
-                                                datetime, intvl_tsvs[j].time.datetime()
-                                            )
-                                        ).total_seconds()
-                                        / (
-                                            cast(datetime, old_tsvs[1].time.datetime())
-                                            - cast(
-                                                datetime, old_tsvs[0].time.datetime()
-                                            )
-                                        ).total_seconds()
-                                    )
-                                    if first_fraction:
-                                        first_fraction = False
-                                        if 0.0 <= fraction <= 1.0:
-                                            partial_first_component = True
-                                    intvl_tsvs[j].value = old_tsvs[0].value * fraction
-                    if (
-                        cast(
-                            HecTime,
-                            (
-                                old_tsvs[prev_lo].time
-                                if prev_lo is not None
-                                else old_tsvs[lo].time
-                                - timedelta(seconds=old_interval_seconds)
-                            ),
-                        )
-                        < cast(TimeSeriesValue, prev_interpolated).time
-                    ):
-                        partial_first_component = True
-                for j in range(prev_hi, hi + 1):
-                    if (
-                        cast(TimeSeriesValue, prev_interpolated).time
-                        < old_tsvs[j].time
-                        < interpolated.time
-                    ):
-                        intvl_tsvs.append(old_tsvs[j])
-                if interpolated.time > intvl_tsvs[-1].time:
-                    intvl_tsvs.append(interpolated)
-                if (
-                    partial_first_component
-                    and is_total
-                    and (
-                        math.isfinite(intvl_tsvs[0].value.magnitude)
-                        and intvl_tsvs[1].value.magnitude
-                        < intvl_tsvs[0].value.magnitude
+                    + offset_nanoseconds
+                )
+            if timeseries.has_selection:
+                new_times = new_times[timeseries._data["selected"].to_numpy(dtype=bool)]
+                if timeseries.selection_state == SelectionState.TRANSIENT:
+                    timeseries.iselect(Select.ALL)
+        elif isinstance(interval, (Interval, TimeSpan, timedelta)):
+            timespan, start_time = TimeSeries._resample_start(
+                interval, interval_offset, time_window["start"]
+            )
+            step = TimeSeries._span_nanoseconds(timespan)
+            if step:
+                new_times = np.arange(
+                    TimeSeries._hectime_nanoseconds([start_time])[0],
+                    TimeSeries._hectime_nanoseconds([time_window["end"]])[0] + 1,
+                    step,
+                    dtype=np.int64,
+                )
+            else:
+                hectimes: List[HecTime] = []
+                t = start_time
+                while t <= time_window["end"]:
+                    hectimes.append(t.copy())
+                    t += timespan
+                new_times = TimeSeries._hectime_nanoseconds(hectimes)
+        else:
+            raise TypeError(
+                f"Expected Optional[Union[TimeSeries, TimeSpan, timedelta]] for interval parameter, got {type(interval)}"
+            )
+        # --------------------------------------------------- #
+        # get the arrays at the (possibly selected) old times #
+        # --------------------------------------------------- #
+        data = self._data
+        if self.has_selection:
+            data = data.loc[data["selected"]]
+        # ---------------------------------------------------------------- #
+        # perform the resample operations, sharing the bounds and validity #
+        # ---------------------------------------------------------------- #
+        old_times = TimeSeries._index_nanoseconds(cast(pd.DatetimeIndex, data.index))
+        values = data["value"].to_numpy(dtype=np.float64)
+        valid = ~TimeSeries._unusable_mask(
+            values, data["quality"].to_numpy(dtype=np.int64)
+        )
+        bounds = TimeSeries._resample_bounds(old_times, new_times)
+        is_regular = isinstance(interval, Interval) and interval.is_any_regular
+        all_new_values = [
+            self._resample_values(
+                resample_operation,
+                old_times,
+                values,
+                valid,
+                new_times,
+                bounds,
+                before_value,
+                after_value,
+                is_regular,
+                max_missing_percent,
+                entire_interval,
+            )
+            for resample_operation in resample_operations
+        ]
+        index = pd.DatetimeIndex(new_times.view("datetime64[ns]"), name="time")
+        time_zone = cast(pd.DatetimeIndex, data.index).tz
+        if time_zone is not None:
+            index = index.tz_localize("UTC").tz_convert(time_zone)
+        targets = []
+        for resample_operation, new_values in zip(resample_operations, all_new_values):
+            target = self._target(in_place)
+            target._data = None
+            # ------------------------------------------------ #
+            # update parameter and unit info for the operation #
+            # ------------------------------------------------ #
+            if resample_operation == _RESAMPLE_OP_AVERAGE:
+                target.iset_parameter_type(ParameterType("Average", target.context))
+            elif resample_operation == _RESAMPLE_OP_COUNT:
+                target.iset_parameter(f"Count-{target.parameter.name}")
+                target.iset_parameter_type(ParameterType("Total", target.context))
+            elif resample_operation == _RESAMPLE_OP_MAXIMUM:
+                target.iset_parameter_type(ParameterType("Maximum", target.context))
+            elif resample_operation == _RESAMPLE_OP_MINIMUM:
+                target.iset_parameter_type(ParameterType("Minimum", target.context))
+            elif resample_operation in (_RESAMPLE_OP_INTEGRATE, _RESAMPLE_OP_VOLUME):
+                new_parameter = self.get_integration_parameter()
+                target.iset_parameter(new_parameter)
+            # ---------------------------- #
+            # update interval information  #
+            # ---------------------------- #
+            if interval is None:
+                target.iset_interval(self.interval)
+            elif isinstance(interval, TimeSeries):
+                target.iset_interval(interval.interval)
+            elif isinstance(interval, Interval):
+                target.iset_interval(interval)
+            else:
+                if target.context == DSS:
+                    times_per_year = len(new_times) / (
+                        (new_times[-1] - new_times[0]) / 1e9 / 86400.0 / 365.0
                     )
-                ):
-                    # ---------------------------------------------------------------------------------- #
-                    # Zero out the first value to prevent averaging of the first two values in this case #
-                    # ---------------------------------------------------------------------------------- #
-                    intvl_tsvs[0].value = UnitQuantity(0.0, self.unit)
-                # --------------------------- #
-                # compute the resampled value #
-                # --------------------------- #
-                values: List[float] = []
-                value_seconds: List[float] = []
-                invalid: List[bool] = []
-                if partial_first_component and not math.isnan(
-                    intvl_tsvs[0].value.magnitude
-                ):
-                    values.append(intvl_tsvs[0].value.magnitude)
-                    value_seconds.append(0)
-                    invalid.append(False)
-                for j in range(1, len(intvl_tsvs)):
-                    seconds = (
-                        cast(datetime, intvl_tsvs[j].time.datetime())
-                        - cast(datetime, intvl_tsvs[j - 1].time.datetime())
-                    ).total_seconds()
-                    is_invalid = False
-                    if operation == _RESAMPLE_OP_ACCUMULATE:
-                        if is_inst:
-                            if not (
-                                intvl_tsvs[j - 1].is_valid and intvl_tsvs[j].is_valid
-                            ):
-                                missing_seconds += seconds
-                                is_invalid = True
-                            value = (
-                                intvl_tsvs[j - 1].value.magnitude
-                                + intvl_tsvs[j].value.magnitude
-                            ) / 2
-                        else:
-                            if not intvl_tsvs[j].is_valid:
-                                missing_seconds += seconds
-                                is_invalid = True
-                            if new_interval_seconds < old_interval_seconds:
-                                value = old_tsvs[hi].value.magnitude
-                            else:
-                                value = intvl_tsvs[j].value.magnitude
-                    elif operation == _RESAMPLE_OP_AVERAGE:
-                        if is_inst:
-                            if not (
-                                intvl_tsvs[j - 1].is_valid and intvl_tsvs[j].is_valid
-                            ):
-                                missing_seconds += seconds
-                                is_invalid = True
-                            value = (
-                                intvl_tsvs[j - 1].value.magnitude
-                                + intvl_tsvs[j].value.magnitude
-                            ) / 2
-                        elif is_total:
-                            if j == 1 and (
-                                partial_first_component
-                                or (
-                                    new_interval_seconds > old_interval_seconds
-                                    and (
-                                        cast(datetime, intvl_tsvs[1].time.datetime())
-                                        - cast(datetime, intvl_tsvs[0].time.datetime())
-                                    ).total_seconds()
-                                    < old_interval_seconds
-                                )
-                            ):
-                                values.append(intvl_tsvs[0].value.magnitude)
-                                value_seconds.append(0)
-                                invalid.append(not intvl_tsvs[0].is_valid)
-                                value = intvl_tsvs[1].value.magnitude
-                                if not intvl_tsvs[1].is_valid:
-                                    missing_seconds += seconds
-                                    is_invalid = True
-                            else:
-                                if not intvl_tsvs[j].is_valid:
-                                    missing_seconds += seconds
-                                    is_invalid = True
-                                value = intvl_tsvs[j].value.magnitude
-                        else:
-                            if not intvl_tsvs[j].is_valid:
-                                missing_seconds += seconds
-                                is_invalid = True
-                            value = intvl_tsvs[j].value.magnitude
-                    elif operation in (_RESAMPLE_OP_INTEGRATE, _RESAMPLE_OP_VOLUME):
-                        if is_inst:
-                            if not (
-                                intvl_tsvs[j - 1].is_valid and intvl_tsvs[j].is_valid
-                            ):
-                                missing_seconds += seconds
-                                is_invalid = True
-                            value = (
-                                intvl_tsvs[j - 1].value.magnitude
-                                + intvl_tsvs[j].value.magnitude
-                            ) / 2
-                        elif is_total:
-                            if j == 1 and partial_first_component:
-                                values.append(intvl_tsvs[0].value.magnitude)
-                                value_seconds.append(0)
-                                invalid.append(not intvl_tsvs[0].is_valid)
-                                value = intvl_tsvs[1].value.magnitude
-                                if not intvl_tsvs[1].is_valid:
-                                    missing_seconds += seconds
-                                    is_invalid = True
-                            else:
-                                if not intvl_tsvs[j].is_valid:
-                                    missing_seconds += seconds
-                                    is_invalid = True
-                                value = intvl_tsvs[j].value.magnitude / 2
-                        else:
-                            if not intvl_tsvs[j].is_valid:
-                                missing_seconds += seconds
-                                is_invalid = True
-                            value = intvl_tsvs[j].value.magnitude
-                    values.append(value)
-                    value_seconds.append(seconds)
-                    invalid.append(is_invalid)
-                if operation == _RESAMPLE_OP_ACCUMULATE:
-                    if (
-                        lo == hi
-                        and len(values) < 2
-                        and seconds == old_interval_seconds == new_interval_seconds
-                    ):
-                        if is_inst and hi > 0:
-                            new_val = (
-                                old_tsvs[hi - 1].value.magnitude
-                                + old_tsvs[hi].value.magnitude
-                            ) / 2
-                        else:
-                            new_val = old_tsvs[hi].value.magnitude
-                    else:
-                        if missing_seconds > max_missing_seconds:
-                            continue
-                        if is_total:
-                            # ----------------- #
-                            # add up components #
-                            # ----------------- #
-                            if len(intvl_tsvs) == 2:
-                                # ------------ #
-                                # 1 components #
-                                # ------------ #
-                                if not intvl_tsvs[1].is_valid:
-                                    new_val = math.nan
-                                elif not intvl_tsvs[0].is_valid:
-                                    new_val = intvl_tsvs[1].value.magnitude / (
-                                        old_interval_seconds / new_interval_seconds
-                                    )
-                                else:
-                                    for j in range(len_old):
-                                        if old_tsvs[j].time >= intvl_tsvs[1].time:
-                                            new_val = (old_tsvs[j].value.magnitude) / (
-                                                old_interval_seconds
-                                                / new_interval_seconds
-                                            )
-                                            break
-                                    else:
-                                        new_val = (intvl_tsvs[1].value.magnitude) / (
-                                            old_interval_seconds / new_interval_seconds
-                                        )
-                            elif len(intvl_tsvs) == 3:
-                                # ------------ #
-                                # 2 components #
-                                # ------------ #
-                                new_val = math.nan
-                                if partial_first_component:
-                                    if (
-                                        intvl_tsvs[0].is_valid
-                                        and intvl_tsvs[1].is_valid
-                                    ):
-                                        new_val = (
-                                            intvl_tsvs[1].value.magnitude
-                                            - intvl_tsvs[0].value.magnitude
-                                        )
-                                        if intvl_tsvs[2].is_valid:
-                                            new_val += intvl_tsvs[2].value.magnitude
-                                    else:
-                                        new_val = intvl_tsvs[2].value.magnitude
-                                else:
-                                    new_val = intvl_tsvs[2].value.magnitude
-                            else:
-                                # ---------------------- #
-                                # more than 2 components #
-                                # ---------------------- #
-                                if partial_first_component:
-                                    if invalid[0] or invalid[1]:
-                                        new_val = 0
-                                    else:
-                                        new_val = values[1] - values[0]
-                                    new_val += sum(
-                                        [
-                                            values[j]
-                                            for j in range(2, len(values))
-                                            if not invalid[j]
-                                        ]
-                                    )
-                                else:
-                                    new_val = sum(
-                                        [
-                                            values[j]
-                                            for j in range(len(values))
-                                            if not invalid[j]
-                                        ]
-                                    )
-                        else:
-                            # --------------------------------- #
-                            # diff between end and start values #
-                            # --------------------------------- #
-                            new_val = (
-                                intvl_tsvs[-1].value.magnitude
-                                - intvl_tsvs[0].value.magnitude
-                            )
-                            if is_accum and new_val < 0.0:
-                                new_val = math.nan
-                elif operation == _RESAMPLE_OP_AVERAGE:
-                    if (
-                        lo == hi
-                        and len(values) < 2
-                        and seconds == old_interval_seconds == new_interval_seconds
-                    ):
-                        # ------------------------------------------------------------ #
-                        # single value in interval that represents the exact interval #
-                        # ------------------------------------------------------------ #
-                        if is_inst and hi > 0:
-                            new_val = (
-                                old_tsvs[hi - 1].value.magnitude
-                                + old_tsvs[hi].value.magnitude
-                            ) / 2
-                        elif is_total:
-                            new_val = old_tsvs[hi].value.magnitude / 2
-                        else:
-                            new_val = old_tsvs[hi].value.magnitude
-                    else:
-                        if missing_seconds > max_missing_seconds:
-                            continue
-                        if is_total:
-                            new_val = 0.0
-                            for j in range(len(values)):
-                                if invalid[j]:
-                                    continue
-                                if (values[j] < last_valid) or (
-                                    value_seconds[j] == old_interval_seconds
-                                ):
-                                    new_val += values[j] / 2 * value_seconds[j]
-                                else:
-                                    if j == 0:
-                                        last_valid = values[j]
-                                        continue
-                                    new_val += (
-                                        (values[j - 1] + values[j])
-                                        / 2
-                                        * value_seconds[j]
-                                    )
-                                last_valid = values[j]
-                            new_val /= sum(
-                                [
-                                    value_seconds[j]
-                                    for j in range(len(value_seconds))
-                                    if not invalid[j]
-                                ]
-                            )
-                        else:
-                            # ------------------------------- #
-                            # data type isn't Total (PER-CUM) #
-                            # ------------------------------- #
-                            new_val = sum(
-                                [
-                                    values[j] * value_seconds[j]
-                                    for j in range(len(values))
-                                    if not invalid[j]
-                                ]
-                            ) / sum(
-                                [
-                                    value_seconds[j]
-                                    for j in range(len(value_seconds))
-                                    if not invalid[j]
-                                ]
-                            )
-                elif operation in (_RESAMPLE_OP_INTEGRATE, _RESAMPLE_OP_VOLUME):
-                    if (
-                        lo == hi
-                        and len(values) < 2
-                        and seconds == old_interval_seconds == new_interval_seconds
-                    ):
-                        if is_inst and hi > 0:
-                            new_val = (
-                                (
-                                    old_tsvs[hi - 1].value.magnitude
-                                    + old_tsvs[hi].value.magnitude
-                                )
-                                / 2
-                                * new_interval_seconds
-                            )
-                        else:
-                            new_val = (
-                                old_tsvs[hi].value.magnitude * new_interval_seconds
-                            )
+                    if times_per_year < 10:
+                        target.iset_interval(Interval.get_dss("Ir-Decade"))
+                    elif times_per_year < 1000:
+                        target.iset_interval(Interval.get_dss("Ir-Year"))
+                    elif times_per_year < 10000:
+                        target.iset_interval(Interval.get_dss("Ir-Month"))
                     else:
-                        if missing_seconds > max_missing_seconds:
-                            continue
-                        new_val = sum(
-                            [
-                                values[j] * value_seconds[j]
-                                for j in range(len(values))
-                                if not invalid[j]
-                            ]
-                        )
-                new_tsvs[i].value = UnitQuantity(new_val, new_unit)
-                if new_parameter:
-                    new_tsvs[i].value.ito(new_parameter.unit)
+                        target.iset_interval(Interval.get_dss("Ir-Day"))
+                else:
+                    target.iset_interval(Interval.get_cwms("0"))
+            # ---------------------- #
+            # rebuild the data frame #
+            # ---------------------- #
+            target._data = pd.DataFrame(
+                {
+                    "value": new_values,
+                    "quality": np.zeros(len(new_values), dtype=np.int64),
+                },
+                index=index.copy(),
+            )
+            target._validate()
+            targets.append(target)
+        return targets
 
-    def _resample_discreet(
+    @staticmethod
+    def _resample_offset(offset: Optional[Union[int, TimeSpan, timedelta]]) -> TimeSpan:
+        # ------------------------------------------------------ #
+        # the offset of each new time into the resample interval #
+        # ------------------------------------------------------ #
+        if not offset:
+            return TimeSpan()
+        if isinstance(offset, int):
+            return TimeSpan(0, 0, 0, 0, offset)
+        return TimeSpan(offset)
+
+    @staticmethod
+    def _resample_start(
+        interval: Union[TimeSpan, timedelta],
+        interval_offset: TimeSpan,
+        window_start: HecTime,
+    ) -> tuple[TimeSpan, HecTime]:
+        # ------------------------------------------------------------- #
+        # the span between new times and the first new time for a       #
+        # resample onto an Interval, TimeSpan, or timedelta starting at #
+        # window_start                                                  #
+        # ------------------------------------------------------------- #
+        if isinstance(interval, Interval):
+            # ---------------------- #
+            # use Interval for times #
+            # ---------------------- #
+            start_time = cast(HecTime, window_start.clone())
+            if interval.is_any_regular:
+                start_time -= TimeSpan(
+                    minutes=cast(int, start_time.get_interval_offset(interval))
+                    - interval_offset.total_seconds() // 60
+                )
+                if start_time < window_start:
+                    start_time += interval
+            return interval, start_time
+        # ---------------------- #
+        # use TimeSpan for times #
+        # ---------------------- #
+        timespan = TimeSpan(interval) if isinstance(interval, timedelta) else interval
+        return timespan, window_start + interval_offset
+
+    @staticmethod
+    def _resample_bounds(
+        old_times: npt.NDArray[np.int64], new_times: npt.NDArray[np.int64]
+    ) -> tuple[
+        npt.NDArray[np.intp],
+        npt.NDArray[np.intp],
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.bool_],
+    ]:
+        # ----------------------------------------------------------------- #
+        # the bounding old indices (lo, hi) of each new time, plus masks of #
+        # the new times that are before the old times and of those that     #
+        # are at or after the first new time past the last old time         #
+        # ----------------------------------------------------------------- #
+        count = len(old_times)
+        prev = np.searchsorted(old_times, new_times, side="right")
+        lo = np.maximum(prev - 1, 0)
+        exact = old_times[lo] == new_times if count else np.zeros(len(new_times), bool)
+        after = np.maximum.accumulate((prev == count) & ~exact) if count else prev < 0
+        before = (prev == 0) & ~after
+        hi = np.where(exact, lo, lo + 1)
+        return lo, hi, before, after
+
+    def _resample_discreet_arrays(
         self,
         operation: str,
-        old_tsvs: List[TimeSeriesValue],
-        new_tsvs: List[TimeSeriesValue],
-        bounds: List[Any],
+        old_times: npt.NDArray[np.int64],
+        values: npt.NDArray[np.float64],
+        valid: npt.NDArray[np.bool_],
+        new_times: npt.NDArray[np.int64],
+        bounded: npt.NDArray[np.bool_],
+        lo: npt.NDArray[np.intp],
+        hi: npt.NDArray[np.intp],
         entire_interval: Optional[bool] = None,
-    ) -> None:
+    ) -> npt.NDArray[np.float64]:
+        # ------------------------------------------------------------------ #
+        # discreet operations (count, maximum, minimum, previous) - returns  #
+        # the new values for the bounded new times. Each new interval uses   #
+        # the valid old points in [start, end) where start follows from the  #
+        # previous bounds                                                    #
+        # ------------------------------------------------------------------ #
         is_inst = (
             cast(ParameterType, self.parameter_type).get_raw_name() == "Instantaneous"
         )
@@ -2848,94 +3566,719 @@ class TimeSeries:
             if entire_interval is not None
             else not is_inst and operation != _RESAMPLE_OP_PREVIOUS
         )
-        prev_lo = None
-        prev_hi = None
-        for i, boundary in [(i, b) for (i, b) in enumerate(bounds) if b is not None]:
-            lo, hi = boundary
-            # -------------------------------------------------------- #
-            # get a list of valid indices that end in the new interval #
-            # -------------------------------------------------------- #
-            if prev_hi is None:
-                indices = [
-                    j for j in range(hi + 1 if lo == hi else hi) if old_tsvs[j].is_valid
-                ]
-            else:
-                if operation == _RESAMPLE_OP_PREVIOUS and hi == prev_hi:
-                    prev_hi -= 1
-                elif prev_hi == prev_lo and operation != _RESAMPLE_OP_PREVIOUS:
-                    prev_hi += 1
-                indices = [
-                    j
-                    for j in range(prev_hi, hi + 1 if lo == hi else hi)
-                    if old_tsvs[j].is_valid
-                ]
-            if require_entire_interval and operation != _RESAMPLE_OP_PREVIOUS:
-                # ---------------------------------------------------------- #
-                # reduce the indices to those that start in the new interval #
-                # ---------------------------------------------------------- #
-                new_interval_start = (
-                    new_tsvs[i - 1].time
-                    if i > 0
-                    else (
-                        new_tsvs[0].time - (new_tsvs[1].time - new_tsvs[0].time)
-                        if len(new_tsvs) > 1
-                        else None
+        positions = np.flatnonzero(bounded)
+        lo = lo[positions]
+        hi = hi[positions]
+        exact = lo == hi
+        end = np.where(exact, hi + 1, hi)
+        start = np.zeros(len(positions), dtype=np.int64)
+        if operation == _RESAMPLE_OP_PREVIOUS:
+            start[1:] = np.where(hi[1:] == hi[:-1], hi[:-1] - 1, hi[:-1])
+            start = np.maximum(start, 0)
+            # -------------------------------------------- #
+            # last valid old index in each [start, end)    #
+            # -------------------------------------------- #
+            last_valid = np.maximum.accumulate(
+                np.where(valid, np.arange(len(valid)), -1)
+            )
+            last = np.where(end > 0, last_valid[np.maximum(end - 1, 0)], -1)
+            found = (last >= start) & (last >= 0)
+            source = np.where(exact, last - 1, last)
+            found &= source >= 0
+            return np.where(found, values[np.maximum(source, 0)], np.nan)
+        start[1:] = hi[:-1] + exact[:-1]
+        if require_entire_interval:
+            # ---------------------------------------------------------- #
+            # reduce the indices to those that start in the new interval #
+            # ---------------------------------------------------------- #
+            if len(new_times) > 1:
+                new_starts = np.concatenate(
+                    ([2 * new_times[0] - new_times[1]], new_times[:-1])
+                )[positions]
+                if len(old_times) > 1:
+                    old_starts = np.concatenate(
+                        ([2 * old_times[0] - old_times[1]], old_times[:-1])
                     )
+                    first = np.searchsorted(old_starts, new_starts, side="left")
+                else:
+                    first = np.ones(len(positions), dtype=np.int64)
+                start = np.maximum(start, first)
+            else:
+                start = end
+        nonempty = start < end
+        if operation == _RESAMPLE_OP_COUNT:
+            # ----------- #
+            # count valid #
+            # ----------- #
+            counts = np.concatenate(([0], np.cumsum(valid)))
+            return np.where(
+                nonempty,
+                counts[end] - counts[np.minimum(start, end)],
+                0,
+            ).astype(np.float64)
+        if operation in (_RESAMPLE_OP_MAXIMUM, _RESAMPLE_OP_MINIMUM):
+            # ------------------ #
+            # maximum or minimum #
+            # ------------------ #
+            new_values = np.full(len(positions), np.nan)
+            if nonempty.any():
+                mins, maxs = TimeSeries._window_extrema(
+                    np.where(valid, values, np.nan),
+                    start[nonempty],
+                    end[nonempty] - 1,
+                )
+                new_values[nonempty] = (
+                    maxs if operation == _RESAMPLE_OP_MAXIMUM else mins
+                )
+            return new_values
+        raise TimeSeriesException(
+            f"Unexpected discreet resample operation: {operation}"
+        )
+
+    def _resample_continuous_arrays(
+        self,
+        operation: str,
+        old_times: npt.NDArray[np.int64],
+        values: npt.NDArray[np.float64],
+        valid: npt.NDArray[np.bool_],
+        new_times: npt.NDArray[np.int64],
+        bounded: npt.NDArray[np.bool_],
+        lo_bounds: npt.NDArray[np.intp],
+        hi_bounds: npt.NDArray[np.intp],
+        is_regular: bool,
+        max_missing_percent: float,
+    ) -> npt.NDArray[np.float64]:
+        # ------------------------------------------------------------------ #
+        # continuous operations - returns the new values for the bounded new #
+        # times. Each new interval is made of the segments from the value    #
+        # interpolated at the previous new time through the old values in    #
+        # between to the value interpolated at the new time, and the sums    #
+        # over the old values come from prefix sums of segments              #
+        # ------------------------------------------------------------------ #
+        new_parameter, new_unit = self._continuous_resample_units(operation)
+        factor = (
+            UnitQuantity(1.0, new_unit).to(new_parameter.unit).magnitude
+            if new_parameter
+            else 1.0
+        )
+        is_inst = (
+            cast(ParameterType, self.parameter_type).get_raw_name() == "Instantaneous"
+        )
+        is_total = cast(ParameterType, self.parameter_type).get_raw_name() == "Total"
+        is_accum = (
+            cast(ParameterType, self.parameter_type).name == "INST-CUM"
+            if self.context == DSS
+            else is_inst and self.parameter.base_parameter == "Precip"
+        )
+        positions = np.flatnonzero(bounded)
+        if not len(positions):
+            return np.full(0, np.nan)
+        count = len(old_times)
+        lo = lo_bounds[positions]
+        hi = hi_bounds[positions]
+        times = new_times[positions]
+        # ------------------------------------------------------------------ #
+        # the new interval ending at each new time (the first one is assumed #
+        # to be the same as the second) and the old interval around it       #
+        # ------------------------------------------------------------------ #
+        previous_times = np.where(
+            positions > 0,
+            new_times[np.maximum(positions - 1, 0)],
+            2 * new_times[0] - new_times[1],
+        )
+        new_intervals = times - previous_times
+        max_missing_seconds = new_intervals / 1e9 * max_missing_percent / 100.0
+        old_intervals = np.where(
+            lo == hi,
+            np.where(
+                lo < count - 1,
+                old_times[np.minimum(lo + 1, count - 1)] - old_times[lo],
+                old_times[hi] - old_times[np.maximum(hi - 1, 0)],
+            ),
+            old_times[hi] - old_times[lo],
+        )
+        interpolated, lo, hi, missing = TimeSeries._resample_interpolation(
+            old_times,
+            values,
+            valid,
+            times,
+            lo,
+            hi,
+            max_missing_seconds,
+            is_inst,
+            is_total,
+            is_accum,
+        )
+        if operation == _RESAMPLE_OP_INTERPOLATE:
+            return interpolated
+        if is_total:
+            return self._resample_total_arrays(
+                operation,
+                old_times,
+                values,
+                valid,
+                new_times,
+                positions,
+                interpolated,
+                lo,
+                hi,
+                missing,
+                old_intervals,
+                new_intervals,
+                max_missing_seconds,
+                is_regular,
+                factor,
+            )
+        if operation == _RESAMPLE_OP_ACCUMULATE:
+            # ------------------------------------------ #
+            # differences of the interpolated end values #
+            # ------------------------------------------ #
+            new_values = np.full(len(positions), np.nan)
+            new_values[1:] = np.diff(interpolated)
+            if is_accum:
+                new_values[new_values < 0.0] = np.nan
+            return new_values
+        # ------------------------------------------------------------------ #
+        # the point that starts each new interval: the interpolated value at #
+        # the previous new time, or for the first new interval no value at   #
+        # the later of the previous new time and one old interval before the #
+        # first old time (the time before that is missing)                   #
+        # ------------------------------------------------------------------ #
+        is_valid = np.isfinite(interpolated)
+        first_start = max(previous_times[0], old_times[0] - old_intervals[0])
+        starts = np.append(first_start, times[:-1])
+        start_values = np.append(np.nan, interpolated[:-1])
+        start_valid = np.append(False, is_valid[:-1])
+        start_hi = np.append(0, hi[:-1])
+        missing[0] += first_start - previous_times[0]
+        # ------------------------------------------------------------------ #
+        # the old values strictly inside each new interval, from the old     #
+        # index the previous new time was interpolated to                    #
+        # ------------------------------------------------------------------ #
+        first = np.maximum(start_hi, np.searchsorted(old_times, starts, side="right"))
+        last = np.minimum(hi, np.searchsorted(old_times, times, side="left") - 1)
+        interior = first <= last
+        first = np.minimum(first, count - 1)
+        last = np.maximum(last, 0)
+        # ------------------------------------------------------------------ #
+        # prefix sums of the segments between consecutive old values (the    #
+        # trapezoid for instantaneous values, otherwise the value at the end #
+        # of the segment), so prefix[j] covers the segments ending at 1..j   #
+        # ------------------------------------------------------------------ #
+        seconds = np.diff(old_times) / 1e9
+        if is_inst:
+            segment_valid = valid[:-1] & valid[1:]
+            segment_values = (values[:-1] + values[1:]) / 2
+        else:
+            segment_valid = valid[1:]
+            segment_values = values[1:]
+        prefix_areas = np.concatenate(
+            ([0.0], np.cumsum(np.where(segment_valid, segment_values * seconds, 0.0)))
+        )
+        prefix_seconds = np.concatenate(
+            ([0.0], np.cumsum(np.where(segment_valid, seconds, 0.0)))
+        )
+        prefix_missing = np.concatenate(
+            ([0.0], np.cumsum(np.where(segment_valid, 0.0, seconds)))
+        )
+        # ------------------------------------------------------------------ #
+        # the segments from the start to the first old value (or to the new  #
+        # time if there are none) and from the last old value to the new time #
+        # ------------------------------------------------------------------ #
+        head_ends = np.where(interior, old_times[first], times)
+        head_seconds = (head_ends - starts) / 1e9
+        tail_seconds = (times - old_times[last]) / 1e9
+        head_end_values = np.where(interior, values[first], interpolated)
+        head_end_valid = np.where(interior, valid[first], is_valid)
+        if is_inst:
+            head_valid = start_valid & head_end_valid
+            head_values = (start_values + head_end_values) / 2
+            tail_valid = valid[last] & is_valid
+            tail_values = (values[last] + interpolated) / 2
+        else:
+            head_valid = head_end_valid
+            head_values = head_end_values
+            tail_valid = is_valid
+            tail_values = interpolated
+        areas = np.where(head_valid, head_values * head_seconds, 0.0) + np.where(
+            interior,
+            prefix_areas[last]
+            - prefix_areas[first]
+            + np.where(tail_valid, tail_values * tail_seconds, 0.0),
+            0.0,
+        )
+        valid_seconds = np.where(head_valid, head_seconds, 0.0) + np.where(
+            interior,
+            prefix_seconds[last]
+            - prefix_seconds[first]
+            + np.where(tail_valid, tail_seconds, 0.0),
+            0.0,
+        )
+        missing_seconds = (
+            missing / 1e9
+            + np.where(head_valid, 0.0, head_seconds)
+            + np.where(
+                interior,
+                prefix_missing[last]
+                - prefix_missing[first]
+                + np.where(tail_valid, 0.0, tail_seconds),
+                0.0,
+            )
+        )
+        # ------------------------------------------------------------------ #
+        # a new interval that is a single old interval ending on a valid old #
+        # value uses that value. The interval isn't single if it includes    #
+        # time before the first old interval or starts inside an old interval #
+        # with a valid interpolated value                                    #
+        # ------------------------------------------------------------------ #
+        segments = np.where(interior, last - first + 2, 1)
+        segments[0] += first_start > previous_times[0]
+        previous_lo = np.append(-1, lo[:-1])
+        partial = (
+            (previous_lo >= 0)
+            & (old_times[np.maximum(previous_lo, 0)] < starts)
+            & start_valid
+        )
+        last_seconds = np.where(interior, times - old_times[last], times - starts)
+        single = (
+            (lo == hi)
+            & (segments == 1)
+            & ~partial
+            & (last_seconds == old_intervals)
+            & (old_intervals == new_intervals)
+        )
+        if is_inst:
+            single_values = np.where(
+                hi > 0, (values[np.maximum(hi - 1, 0)] + values[hi]) / 2, values[hi]
+            )
+        else:
+            single_values = values[hi]
+        if operation == _RESAMPLE_OP_AVERAGE:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                new_values = np.where(
+                    valid_seconds > 0.0, areas / valid_seconds, np.nan
                 )
-                if not new_interval_start:
-                    indices = []
+        else:
+            new_values = areas
+            single_values = single_values * (new_intervals / 1e9)
+        new_values = np.where(
+            single,
+            single_values,
+            np.where(missing_seconds > max_missing_seconds, np.nan, new_values),
+        )
+        return cast(npt.NDArray[np.float64], new_values * factor)
+
+    @staticmethod
+    def _resample_interpolation(
+        old_times: npt.NDArray[np.int64],
+        values: npt.NDArray[np.float64],
+        valid: npt.NDArray[np.bool_],
+        new_times: npt.NDArray[np.int64],
+        lo: npt.NDArray[np.intp],
+        hi: npt.NDArray[np.intp],
+        max_missing_seconds: npt.NDArray[np.float64],
+        is_inst: bool,
+        is_total: bool,
+        is_accum: bool,
+    ) -> tuple[
+        npt.NDArray[np.float64],
+        npt.NDArray[np.intp],
+        npt.NDArray[np.intp],
+        npt.NDArray[np.int64],
+    ]:
+        # ------------------------------------------------------------------ #
+        # the values interpolated at the new times from the old values at or #
+        # around lo and hi, skipping invalid values at or after hi (an       #
+        # invalid value at lo gives NaN). Returns the values (NaN if they    #
+        # can't be interpolated), lo (-1 if invalid), hi (the next valid     #
+        # index, or at most the last index), and the skipped nanoseconds     #
+        # ------------------------------------------------------------------ #
+        count = len(old_times)
+        last = count - 1
+        steps = np.diff(old_times)
+        forward = np.append(steps, steps[-1:]) if count > 1 else np.zeros(1, np.int64)
+        backward = np.append(forward[:1], steps)
+        next_valid = np.minimum.accumulate(
+            np.where(valid, np.arange(count), count)[::-1]
+        )[::-1]
+        lo_valid = valid[lo]
+        following = next_valid[hi]
+        found = following < count
+        following = np.minimum(following, last)
+        missing = np.where(
+            lo_valid,
+            np.where(
+                found,
+                old_times[following] - old_times[hi],
+                old_times[last] - old_times[hi] + backward[last],
+            ),
+            backward[lo],
+        )
+        usable = lo_valid & found & (missing / 1e9 <= max_missing_seconds)
+        if is_accum:
+            usable &= ~(values[following] < values[lo])
+        new_values = values[following]
+        if is_total:
+            # ------------------------------------------------------------- #
+            # a total inside an old interval is its fraction of the next    #
+            # total                                                         #
+            # ------------------------------------------------------------- #
+            span = old_times[following] - old_times[lo]
+            fraction = (new_times - old_times[lo]) / np.where(span > 0, span, 1)
+            new_values = np.where(
+                (lo != following)
+                & (old_times[lo] <= new_times)
+                & (new_times < old_times[following]),
+                new_values * fraction,
+                np.where(
+                    lo == following,
+                    new_values,
+                    values[lo] + fraction * (new_values - values[lo]),
+                ),
+            )
+        elif is_inst and valid.any():
+            # ---------------------------------------------------------- #
+            # linear between the valid values on either side (times are #
+            # relative to the first time to keep nanosecond precision)  #
+            # ---------------------------------------------------------- #
+            new_values = np.interp(
+                new_times - old_times[0],
+                old_times[valid] - old_times[0],
+                values[valid],
+            )
+        return (
+            np.where(usable, new_values, np.nan),
+            np.where(lo_valid, lo, -1),
+            np.where(lo_valid, following, hi),
+            missing,
+        )
+
+    def _resample_total_arrays(
+        self,
+        operation: str,
+        old_times: npt.NDArray[np.int64],
+        values: npt.NDArray[np.float64],
+        valid: npt.NDArray[np.bool_],
+        new_times: npt.NDArray[np.int64],
+        positions: npt.NDArray[np.intp],
+        interpolated: npt.NDArray[np.float64],
+        lo_adjusted: npt.NDArray[np.intp],
+        hi_adjusted: npt.NDArray[np.intp],
+        missing: npt.NDArray[np.int64],
+        old_intervals: npt.NDArray[np.int64],
+        new_intervals: npt.NDArray[np.int64],
+        max_missing_seconds: npt.NDArray[np.float64],
+        is_regular: bool,
+        factor: float,
+    ) -> npt.NDArray[np.float64]:
+        # ------------------------------------------------------------------ #
+        # the new values of a Total time series for the bounded new times    #
+        # from the interpolated values. Totals are split into partial first  #
+        # components and averaged against the last valid value of the       #
+        # previous interval, so the intervals are walked in order            #
+        # ------------------------------------------------------------------ #
+        t: list[int] = old_times.tolist()
+        v: list[float] = values.tolist()
+        ok: list[bool] = valid.tolist()
+        nt: list[int] = new_times.tolist()
+        len_old = len(t)
+        new_values = np.full(len(positions), np.nan)
+        prev_lo: Optional[int] = None
+        prev_hi = 0
+        lo = hi = 0
+        interpolated_point: list[Any] = []
+        prev_interpolated: Optional[list[Any]] = None
+        last_valid = 0.0
+        seconds = math.nan
+        for k, i in enumerate(positions.tolist()):
+            new_interval_seconds = int(new_intervals[k]) / 1e9
+            old_interval_seconds = int(old_intervals[k]) / 1e9
+            old_interval = int(old_intervals[k])
+            new_val = math.nan
+            if k:
+                prev_lo, prev_hi = lo, hi
+                prev_interpolated = interpolated_point
+            lo, hi = int(lo_adjusted[k]), int(hi_adjusted[k])
+            missing_seconds = int(missing[k]) / 1e9
+            interpolated_value = float(interpolated[k])
+            interpolated_point = [
+                nt[i],
+                interpolated_value,
+                math.isfinite(interpolated_value),
+            ]
+            # ---------------------------------- #
+            # gather the contributing components #
+            # ---------------------------------- #
+            intvl: list[list[Any]] = []
+            partial_first_component = False
+            is_first = prev_interpolated is None
+            if is_first:
+                prev_new_time = nt[0] - (nt[1] - nt[0]) if i == 0 else nt[i - 1]
+                prev_interpolated = [prev_new_time, math.nan, False]
+                prev_hi = 0
+            assert prev_interpolated is not None
+            if prev_interpolated[0] < t[hi]:
+                intvl.append(prev_interpolated)
+                if is_first:
+                    if operation == _RESAMPLE_OP_ACCUMULATE:
+                        prev_new_time = intvl[0][0]
+                        while prev_new_time + old_interval < t[0]:
+                            prev_new_time = prev_new_time + old_interval
+                        if prev_new_time > intvl[0][0]:
+                            intvl.append([prev_new_time, math.nan, False])
+                    elif t[0] - old_interval > prev_interpolated[0]:
+                        intvl.append([t[0] - old_interval, math.nan, False])
+                    intvl.sort(key=lambda point: cast(int, point[0]))
+                    if is_regular:
+                        first_fraction = True
+                        for point in intvl:
+                            if math.isnan(point[1]) and point[0] > t[0] - old_interval:
+                                fraction = 1.0 - ((t[0] - point[0]) / 1e9) / (
+                                    (t[1] - t[0]) / 1e9
+                                )
+                                if first_fraction:
+                                    first_fraction = False
+                                    if 0.0 <= fraction <= 1.0:
+                                        partial_first_component = True
+                                point[1] = v[0] * fraction
+                                point[2] = math.isfinite(point[1])
+                if (
+                    t[prev_lo] if prev_lo is not None else t[lo] - old_interval
+                ) < prev_interpolated[0]:
+                    partial_first_component = True
+            for j in range(prev_hi, hi + 1):
+                if prev_interpolated[0] < t[j] < interpolated_point[0]:
+                    intvl.append([t[j], v[j], ok[j]])
+            if interpolated_point[0] > intvl[-1][0]:
+                intvl.append(interpolated_point)
+            if partial_first_component and (
+                math.isfinite(intvl[0][1]) and intvl[1][1] < intvl[0][1]
+            ):
+                intvl[0][1] = 0.0
+                intvl[0][2] = True
+            # --------------------------- #
+            # compute the resampled value #
+            # --------------------------- #
+            vals: list[float] = []
+            value_seconds: list[float] = []
+            invalid: list[bool] = []
+            if partial_first_component and not math.isnan(intvl[0][1]):
+                vals.append(intvl[0][1])
+                value_seconds.append(0)
+                invalid.append(False)
+            for j in range(1, len(intvl)):
+                seconds = (intvl[j][0] - intvl[j - 1][0]) / 1e9
+                is_invalid = False
+                if operation == _RESAMPLE_OP_ACCUMULATE:
+                    if not intvl[j][2]:
+                        missing_seconds += seconds
+                        is_invalid = True
+                    if new_interval_seconds < old_interval_seconds:
+                        value = v[hi]
+                    else:
+                        value = intvl[j][1]
+                elif j == 1 and (
+                    partial_first_component
+                    or (
+                        operation == _RESAMPLE_OP_AVERAGE
+                        and new_interval_seconds > old_interval_seconds
+                        and (intvl[1][0] - intvl[0][0]) / 1e9 < old_interval_seconds
+                    )
+                ):
+                    vals.append(intvl[0][1])
+                    value_seconds.append(0)
+                    invalid.append(not intvl[0][2])
+                    value = intvl[1][1]
+                    if not intvl[1][2]:
+                        missing_seconds += seconds
+                        is_invalid = True
                 else:
-                    for k in range(len(indices)):
-                        old_interval_start = (
-                            old_tsvs[indices[k] - 1].time
-                            if indices[k] > 0
-                            else (
-                                old_tsvs[0].time - (old_tsvs[1].time - old_tsvs[0].time)
-                                if len(old_tsvs) > 1
-                                else None
-                            )
+                    if not intvl[j][2]:
+                        missing_seconds += seconds
+                        is_invalid = True
+                    value = intvl[j][1]
+                    if operation != _RESAMPLE_OP_AVERAGE:
+                        value /= 2
+                vals.append(value)
+                value_seconds.append(seconds)
+                invalid.append(is_invalid)
+            single = (
+                lo == hi
+                and len(vals) < 2
+                and seconds == old_interval_seconds == new_interval_seconds
+            )
+            if single:
+                if operation == _RESAMPLE_OP_ACCUMULATE:
+                    new_val = v[hi]
+                elif operation == _RESAMPLE_OP_AVERAGE:
+                    new_val = v[hi] / 2
+                else:
+                    new_val = v[hi] * new_interval_seconds
+            elif missing_seconds > max_missing_seconds[k]:
+                continue
+            elif operation == _RESAMPLE_OP_ACCUMULATE:
+                # ----------------- #
+                # add up components #
+                # ----------------- #
+                if len(intvl) == 2:
+                    if not intvl[1][2]:
+                        new_val = math.nan
+                    elif not intvl[0][2]:
+                        new_val = intvl[1][1] / (
+                            old_interval_seconds / new_interval_seconds
+                        )
+                    else:
+                        j = int(np.searchsorted(old_times, intvl[1][0]))
+                        new_val = (v[j] if j < len_old else intvl[1][1]) / (
+                            old_interval_seconds / new_interval_seconds
                         )
-                        if (
-                            old_interval_start is not None
-                            and old_interval_start >= new_interval_start
-                        ):
-                            indices = indices[k:]
-                            break
+                elif len(intvl) == 3:
+                    new_val = math.nan
+                    if partial_first_component:
+                        if intvl[0][2] and intvl[1][2]:
+                            new_val = intvl[1][1] - intvl[0][1]
+                            if intvl[2][2]:
+                                new_val += intvl[2][1]
+                        else:
+                            new_val = intvl[2][1]
                     else:
-                        indices = []
-            if operation == _RESAMPLE_OP_COUNT:
-                # ----------- #
-                # count valid #
-                # ----------- #
-                new_val = float(len(indices))
-            elif operation in (_RESAMPLE_OP_MAXIMUM, _RESAMPLE_OP_MINIMUM):
-                # ------------------ #
-                # maximum or minimum #
-                # ------------------ #
-                vals = [old_tsvs[j].value.magnitude for j in indices]
-                func = max if operation == _RESAMPLE_OP_MAXIMUM else min
-                new_val = func(vals) if vals else math.nan
-            elif operation == _RESAMPLE_OP_PREVIOUS:
-                # -------- #
-                # previous #
-                # -------- #
-                if hi == lo:
-                    new_val = (
-                        old_tsvs[indices[-1] - 1].value.magnitude
-                        if indices and indices[-1] != 0
-                        else math.nan
+                        new_val = intvl[2][1]
+                elif partial_first_component:
+                    new_val = 0 if invalid[0] or invalid[1] else vals[1] - vals[0]
+                    new_val += sum(
+                        [vals[j] for j in range(2, len(vals)) if not invalid[j]]
                     )
                 else:
-                    new_val = (
-                        old_tsvs[indices[-1]].value.magnitude if indices else math.nan
-                    )
+                    new_val = sum([vals[j] for j in range(len(vals)) if not invalid[j]])
+            elif operation == _RESAMPLE_OP_AVERAGE:
+                new_val = 0.0
+                for j in range(len(vals)):
+                    if invalid[j]:
+                        continue
+                    if (vals[j] < last_valid) or (
+                        value_seconds[j] == old_interval_seconds
+                    ):
+                        new_val += vals[j] / 2 * value_seconds[j]
+                    else:
+                        if j == 0:
+                            last_valid = vals[j]
+                            continue
+                        new_val += (vals[j - 1] + vals[j]) / 2 * value_seconds[j]
+                    last_valid = vals[j]
+                new_val /= sum(
+                    [
+                        value_seconds[j]
+                        for j in range(len(value_seconds))
+                        if not invalid[j]
+                    ]
+                )
             else:
-                raise TimeSeriesException(
-                    f"Unexpected discreet resample operation: {operation}"
+                new_val = sum(
+                    [
+                        vals[j] * value_seconds[j]
+                        for j in range(len(vals))
+                        if not invalid[j]
+                    ]
                 )
-            new_tsvs[i].value = UnitQuantity(new_val, self.unit)
-            prev_lo = lo
-            prev_hi = hi
+            new_values[k] = new_val * factor
+        return new_values
+
+    def _resample_values(
+        self,
+        operation: str,
+        old_times: npt.NDArray[np.int64],
+        values: npt.NDArray[np.float64],
+        valid: npt.NDArray[np.bool_],
+        new_times: npt.NDArray[np.int64],
+        bounds: tuple[
+            npt.NDArray[np.intp],
+            npt.NDArray[np.intp],
+            npt.NDArray[np.bool_],
+            npt.NDArray[np.bool_],
+        ],
+        before_value: float,
+        after_value: float,
+        is_regular: bool,
+        max_missing_percent: float,
+        entire_interval: Optional[bool],
+    ) -> npt.NDArray[np.float64]:
+        # ------------------------------------------------------------------- #
+        # array resample engine - returns the values at the new times from    #
+        # int64 nanosecond times, float64 values, and the validity mask, with #
+        # the bounds from _resample_bounds (shared by all operations)         #
+        # ------------------------------------------------------------------- #
+        lo, hi, before, after = bounds
+        new_values = np.full(len(new_times), np.nan)
+        for mask, fill_value, index in (
+            (before, before_value, 0),
+            (after, after_value, -1),
+        ):
+            if not mask.any():
+                continue
+            if math.isfinite(fill_value) or math.isnan(fill_value):
+                new_values[mask] = fill_value
+            elif fill_value == -math.inf:
+                # _RESAMPLE_FIRST or _RESAMPLE_LAST
+                new_values[mask] = values[index]
+        bounded = ~(before | after)
+        if _resample_operations[operation]:
+            new_values[bounded] = self._resample_discreet_arrays(
+                operation,
+                old_times,
+                values,
+                valid,
+                new_times,
+                bounded,
+                lo,
+                hi,
+                entire_interval,
+            )
+        else:
+            new_values[bounded] = self._resample_continuous_arrays(
+                operation,
+                old_times,
+                values,
+                valid,
+                new_times,
+                bounded,
+                lo,
+                hi,
+                is_regular,
+                max_missing_percent,
+            )
+        return new_values
+
+    @staticmethod
+    def _window_extrema(
+        values: npt.NDArray[np.float64],
+        first: npt.NDArray[np.intp],
+        last: npt.NDArray[np.intp],
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        # ----------------------------------------------------------------- #
+        # NaN-ignoring minimum and maximum of values[first[i]:last[i] + 1]  #
+        # for each i. Uses a sparse table built one level at a time so only #
+        # two levels of the table (O(n) memory) are ever held, and each     #
+        # window is answered from the level that covers half its length     #
+        # ----------------------------------------------------------------- #
+        length = last - first + 1
+        level = np.floor(np.log2(length)).astype(np.int64)
+        mins = np.full(len(first), np.nan)
+        maxs = np.full(len(first), np.nan)
+        level_min = values
+        level_max = values
+        width = 1
+        for k in range(int(level.max()) + 1):
+            if k:
+                level_min = np.fmin(level_min[:-width], level_min[width:])
+                level_max = np.fmax(level_max[:-width], level_max[width:])
+                width *= 2
+            sel = level == k
+            if sel.any():
+                lo = first[sel]
+                hi = last[sel] - width + 1
+                mins[sel] = np.fmin(level_min[lo], level_min[hi])
+                maxs[sel] = np.fmax(level_max[lo], level_max[hi])
+        return mins, maxs
 
     @staticmethod
     def _round_off(v: float, precision: int, tens_place: int) -> float:
@@ -2963,31 +4306,38 @@ class TimeSeries:
         return round(float(v3), 10)
 
     @staticmethod
-    def _screen_with_constant_value(
-        times: list[HecTime],
-        values: list[float],
-        qualities: Optional[list[int]],
+    def _screen_with_constant_value_vectorized(
+        times: npt.NDArray[np.int64],
+        values: npt.NDArray[np.float64],
+        qualities: Optional[npt.NDArray[np.int64]],
         duration: Duration,
         missing_limit: float,
         reject_limit: float,
         question_limit: float,
         min_threshold: float,
         percent_valid_required: float,
-    ) -> list[int]:
+    ) -> npt.NDArray[np.int64]:
+        # ------------------------------------------------------------------ #
+        # the qualities set by screen_with_constant_value() for each value;  #
+        # times are int64 nanoseconds                                        #
+        # ------------------------------------------------------------------ #
         total_count = len(times)
         if total_count < 2:
             raise TimeSeriesException("Operation requires a time series of length > 1")
-        if qualities is None:
-            qualities_in = total_count * [0]
-        else:
-            qualities_in = qualities
-        if len(values) != total_count:
+        t = np.asarray(times, dtype=np.int64)
+        v = np.asarray(values, dtype=np.float64)
+        q = (
+            np.zeros(total_count, dtype=np.int64)
+            if qualities is None
+            else np.asarray(qualities, dtype=np.int64)
+        )
+        if len(v) != total_count:
             raise TimeSeriesException(
-                f"Lists of times and values must be of same length, got {total_count} and {len(values)}"
+                f"Lists of times and values must be of same length, got {total_count} and {len(v)}"
             )
-        if len(qualities_in) != total_count:
+        if len(q) != total_count:
             raise TimeSeriesException(
-                f"Lists of times and qualities must be of same length, got {total_count} and {len(qualities_in)}"
+                f"Lists of times and qualities must be of same length, got {total_count} and {len(q)}"
             )
         if (
             not math.isnan(percent_valid_required)
@@ -2999,7 +4349,7 @@ class TimeSeries:
         # ----------------- #
         # set the variables #
         # ----------------- #
-        qualities_out = total_count * [0]
+        qualities_out = np.zeros(total_count, dtype=np.int64)
         test_missing = not math.isnan(missing_limit)
         test_reject = not math.isnan(reject_limit)
         test_question = not math.isnan(question_limit)
@@ -3017,6 +4367,8 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Reject limit must be less than Question limit"
                 )
+        if not (test_missing or test_reject or test_question):
+            return qualities_out
         quality_text = {
             "okay": "Screened Okay No_Range Original None None None Unprotected",
             "missing": "Screened Missing No_Range Modified Automatic Missing Duration_Value Unprotected",
@@ -3027,72 +4379,62 @@ class TimeSeries:
         missing_code = Quality(quality_text["missing"].split()).code
         question_code = Quality(quality_text["question"].split()).code
         reject_code = Quality(quality_text["reject"].split()).code
-        # ---------------- #
-        # do the screening #
-        # ---------------- #
-        for last in range(1, total_count):
-            # --------------------------- #
-            # don't screen invalid values #
-            # --------------------------- #
-            if (
-                math.isnan(values[last])
-                or math.isinf(values[last])
-                or Quality(qualities_in[last]).score == 0
-            ):
-                continue
-            if (
-                values[last] < min_threshold
-            ):  # always False if min_threshold is math.nan:
-                continue
-            # ---------------------------------------------------------------------------------------------- #
-            # get the times that contribute to the accumulation at this time step for the specified duration #
-            # ---------------------------------------------------------------------------------------------- #
-            for first in range(last + 1)[::-1]:
-                minutes = (
-                    cast(TimeSpan, (times[last] - times[first])).total_seconds() / 60
-                )
-                if minutes >= duration.minutes:
-                    break
-            if minutes < duration.minutes:
-                continue
-            span = range(first, last + 1)
-            # ---------------------------------- #
-            # verify we have enough valid values #
-            # ---------------------------------- #
-            valid = [
-                values[i]
-                for i in span
-                if not math.isnan(values[i])
-                and not math.isinf(values[i])
-                and Quality(qualities_in[i]).score > 0
-            ]
-            if (
-                100.0 * len(valid) / len(span) < percent_valid_required
-            ):  # will always be False with math.nan
-                continue
-            # ---------------------------------- #
-            # get the max change in the duration #
-            # ---------------------------------- #
-            max_change = max(valid) - min(valid)
-            # ------------------------- #
-            # set the retuned qualities #
-            # ------------------------- #
-            if test_missing and max_change < missing_limit:
-                qualities_out[last] = missing_code
-            elif test_reject and max_change < reject_limit:
-                qualities_out[last] = reject_code
-            elif test_question and max_change < question_limit:
-                qualities_out[last] = question_code
-            elif test_missing or test_reject or test_question:
-                qualities_out[last] = okay_code
+        # ------------------------------------------------------------------- #
+        # find the first position of each duration window with a single       #
+        # binary search: the last time at least the duration before each time #
+        # ------------------------------------------------------------------- #
+        valid = ~TimeSeries._unusable_mask(v, q)
+        duration_ns = np.int64(duration.minutes) * 60_000_000_000
+        first = np.searchsorted(t, t - duration_ns, side="right") - 1
+        candidates = valid & (first >= 0)
+        candidates[0] = False
+        with np.errstate(invalid="ignore"):
+            candidates &= ~(v < min_threshold)  # always False if min_threshold is nan
+        last = np.nonzero(candidates)[0]
+        if not len(last):
+            return qualities_out
+        first = first[last]
+        # ---------------------------------- #
+        # verify we have enough valid values #
+        # ---------------------------------- #
+        valid_count = np.concatenate(([0], np.cumsum(valid)))
+        span_count = last - first + 1
+        percent_valid = (
+            100.0 * (valid_count[last + 1] - valid_count[first]) / span_count
+        )
+        keep = ~(percent_valid < percent_valid_required)
+        last, first = last[keep], first[keep]
+        if not len(last):
+            return qualities_out
+        # ---------------------------------- #
+        # get the max change in the duration #
+        # ---------------------------------- #
+        valid_values = np.where(valid, v, np.nan)
+        window_min, window_max = TimeSeries._window_extrema(valid_values, first, last)
+        max_change = window_max - window_min
+        # ------------------------- #
+        # set the retuned qualities #
+        # ------------------------- #
+        conditions = []
+        codes = []
+        if test_missing:
+            conditions.append(max_change < missing_limit)
+            codes.append(missing_code)
+        if test_reject:
+            conditions.append(max_change < reject_limit)
+            codes.append(reject_code)
+        if test_question:
+            conditions.append(max_change < question_limit)
+            codes.append(question_code)
+        qualities_out[last] = np.select(conditions, codes, default=okay_code)
 
         return qualities_out
 
     @staticmethod
-    def _screen_with_duration_magnitude(
-        times: list[HecTime],
-        values: list[float],
-        qualities: Optional[list[int]],
+    def _screen_with_duration_magnitude_vectorized(
+        times: npt.NDArray[np.int64],
+        values: npt.NDArray[np.float64],
+        qualities: Optional[npt.NDArray[np.int64]],
         duration: Duration,
         min_missing_limit: float,
         min_reject_limit: float,
@@ -3101,21 +4443,28 @@ class TimeSeries:
         max_reject_limit: float,
         max_missing_limit: float,
         percent_valid_required: float,
-    ) -> list[int]:
+    ) -> npt.NDArray[np.int64]:
+        # ------------------------------------------------------------------ #
+        # the qualities set by screen_with_duration_magnitude() for each     #
+        # value; times are int64 nanoseconds                                 #
+        # ------------------------------------------------------------------ #
         total_count = len(times)
         if total_count < 2:
             raise TimeSeriesException("Operation requires a time series of length > 1")
-        if qualities is None:
-            qualities_in = total_count * [0]
-        else:
-            qualities_in = qualities
-        if len(values) != total_count:
+        t = np.asarray(times, dtype=np.int64)
+        v = np.asarray(values, dtype=np.float64)
+        q = (
+            np.zeros(total_count, dtype=np.int64)
+            if qualities is None
+            else np.asarray(qualities, dtype=np.int64)
+        )
+        if len(v) != total_count:
             raise TimeSeriesException(
-                f"Lists of times and values must be of same length, got {total_count} and {len(values)}"
+                f"Lists of times and values must be of same length, got {total_count} and {len(v)}"
             )
-        if len(qualities_in) != total_count:
+        if len(q) != total_count:
             raise TimeSeriesException(
-                f"Lists of times and qualities must be of same length, got {total_count} and {len(qualities_in)}"
+                f"Lists of times and qualities must be of same length, got {total_count} and {len(q)}"
             )
         if (
             not math.isnan(percent_valid_required)
@@ -3131,13 +4480,22 @@ class TimeSeries:
         # ----------------- #
         # set the variables #
         # ----------------- #
-        qualities_out = total_count * [0]
+        qualities_out = np.zeros(total_count, dtype=np.int64)
         test_min_missing = not math.isnan(min_missing_limit)
         test_min_reject = not math.isnan(min_reject_limit)
         test_min_question = not math.isnan(min_question_limit)
         test_max_question = not math.isnan(max_question_limit)
         test_max_reject = not math.isnan(max_reject_limit)
         test_max_missing = not math.isnan(max_missing_limit)
+        if not (
+            test_min_missing
+            or test_max_missing
+            or test_min_reject
+            or test_max_reject
+            or test_min_question
+            or test_max_question
+        ):
+            return qualities_out
         quality_text = {
             "okay": "Screened Okay No_Range Original None None None Unprotected",
             "missing": "Screened Missing No_Range Modified Automatic Missing Duration_Value Unprotected",
@@ -3148,114 +4506,69 @@ class TimeSeries:
         missing_code = Quality(quality_text["missing"].split()).code
         question_code = Quality(quality_text["question"].split()).code
         reject_code = Quality(quality_text["reject"].split()).code
-        base_time = times[0] - (
-            times[1] - times[0]
-        )  # assume the first interval is equal to the second
+        # ------------------------------------------------------------------- #
+        # the beginning of each value's interval, assuming the first interval #
+        # is equal to the second                                              #
+        # ------------------------------------------------------------------- #
+        begin = np.concatenate(([t[0] - (t[1] - t[0])], t[:-1]))
+        # ---------------------------------------------------------------------------- #
+        # get the first value that contributes to the accumulation at each time step - #
+        # the last one whose interval begins at least the duration before the time     #
+        # ---------------------------------------------------------------------------- #
+        valid = ~TimeSeries._unusable_mask(v, q)
+        duration_ns = np.int64(duration.minutes) * 60_000_000_000
+        first = np.searchsorted(begin, t - duration_ns, side="right") - 1
+        last = np.nonzero(valid & (first >= 0))[0]
+        if not len(last):
+            return qualities_out
+        first = np.minimum(first[last], last)
+        # ----------------------------------------------- #
+        # verify we have enough valid contributing values #
+        # ----------------------------------------------- #
+        valid_count = np.concatenate(([0], np.cumsum(valid)))
+        span_count = last - first + 1
+        percent_valid = (
+            100.0 * (valid_count[last + 1] - valid_count[first]) / span_count
+        )
+        keep = (first == last) | ~(percent_valid < percent_valid_required)
+        last, first = last[keep], first[keep]
+        if not len(last):
+            return qualities_out
+        # ---------------------------------------------------------------- #
+        # sum the valid contributions from the prefix sums of valid values #
+        # ---------------------------------------------------------------- #
+        contrib = np.where(valid, v, 0.0)
+        running_total = np.concatenate(([0.0], np.cumsum(contrib)))
+        total = running_total[last + 1] - running_total[first]
+        # ----------------------------------------------------------- #
+        # adjust for accumulations that exceed the specified duration #
+        # ----------------------------------------------------------- #
+        minutes = (t[last] - begin[first]) / 60_000_000_000
+        extra_minutes = minutes % duration.minutes
+        first_interval = (t[first] - begin[first]) / 60_000_000_000
+        adjust = extra_minutes != 0
+        total[adjust] -= (
+            contrib[first[adjust]] * extra_minutes[adjust] / first_interval[adjust]
+        )
 
-        # ---------------- #
-        # do the screening #
-        # ---------------- #
-        for last in range(total_count):
-            # --------------------------- #
-            # don't screen invalid values #
-            # --------------------------- #
-            if (
-                math.isnan(values[last])
-                or math.isinf(values[last])
-                or Quality(qualities_in[last]).score == 0
-            ):
-                continue
-            # ---------------------------------------------------------------------------------------------- #
-            # get the times that contribute to the accumulation at this time step for the specified duration #
-            # ---------------------------------------------------------------------------------------------- #
-            if last == 0:
-                # ------------------------------------------------ #
-                # assume the first interval is equal to the second #
-                # ------------------------------------------------ #
-                first = 0
-                minutes = cast(TimeSpan, (times[last] - base_time)).total_seconds() / 60
-            else:
-                for first in range(last + 1)[::-1]:
-                    first_time = base_time if first == 0 else times[first - 1]
-                    minutes = (
-                        cast(TimeSpan, (times[last] - first_time)).total_seconds() / 60
-                    )
-                    if minutes >= duration.minutes:
-                        break
-            if minutes < duration.minutes:
-                continue
-            span = range(first, last + 1)
-            if first == last:
-                # ------------------ #
-                # single valid value #
-                # ------------------ #
-                total = values[last]
-            else:
-                # ----------------------------------------------- #
-                # verify we have enough valid contributing values #
-                # ----------------------------------------------- #
-                valid = [
-                    i
-                    for i in span
-                    if not math.isnan(values[i])
-                    and not math.isinf(values[i])
-                    and Quality(qualities_in[i]).score > 0
-                ]
-                if (
-                    100.0 * len(valid) / len(span) < percent_valid_required
-                ):  # will always be False with math.nan
-                    continue
-                # -------------------------------------------------- #
-                # enumerate the contributions so we can adjust later #
-                # -------------------------------------------------- #
-                contrib = [
-                    (values[i], 0)[
-                        bool(
-                            math.isnan(values[i])
-                            or math.isinf(values[i])
-                            or Quality(qualities_in[i]).score == 0
-                        )
-                    ]
-                    for i in span
-                ]
-                total = sum(contrib)
-            extra_minutes = minutes % duration.minutes
-            # ----------------------------------------------------------- #
-            # adjust for accumulations that exceed the specified duration #
-            # ----------------------------------------------------------- #
-            if extra_minutes:
-                # ----------------------------------------------------------- #
-                # take all of the extra out of the first value's contribution #
-                # ----------------------------------------------------------- #
-                first_time = base_time if first == 0 else times[first - 1]
-                first_interval = (
-                    cast(TimeSpan, (times[first] - first_time)).total_seconds() / 60
-                )
-                total -= contrib[0] * float(extra_minutes) / first_interval
-            # ------------------------- #
-            # set the retuned qualities #
-            # ------------------------- #
-            if (test_min_missing and total < min_missing_limit) or (
-                test_max_missing and total > max_missing_limit
-            ):
-                qualities_out[last] = missing_code
-            elif (test_min_reject and total < min_reject_limit) or (
-                test_max_reject and total > max_reject_limit
-            ):
-                qualities_out[last] = reject_code
-            elif (test_min_question and total < min_question_limit) or (
-                test_max_question and total > max_question_limit
-            ):
-                qualities_out[last] = question_code
-            elif (
-                test_min_missing
-                or test_max_missing
-                or test_min_reject
-                or test_max_reject
-                or test_min_question
-                or test_max_question
-            ):
-                qualities_out[last] = okay_code
+        # ------------------------- #
+        # set the retuned qualities #
+        # ------------------------- #
+        def outside(min_limit: float, max_limit: float) -> npt.NDArray[np.bool_]:
+            # comparisons are always False for limits of math.nan
+            return cast(
+                npt.NDArray[np.bool_], (total < min_limit) | (total > max_limit)
+            )
+
+        qualities_out[last] = np.select(
+            [
+                outside(min_missing_limit, max_missing_limit),
+                outside(min_reject_limit, max_reject_limit),
+                outside(min_question_limit, max_question_limit),
+            ],
+            [missing_code, reject_code, question_code],
+            default=okay_code,
+        )
 
         return qualities_out
 
@@ -3273,16 +4586,209 @@ class TimeSeries:
         )
 
     @staticmethod
-    def _unProtected_indices(df: pd.DataFrame) -> list[np.datetime64]:
+    def _unProtected_indices(df: pd.DataFrame) -> list[np.datetime64]:
+        return cast(
+            list[np.datetime64],
+            df[
+                (
+                    df["quality"].astype("int64")
+                    & 0b1000_0000_0000_0000_0000_0000_0000_0000
+                )
+                == 0
+            ].index,
+        )
+
+    def _position_of(
+        self,
+        item: Union[HecTime, datetime, int, str],
+        not_found: Optional[str] = None,
+    ) -> int:
+        # ------------------------------------------------------------ #
+        # the position in the data of a time item or integer, with the #
+        # not_found behaviors of index_of(), by binary search if the   #
+        # times are sorted and by a linear scan otherwise              #
+        # ------------------------------------------------------------ #
+        index = cast(pd.DatetimeIndex, cast(pd.DataFrame, self._data).index)
+        count = len(index)
+        if isinstance(item, (HecTime, datetime, str)):
+            times = TimeSeries._index_nanoseconds(index)
+            key = TimeSeries._index_key(index, item)
+            if index.is_monotonic_increasing:
+                pos = int(np.searchsorted(times, key))
+                found = pos if pos < count and times[pos] == key else None
+                next_pos = pos if pos < count else None
+                previous_pos = pos - 1 if pos > 0 else None
+            else:
+                matches = np.flatnonzero(times == key)
+                later = np.flatnonzero(times > key)
+                earlier = np.flatnonzero(times < key)
+                found = int(matches[0]) if len(matches) else None
+                next_pos = int(later[np.argmin(times[later])]) if len(later) else None
+                previous_pos = (
+                    int(earlier[np.argmax(times[earlier])]) if len(earlier) else None
+                )
+            if found is not None:
+                return found
+            if not_found == "next":
+                if next_pos is not None:
+                    return next_pos
+                raise IndexError(f"{item} is not in times and no next time was found")
+            if not_found == "previous":
+                if previous_pos is not None:
+                    return previous_pos
+                raise IndexError(
+                    f"{item} is not in times and no previous time was found"
+                )
+            if not_found == "stop" and previous_pos is not None:
+                return min(previous_pos + 1, count - 1)
+            raise IndexError(f"{item} is not in times")
+        elif isinstance(item, int):
+            pos = item
+            if pos < 0 and not_found == "next":
+                pos = 0
+            if pos >= count and not_found == "previous":
+                pos = count - 1
+            if not -count <= pos < count:
+                raise IndexError("list index out of range")
+            return pos % count
+        else:
+            raise TypeError(
+                f"Expected HecTime, datetime, str, or int. Got {type(item)}"
+            )
+
+    def _slice_positions(self, key: slice) -> Union[slice, npt.NDArray[np.intp]]:
+        # ------------------------------------------------------------------ #
+        # the positional slice of the data for a slice of integers or time   #
+        # items; integers are positions (negative from the end) and times    #
+        # are located by binary search, with the stop time exclusive or      #
+        # inclusive per this object's setting. If the times are not sorted,  #
+        # the positions of the rows whose times are within the time bounds   #
+        # are returned instead                                               #
+        # ------------------------------------------------------------------ #
+        index = cast(pd.DatetimeIndex, cast(pd.DataFrame, self._data).index)
+        count = len(index)
+        if not index.is_monotonic_increasing and not all(
+            item is None or isinstance(item, int) for item in (key.start, key.stop)
+        ):
+            times = TimeSeries._index_nanoseconds(index)
+            positions = np.arange(count)
+            within = np.ones(count, dtype=bool)
+            for item, is_stop in (key.start, False), (key.stop, True):
+                if item is None:
+                    continue
+                if isinstance(item, int):
+                    pos = item + count if item < 0 else item
+                    if is_stop and not self._slice_stop_exclusive:
+                        pos += 1
+                    within &= positions < pos if is_stop else positions >= pos
+                else:
+                    bound = TimeSeries._index_key(index, item)
+                    if not is_stop:
+                        within &= times >= bound
+                    elif self._slice_stop_exclusive:
+                        within &= times < bound
+                    else:
+                        within &= times <= bound
+            return np.flatnonzero(within)[:: key.step]
+
+        def position(item: Any, inclusive: bool) -> int:
+            if isinstance(item, int):
+                pos = item + count if item < 0 else item
+                return min(max(pos + 1 if inclusive else pos, 0), count)
+            return int(
+                np.searchsorted(
+                    TimeSeries._index_nanoseconds(index),
+                    TimeSeries._index_key(index, item),
+                    side="right" if inclusive else "left",
+                )
+            )
+
+        return slice(
+            None if key.start is None else position(key.start, False),
+            (
+                None
+                if key.stop is None
+                else position(key.stop, not self._slice_stop_exclusive)
+            ),
+            key.step,
+        )
+
+    @staticmethod
+    def _span_nanoseconds(span: TimeSpan) -> Optional[int]:
+        # ------------------------------------------------------------- #
+        # the fixed length of a span in nanoseconds, or None if adding  #
+        # the span to a HecTime depends on the calendar or local time   #
+        # ------------------------------------------------------------- #
+        if isinstance(span, Interval) and span.is_local_regular:
+            return None
+        values = span.values
+        if values is None or values[0] or values[1]:
+            return None
+        return span.total_seconds() * 1_000_000_000
+
+    def _target(self, in_place: bool) -> "TimeSeries":
+        # ------------------------------------------------------------------ #
+        # the object an operation modifies (this object or a copy of it) in  #
+        # the working layout, so modified data is no longer compact          #
+        # ------------------------------------------------------------------ #
+        target = self._writable(in_place)
+        if target._data is not None:
+            target._data = TimeSeries._working_data(target._data)
+        return target
+
+    def _writable(self, in_place: bool) -> "TimeSeries":
+        # ------------------------------------------------------------------ #
+        # this object or a copy of it with data that no other object shares, #
+        # copying the data only if it is shared or the copy is needed        #
+        # ------------------------------------------------------------------ #
+        if not in_place:
+            target = self.copy(include_data=False)
+            if self._data is not None:
+                target._data = self._data.copy()
+                target._expanded = self._expanded
+            return target
+        if self._data_shared and self._data is not None:
+            self._data = self._data.copy()
+        self._data_shared = False
+        return self
+
+    @staticmethod
+    def _time_mask(
+        data: pd.DataFrame, item: Union[HecTime, datetime, str]
+    ) -> npt.NDArray[np.bool_]:
+        # --------------------------------------------------------------- #
+        # rows in the same minute as the item, resolved as _index_key()   #
+        # resolves it so selecting agrees with index_of() and indexing    #
+        # --------------------------------------------------------------- #
+        index = cast(pd.DatetimeIndex, data.index)
+        times = TimeSeries._index_nanoseconds(index)
+        key = TimeSeries._index_key(index, item)
+        return np.asarray(times - times % 60_000_000_000 == key)
+
+    @staticmethod
+    def _time_string(t: pd.Timestamp) -> str:
+        # ----------------------------------------------------- #
+        # format an index time as an item of the times property #
+        # ----------------------------------------------------- #
+        tstr = t.strftime("%Y-%m-%d %H:%M:%S%z")
+        if tstr[-5] in "-+":
+            tstr = f"{tstr[:-2]}:{tstr[-2:]}"
+        return tstr
+
+    @staticmethod
+    def _unusable_mask(
+        values: npt.NDArray[np.float64], qualities: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.bool_]:
+        # ------------------------------------------------------------------- #
+        # values that are NaN, infinite, or have a quality score of zero      #
+        # (screened missing or screened rejected), which are not screened     #
+        # ------------------------------------------------------------------- #
+        screened_validity = qualities & 0b1_1111
         return cast(
-            list[np.datetime64],
-            df[
-                (
-                    df["quality"].astype("int64")
-                    & 0b1000_0000_0000_0000_0000_0000_0000_0000
-                )
-                == 0
-            ].index,
+            npt.NDArray[np.bool_],
+            ~np.isfinite(values)
+            | (screened_validity == 0b0_0101)
+            | (screened_validity == 0b1_0001),
         )
 
     @staticmethod
@@ -3306,30 +4812,40 @@ class TimeSeries:
         if self._skip_validation:
             return
         if self.is_any_regular and self._data is not None and not self._data.empty:
+            index = cast(pd.DatetimeIndex, self._data.index)
             if self._timezone:
-                my_datetimes = (
-                    self._data.copy()
-                    .tz_localize(None)
-                    .tz_localize(
-                        self._timezone,
-                        ambiguous=np.zeros(len(self._data.index), dtype=bool),
-                    )
-                    .index.to_list()
+                index = index.tz_localize(None).tz_localize(
+                    self._timezone,
+                    ambiguous=np.zeros(len(index), dtype=bool),
+                )
+            # ------------------------------------------------------------ #
+            # each time must be one of the first len(index) interval times #
+            # beginning at the first time                                  #
+            # ------------------------------------------------------------ #
+            times = TimeSeries._index_nanoseconds(index)
+            span = TimeSeries._span_nanoseconds(self.interval)
+            if span:
+                steps = times - times[0]
+                consistent = (
+                    (steps % span == 0) & (steps >= 0) & (steps < len(times) * span)
                 )
             else:
-                my_datetimes = self._data.index.to_list()
-            interval_times = self.interval.get_datetime_index(
-                start_time=my_datetimes[0],
-                count=len(my_datetimes),
-                time_zone=self.time_zone,
-            ).to_list()
-            for dt in my_datetimes:
-                if not dt in interval_times:
-                    raise (
-                        TimeSeriesException(
-                            f"Time {dt} is not consistent with interval {self.interval.name} beginning at {my_datetimes[0]}"
+                consistent = np.isin(
+                    times,
+                    TimeSeries._index_nanoseconds(
+                        self.interval.get_datetime_index(
+                            start_time=index[0],
+                            count=len(index),
+                            time_zone=self.time_zone,
                         )
+                    ),
+                )
+            if not consistent.all():
+                raise (
+                    TimeSeriesException(
+                        f"Time {index[int(np.argmin(consistent))]} is not consistent with interval {self.interval.name} beginning at {index[0]}"
                     )
+                )
 
     def accum(self, in_place: bool = False) -> "TimeSeries":
         """
@@ -3371,7 +4887,7 @@ class TimeSeries:
             raise TimeSeriesException(
                 f"Cannot perform accumulate a {cast(ParameterType, self.parameter_type).name} time series."
             )
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         if target._data is None:
             raise TimeSeriesException("Operation is invalid with empty time series.")
         if target.has_selection:
@@ -3571,44 +5087,70 @@ class TimeSeries:
             # ----------------------------------- #
             # filter out time series without data #
             # ----------------------------------- #
-            with_data = [ts for ts in timeseries if ts.data is not None]
+            with_data = [ts for ts in timeseries if ts._data is not None]
             if len(with_data) < 2:
                 raise TimeSeriesException(
                     "More that one time series with data is required"
                 )
-            # ------------------------------------------------------------------------------------------------- #
-            # generate an index common to all time series and create a list of DataFrames with only those times #
-            # ------------------------------------------------------------------------------------------------- #
-            common_index = cast(pd.DataFrame, with_data[0].data).index
-            for ts in with_data[1:]:
-                common_index = common_index.intersection(
-                    cast(pd.DataFrame, ts.data).index
-                )
-                if len(common_index) == 0:
-                    raise TimeSeriesException("Time series do not include common times")
-            common_index.name = "time"
-            dfs = [cast(pd.DataFrame, ts.data).loc[common_index] for ts in with_data]
+            # ----------------------------------------------------------------- #
+            # gather the values at the times common to all time series into one #
+            # (times x time series) array                                       #
+            # ----------------------------------------------------------------- #
+            common_index, block = TimeSeries._aligned_values(with_data, False)
             # ---------------------------------------- #
             # generate and return a result time series #
             # ---------------------------------------- #
             ts = timeseries[0].copy(include_data=False)
             ts.ito("Code").version = "Aggregate"
-            if func in (stat.stdev, stat.pstdev):
+            native = None if isinstance(func, list) else _native_aggregations.get(func)
+            if native:
+                # ------------------------------------------- #
+                # reduce all rows at once with a NumPy method #
+                # ------------------------------------------- #
+                with warnings.catch_warnings(), np.errstate(all="ignore"):
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    ts._data = pd.DataFrame(
+                        {"value": native(block)}, index=common_index
+                    )
+            elif not isinstance(func, list) and func in _row_aggregations:
                 # ------------------------------------------------------------------#
                 # why don't these functions just return NaN if the encounter a NaN? #
                 # ------------------------------------------------------------------#
-                def func2(*args: Any) -> float:
-                    v = (
-                        cast(Callable[[Any], Any], func)(*args)
-                        if all([np.isfinite(x) for x in args[0].to_list()])
-                        else np.nan
-                    )
-                    return v
-
-                ts._data = pd.concat(dfs)[["value"]].groupby(level=0).agg(func2)
+                row_func = cast(Callable[[Any], Any], func)
+                finite_only = func in (stat.stdev, stat.pstdev)
+                ts._data = pd.DataFrame(
+                    {
+                        "value": [
+                            (
+                                np.nan
+                                if finite_only and not np.isfinite(row).all()
+                                else row_func(row)
+                            )
+                            for row in block
+                        ]
+                    },
+                    index=common_index,
+                )
             else:
-                ts._data = pd.concat(dfs)[["value"]].groupby(level=0).agg(func)
-            ts._data.set_index(common_index)
+                # -------------------------------------------------------------- #
+                # other functions get each time's values as a Series, as pandas  #
+                # groupby aggregations do                                        #
+                # -------------------------------------------------------------- #
+                aggregated = (
+                    pd.DataFrame(
+                        {"value": block.ravel()},
+                        index=common_index[
+                            np.repeat(np.arange(len(common_index)), block.shape[1])
+                        ],
+                    )
+                    .groupby(level=0)
+                    .agg(func)
+                )
+                ts._data = (
+                    aggregated.to_frame()
+                    if isinstance(aggregated, pd.Series)
+                    else aggregated
+                )
             ts._data["quality"] = 0
             return ts
         finally:
@@ -3663,26 +5205,50 @@ class TimeSeries:
         """
         Creates a copy of this object, with or without data
 
+        The data of the copy shares memory with the data of this object until either object modifies it, so
+        copying a time series does not duplicate its values.
+
         Args:
             include_data (bool, optional): Specifies whether to include the data in the copy. Defaults to True.
 
         Returns:
             TimeSeries: The copy of this object
         """
-        other = TimeSeries(self.name)
+        # -------------------------------------------------------------------- #
+        # build the copy directly instead of re-parsing the name; Interval and #
+        # Duration objects are immutable, so they are shared                   #
+        # -------------------------------------------------------------------- #
+        other = TimeSeries.__new__(TimeSeries)
+        other._slice_stop_exclusive = TimeSeries._default_slice_stop_exclusive
+        other._compact_values = self._compact_values
+        other._context = self._context
+        other._watershed = self._watershed if self._context == DSS else None
         other._location = deepcopy(self._location)
         other._parameter = deepcopy(self._parameter)
         other._parameter_type = deepcopy(self._parameter_type)
-        other._interval = deepcopy(self._interval)
-        other._duration = deepcopy(self._duration)
+        other._interval = self._interval
+        other._duration = self._duration
         other._version = self._version
         other._version_time = (
             None if self._version_time is None else self._version_time.copy()
         )
         other._timezone = self._timezone
+        other._data = None
+        other._times_cache = None
+        other._midnight_as_2400 = False
+        other._selection_state = SelectionState.TRANSIENT
+        other._expanded = False
+        other._skip_validation = False
+        other._data_shared = False
         if include_data and self._data is not None:
-            other._data = self._data.copy()
+            # -------------------------------------------------------------- #
+            # the copy shares the data buffers with this object; both are    #
+            # marked so that _writable() copies the data before either one   #
+            # modifies it                                                    #
+            # -------------------------------------------------------------- #
+            other._data = self._data.copy(deep=False)
             other._expanded = self._expanded
+            self._data_shared = other._data_shared = True
         return other
 
     def collapse(self, in_place: bool = False) -> "TimeSeries":
@@ -3727,6 +5293,67 @@ class TimeSeries:
         target._expanded = False
         return target
 
+    @property
+    def compact(self) -> bool:
+        """
+        Whether the data of this object is stored in the compact layout (int32 quality codes, and float32 values if
+        every value is exactly representable as a float32) instead of float64 values and int64 quality codes.
+        Values that need float64 (e.g., 0.1 or 1000000.1) keep the float64 layout, so compacting never changes a value
+        unless [compact_values](#TimeSeries.compact_values) is "float32", in which case the values are always stored as float32.
+
+        Setting to `True` stores the current data compactly and setting to `False` restores the float64/int64 layout.
+        The compact layout is a storage-only mode: operations that modify the data (including in-place operations) and
+        accessing [data](#TimeSeries.data) restore the float64/int64 layout, so the object is no longer compact afterward.
+
+        Compacting normalizes the quality codes to the signed convention of [Quality.signed](quality.html#Quality.signed):
+        unsigned codes with the high bit set (e.g., 2147483651) are stored as their signed int32 equivalents and are restored
+        as signed int64 codes (e.g., -2147483645). The quality each code represents doesn't change.
+
+        The default value for new TimeSeries objects is `False`, but can be set by calling
+        [set_default_compact()](#TimeSeries.set_default_compact)
+
+        Operations:
+            Read/Write
+        """
+        return self._data is not None and self._data["quality"].dtype == np.int32
+
+    @compact.setter
+    def compact(self, state: bool) -> None:
+        if self._data is not None:
+            self._data = (
+                TimeSeries._compact_data(self._data, self._compact_values)
+                if state
+                else TimeSeries._working_data(self._data)
+            )
+
+    @property
+    def compact_values(self) -> Optional[str]:
+        """
+        How the values of this object are stored when it is [compact](#TimeSeries.compact)
+        * If `None`, the values are stored as float32 only if every value is exactly representable as a float32
+        * If "float32", the values are always stored as float32, rounding values that are not exactly representable
+            (saving 8 instead of 4 bytes per value)
+
+        Setting this property on a compact object stores its data again with the new setting. The default value for new
+        TimeSeries objects is `None`, but can be set by calling [set_default_compact()](#TimeSeries.set_default_compact)
+
+        Operations:
+            Read/Write
+        """
+        return self._compact_values
+
+    @compact_values.setter
+    def compact_values(self, values: Optional[str]) -> None:
+        if values not in (None, "float32"):
+            raise TimeSeriesException(
+                f"Invalid compact values type: {values}; must be None or 'float32'"
+            )
+        compact = self.compact
+        self._compact_values = values
+        if compact:
+            self.compact = False
+            self.compact = True
+
     @property
     def context(self) -> Optional[str]:
         """
@@ -3844,7 +5471,7 @@ class TimeSeries:
         Returns:
             list[TimeSeries]: The 14 time series containing the cyclic analysis statistics
         """
-        if self.data is None or self.data.empty:
+        if self._data is None or self._data.empty:
             raise TimeSeriesException("Operation is invalid with empty time series.")
         if method.upper() in PercentileMethods.__members__:
             method = PercentileMethods[method.upper()].name.lower()
@@ -3853,55 +5480,38 @@ class TimeSeries:
                 f"Invalid method specified: {method}; must be one of {','.join(PercentileMethods.__members__)}"
             )
         dummy_ts = TimeSeries(self.name)
-        df = self.data.copy()
-        # following line to work around 2400/0000 problem
-        df.index -= pd.Timedelta(seconds=1)  # type: ignore
+        df = self._data
+        # ------------------------------------------------------------------ #
+        # bin each value by month, day and hour, after moving the times back #
+        # one second to work around the 2400/0000 problem; rows that dropna  #
+        # would remove (and February 29 for daily and hourly bins) are not   #
+        # binned                                                             #
+        # ------------------------------------------------------------------ #
+        index = cast(pd.DatetimeIndex, df.index) - pd.Timedelta(seconds=1)
+        months = index.month.to_numpy()
+        days = index.day.to_numpy()
+        keep = df.notna().all(axis=1).to_numpy()
+        days_before_month = np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+        day_of_year = days_before_month[months - 1] + days - 1
         target_year = 2100  # non-leap year
         if self.interval.minutes == Interval.MINUTES["1Hour"]:
             # ---------------- #
             # 8760 1-Hour bins #
             # ---------------- #
-            bins: list[pd.DataFrame] = []
             times = [
                 datetime(target_year, 1, 1, 1) + timedelta(days=i, hours=j)
                 for i in range(365)
                 for j in range(24)
             ]
-            bins = []
-            for m in range(1, 13):
-                for d in range(
-                    1, 29 if m == 2 else 32 if m in (1, 3, 5, 7, 8, 10, 12) else 31
-                ):
-                    df2 = df[
-                        (
-                            (cast(pd.DatetimeIndex, df.index).month == m)
-                            & (cast(pd.DatetimeIndex, df.index).day == d)
-                        )
-                    ]
-                    bins.extend(
-                        [
-                            df2[cast(pd.DatetimeIndex, df2.index).hour == j]
-                            for j in range(24)
-                        ]
-                    )
+            bin_numbers = day_of_year * 24 + index.hour.to_numpy()
+            keep = keep & ((months != 2) | (days != 29))
         elif self.interval.minutes == Interval.MINUTES["1Day"]:
             # -------------- #
             # 365 1-Day bins #
             # -------------- #
             times = [datetime(target_year, 1, 2) + timedelta(i) for i in range(365)]
-            bins = []
-            for m in range(1, 13):
-                for d in range(
-                    1, 29 if m == 2 else 32 if m in (1, 3, 5, 7, 8, 10, 12) else 31
-                ):
-                    bins.append(
-                        df[
-                            (
-                                (cast(pd.DatetimeIndex, df.index).month == m)
-                                & (cast(pd.DatetimeIndex, df.index).day == d)
-                            )
-                        ]
-                    )
+            bin_numbers = day_of_year
+            keep = keep & ((months != 2) | (days != 29))
         elif self.interval.minutes == Interval.MINUTES["1Month"]:
             # --------------- #
             # 12 1-Month bins #
@@ -3914,9 +5524,7 @@ class TimeSeries:
                 )
                 for i in range(12)
             ]
-            bins = [
-                df[cast(pd.DatetimeIndex, df.index).month == i] for i in range(1, 13)
-            ]
+            bin_numbers = months - 1
         else:
             raise TimeSeriesException(
                 "Operation can only be performed on 1Hour, 1Day, or 1Month data"
@@ -3925,146 +5533,80 @@ class TimeSeries:
             zi = ZoneInfo(self.time_zone)
             times = [t.replace(tzinfo=zi) for t in times]
         indx = pd.DatetimeIndex(data=times, name="time")
-        first_time, last_time = [self.times[i] for i in (0, -1)]
+        first_time, last_time = [TimeSeries._time_string(df.index[i]) for i in (0, -1)]
         dummy_ts.version = f"{self.version}[{HecTime(first_time).date(104)}-{HecTime(last_time).date(104)}]"
-        if method == "hecmath":
-            sorted_bins = [
-                bin.dropna().sort_values("value").reset_index(drop=True) for bin in bins
-            ]
-        else:
-            bins = [bin.dropna() for bin in bins]
-        results = []
-        # ----- #
-        # count #
-        # ----- #
-        dummy_ts.iset_parameter(
-            Parameter(f"Count-{self.parameter.name}", "EN" if self.is_english else "SI")
-        )
-        binvals = [float(bins[i]["value"].count()) for i in range(len(bins))]
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # ----------------- #
-        # maximum date/time #
-        # ----------------- #
-        dummy_ts.iset_parameter(Parameter(f"Date-{self.parameter.name}-Max", "n/a"))
-        maxtimes = [bins[i]["value"].idxmax() for i in range(len(bins))]
-        binvals = [t.year for t in maxtimes]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # ----------------- #
-        # minimum date/time #
-        # ----------------- #
-        dummy_ts.iset_parameter(Parameter(f"Date-{self.parameter.name}-Min", "n/a"))
-        mintimes = [bins[i]["value"].idxmin() for i in range(len(bins))]
-        binvals = [t.year for t in mintimes]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # ------- #
-        # average #
-        # ------- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-Aver", self.unit))
-        binvals = [bins[i]["value"].mean() for i in range(len(bins))]
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # ------- #
-        # maximum #
-        # ------- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-Max", self.unit))
-        binvals = [bins[i]["value"].max() for i in range(len(bins))]
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # ------- #
-        # minimum #
-        # ------- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-Min", self.unit))
-        binvals = [bins[i]["value"].min() for i in range(len(bins))]
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # -- #
-        # 5% #
-        # -- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-P05", self.unit))
-        if method == "hecmath":
-            binvals = [
-                bin["value"][max(0, int(len(bin) * 0.05 + 0.5) - 1)]
-                for bin in sorted_bins
-            ]
-        else:
-            binvals = [np.percentile(bin["value"].values, 5, method=method) for bin in bins]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # --- #
-        # 10% #
-        # --- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-P10", self.unit))
-        if method == "hecmath":
-            binvals = [
-                bin["value"][max(0, int(len(bin) * 0.1 + 0.5) - 1)]
-                for bin in sorted_bins
-            ]
-        else:
-            binvals = [np.percentile(bin["value"].values, 10, method=method) for bin in bins]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # --- #
-        # 25% #
-        # --- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-P25", self.unit))
-        if method == "hecmath":
-            binvals = [
-                bin["value"][max(0, int(len(bin) * 0.25 + 0.5) - 1)]
-                for bin in sorted_bins
-            ]
-        else:
-            binvals = [np.percentile(bin["value"].values, 25, method=method) for bin in bins]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # --- #
-        # 50% #
-        # --- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-P50", self.unit))
-        if method == "hecmath":
-            binvals = [
-                bin["value"][max(0, int(len(bin) * 0.5 + 0.5) - 1)]
-                for bin in sorted_bins
-            ]
-        else:
-            binvals = [np.percentile(bin["value"].values, 50, method=method) for bin in bins]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # --- #
-        # 75% #
-        # --- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-P75", self.unit))
-        if method == "hecmath":
-            binvals = [
-                bin["value"][max(0, int(len(bin) * 0.75 + 0.5) - 1)]
-                for bin in sorted_bins
-            ]
-        else:
-            binvals = [np.percentile(bin["value"].values, 75, method=method) for bin in bins]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # --- #
-        # 90% #
-        # --- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-P90", self.unit))
-        if method == "hecmath":
-            binvals = [
-                bin["value"][max(0, int(len(bin) * 0.9 + 0.5) - 1)]
-                for bin in sorted_bins
+        # ------------------------------------------------------------------ #
+        # pack the values (and their years) into padded bins x values arrays #
+        # with each bin's values in time order                               #
+        # ------------------------------------------------------------------ #
+        bin_numbers = bin_numbers[keep]
+        order = np.argsort(bin_numbers, kind="stable")
+        bin_numbers = bin_numbers[order]
+        counts = np.bincount(bin_numbers, minlength=len(times))
+        columns = np.arange(len(order)) - np.repeat(np.cumsum(counts) - counts, counts)
+        values = np.full((len(times), max(1, int(counts.max(initial=0)))), np.nan)
+        years = values.copy()
+        values[bin_numbers, columns] = df["value"].to_numpy(dtype=np.float64)[keep][
+            order
+        ]
+        years[bin_numbers, columns] = index.year.to_numpy()[keep][order]
+        # ---------------------------------------------- #
+        # compute all the statistics for all of the bins #
+        # ---------------------------------------------- #
+        empty = counts == 0
+        rows = np.arange(len(times))
+        percents = [5, 10, 25, 50, 75, 90, 95]
+        with warnings.catch_warnings(), np.errstate(all="ignore"):
+            warnings.simplefilter("ignore", RuntimeWarning)
+            missing = np.isnan(values)
+            max_years = years[
+                rows, np.argmax(np.where(missing, -np.inf, values), axis=1)
             ]
-        else:
-            binvals = [np.percentile(bin["value"].values, 90, method=method) for bin in bins]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # --- #
-        # 95% #
-        # --- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-P95", self.unit))
-        if method == "hecmath":
-            binvals = [
-                bin["value"][max(0, int(len(bin) * 0.95 + 0.5) - 1)]
-                for bin in sorted_bins
+            min_years = years[
+                rows, np.argmin(np.where(missing, np.inf, values), axis=1)
             ]
-        else:
-            binvals = [np.percentile(bin["value"].values, 95, method=method) for bin in bins]  # type: ignore
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-        # ------- #
-        # std dev #
-        # ------- #
-        dummy_ts.iset_parameter(Parameter(f"{self.parameter.name}-SD", self.unit))
-        binvals = [bins[i]["value"].std() for i in range(len(bins))]
-        results.append(TimeSeries(dummy_ts.name, indx, binvals, 0))
-
+            averages = np.nanmean(values, axis=1)
+            maximums = np.nanmax(values, axis=1)
+            minimums = np.nanmin(values, axis=1)
+            std_devs = np.nanstd(values, axis=1, ddof=1)
+            if method == "hecmath":
+                # ------------------------------------------------------- #
+                # nearest rank in each bin's sorted values (NaNs sort to  #
+                # the end of each row)                                    #
+                # ------------------------------------------------------- #
+                ranks = (
+                    counts[:, np.newaxis]
+                    * np.array([0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95])
+                    + 0.5
+                ).astype(int)
+                percentiles = np.sort(values, axis=1)[
+                    rows[:, np.newaxis], np.maximum(0, ranks - 1)
+                ]
+            else:
+                percentiles = np.nanpercentile(values, percents, axis=1, method=method).T  # type: ignore
+        max_years[empty] = min_years[empty] = np.nan
+        percentiles[empty] = np.nan
+        # --------------------------------------------------- #
+        # generate a time series for each statistic, in order #
+        # --------------------------------------------------- #
+        name = self.parameter.name
+        statistics = [
+            (f"Count-{name}", "EN" if self.is_english else "SI", counts.astype(float)),
+            (f"Date-{name}-Max", "n/a", max_years),
+            (f"Date-{name}-Min", "n/a", min_years),
+            (f"{name}-Aver", self.unit, averages),
+            (f"{name}-Max", self.unit, maximums),
+            (f"{name}-Min", self.unit, minimums),
+        ]
+        statistics.extend(
+            (f"{name}-P{percent:02d}", self.unit, percentiles[:, i])
+            for i, percent in enumerate(percents)
+        )
+        statistics.append((f"{name}-SD", self.unit, std_devs))
+        results = []
+        for parameter_name, unit, binvals in statistics:
+            dummy_ts.iset_parameter(Parameter(parameter_name, unit))
+            results.append(TimeSeries(dummy_ts.name, indx, binvals.tolist(), 0))
         return results
 
     @property
@@ -4074,10 +5616,16 @@ class TimeSeries:
         allow direct modification. For uses that should not modify this TimeSeries object, the DataFrame
         should be copied using its `copy()` method prior to modification (e.g., `df = ts.data.copy()`)
 
+        If the data is [compact](#TimeSeries.compact), it is restored to float64 values and int64 quality codes on this
+        access, so the object is no longer compact.
+
+        If the data is shared with a [copy](#TimeSeries.copy) of this object (or with another object that must not
+        change, like an Arrow table), it is copied on this access, so modifying the DataFrame never modifies the other object.
+
         Operations:
             Read Only
         """
-        return self._data
+        return self._target(True)._data
 
     def diff(self, in_place: bool = False) -> "TimeSeries":
         """
@@ -4165,61 +5713,47 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
+        selected = data["selected"].to_numpy(dtype=bool) if self.has_selection else None
         df = data.loc[data["selected"]] if self.has_selection else data
-        df_protected = df.loc[
-            (df["quality"] & 0b1000_0000_0000_0000_0000_0000_0000_0000) != 0
-        ].copy()
+        protected = TimeSeries._protected_mask(df)
         # ----------------- #
         # do the estimation #
         # ----------------- #
+        values = df["value"].to_numpy(dtype=np.float64, copy=True)
+        qualities = df["quality"].to_numpy(dtype=np.int64, copy=True)
         if estimate_rejected:
-            mask = (df["quality"] & 0b1_1111) == 0b1_0001
-            df.loc[mask, "value"] = np.nan
-        original = df["value"].copy()
+            values[(qualities & 0b1_1111) == 0b1_0001] = np.nan
+        originally_missing = np.isnan(values)
         if accumulation:
-
-            def conditional_interpolation(
-                df: pd.DataFrame, max_nan: int
-            ) -> pd.DataFrame:
-                values = df["value"]
-                is_nan = values.isna()
-                groups = (
-                    is_nan != is_nan.shift()
-                ).cumsum()  # Identify groups of consecutive NaN/Non-NaN
-                # Iterate through groups
-                for group_id, group in df.groupby(groups):
-                    if not group["value"].isna().any():
-                        continue  # Skip non-NaN groups
-                    # Find indices for the current NaN group
-                    nan_indices = group.index
-                    prev_pos = cast(int, df.index.get_loc(nan_indices[0])) - 1
-                    next_pos = cast(int, df.index.get_loc(nan_indices[-1])) + 1
-                    # Check bounds
-                    if prev_pos < 0 or next_pos >= len(values):
-                        continue  # Skip interpolation if out of bounds
-                    # Get values before and after the NaNs
-                    prev_index = df.index[prev_pos]
-                    next_index = df.index[next_pos]
-                    prev_value = values[prev_index]
-                    next_value = values[next_index]
-                    # Apply conditions
-                    if next_value < prev_value:
-                        continue  # Skip interpolation if the next value is less than the previous
-                    if prev_value == next_value:
-                        df.loc[nan_indices, "value"] = (
-                            prev_value  # Fill with the same value
-                        )
-                        continue
-                    # Check if NaN count exceeds the limit
-                    if len(nan_indices) > max_nan:
-                        continue
-                    # Perform interpolation
-                    df.loc[nan_indices, "value"] = values.interpolate().loc[nan_indices]
-                return df
-
-            df = conditional_interpolation(df, max_missing_count)
+            # ----------------------------------------------------------------- #
+            # run-length encode the NaN mask and decide for each run of missing #
+            # values whether to fill it, based on its bounding valid values     #
+            # ----------------------------------------------------------------- #
+            is_nan = originally_missing
+            edges = np.diff(np.concatenate(([0], is_nan.astype(np.int8), [0])))
+            run_starts = np.flatnonzero(edges == 1)
+            run_ends = np.flatnonzero(edges == -1) - 1
+            run_lengths = run_ends - run_starts + 1
+            bounded = (run_starts > 0) & (run_ends < len(values) - 1)
+            prev_values = values[np.maximum(run_starts - 1, 0)]
+            next_values = values[np.minimum(run_ends + 1, len(values) - 1)]
+            fill_run = (
+                bounded
+                & (next_values >= prev_values)  # never estimate decreasing values
+                & (
+                    (next_values == prev_values)  # fill without regard to count
+                    | (run_lengths <= max_missing_count)
+                )
+            )
+            fill = np.zeros(len(values), dtype=bool)
+            fill[is_nan] = np.repeat(fill_run, run_lengths)
+            # ------------------------------------------------------------- #
+            # a single interpolation pass gives the estimates for every run #
+            # ------------------------------------------------------------- #
+            if fill.any():
+                values[fill] = pd.Series(values).interpolate().to_numpy()[fill]
         else:
 
             def interp(series: pd.Series, max_nan: int) -> pd.Series:  # type: ignore
@@ -4238,18 +5772,14 @@ class TimeSeries:
                 series[nan_indicies] = np.nan
                 return series
 
-            df.loc[:, "value"] = interp(df["value"].copy(), max_missing_count)
-        modified = (original.isna()) & (df["value"].notna())
-        df.loc[modified, "quality"] = quality_code
+            values = interp(pd.Series(values), max_missing_count).to_numpy(
+                dtype=np.float64
+            )
+        qualities[originally_missing & ~np.isnan(values)] = quality_code
         # --------------- #
         # set the results #
         # --------------- #
-        for idx in df_protected.index:
-            df.loc[idx, "value"] = df_protected.loc[idx, "value"]
-            df.loc[idx, "quality"] = df_protected.loc[idx, "quality"]
-        for idx in df.index:
-            data.loc[idx, "value"] = df.loc[idx, "value"]
-            data.loc[idx, "quality"] = df.loc[idx, "quality"]
+        TimeSeries._apply_masked(data, values, qualities, selected, protected)
         if self.selection_state == SelectionState.TRANSIENT:
             self.iselect(Select.ALL)
             if target is not self:
@@ -4286,7 +5816,7 @@ class TimeSeries:
         Returns:
             TimeSeries: The expanded time series
         """
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         if self.is_any_regular and not target._expanded:
             if target._data is None or target._data.empty:
                 if start_time and end_time:
@@ -4451,7 +5981,7 @@ class TimeSeries:
             # -------------------------------------- #
             # mod time series with a unitless scalar #
             # -------------------------------------- #
-            target = self if in_place else self.copy()
+            target = self._target(in_place)
             data = cast(pd.DataFrame, target._data)
             if target.has_selection:
                 data.loc[data["selected"], ["value"]] %= amount
@@ -4479,26 +6009,12 @@ class TimeSeries:
                 raise TimeSeriesException(
                     "Operation is invalid with empty time series."
                 )
-            this = self._data
             if UnitQuantity(1, amount.unit).unit.dimensionless:
-                that = cast(pd.DataFrame, amount.to("n/a")._data)
+                to_unit = "n/a"
             else:
-                that = cast(pd.DataFrame, amount.to(self.unit)._data)
+                to_unit = self.unit
             target = self.copy(include_data=False)
-            target._data = pd.merge(
-                this[this["selected"]] if "selected" in this.columns else this,
-                that[that["selected"]] if "selected" in that.columns else that,
-                left_index=True,
-                right_index=True,
-                suffixes=("_1", "_2"),
-            )
-            target._data["value"] = np.fmod(
-                target._data["value_1"], target._data["value_2"]
-            )
-            target._data["quality"] = 0
-            target._data.drop(
-                columns=["value_1", "value_2", "quality_1", "quality_2"], inplace=True
-            )
+            target._data = self._combine_data(amount, to_unit, np.fmod)
             # ------------------------------ #
             # reset any transient selections #
             # ------------------------------ #
@@ -4559,7 +6075,211 @@ class TimeSeries:
         )
 
     @staticmethod
-    def from_native(datastore: Any, native_ts: Any) -> "TimeSeries":
+    def from_arrays(
+        name: str,
+        times: npt.NDArray[Union[np.int64, np.datetime64]],
+        values: npt.NDArray[np.floating[Any]],
+        qualities: Optional[npt.NDArray[np.signedinteger[Any]]] = None,
+        time_zone: Optional[str] = None,
+        validate: bool = True,
+    ) -> "TimeSeries":
+        """
+        Returns a new `TimeSeries` object that wraps the specified NumPy arrays.
+
+        Arrays that already have the data types used by time series (int64 or datetime64 times, float64 values, and int64
+        qualities, or the float32 values and int32 qualities of the [compact](#TimeSeries.compact) layout) are used without copying, so later modifications of the arrays are visible in the time series
+        (unless [set_default_compact()](#TimeSeries.set_default_compact) has been called, in which case the values and
+        qualities are stored compactly). Use
+        [`TimeSeries(name, times, values, qualities, time_zone)`](#TimeSeries.__init__) to generate a time series from lists.
+
+        Args:
+            name (str): The time series name. Must be either a CWMS time series identifier or HEC-DSS time series pathname.
+                See [`TimeSeries()`](#TimeSeries.__init__) for the components set from the name.
+            times (np.ndarray): The times of the time series, which must be increasing and unique
+                - If int64, the nanoseconds since 1970-01-01T00:00:00Z of each time. The time series is in the UTC time zone if `time_zone`
+                    is not specified. Times are converted to `time_zone` without copying.
+                - If datetime64, the time zone unaware times. The time series is in the local time zone if `time_zone` is not specified.
+                    Times are localized to `time_zone` if it is specified, which copies them.
+            values (np.ndarray): The values of the time series. Must be the same length as `times`
+            qualities (Optional[np.ndarray]): The quality codes of the time series. If specified, must be the same length as `times`.
+                Defaults to None, which causes all qualities to be zero.
+            time_zone (Optional[str]): The time zone of the time series. If specified, must be a valid time zone name. Defaults to None.
+            validate (bool, optional): Specifies whether to verify that the times are increasing and unique and that the times of a regular
+                time series are consistent with its interval. Specify False only when the times are known to be valid to skip the verification.
+                Defaults to True.
+
+        Raises:
+            TimeSeriesException: If `times` is not an int64 or datetime64 array, the lengths of the arrays differ, or (if `validate` is True)
+                the times are not increasing and unique or are not consistent with the interval of a regular time series.
+
+        Returns:
+            TimeSeries: The generated `TimeSeries` object
+        """
+        # ------------ #
+        # handle times #
+        # ------------ #
+        if not isinstance(times, np.ndarray) or times.ndim != 1:
+            raise TimeSeriesException(
+                f"Expected one-dimensional numpy array for times, got {times.__class__.__name__}"
+            )
+        if times.dtype == np.int64:
+            l_indx = pd.DatetimeIndex(times, dtype="datetime64[ns, UTC]", name="time")
+            if time_zone is None:
+                time_zone = "UTC"
+            else:
+                l_indx = l_indx.tz_convert(ZoneInfo(time_zone))
+        elif times.dtype.kind == "M":
+            l_indx = pd.DatetimeIndex(times, name="time")
+            if time_zone is None:
+                time_zone = tzlocal.get_localzone_name()
+            else:
+                l_indx = l_indx.tz_localize(ZoneInfo(time_zone))
+        else:
+            raise TimeSeriesException(
+                f"Expected int64 or datetime64 array for times, got {times.dtype}"
+            )
+        # --------------------------- #
+        # handle values and qualities #
+        # --------------------------- #
+        l_values = np.asarray(values)
+        if l_values.dtype not in (np.float64, np.float32):
+            l_values = l_values.astype(np.float64)
+        if qualities is None:
+            l_qualities = np.zeros(len(l_indx), dtype=np.int64)
+        else:
+            l_qualities = np.asarray(qualities)
+            if l_qualities.dtype not in (np.int64, np.int32):
+                l_qualities = l_qualities.astype(np.int64)
+        if not len(l_values) == len(l_qualities) == len(l_indx):
+            raise TimeSeriesException(
+                f"Expected {len(l_indx)} values and qualities, got {len(l_values)} values and {len(l_qualities)} qualities"
+            )
+        if validate and not (l_indx.is_monotonic_increasing and l_indx.is_unique):
+            raise TimeSeriesException("Times must be increasing and unique")
+        # -------------------------- #
+        # finally, set the DataFrame #
+        # -------------------------- #
+        ts = TimeSeries(name)
+        ts._timezone = time_zone
+        if len(l_indx):
+            ts._data = pd.DataFrame(
+                {"value": l_values, "quality": l_qualities}, index=l_indx, copy=False
+            )
+            if validate:
+                ts._validate()
+            if TimeSeries._default_compact:
+                ts.compact = True
+        return ts
+
+    @staticmethod
+    def from_arrow(table: Any, validate: bool = True) -> "TimeSeries":
+        """
+        Returns a `TimeSeries` object from a `pyarrow.Table` as returned by [`to_arrow()`](#TimeSeries.to_arrow).
+
+        The time, value, and quality columns are used without copying when each is a single chunk, until the data is
+        first modified. Requires the `pyarrow` package.
+
+        Args:
+            table (Any): The `pyarrow.Table` object
+            validate (bool, optional): Specifies whether to verify that the times of a regular time series are consistent with its interval. Specify
+                False only when the times are known to be consistent to skip the verification. Defaults to True.
+
+        Raises:
+            TimeSeriesException: If the table does not contain time series metadata or the times are not consistent with the
+                interval of a regular time series
+
+        Returns:
+            TimeSeries: The generated `TimeSeries` object
+        """
+        metadata = table.schema.metadata or {}
+        if _arrow_metadata_key not in metadata:
+            raise TimeSeriesException("Table does not contain time series metadata")
+        return TimeSeries._from_arrow_table(
+            json.loads(metadata[_arrow_metadata_key]),
+            table,
+            table.schema.field("time").type.tz is not None,
+            validate,
+        )
+
+    @staticmethod
+    def from_arrow_many(table: Any, validate: bool = True) -> List["TimeSeries"]:
+        """
+        Returns the `TimeSeries` objects from a `pyarrow.Table` as returned by [`to_arrow_many()`](#TimeSeries.to_arrow_many).
+
+        The time, value, and quality columns are used without copying when each is a single chunk, until the data is
+        first modified. Requires the `pyarrow` package.
+
+        Args:
+            table (Any): The `pyarrow.Table` object
+            validate (bool, optional): Specifies whether to verify that the times of each regular time series are consistent with its interval. Specify
+                False only when the times are known to be consistent to skip the verification. Defaults to True.
+
+        Raises:
+            TimeSeriesException: If the table does not contain time series metadata or the times are not consistent with the
+                interval of a regular time series
+
+        Returns:
+            List[TimeSeries]: The generated `TimeSeries` objects, in the order they were stored
+        """
+        metadata = table.schema.metadata or {}
+        if _arrow_metadata_key not in metadata:
+            raise TimeSeriesException("Table does not contain time series metadata")
+        timeseries: List[TimeSeries] = []
+        offset = 0
+        for item in json.loads(metadata[_arrow_metadata_key]):
+            timeseries.append(
+                TimeSeries._from_arrow_table(
+                    item,
+                    table.slice(offset, item["rows"]),
+                    item["time_zone_aware"],
+                    validate,
+                )
+            )
+            offset += item["rows"]
+        return timeseries
+
+    @staticmethod
+    def from_chunks(chunks: Iterable["TimeSeries"]) -> "TimeSeries":
+        """
+        Returns a `TimeSeries` object that contains the data of consecutive chunks of a time series, such as those
+        generated by [`iter_chunks()`](#TimeSeries.iter_chunks) or [`process_chunks()`](#TimeSeries.process_chunks).
+        The metadata is taken from the first chunk.
+
+        Args:
+            chunks (Iterable[TimeSeries]): The chunks, in increasing time order
+
+        Raises:
+            TimeSeriesException: If there are no chunks or the chunks are not in increasing time order without overlap
+
+        Returns:
+            TimeSeries: The generated `TimeSeries` object
+        """
+        timeseries: Optional[TimeSeries] = None
+        frames: List[pd.DataFrame] = []
+        for chunk in chunks:
+            if timeseries is None:
+                timeseries = chunk.copy(include_data=False)
+            if chunk._data is not None and not chunk._data.empty:
+                frames.append(chunk._data)
+        if timeseries is None:
+            raise TimeSeriesException("No chunks to combine")
+        if frames:
+            if len({(f["value"].dtype, f["quality"].dtype) for f in frames}) > 1:
+                frames = [TimeSeries._working_data(f) for f in frames]
+            data = pd.concat(frames) if len(frames) > 1 else frames[0]
+            if not data.index.is_monotonic_increasing or data.index.has_duplicates:
+                raise TimeSeriesException(
+                    "Chunks must be in increasing time order without overlap"
+                )
+            timeseries._data = data
+            if TimeSeries._default_compact:
+                timeseries.compact = True
+        return timeseries
+
+    @staticmethod
+    def from_native(
+        datastore: Any, native_ts: Any, validate: bool = True
+    ) -> "TimeSeries":
         """
         Returns a `TimeSeries` object generated from native format of the specified data store.
 
@@ -4568,6 +6288,8 @@ class TimeSeries:
                 - If an instance of [`CwmsDataStore`](datastore.html#CwmsDataStore), `native_ts` must be a `cwms.cwms_types.Data` object suitable for use with the `cwms-python` package
                 - If an instance of [`DssDataStore`](datastore.html#DssDataStore), `native_ts` must be an `hecdss.RegularTimeSeries` or `hecdss.IrregularTimeSeries` object suitable for use wth the `hecdss` package
             native_ts (Any): The native-format time series. Much match the format of the specified data store
+            validate (bool, optional): Specifies whether to verify that the times of a regular time series are consistent with its interval. Specify
+                False only when the times are known to be consistent to skip the verification. Defaults to True.
 
         Returns:
             TimeSeries: The generated `TimeSeries` object
@@ -4607,11 +6329,12 @@ class TimeSeries:
                     Parameter(timeseries.parameter.name, props["units"])
                 )
             if df is not None and len(df):
-                timeseries._data = df.rename(
-                    columns={"date-time": "time", "quality-code": "quality"}
-                ).set_index("time")
-                timeseries._validate()
+                timeseries._data = TimeSeries._cwms_data(df)
+                if validate:
+                    timeseries._validate()
             timeseries.expand()
+            if TimeSeries._default_compact:
+                timeseries.compact = True
             return timeseries
         elif isinstance(datastore, DssDataStore):
             # ---------------------- #
@@ -4661,6 +6384,8 @@ class TimeSeries:
                     if not cast(pd.DatetimeIndex, ts._data.index).tzinfo:
                         ts._data.tz_localize(native_ts.time_zone_name)
                     ts._timezone = str(cast(pd.DatetimeIndex, ts._data.index).tzinfo)
+                if TimeSeries._default_compact:
+                    ts.compact = True
                 return ts
             else:
                 raise TypeError(
@@ -4739,7 +6464,29 @@ class TimeSeries:
         Returns:
             bool: Whether another time series has the same times as this time series.
         """
-        return other.times == self.times
+        if (
+            self._data is None
+            or other._data is None
+            or len(self._data.shape) == 1
+            or len(other._data.shape) == 1
+        ):
+            return other.times == self.times
+        # -------------------------------------------------------------- #
+        # the same as comparing the times strings: the same instants and #
+        # the same UTC offsets, or the same local times if no time zone  #
+        # -------------------------------------------------------------- #
+        this = cast(pd.DatetimeIndex, self._data.index)
+        that = cast(pd.DatetimeIndex, other._data.index)
+        if len(this) != len(that) or (this.tz is None) != (that.tz is None):
+            return False
+        if not np.array_equal(
+            TimeSeries._index_nanoseconds(this), TimeSeries._index_nanoseconds(that)
+        ):
+            return False
+        return this.tz is None or np.array_equal(
+            TimeSeries._index_nanoseconds(this.tz_localize(None)),
+            TimeSeries._index_nanoseconds(that.tz_localize(None)),
+        )
 
     @property
     def has_selection(self) -> bool:
@@ -4865,6 +6612,10 @@ class TimeSeries:
         """
         Retrieves the data index of a specified object
 
+        Times are located by binary search of the data index (or by a linear scan if the times are not sorted) and are
+        compared as instants if the time series has a time zone (times without a time zone are taken to be in the time
+        zone of the time series).
+
         Args:
             item_to_index (Union[HecTime, datetime, int, str]): The object to retrieve the index of.
                 * **HecTime**: an HecTime object
@@ -4893,66 +6644,10 @@ class TimeSeries:
             raise TimeSeriesException(
                 'Parameter not_found must be None, "next", "previous", or "stop"'
             )
-        times = self.times
-        idx = None
-        try:
-            if isinstance(item_to_index, (HecTime, datetime, str)):
-                ht = HecTime(item_to_index)
-                ht.midnight_as_2400 = False
-                key = str(ht).replace("T", " ")
-                if not_found is None:
-                    idx = times.index(key)
-                else:
-                    try:
-                        idx = times.index(key)
-                    except:
-                        if not_found == "next":
-                            for i in range(len(times)):
-                                if times[i] > key:
-                                    idx = i
-                                    break
-                            else:
-                                raise
-                        elif not_found == "previous":
-                            for i in range(len(times))[::-1]:
-                                if times[i] < key:
-                                    idx = i
-                                    break
-                            else:
-                                raise
-                        elif not_found == "stop":
-                            for i in range(len(times))[::-1]:
-                                if times[i] < key:
-                                    idx = i
-                                    if idx < len(times) - 1:
-                                        idx += 1
-                                    break
-                            else:
-                                raise
-            elif isinstance(item_to_index, int):
-                idx = item_to_index
-                if idx < 0 and not_found == "next":
-                    idx = 0
-                if idx >= len(times) and not_found == "previous":
-                    idx = len(times) - 1
-            else:
-                raise TypeError(
-                    f"Expected HecTime, datetime, str, or int. Got {type(item_to_index)}"
-                )
-        except TypeError:
-            raise
-        except:
-            if not_found == "next":
-                raise IndexError(
-                    f"{item_to_index} is not in times and no next time was found"
-                )
-            if not_found == "previous":
-                raise IndexError(
-                    f"{item_to_index} is not in times and no previous time was found"
-                )
-            raise IndexError(f"{item_to_index} is not in times")
-        assert idx is not None
-        return times[idx]
+        index = cast(pd.DatetimeIndex, self._data.index)
+        return TimeSeries._time_string(
+            index[self._position_of(item_to_index, not_found)]
+        )
 
     @property
     def interval(self) -> Interval:
@@ -5134,7 +6829,7 @@ class TimeSeries:
                 f"Expected int, str, datetime, or HecTime, got {type(index)}"
             )
         try:
-            df = self[index].data
+            df = self[index]._data
             if df is None:
                 return False
             if math.isnan(df.value) or math.isinf(df.value):
@@ -5264,7 +6959,15 @@ class TimeSeries:
 
     def iselect(
         self,
-        selection: Union[Select, int, slice, Callable[[TimeSeriesValue], bool]],
+        selection: Union[
+            Select,
+            int,
+            str,
+            datetime,
+            HecTime,
+            slice,
+            Callable[[TimeSeriesValue], bool],
+        ],
         combination: Combine = Combine.REPLACE,
     ) -> "TimeSeries":
         """
@@ -5279,6 +6982,18 @@ class TimeSeries:
         self.select_valid(in_place=True)
         return self
 
+    def iselect_where(
+        self,
+        predicate: Callable[
+            [pd.DatetimeIndex, npt.NDArray[np.float64], npt.NDArray[np.int64]], Any
+        ],
+        combination: Combine = Combine.REPLACE,
+    ) -> "TimeSeries":
+        """
+        Convenience method for executing [select_where(...)](#TimeSeries.select_where) with `in_place=True`.
+        """
+        return self.select_where(predicate, combination, in_place=True)
+
     def iset_duration(self, value: Union[Duration, str, int]) -> "TimeSeries":
         """
         Convenience method for executing [set_duration(...)](#TimeSeries.set_duration) with `in_place=True`.
@@ -5367,6 +7082,60 @@ class TimeSeries:
         """
         return self.snap_to_regular(interval, offset, backward, forward, in_place=True)
 
+    def iter_chunks(
+        self, size: Union[int, TimeSpan, timedelta]
+    ) -> Iterator["TimeSeries"]:
+        """
+        Returns an iterator over consecutive chunks of this time series, each a `TimeSeries` object with the same
+        metadata and a view of the rows in the chunk. Chunks of time are aligned on the first time of this time series
+        and chunks that contain no times are skipped.
+
+        Use with [`process_chunks()`](#TimeSeries.process_chunks) and [`from_chunks()`](#TimeSeries.from_chunks).
+
+        Args:
+            size (Union[int, TimeSpan, timedelta]): The number of rows in each chunk, or the fixed length of time
+                covered by each chunk
+
+        Raises:
+            TimeSeriesException: If this time series has a selection or the size is not positive or is a length of time that depends on the calendar
+
+        Returns:
+            Iterator[TimeSeries]: The chunks
+        """
+        if self.has_selection:
+            raise TimeSeriesException("Cannot iterate over chunks with a selection")
+        if isinstance(size, int):
+            step = size
+        else:
+            span = TimeSeries._span_nanoseconds(
+                size if isinstance(size, TimeSpan) else TimeSpan(size)
+            )
+            if span is None:
+                raise TimeSeriesException(
+                    f"Chunk size {size} depends on the calendar or local time"
+                )
+            step = span
+        if step <= 0:
+            raise TimeSeriesException(f"Chunk size must be positive, got {size}")
+        bounds: List[int] = []
+        if self._data is not None and not self._data.empty:
+            if isinstance(size, int):
+                bounds = list(range(0, len(self._data), step)) + [len(self._data)]
+            else:
+                times = TimeSeries._index_nanoseconds(
+                    cast(pd.DatetimeIndex, self._data.index)
+                )
+                bounds = sorted(
+                    set(
+                        np.searchsorted(
+                            times,
+                            times[0]
+                            + step * np.arange((times[-1] - times[0]) // step + 2),
+                        ).tolist()
+                    )
+                )
+        return (self._chunk(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1))
+
     def itime_derivative(self, in_place: bool = False) -> "TimeSeries":
         """
         Convenience method for executing [time_derivative(...)](#TimeSeries.time_derivative) with `in_place=True`.
@@ -5482,6 +7251,23 @@ class TimeSeries:
                 target._timezone = str(tz)
         return target
 
+    def lazy(self) -> "LazyTimeSeries":
+        """
+        Returns a [LazyTimeSeries](#LazyTimeSeries) object that records operations on this time series and performs them
+        together when its [collect()](#LazyTimeSeries.collect) method is called.
+
+        For example:
+        ```
+        result = ts.lazy().estimate_missing_values(4).olympic_moving_average(7).screen_with_value_range(...).collect()
+        ```
+        returns the same time series as calling the methods in sequence on `ts`, but copies `ts` only once and
+        validates the times against the interval only once.
+
+        Returns:
+            LazyTimeSeries: The lazy time series
+        """
+        return LazyTimeSeries(self)
+
     @property
     def last_valid_time(self) -> Optional[np.datetime64]:
         """
@@ -5558,7 +7344,7 @@ class TimeSeries:
         """
         if self._data is None:
             raise TimeSeriesException("Operation is invalid with empty time series.")
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         cast(pd.DataFrame, target._data)["value"] = cast(pd.DataFrame, target._data)[
             "value"
         ].map(func)
@@ -5609,6 +7395,17 @@ class TimeSeries:
         else:
             return HecTime(self._data["value"].idxmax())
 
+    def memory_usage(self) -> int:
+        """
+        Returns the number of bytes used by the data of this object, including the times
+
+        Returns:
+            int: The number of bytes, or 0 if there is no data
+        """
+        if self._data is None:
+            return 0
+        return int(self._data.memory_usage(index=True).sum())
+
     def merge(
         self, other: Union["TimeSeries", List["TimeSeries"]], in_place: bool = False
     ) -> "TimeSeries":
@@ -5632,68 +7429,85 @@ class TimeSeries:
         Returns:
             TimeSeries: The merged time series
         """
-        # ---------------- #
-        # set up variables #
-        # ---------------- #
+        # ---------------------------------------------------------- #
+        # the DataFrames to merge, in order, starting with this one  #
+        # (a time series without data takes no part in the merge)    #
+        # ---------------------------------------------------------- #
         others = other if isinstance(other, list) else [other]
-        # ------------------------------ #
-        # get the DataFrame to work with #
-        # ------------------------------ #
-        target = self if in_place else self.copy()
-        data = cast(
-            pd.DataFrame, target._data
-        )  # doesn't affect selection, can't overwrite protected rows
-        # ----------------- #
-        # perform the merge #
-        # ----------------- #
-        all_times = set() if data is None or data.empty else set(data.index.to_list())
-        for ts in others:
-            if data is None:
-                if ts._data is None:
-                    continue
-                data = ts._data.copy()
-            elif ts._data is None:
-                continue
-            else:
-                data2 = ts._data
-                # Align data2 with data by reindexing
-                #
-                # Moved to using sets becuase data.index.union(data2.index) didn't always work
-                all_times |= set(data2.index.to_list())
-                aligned_data2 = data2.reindex(
-                    pd.DatetimeIndex(sorted(all_times), name="time")
-                )
-                aligned_data2["quality"] = (
-                    pd.to_numeric(aligned_data2["quality"], errors="coerce")
-                    .fillna(5)
-                    .astype("Int64")  # set to missing quality
-                )
-                # Create overwrite_mask
-                overwrite_mask = (
-                    (data["value"].isna() | np.isinf(data["value"]))  # NaN or infinite
-                    & ~(
-                        (data["quality"].astype(int) & (1 << 31)) != 0
-                    )  # Bit 31 not set in data
-                ) | (
-                    (
-                        (aligned_data2["quality"].astype(int) & (1 << 31)) != 0
-                    )  # Bit 31 set in data2
-                )
-                # Update rows in data where overwrite_mask is True
-                updated_data = data.copy()
-                updated_data.loc[overwrite_mask] = aligned_data2.loc[overwrite_mask]
-                # Add rows from data2 not in data
-                data = pd.concat(
-                    [
-                        df
-                        for df in (
-                            updated_data,
-                            aligned_data2[~aligned_data2.index.isin(data.index)],
-                        )
-                        if not df.empty
-                    ]
-                )
-            target._data = data
+        target = self._target(in_place)
+        frames = [ts._data for ts in [target] + others if ts._data is not None]
+        if len(frames) < 2:
+            if frames and target._data is None:
+                target._data = frames[0].copy()
+            target._validate()
+            return target
+        if len({cast(pd.DatetimeIndex, f.index).tz is None for f in frames}) > 1:
+            raise TimeSeriesException(
+                "Cannot merge time series with and without time zones"
+            )
+        # --------------------------------------- #
+        # union all the times in a single pass    #
+        # --------------------------------------- #
+        nanos = [
+            TimeSeries._index_nanoseconds(cast(pd.DatetimeIndex, frame.index))
+            for frame in frames
+        ]
+        times = np.unique(np.concatenate(nanos))
+        count = len(frames)
+        positions = [np.searchsorted(times, ns) for ns in nanos]
+        frame_values = [frame["value"].to_numpy(dtype=np.float64) for frame in frames]
+        frame_qualities = [
+            pd.to_numeric(frame["quality"], errors="coerce")
+            .fillna(5)
+            .to_numpy(dtype=np.int64)
+            for frame in frames
+        ]
+        # ---------------------------------------------------------------- #
+        # merging the frames in sequence leaves each time with the row of  #
+        # * the last frame with a protected value at that time, else       #
+        # * the first frame with a finite value at that time, else         #
+        # * the last frame, or a missing value if it doesn't have the time #
+        # ---------------------------------------------------------------- #
+        last_protected = np.full(len(times), -1)
+        first_valid = np.full(len(times), count)
+        in_last = np.zeros(len(times), dtype=bool)
+        for k, (pos, values, qualities) in enumerate(
+            zip(positions, frame_values, frame_qualities)
+        ):
+            last_protected[pos[(qualities & (1 << 31)) != 0]] = k
+            valid = pos[np.isfinite(values)]
+            first_valid[valid] = np.minimum(first_valid[valid], k)
+        in_last[positions[-1]] = True
+        source = np.where(
+            last_protected >= 0,
+            last_protected,
+            np.where(
+                first_valid < count, first_valid, np.where(in_last, count - 1, -1)
+            ),
+        )
+        # ------------------------------------------- #
+        # gather the merged rows in one allocation    #
+        # ------------------------------------------- #
+        merged_values = np.full(len(times), np.nan)
+        merged_qualities = np.full(len(times), 5, dtype=np.int64)
+        for k, (pos, values, qualities) in enumerate(
+            zip(positions, frame_values, frame_qualities)
+        ):
+            use = source[pos] == k
+            merged_values[pos[use]] = values[use]
+            merged_qualities[pos[use]] = qualities[use]
+        index = pd.DatetimeIndex(times.view("datetime64[ns]"), name="time")
+        time_zone = cast(pd.DatetimeIndex, frames[0].index).tz
+        if time_zone is not None:
+            index = index.tz_localize("UTC").tz_convert(time_zone)
+        data = pd.DataFrame(
+            {"value": merged_values, "quality": merged_qualities}, index=index
+        )
+        if target._data is not None and "selected" in target._data.columns:
+            selected = np.zeros(len(times), dtype=bool)
+            selected[positions[0]] = target._data["selected"].to_numpy(dtype=bool)
+            data["selected"] = selected
+        target._data = data
         target._validate()
         return target
 
@@ -6146,7 +7960,10 @@ class TimeSeries:
             return self._data["value"].quantile(pct / 100.0)
 
     @staticmethod
-    def percentile_ts(pct: float, timeseries: list["TimeSeries"]) -> "TimeSeries":
+    def percentile_ts(
+        pct: Union[float, list[float], tuple[float, ...]],
+        timeseries: list["TimeSeries"],
+    ) -> "TimeSeries":
         """
         Computes the specified percentile of the values in the time series
 
@@ -6168,22 +7985,16 @@ class TimeSeries:
             # ----------------------------------- #
             # filter out time series without data #
             # ----------------------------------- #
-            with_data = [ts for ts in timeseries if ts.data is not None]
+            with_data = [ts for ts in timeseries if ts._data is not None]
             if len(with_data) < 2:
                 raise TimeSeriesException(
                     "More that one time series with data is required"
                 )
-            # ------------------------------------------------------------------------------------------------- #
-            # generate an index common to all time series and create a list of DataFrames with only those times #
-            # ------------------------------------------------------------------------------------------------- #
-            common_index = cast(pd.DataFrame, with_data[0].data).index
-            for ts in with_data[1:]:
-                common_index = common_index.intersection(
-                    cast(pd.DataFrame, ts.data).index
-                )
-                if len(common_index) == 0:
-                    raise TimeSeriesException("Time series do not include common times")
-            common_index.name = "time"
+            # ----------------------------------------------------------------- #
+            # gather the selected values at the times common to all time series #
+            # into one (times x time series) array                              #
+            # ----------------------------------------------------------------- #
+            common_index, block = TimeSeries._aligned_values(with_data, True)
             # ---------------------------------------- #
             # generate and return a result time series #
             # ---------------------------------------- #
@@ -6191,21 +8002,25 @@ class TimeSeries:
             ts.ito("Code-Percentile").version = (
                 f"{str(pct).replace('.', '_')}-percentile"
             )
+            # ---------------------------------------------------------------- #
+            # sort the NaNs to the end of each row and compute the percentiles #
+            # of all rows with the same number of values in one call, which is #
+            # the same as computing them row by row on the non-NaN values      #
+            # ---------------------------------------------------------------- #
+            ordered = np.sort(block, axis=1)
+            counts = np.count_nonzero(~np.isnan(ordered), axis=1)
+            quantiles = np.asarray(pct, dtype=np.float64)
+            percentiles = np.full(quantiles.shape + (len(ordered),), np.nan)
+            for count in np.unique(counts[counts > 0]):
+                rows = counts == count
+                percentiles[..., rows] = np.percentile(
+                    ordered[rows, :count], quantiles, axis=1
+                )
             ts._data = pd.DataFrame(
                 {
-                    "value": pd.concat(
-                        [
-                            (
-                                cast(pd.DataFrame, ts._data).loc[
-                                    cast(pd.DataFrame, ts._data)["selected"], ["value"]
-                                ]
-                                if ts.has_selection
-                                else cast(pd.DataFrame, ts._data)["value"]
-                            )
-                            for ts in timeseries
-                        ],
-                        axis=1,
-                    ).apply(lambda row: np.percentile(row.dropna(), pct), axis=1),
+                    "value": (
+                        percentiles if percentiles.ndim == 1 else list(percentiles.T)
+                    ),
                     "quality": 0,
                 },
                 index=common_index,
@@ -6216,6 +8031,70 @@ class TimeSeries:
                 if timeseries[i].selection_state == SelectionState.TRANSIENT:
                     timeseries[i].select(Select.ALL)
 
+    @staticmethod
+    def process_chunks(
+        chunks: Iterable["TimeSeries"], operation: str, *args: Any, **kwargs: Any
+    ) -> Iterator["TimeSeries"]:
+        """
+        Performs an operation on consecutive chunks of a time series, such as those generated by [`iter_chunks()`](#TimeSeries.iter_chunks)
+        or [`read_parquet_chunks()`](#TimeSeries.read_parquet_chunks), and returns an iterator over the resulting chunks.
+
+        The rows before and after each chunk that the operation uses (and the state it carries, like the running total of
+        [`accum()`](#TimeSeries.accum)) are kept between chunks, so the resulting chunks contain the same times, values, and
+        quality codes as performing the operation on the entire time series, while the memory used is proportional to the size
+        of the chunks plus the context each operation needs. Moving averages are computed from block window sums that don't
+        depend on the chunk boundaries, so their values are identical to those of the entire time series. Only the chunks
+        are read when the iterator is advanced, so a period of record can be screened without holding it in memory:
+        ```
+        chunks = TimeSeries.read_parquet_chunks("por.parquet", 1_000_000)
+        screened = TimeSeries.process_chunks(chunks, "screen_with_value_range", 0.0, 0.0, 100.0, 1000.0)
+        TimeSeries.to_parquet_chunks(screened, "screened.parquet")
+        ```
+
+        The supported operations are:
+        * [`accum`](#TimeSeries.accum)
+        * [`centered_moving_average`](#TimeSeries.centered_moving_average)
+        * [`diff`](#TimeSeries.diff)
+        * [`estimate_missing_values`](#TimeSeries.estimate_missing_values)
+        * [`forward_moving_average`](#TimeSeries.forward_moving_average)
+        * [`olympic_moving_average`](#TimeSeries.olympic_moving_average)
+        * [`resample`](#TimeSeries.resample) onto a time series pattern or an interval of fixed length, except averaging a `Total` time series
+        * [`screen_with_constant_value`](#TimeSeries.screen_with_constant_value)
+        * [`screen_with_duration_magnitude`](#TimeSeries.screen_with_duration_magnitude)
+        * [`screen_with_forward_moving_average`](#TimeSeries.screen_with_forward_moving_average)
+        * [`screen_with_value_change_rate`](#TimeSeries.screen_with_value_change_rate)
+        * [`screen_with_value_range`](#TimeSeries.screen_with_value_range)
+        * [`screen_with_value_range_or_change`](#TimeSeries.screen_with_value_range_or_change)
+        * [`time_derivative`](#TimeSeries.time_derivative)
+
+        Args:
+            chunks (Iterable[TimeSeries]): The chunks, in increasing time order without overlap and without selections
+            operation (str): The name of the operation
+            *args (Any): The positional arguments of the operation
+            **kwargs (Any): The keyword arguments of the operation, except `in_place`
+
+        Raises:
+            TimeSeriesException: If the operation is not supported or cannot be performed in chunks with the specified arguments,
+                or (when iterating) if the chunks have selections or are not in increasing time order
+            TypeError: If the arguments do not match those of the operation
+
+        Returns:
+            Iterator[TimeSeries]: The resulting chunks, each with the metadata of performing the operation on a chunk
+        """
+        if operation not in _chunked_operations:
+            raise TimeSeriesException(
+                f"Operation {operation} cannot be performed in chunks"
+            )
+        bound = inspect.signature(getattr(TimeSeries, operation)).bind(
+            None, *args, **kwargs
+        )
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments["self"]
+        if arguments.pop("in_place", False):
+            raise TimeSeriesException("Cannot perform operations in place on chunks")
+        return TimeSeries._process_chunks(iter(chunks), operation, arguments)
+
     @property
     def qualities(self) -> list[int]:
         """
@@ -6226,7 +8105,7 @@ class TimeSeries:
         """
         return (
             []
-            if self._data is None or cast(pd.DataFrame, self.data).empty
+            if self._data is None or self._data.empty
             else (
                 [tsv.quality.signed for tsv in self.tsv]
                 if Quality._return_signed_codes
@@ -6234,6 +8113,97 @@ class TimeSeries:
             )
         )
 
+    @staticmethod
+    def read_parquet(
+        path: str, memory_map: bool = True, validate: bool = True
+    ) -> "TimeSeries":
+        """
+        Returns a `TimeSeries` object from a Parquet file written by [`to_parquet()`](#TimeSeries.to_parquet).
+        Requires the `pyarrow` package.
+
+        Args:
+            path (str): The name of the Parquet file
+            memory_map (bool, optional): Specifies whether to memory-map the file when reading it. Defaults to True.
+            validate (bool, optional): Specifies whether to verify that the times of a regular time series are consistent with its interval. Specify
+                False only when the times are known to be consistent to skip the verification. Defaults to True.
+
+        Raises:
+            TimeSeriesException: If the file does not contain time series metadata or the times are not consistent with the
+                interval of a regular time series
+
+        Returns:
+            TimeSeries: The generated `TimeSeries` object
+        """
+        pa = hec.shared.import_pyarrow()
+        return TimeSeries.from_arrow(
+            pa.parquet.read_table(path, memory_map=memory_map), validate
+        )
+
+    @staticmethod
+    def read_parquet_chunks(
+        path: str, size: int, validate: bool = True
+    ) -> Iterator["TimeSeries"]:
+        """
+        Returns an iterator over consecutive chunks of the time series in a Parquet file written by [`to_parquet()`](#TimeSeries.to_parquet)
+        or [`to_parquet_chunks()`](#TimeSeries.to_parquet_chunks), reading each chunk from the file when the iterator is advanced.
+        Requires the `pyarrow` package.
+
+        Use with [`process_chunks()`](#TimeSeries.process_chunks) and [`from_chunks()`](#TimeSeries.from_chunks).
+
+        Args:
+            path (str): The name of the Parquet file
+            size (int): The maximum number of rows in each chunk
+            validate (bool, optional): Specifies whether to verify that the times of each chunk of a regular time series are consistent with
+                its interval. Specify False only when the times are known to be consistent to skip the verification. Defaults to True.
+
+        Raises:
+            TimeSeriesException: If the file does not contain time series metadata or the times are not consistent with the
+                interval of a regular time series
+
+        Returns:
+            Iterator[TimeSeries]: The chunks
+        """
+        pa = hec.shared.import_pyarrow()
+        file = pa.parquet.ParquetFile(path, memory_map=True)
+        schema = file.schema_arrow
+        metadata = schema.metadata or {}
+        if _arrow_metadata_key not in metadata:
+            raise TimeSeriesException("File does not contain time series metadata")
+        item = json.loads(metadata[_arrow_metadata_key])
+        aware = schema.field("time").type.tz is not None
+        return (
+            TimeSeries._from_arrow_table(
+                item, pa.Table.from_batches([batch], schema), aware, validate
+            )
+            for batch in file.iter_batches(batch_size=size)
+        )
+
+    @staticmethod
+    def read_parquet_many(
+        path: str, memory_map: bool = True, validate: bool = True
+    ) -> List["TimeSeries"]:
+        """
+        Returns the `TimeSeries` objects from a Parquet file written by [`to_parquet_many()`](#TimeSeries.to_parquet_many).
+        Requires the `pyarrow` package.
+
+        Args:
+            path (str): The name of the Parquet file
+            memory_map (bool, optional): Specifies whether to memory-map the file when reading it. Defaults to True.
+            validate (bool, optional): Specifies whether to verify that the times of each regular time series are consistent with its interval. Specify
+                False only when the times are known to be consistent to skip the verification. Defaults to True.
+
+        Raises:
+            TimeSeriesException: If the file does not contain time series metadata or the times are not consistent with the
+                interval of a regular time series
+
+        Returns:
+            List[TimeSeries]: The generated `TimeSeries` objects, in the order they were stored
+        """
+        pa = hec.shared.import_pyarrow()
+        return TimeSeries.from_arrow_many(
+            pa.parquet.read_table(path, memory_map=memory_map), validate
+        )
+
     def resample(
         self,
         operation: str,
@@ -6278,6 +8248,10 @@ class TimeSeries:
         For discreet operations (except `Previous`) the `entire_interval` argument specifies whether to require that each entire old interval falls within the new interval
         (True) or to allow all old points whose interval time is in the new interval (False).
 
+        Continuous operations weight the old values by the actual time elapsed between points. For a time series with a time zone, a new interval
+        that contains a daylight saving time change is integrated and averaged over its actual length (e.g., 23 hours for a day that loses an hour)
+        rather than over its length in wall clock time.
+
         See [base_parameter_definitions](parameter.html#base_parameter_definitions) for information on base parameters and their conversions.
 
         **Parameter Type Effects**
@@ -6368,302 +8342,86 @@ class TimeSeries:
                 * **str**: May be one of
                     * "LAST": sets the new values to the last value in the old time series
                     * "MISSING": sets the new values to missing
-                Defaults to "LAST".
-            in_place (bool, optional): Specifies whether to resample onto this time series (True) or onto a new time series (False). Defaults to False.
-
-        Raises:
-            TimeSeriesException:<br>
-                * on time series with no data
-                * on time series with no parameter type
-                * on invalid `operation` parameter (matches zero or more than one)
-                * on invalid `before` paremeter
-                * on invalid `after` parameter
-                * on empty pattern time series
-                * on attempt perform invalid continuous resample operation (see [Restrictions](#restrictions)) above
-            TypeError:<br>
-                * on unexpected `interval` type parameter
-
-        Returns:
-            TimeSeries: The resampled time series, whether this one or a new one.
-        """
-        # ------------- #
-        # sanity checks #
-        # ------------- #
-        if self._data is None or self._data.empty:
-            raise TimeSeriesException("Operation is invalid with empty time series.")
-        if self.parameter_type is None:
-            raise TimeSeriesException(
-                "Cannot resample a time series without a known parameter type."
-            )
-        matched_operations = [
-            o for o in _resample_operations if o.startswith(operation.upper())
-        ]
-        if not matched_operations:
-            raise TimeSeriesException(
-                f"'{operation}' does not match any valid resample operation"
-            )
-        if len(matched_operations) > 1:
-            raise Exception(
-                f"'{operation}' matches multiple operations: {', '.join(matched_operations)}"
-            )
-        resample_operation = matched_operations[0]
-        if isinstance(before, str):
-            matched_value = [
-                o for o in _resample_before if o.startswith(before.upper())
-            ]
-            if not matched_value:
-                raise TimeSeriesException(
-                    f"'{before}' doesn't match any valid before option"
-                )
-            if matched_value[0] == _RESAMPLE_FIRST:
-                before_value = -math.inf
-            elif matched_value[0] == _RESAMPLE_MISSING:
-                before_value = math.inf
-            else:
-                raise TimeSeriesException(
-                    f"'{matched_value}' is unexpected before option"
-                )
-        else:
-            before_value = before
-        if isinstance(after, str):
-            matched_value = [o for o in _resample_after if o.startswith(after.upper())]
-            if not matched_value:
-                raise TimeSeriesException(
-                    f"'{after}' doesn't match any valid after option"
-                )
-            if matched_value[0] == _RESAMPLE_LAST:
-                after_value = -math.inf
-            elif matched_value[0] == _RESAMPLE_MISSING:
-                after_value = math.inf
-            else:
-                raise TimeSeriesException(
-                    f"'{matched_value}' is unexpected after option"
-                )
-        else:
-            after_value = after
-        # ---------------------------------------- #
-        # Generate time series values at new times #
-        # ---------------------------------------- #
-        time_window = {
-            "start": HecTime(start_time if start_time else self.times[0]),
-            "end": HecTime(end_time if end_time else self.times[-1]),
-        }
-        new_tsvs: List[TimeSeriesValue]
-        interval_offset = (
-            TimeSpan()
-            if not offset
-            else (
-                TimeSpan(0, 0, 0, 0, offset)
-                if isinstance(offset, int)
-                else TimeSpan(offset)
-            )
-        )
-        if interval is None or isinstance(interval, TimeSeries):
-            # --------------------------------- #
-            # use pattern time series for times #
-            # --------------------------------- #
-            timeseries = interval
-            if timeseries is None:
-                # ------------------------------------- #
-                # use same interval as this time series #
-                # ------------------------------------- #
-                timeseries = self
-            if timeseries._data is None or timeseries._data.empty:
-                raise TimeSeriesException(
-                    "Operation is invalid with empty pattern time series."
-                )
-            new_tsvs = [
-                TimeSeriesValue(
-                    HecTime(t) + interval_offset,
-                    UnitQuantity(math.nan, timeseries.unit),
-                    0,
-                )
-                for t in timeseries.times
-            ]
-            if timeseries.has_selection:
-                new_tsvs = [
-                    new_tsvs[i]
-                    for i in list(
-                        np.flatnonzero(cast(pd.DataFrame, timeseries.data)["selected"])
-                    )
-                ]
-                if timeseries.selection_state == SelectionState.TRANSIENT:
-                    timeseries.iselect(Select.ALL)
-        elif isinstance(interval, Interval):
-            # ---------------------- #
-            # use Interval for times #
-            # ---------------------- #
-            start_time = cast(HecTime, time_window["start"].clone())
-            if interval.is_any_regular:
-                start_time -= TimeSpan(
-                    minutes=cast(int, start_time.get_interval_offset(interval))
-                    - interval_offset.total_seconds() // 60
-                )
-                if start_time < time_window["start"]:
-                    start_time += interval
-            new_tsvs = []
-            t = start_time
-            while t <= time_window["end"]:
-                new_tsvs.append(
-                    TimeSeriesValue(t, UnitQuantity(math.nan, self.unit), 0)
-                )
-                t += interval
-        elif isinstance(interval, (TimeSpan, timedelta)):
-            # ---------------------- #
-            # use TimeSpan for times #
-            # ---------------------- #
-            timespan = (
-                TimeSpan(interval) if isinstance(interval, timedelta) else interval
-            )
-            new_tsvs = []
-            t = time_window["start"] + interval_offset
-            while t <= time_window["end"]:
-                new_tsvs.append(
-                    TimeSeriesValue(t, UnitQuantity(math.nan, self.unit), 0)
-                )
-                t += timespan
-        else:
-            raise TypeError(
-                f"Expected Optional[Union[TimeSeries, TimeSpan, timedelta]] for interval parameter, got {type(interval)}"
-            )
-        # ------------------------------------------------------------ #
-        # generate time series values at (possibly selected) old times #
-        # ------------------------------------------------------------ #
-        old_tsvs = self.tsv
-        if self.has_selection:
-            old_tsvs = [
-                old_tsvs[i]
-                for i in list(np.flatnonzero(cast(pd.DataFrame, self.data)["selected"]))
-            ]
-        # ----------------------------------------------------------- #
-        # get the bounding indices of the old times for each new time #
-        # ----------------------------------------------------------- #
-        bounds: List[Any] = len(new_tsvs) * [None]
-        for i in range(len(new_tsvs)):
-            prev = bisect.bisect_right(old_tsvs, new_tsvs[i])
-            if prev == 0:
-                # ------------------------------------------------------------------------- #
-                # old time is before first new time  - set value and leave bounds[i] = None #
-                # ------------------------------------------------------------------------- #
-                if math.isfinite(before_value) or math.isnan(before_value):
-                    new_tsvs[i].value = UnitQuantity(before_value, self.unit)
-                elif before_value == -math.inf:
-                    # RESAMPLE_FIRST
-                    new_tsvs[i].value = old_tsvs[0].value
-                else:
-                    # RESAMPLE_MISSING
-                    new_tsvs[i].value = UnitQuantity(math.nan, self.unit)
-            elif prev == len(old_tsvs):
-                prev -= 1
-                if old_tsvs[prev].time == new_tsvs[i].time:
-                    # --------------------------------- #
-                    # old time is exactly last new time #
-                    # --------------------------------- #
-                    bounds[i] = (prev, prev)
-                else:
-                    # ----------------------------------------------------------------------------------------- #
-                    # old time is after last new time - set remaining values and leave bounds for values = None #
-                    # ----------------------------------------------------------------------------------------- #
-                    for j in range(i, len(new_tsvs)):
-                        if math.isfinite(after_value) or math.isnan(after_value):
-                            new_tsvs[j].value = UnitQuantity(after_value, self.unit)
-                        elif after_value == -math.inf:
-                            # _RESAMPLE_LAST
-                            new_tsvs[j].value = old_tsvs[-1].value
-                        else:
-                            # _RESAMPLE_MISSING
-                            new_tsvs[j].value = UnitQuantity(math.nan, self.unit)
-                    break
-            else:
-                # ----------------------------------------------------------------------------- #
-                # old time is in range of new times - set the bounds to fill in the value later #
-                # ----------------------------------------------------------------------------- #
-                prev -= 1
-                if old_tsvs[prev].time == new_tsvs[i].time:
-                    bounds[i] = (prev, prev)
-                else:
-                    bounds[i] = (prev, prev + 1)
-        # ------------------------------ #
-        # perform the resample operation #
-        # ------------------------------ #
-        target = self if in_place else self.copy()
-        is_discreet = _resample_operations[resample_operation]
-        if is_discreet:
-            self._resample_discreet(
-                resample_operation, old_tsvs, new_tsvs, bounds, entire_interval
-            )
-        else:
-            is_regular = isinstance(interval, Interval) and interval.is_any_regular
-            self._resample_continuous(
-                resample_operation,
-                old_tsvs,
-                new_tsvs,
-                is_regular,
-                bounds,
-                max_missing_percent,
-            )
-        target._data = None
-        # ------------------------------------------------ #
-        # update parameter and unit info for the operation #
-        # ------------------------------------------------ #
-        if resample_operation == _RESAMPLE_OP_AVERAGE:
-            target.iset_parameter_type(ParameterType("Average", target.context))
-        elif resample_operation == _RESAMPLE_OP_COUNT:
-            target.iset_parameter(f"Count-{target.parameter.name}")
-            target.iset_parameter_type(ParameterType("Total", target.context))
-        elif resample_operation == _RESAMPLE_OP_MAXIMUM:
-            target.iset_parameter_type(ParameterType("Maximum", target.context))
-        elif resample_operation == _RESAMPLE_OP_MINIMUM:
-            target.iset_parameter_type(ParameterType("Minimum", target.context))
-        elif resample_operation in (_RESAMPLE_OP_INTEGRATE, _RESAMPLE_OP_VOLUME):
-            new_parameter = self.get_integration_parameter()
-            target.iset_parameter(new_parameter)
-        # ---------------------------- #
-        # update interval information  #
-        # ---------------------------- #
-        if interval is None:
-            target.iset_interval(self.interval)
-        elif isinstance(interval, TimeSeries):
-            target.iset_interval(interval.interval)
-        elif isinstance(interval, Interval):
-            target.iset_interval(interval)
-        else:
-            if target.context == DSS:
-                times_per_year = len(new_tsvs) / (
-                    (
-                        cast(datetime, new_tsvs[-1].time.datetime())
-                        - cast(datetime, new_tsvs[0].time.datetime())
-                    ).total_seconds()
-                    / 86400.0
-                    / 365.0
-                )
-                if times_per_year < 10:
-                    target.iset_interval(Interval.get_dss("Ir-Decade"))
-                elif times_per_year < 1000:
-                    target.iset_interval(Interval.get_dss("Ir-Year"))
-                elif times_per_year < 10000:
-                    target.iset_interval(Interval.get_dss("Ir-Month"))
-                else:
-                    target.iset_interval(Interval.get_dss("Ir-Day"))
-            else:
-                target.iset_interval(Interval.get_cwms("0"))
-        # ---------------------- #
-        # rebuild the data frame #
-        # ---------------------- #
-        target._data = pd.DataFrame(
-            {
-                "value": [tsv.value.magnitude for tsv in new_tsvs],
-                "quality": [tsv.quality.code for tsv in new_tsvs],
-            },
-            index=pd.DatetimeIndex(
-                [tsv.time.datetime() for tsv in new_tsvs], name="time"
-            ),
+                Defaults to "LAST".
+            in_place (bool, optional): Specifies whether to resample onto this time series (True) or onto a new time series (False). Defaults to False.
+
+        Raises:
+            TimeSeriesException:<br>
+                * on time series with no data
+                * on time series with no parameter type
+                * on invalid `operation` parameter (matches zero or more than one)
+                * on invalid `before` paremeter
+                * on invalid `after` parameter
+                * on empty pattern time series
+                * on attempt perform invalid continuous resample operation (see [Restrictions](#restrictions)) above
+            TypeError:<br>
+                * on unexpected `interval` type parameter
+
+        Returns:
+            TimeSeries: The resampled time series, whether this one or a new one.
+        """
+        return self._resample(
+            [operation],
+            interval,
+            offset,
+            start_time,
+            end_time,
+            max_missing_percent,
+            entire_interval,
+            before,
+            after,
+            in_place,
+        )[0]
+
+    def resample_many(
+        self,
+        operations: List[str],
+        interval: Optional[Union["TimeSeries", TimeSpan, timedelta]] = None,
+        offset: Optional[Union[int, TimeSpan, timedelta]] = None,
+        start_time: Optional[Union[HecTime, datetime, str]] = None,
+        end_time: Optional[Union[HecTime, datetime, str]] = None,
+        max_missing_percent: float = 25.0,
+        entire_interval: Optional[bool] = None,
+        before: Union[str, float] = 0.0,
+        after: Union[str, float] = _RESAMPLE_LAST,
+    ) -> List["TimeSeries"]:
+        """
+        Resamples a time series using several operations onto the same interval or time pattern and returns one new time series per operation.
+
+        The result for each operation is the same as calling [`resample`](#TimeSeries.resample) with that operation and the other arguments, but the new times,
+        the bounding old points of each new time, and the validity of the old points are computed only once and shared by all the operations.
+
+        Args:
+            operations (List[str]): The resample operations to perform. Each must be one of the operations accepted by [`resample`](#TimeSeries.resample).
+            interval (Optional[Union[&quot;TimeSeries&quot;, TimeSpan, timedelta]]): The interval or time pattern to resample onto. See [`resample`](#TimeSeries.resample). Defaults to None.
+            offset (Optional[Union[int, TimeSpan, timedelta]]): Offset into `interval` for each new time. See [`resample`](#TimeSeries.resample). Defaults to None
+            start_time (Optional[Union[HecTime, datetime, str]]): Start time of the new time series. None specifies the same start time as the old time sereies. Defaults to None.
+            end_time (Optional[Union[HecTime, datetime, str]]): End time of the new time series. None specifies the same end time as the old time sereies. Defaults to None.
+            max_missing_percent (float, optional): The maximum amount of time in each new interval that can be invalid or missing and still perform a continuous resample operation
+                for that interval. See [`resample`](#TimeSeries.resample). Defaults to 25.0.
+            entire_interval (Optional[bool]): *Used only for discreet resample operations (except `Previous`)*. See [`resample`](#TimeSeries.resample). Defaults to None.
+            before (Union[str, float], optional): *Used only for time patterns*. See [`resample`](#TimeSeries.resample). Defaults to 0.0.
+            after (Union[str, float], optional): *Used only for time patterns*. See [`resample`](#TimeSeries.resample). Defaults to "LAST".
+
+        Raises:
+            TimeSeriesException: For any of the reasons [`resample`](#TimeSeries.resample) raises it for any of the operations
+            TypeError: on unexpected `interval` type parameter
+
+        Returns:
+            List[TimeSeries]: The resampled time series, in the same order as `operations`.
+        """
+        return self._resample(
+            operations,
+            interval,
+            offset,
+            start_time,
+            end_time,
+            max_missing_percent,
+            entire_interval,
+            before,
+            after,
+            False,
         )
-        # -------------------------------- #
-        # return the resampled time series #
-        # -------------------------------- #
-        target._validate()
-        return target
 
     def round_off(
         self, precision: int, tens_place: int, in_place: bool = False
@@ -6745,19 +8503,18 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
+        selected = data["selected"].to_numpy(dtype=bool) if self.has_selection else None
         df = data.loc[data["selected"]] if self.has_selection else data
-        df_protected = df.loc[
-            (df["quality"] & 0b1000_0000_0000_0000_0000_0000_0000_0000) != 0
-        ].copy()
+        protected = TimeSeries._protected_mask(df)
         # ---------------- #
         # do the screening #
         # ---------------- #
-        quality_codes = TimeSeries._screen_with_constant_value(
-            list(map(HecTime, map(self.format_time_for_index, df.index.tolist()))),
-            df["value"].tolist(),
-            df["quality"].tolist(),
+        quality_codes = TimeSeries._screen_with_constant_value_vectorized(
+            TimeSeries._index_nanoseconds(cast(pd.DatetimeIndex, df.index)),
+            df["value"].to_numpy(dtype=np.float64),
+            df["quality"].to_numpy(dtype=np.int64),
             dur,
             missing_limit,
             reject_limit,
@@ -6765,18 +8522,11 @@ class TimeSeries:
             min_threshold,
             percent_valid_required,
         )
-        df.loc[:, "quality"] = df["quality"] & 0b0_0001 | np.array(quality_codes)
-        df.loc[(df["quality"] & 0b0_0101 == 0b0_0101), "value"] = np.nan
-        df.update(df_protected)
-        # -------------------------------------------------- #
-        # can't use .update(df) because it doesn't copy NaNs #
-        # -------------------------------------------------- #
-        for idx in df_protected.index:
-            df.loc[idx, "value"] = df_protected.loc[idx, "value"]
-            df.loc[idx, "quality"] = df_protected.loc[idx, "quality"]
-        for idx in df.index:
-            data.loc[idx, "value"] = df.loc[idx, "value"]
-            data.loc[idx, "quality"] = df.loc[idx, "quality"]
+        qualities = df["quality"].to_numpy(dtype=np.int64) & 0b0_0001 | quality_codes
+        values = np.where(
+            qualities & 0b0_0101 == 0b0_0101, np.nan, df["value"].to_numpy()
+        )
+        TimeSeries._apply_masked(data, values, qualities, selected, protected)
         if self.selection_state == SelectionState.TRANSIENT:
             self.iselect(Select.ALL)
             if target is not self:
@@ -6846,19 +8596,18 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
+        selected = data["selected"].to_numpy(dtype=bool) if self.has_selection else None
         df = data.loc[data["selected"]] if self.has_selection else data
-        df_protected = df.loc[
-            (df["quality"] & 0b1000_0000_0000_0000_0000_0000_0000_0000) != 0
-        ].copy()
+        protected = TimeSeries._protected_mask(df)
         # ---------------- #
         # do the screening #
         # ---------------- #
-        quality_codes = TimeSeries._screen_with_duration_magnitude(
-            list(map(HecTime, map(self.format_time_for_index, df.index.tolist()))),
-            df["value"].tolist(),
-            df["quality"].tolist(),
+        quality_codes = TimeSeries._screen_with_duration_magnitude_vectorized(
+            TimeSeries._index_nanoseconds(cast(pd.DatetimeIndex, df.index)),
+            df["value"].to_numpy(dtype=np.float64),
+            df["quality"].to_numpy(dtype=np.int64),
             dur,
             min_missing_limit,
             min_reject_limit,
@@ -6868,18 +8617,11 @@ class TimeSeries:
             max_missing_limit,
             percent_valid_required,
         )
-        df.loc[:, "quality"] = df["quality"] & 0b0_0001 | np.array(quality_codes)
-        df.loc[(df["quality"] & 0b0_0101 == 0b0_0101), "value"] = np.nan
-        df.update(df_protected)
-        # -------------------------------------------------- #
-        # can't use .update(df) because it doesn't copy NaNs #
-        # -------------------------------------------------- #
-        for idx in df_protected.index:
-            df.loc[idx, "value"] = df_protected.loc[idx, "value"]
-            df.loc[idx, "quality"] = df_protected.loc[idx, "quality"]
-        for idx in df.index:
-            data.loc[idx, "value"] = df.loc[idx, "value"]
-            data.loc[idx, "quality"] = df.loc[idx, "quality"]
+        qualities = df["quality"].to_numpy(dtype=np.int64) & 0b0_0001 | quality_codes
+        values = np.where(
+            qualities & 0b0_0101 == 0b0_0101, np.nan, df["value"].to_numpy()
+        )
+        TimeSeries._apply_masked(data, values, qualities, selected, protected)
         if self.selection_state == SelectionState.TRANSIENT:
             self.iselect(Select.ALL)
             if target is not self:
@@ -6944,52 +8686,38 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
+        selected = data["selected"].to_numpy(dtype=bool) if self.has_selection else None
         df = data.loc[data["selected"]] if self.has_selection else data
-        df_protected = df.loc[
-            (df["quality"] & 0b1000_0000_0000_0000_0000_0000_0000_0000) != 0
-        ].copy()
+        protected = TimeSeries._protected_mask(df)
         # ---------------- #
         # do the screening #
         # ---------------- #
-        missing_indices = df.index[
-            pd.isna(df["value"]) | np.isinf(df["value"])
-        ].tolist()
-        df.loc[missing_indices, "value"] = np.nan
-        df.loc[missing_indices, "quality"] = invalid_missing_code
-        for idx in df.index:
-            data.loc[idx, "value"] = df.loc[idx, "value"]
-            data.loc[idx, "quality"] = df.loc[idx, "quality"]
-        df_average = cast(
+        values = df["value"].to_numpy(dtype=np.float64, copy=True)
+        qualities = df["quality"].to_numpy(dtype=np.int64, copy=True)
+        missing = np.isnan(values) | np.isinf(values)
+        values[missing] = np.nan
+        qualities[missing] = invalid_missing_code
+        TimeSeries._apply_masked(data, values, qualities, selected, protected)
+        average = cast(
             pd.DataFrame,
-            target.forward_moving_average(window, only_valid, use_reduced).data,
-        )
-        for idx in set(df.index) - set(missing_indices):
-            current_quality_code = df.loc[idx, "quality"]
-            if np.isnan(df_average.loc[idx, "value"]):
-                continue
-            if abs(df_average.loc[idx, "value"] - df.loc[idx, "value"]) > diff_limit:
-                if failed_validity.upper() == "M":
-                    df.loc[idx, "quality"] = (
-                        current_quality_code & 0b0_0001 | screened_missing_code
-                    )
-                    df.loc[idx, "value"] = np.nan
-                else:
-                    df.loc[idx, "quality"] = (
-                        current_quality_code & 0b0_0001 | screened_other_code
-                    )
-            elif current_quality_code & 1 == 0:
-                df.loc[idx, "quality"] = screened_okay_code
+            target.forward_moving_average(window, only_valid, use_reduced)._data,
+        )["value"].to_numpy(dtype=np.float64)
+        if selected is not None:
+            average = average[selected]
+        screened = ~missing & ~np.isnan(average)
+        failed = screened & (np.abs(average - values) > diff_limit)
+        if failed_validity.upper() == "M":
+            qualities[failed] = qualities[failed] & 0b0_0001 | screened_missing_code
+            values[failed] = np.nan
+        else:
+            qualities[failed] = qualities[failed] & 0b0_0001 | screened_other_code
+        qualities[screened & ~failed & (qualities & 1 == 0)] = screened_okay_code
         # --------------- #
         # set the results #
         # --------------- #
-        for idx in df_protected.index:
-            df.loc[idx, "value"] = df_protected.loc[idx, "value"]
-            df.loc[idx, "quality"] = df_protected.loc[idx, "quality"]
-        for idx in df.index:
-            data.loc[idx, "value"] = df.loc[idx, "value"]
-            data.loc[idx, "quality"] = df.loc[idx, "quality"]
+        TimeSeries._apply_masked(data, values, qualities, selected, protected)
         if self.selection_state == SelectionState.TRANSIENT:
             self.iselect(Select.ALL)
             if target is not self:
@@ -7070,7 +8798,7 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
         data["value_diff"] = data["value"].diff()
         data["minutes_diff"] = data.index.to_series().diff().dt.total_seconds() / 60
@@ -7223,7 +8951,7 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
         df = data.loc[data["selected"]] if self.has_selection else data
         # ---------------- #
@@ -7348,8 +9076,9 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
+        selected = data["selected"].to_numpy(dtype=bool) if self.has_selection else None
         df = data.loc[data["selected"]] if self.has_selection else data
         # ---------------- #
         # do the screening #
@@ -7429,13 +9158,11 @@ class TimeSeries:
                     df.index.isin(change_indices) & ~df.index.isin(protected_indices),
                     "quality",
                 ] = (df["quality"] & ~missing_code) | missing_code
-        # -------------------------------------------------- #
-        # can't use .update(df) because it doesn't copy NaNs #
-        # -------------------------------------------------- #
-        for idx in df.index:
-            data.loc[idx, "value"] = df.loc[idx, "value"]
-            data.loc[idx, "quality"] = df.loc[idx, "quality"]
-
+        # --------------- #
+        # set the results #
+        # --------------- #
+        if selected is not None:
+            TimeSeries._apply_masked(data, df["value"], df["quality"], selected)
         if self.selection_state == SelectionState.TRANSIENT:
             self.iselect(Select.ALL)
             if target is not self:
@@ -7444,7 +9171,15 @@ class TimeSeries:
 
     def select(
         self,
-        selection: Union[Select, int, slice, Callable[[TimeSeriesValue], bool]],
+        selection: Union[
+            Select,
+            int,
+            str,
+            datetime,
+            HecTime,
+            slice,
+            Callable[[TimeSeriesValue], bool],
+        ],
         combination: Combine = Combine.REPLACE,
         in_place: bool = False,
     ) -> "TimeSeries":
@@ -7458,7 +9193,7 @@ class TimeSeries:
         * `SelectionState.DURABLE`: The selection will remain until explicitly changed by a call to iselect()
 
         Args:
-            selection (Union[Select, int, slice, Callable[[TimeSeriesValue], bool]]): One of the following:
+            selection (Union[Select, int, str, datetime, HecTime, slice, Callable[[TimeSeriesValue], bool]]): One of the following:
                 * `Select.NONE`: Marks all items as unselected. Any `combination` is ignored.
                 * `Select.ALL`: Marks all items as selected. Any `combination` is ignored.
                 * `Select.INVERT`: Inverts the current selected state of each item. Any `combination` is ignored.
@@ -7473,6 +9208,7 @@ class TimeSeries:
                         * datetime objects
                         * strings convertible to HecTime objects
                     * The step parameter must be an integer, if specified
+                    * If the times are not sorted, a slice with time bounds selects the items whose times are within the bounds
                 * function: A function that takes a single `TimeSeriesValue` parameter and returns a bool result.
                     An item is marked as selected if and only if the result of the function is True for the item (when combined with the current state if necessary).
             combination (Combine, optional): Specifies how to combine the function result with an item's current selected state.
@@ -7492,7 +9228,7 @@ class TimeSeries:
         """
         if self._data is None:
             raise TimeSeriesException("Operation is invalid with empty time series.")
-        target = self if in_place else self.copy()
+        target = self._writable(in_place)
         data = cast(pd.DataFrame, target._data)
         if isinstance(selection, Select):
             # ---------------- #
@@ -7512,40 +9248,26 @@ class TimeSeries:
                 pass
             else:
                 raise ValueError(f"Invalid selection: {selection}")
-        elif isinstance(selection, int):
-            # --------------------- #
-            # selection via integer #
-            # --------------------- #
-            func = (
-                lambda tsv: target.format_time_for_index(tsv.time)
-                in target.__getitem__(slice(selection, selection + 1)).times
-            )
-            return target.iselect(func, combination)
-        elif isinstance(selection, HecTime):
-            # --------------------- #
-            # selection via HecTime #
-            # --------------------- #
-            func = lambda tsv: target.format_time_for_index(
-                tsv.time
-            ) == target.format_time_for_index(selection)
-            return target.iselect(func, combination)
-        elif isinstance(selection, (str, datetime)):
-            # -------------------------------- #
-            # selection via string or datetime #
-            # -------------------------------- #
-            func = lambda tsv: target.format_time_for_index(
-                tsv.time
-            ) == target.format_time_for_index(HecTime(selection))
-            return target.iselect(func, combination)
-        elif isinstance(selection, slice):
-            # ------------------- #
-            # selection via slice #
-            # ------------------- #
-            func = (
-                lambda tsv: target.format_time_for_index(tsv.time)
-                in target.__getitem__(selection).times
+        elif isinstance(selection, (int, slice)):
+            # ------------------------------ #
+            # selection via integer or slice #
+            # ------------------------------ #
+            mask = np.zeros(len(data), dtype=bool)
+            mask[
+                (
+                    self._slice_positions(selection)
+                    if isinstance(selection, slice)
+                    else selection
+                )
+            ] = True
+            TimeSeries._combine_selection(data, mask, combination)
+        elif isinstance(selection, (HecTime, str, datetime)):
+            # ------------------------------------------ #
+            # selection via HecTime, string, or datetime #
+            # ------------------------------------------ #
+            TimeSeries._combine_selection(
+                data, TimeSeries._time_mask(data, selection), combination
             )
-            return target.iselect(func, combination)
         elif type(selection) == types.FunctionType:
             # ---------------------- #
             # selection via function #
@@ -7626,11 +9348,69 @@ class TimeSeries:
         """
         if self._data is None:
             raise TimeSeriesException("Operation is invalid with empty time series.")
-        target = self if in_place else self.copy()
+        target = self._writable(in_place)
         data = cast(pd.DataFrame, target._data)
         data.loc[:, "selected"] = data.index.isin(TimeSeries._valid_indices(data))
         return target
 
+    def select_where(
+        self,
+        predicate: Callable[
+            [pd.DatetimeIndex, npt.NDArray[np.float64], npt.NDArray[np.int64]], Any
+        ],
+        combination: Combine = Combine.REPLACE,
+        in_place: bool = False,
+    ) -> "TimeSeries":
+        """
+        Marks individual items in this object - or a copy of this object - as selected for pariticpation the next operation
+        based on a predicate that is evaluated once over the whole time series instead of once per item.
+
+        The predicate is called with the times (a pandas DatetimeIndex), the values (a read-only numpy float array), and the
+        qualities (a read-only numpy integer array) of this object and must return a boolean array-like of the same length.
+        For example, `ts.select_where(lambda times, values, qualities: (values < 0) & (times.month == 6))`.
+        No `TimeSeriesValue` objects are created, which makes this much faster than [select(...)](#TimeSeries.select)
+        with a function for large time series.
+
+        This object's selection_state property determines the selection of this object after the next operation
+        as described in [select(...)](#TimeSeries.select).
+
+        Args:
+            predicate (Callable[[pd.DatetimeIndex, np.ndarray, np.ndarray], Any]): The function that returns the selection
+                result for every item from the times, values, and qualities arrays.
+            combination (Combine, optional): Specifies how to combine the predicate result with an item's current selected state.
+                Defaults to Combine.REPLACE.
+                * `Combine.REPLACE`: Current selected state of each item is ignored and is replaced by the result of the predicate.
+                * `Combine.AND`: Current selected state of each item is ANDed with the result of the predicate to generate new selected state.
+                * `Combine.OR`: Current selected state of each items is ORed with the result of the predicate to generate new selected state.
+                * `Combine.XOR`: Current selected state of each item is XORed with the result of the predicate to generate new selected state.
+            in_place (bool, optional): Specifies whether to mark itmes in this object (True) or a copy of this object (False). Defaults to False.
+
+        Raises:
+            TimeSeriesException: If this object has no data
+            ValueError: If an invalid combination is specified or the predicate result is not one boolean per item.
+
+        Returns:
+            TimeSeries: The marked object
+        """
+        if self._data is None:
+            raise TimeSeriesException("Operation is invalid with empty time series.")
+        target = self._writable(in_place)
+        data = cast(pd.DataFrame, target._data)
+        values = data["value"].to_numpy(dtype=np.float64).view()
+        qualities = data["quality"].to_numpy(dtype=np.int64).view()
+        values.flags.writeable = False
+        qualities.flags.writeable = False
+        mask = np.asarray(
+            predicate(cast(pd.DatetimeIndex, data.index), values, qualities)
+        )
+        if mask.shape != (len(data),) or mask.dtype != np.bool_:
+            raise ValueError(
+                f"Predicate must return {len(data)} boolean values, "
+                f"got shape {mask.shape} of type {mask.dtype}"
+            )
+        TimeSeries._combine_selection(data, mask, combination)
+        return target
+
     @property
     def selected(self) -> list[bool]:
         """
@@ -7661,6 +9441,33 @@ class TimeSeries:
     def selection_state(self, period: SelectionState) -> None:
         self._selection_state = period
 
+    @classmethod
+    def set_default_compact(
+        cls, state: bool = True, values: Optional[str] = None
+    ) -> None:
+        """
+        Set whether new TimeSeries objects, including those retrieved from data stores, store their data
+        in the compact layout, and how they store compacted values. See [compact](#TimeSeries.compact) and
+        [compact_values](#TimeSeries.compact_values)
+
+        Compacted quality codes are normalized to signed codes, so unsigned codes with the high bit set (e.g., 2147483651)
+        come back as their signed equivalents (e.g., -2147483645).
+
+        Args:
+            state (bool, optional): Defaults to True.
+            values (Optional[str], optional): The [compact_values](#TimeSeries.compact_values) setting of new TimeSeries objects.
+                Defaults to None.
+
+        Raises:
+            TimeSeriesException: If `values` is not None or "float32"
+        """
+        if values not in (None, "float32"):
+            raise TimeSeriesException(
+                f"Invalid compact values type: {values}; must be None or 'float32'"
+            )
+        cls._default_compact = state
+        cls._default_compact_values = values
+
     @classmethod
     def set_default_slice_stop_exclusive(cls, state: bool = True) -> None:
         """
@@ -7835,7 +9642,7 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
         df = data.loc[data["selected"]] if target.has_selection else data
         # -------------------------------------------- #
@@ -7867,7 +9674,7 @@ class TimeSeries:
         # ------------------------------ #
         # get the DataFrame to work with #
         # ------------------------------ #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
         df = data.loc[data["selected"]] if self.has_selection else data
         df.loc[:, "quality"] = df["quality"] & 0b0111_1111_1111_1111_1111_1111_1111_1111
@@ -7892,7 +9699,7 @@ class TimeSeries:
         Returns:
             TimeSeries: The modified object
         """
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
         if target.has_selection:
             data.loc[data["selected"], ["quality"]] = Quality(quality).code
@@ -7949,7 +9756,7 @@ class TimeSeries:
         Returns:
             TimeSeries: The modified object
         """
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
         if target.has_selection:
             data.loc[data["selected"], ["value"]] = value
@@ -7976,7 +9783,7 @@ class TimeSeries:
         Returns:
             TimeSeries: The modified object
         """
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         data = cast(pd.DataFrame, target._data)
         if target.has_selection:
             data.loc[data["selected"], ["value"]] = value
@@ -8089,7 +9896,7 @@ class TimeSeries:
         # ----------------- #
         # handle parameters #
         # ----------------- #
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         intvl: Optional[Interval] = None
         ofst: Optional[TimeSpan] = None
         back: Optional[TimeSpan] = None
@@ -8169,77 +9976,68 @@ class TimeSeries:
                     f"Expected forward parameter to be TimeSpan, timedelta, or str, got '{type(forward)}'"
                 )
             assert ahead is not None
-        # --------------- #
-        # do the snapping #
-        # --------------- #
-        tsvs = target.tsv
-        tsvs_by_time: Dict[HecTime, TimeSeriesValue] = {}
-        for tsv in tsvs:
-            prev_time = (
-                cast(
-                    HecTime,
-                    tsv.time - cast(int, tsv.time.get_interval_offset(intvl.minutes)),
-                )
-                + ofst.total_seconds() // 60
+        # ------------------------------------------------------------------ #
+        # snap on wall-clock nanoseconds: each value is a candidate for the  #
+        # previous interval/offset time (within the forward time span) and   #
+        # the next one (within the backward time span), and the candidates   #
+        # for each time are ranked protected, then valid, then closest, then #
+        # earliest                                                           #
+        # ------------------------------------------------------------------ #
+        data = target._data
+        if data is None:
+            data = pd.DataFrame(
+                {"value": np.empty(0), "quality": np.empty(0, dtype=np.int64)},
+                index=pd.DatetimeIndex([], name="time"),
             )
-            prev_offset = TimeSpan(
-                minutes=(
-                    cast(HecTime, (tsv.time - ofst)).get_interval_offset(intvl.minutes)
-                )
+        index = cast(pd.DatetimeIndex, data.index)
+        tz = index.tz
+        times = TimeSeries._index_nanoseconds(index.tz_localize(None) if tz else index)
+        offset_ns = int(ofst.total_seconds() // 60) * 60_000_000_000
+        tops, following = TimeSeries._interval_tops(times - offset_ns, intvl)
+        prev_times = tops + offset_ns
+        next_times = np.where(prev_times == times, prev_times, following + offset_ns)
+        after = times - prev_times <= int(ahead.total_seconds() * 1_000_000_000)
+        before = next_times - times <= int(back.total_seconds() * 1_000_000_000)
+        positions = np.arange(len(times))
+        sources = np.concatenate((positions[after], positions[before]))
+        snap_times = np.concatenate((prev_times[after], next_times[before]))
+        values = data["value"].to_numpy(dtype=np.float64)
+        qualities = data["quality"].to_numpy()
+        validity = (qualities.astype(np.int64) >> 1) & 0b1111
+        valid = np.isfinite(values) & np.isin(validity, (0, 1, 4))
+        protected = TimeSeries._protected_mask(data)
+        order = np.lexsort(
+            (
+                sources,
+                np.abs(times[sources] - snap_times),
+                ~valid[sources],
+                ~protected[sources],
+                snap_times,
+            )
+        )
+        snap_times = snap_times[order]
+        sources = sources[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = snap_times[1:] != snap_times[:-1]
+        new_index = pd.DatetimeIndex(
+            snap_times[first].view("datetime64[ns]"), name="time"
+        )
+        if tz:
+            new_index = new_index.tz_localize(
+                tz,
+                ambiguous=np.ones(len(new_index), dtype=bool),
+                nonexistent="shift_forward",
             )
-            next_time = prev_time + intvl if prev_time < tsv.time else prev_time
-            if prev_time <= tsv.time and prev_time + ahead >= tsv.time:
-                if prev_time not in tsvs_by_time:
-                    tsvs_by_time[prev_time] = tsv
-                else:
-                    this_offset = prev_offset
-                    this_valid = tsv.is_valid
-                    this_protected = tsv.quality.protection
-                    other_time = tsvs_by_time[prev_time].time
-                    other_valid = tsvs_by_time[prev_time].is_valid
-                    other_protected = tsvs_by_time[prev_time].quality.protection
-                    if other_time < prev_time:
-                        other_offset = prev_time - other_time
-                    else:
-                        other_offset = other_time - prev_time
-                    if this_protected and not other_protected:
-                        tsvs_by_time[prev_time] = tsv
-                    elif this_valid and not other_valid:
-                        tsvs_by_time[prev_time] = tsv
-                    elif this_offset < other_offset:
-                        tsvs_by_time[prev_time] = tsv
-            if next_time - back <= tsv.time:
-                if next_time not in tsvs_by_time:
-                    tsvs_by_time[next_time] = tsv
-                else:
-                    this_offset = cast(TimeSpan, next_time - tsv.time)
-                    this_valid = tsv.is_valid
-                    this_protected = tsv.quality.protection
-                    other_time = tsvs_by_time[next_time].time
-                    other_valid = tsvs_by_time[next_time].is_valid
-                    other_offset = cast(TimeSpan, next_time - other_time)
-                    other_protected = tsvs_by_time[next_time].quality.protection
-                    if this_protected and not other_protected:
-                        tsvs_by_time[next_time] = tsv
-                    elif this_valid and not other_valid:
-                        tsvs_by_time[next_time] = tsv
-                    elif this_offset < other_offset:
-                        tsvs_by_time[next_time] = tsv
-        for t in tsvs_by_time:
-            tsvs_by_time[t].time = t
-        new_tsvs = [tsvs_by_time[t] for t in sorted(tsvs_by_time)]
         # --------------- #
         # set the results #
         # --------------- #
         target._interval = intvl
         target._data = pd.DataFrame(
             {
-                "value": [tsv.value.magnitude for tsv in new_tsvs],
-                "quality": [tsv.quality.code for tsv in new_tsvs],
+                "value": values[sources[first]],
+                "quality": qualities[sources[first]],
             },
-            index=pd.DatetimeIndex(
-                [tsv.time.datetime() for tsv in new_tsvs], name="time"
-            ),
+            index=new_index,
         )
         target._validate()
         return target
@@ -8292,20 +10090,41 @@ class TimeSeries:
             Read Only
         """
 
-        def add_colon(tstr: str) -> str:
-            if tstr[-5] in "-+":
-                tstr = f"{tstr[:-2]}:{tstr[-2:]}"
-            return tstr
-
         if self._data is None:
             return []
         if len(self._data.shape) == 1:
-            return add_colon(self._data.name.strftime("%Y-%m-%d %H:%M:%S%z"))
-        df = cast(pd.DataFrame, self.data)
-        timestrs = [
-            t.strftime("%Y-%m-%d %H:%M:%S%z") for t in cast(pd.DatetimeIndex, df.index)
-        ]
-        return list(map(add_colon, timestrs))
+            return TimeSeries._time_string(self._data.name)
+        # ---------------------------------------------------------------- #
+        # pandas indexes are immutable, so the formatted times are good as #
+        # long as the data has the same index object                       #
+        # ---------------------------------------------------------------- #
+        index = cast(pd.DatetimeIndex, self._data.index)
+        if self._times_cache is None or self._times_cache[0] is not index:
+            self._times_cache = (index, list(map(TimeSeries._time_string, index)))
+        return list(self._times_cache[1])
+
+    @property
+    def times_ns(self) -> npt.NDArray[np.datetime64]:
+        """
+        The times as a read-only numpy datetime64[ns] array (empty if there is no data). The array shares memory with
+        the data index where possible and is not formatted or parsed.
+
+        The times are UTC if the time series has a time zone and local (wall clock) times otherwise. Use
+        `ts.data.index` for the times with time zone information.
+
+        Operations:
+            Read Only
+        """
+        if self._data is None:
+            return np.array([], dtype="datetime64[ns]")
+        if len(self._data.shape) == 1:
+            times = np.array([self._data.name.as_unit("ns").asm8])
+        else:
+            times = TimeSeries._index_nanoseconds(
+                cast(pd.DatetimeIndex, self._data.index)
+            ).view("datetime64[ns]")
+        times.flags.writeable = False
+        return times
 
     def to(
         self,
@@ -8327,7 +10146,7 @@ class TimeSeries:
         Returns:
             TimeSeries: The converted object
         """
-        target = self if in_place else self.copy()
+        target = self._target(in_place)
         if isinstance(
             unit_parameter_or_datum, str
         ) and hec.parameter._all_datums_pattern.match(unit_parameter_or_datum):
@@ -8398,6 +10217,54 @@ class TimeSeries:
                 )
         return target
 
+    def to_arrow(self) -> Any:
+        """
+        Returns the data and metadata of this time series as a `pyarrow.Table`. Requires the `pyarrow` package.
+
+        The table has the following columns, which share memory with the data of this object.
+        * `time`: The times (a timestamp column with the time zone if the times have one)
+        * `value`: The values
+        * `quality`: The quality codes
+
+        The name, office, parameter, unit, parameter type, interval, duration, version, version time, time zone, vertical
+        datum info, and current vertical datum are stored as JSON in the schema metadata under the key `hec.timeseries`.
+        Any selection is not stored.
+
+        The table and this object share the data buffers, so this object copies its data before it is next modified
+        and later modifications of this object don't change the table.
+
+        Returns:
+            Any: The `pyarrow.Table` object
+        """
+        self._data_shared = True
+        return self._arrow_export()
+
+    @staticmethod
+    def to_arrow_many(timeseries: List["TimeSeries"]) -> Any:
+        """
+        Returns the data and metadata of multiple time series as a single `pyarrow.Table`. Requires the `pyarrow` package.
+
+        The rows of each time series are stored consecutively, in the order specified, with the same columns as for
+        [`to_arrow()`](#TimeSeries.to_arrow) plus a `series` column with the position of the time series in `timeseries`.
+        The times of all time series are stored in UTC (times without a time zone are stored as if they were UTC), and values and quality
+        codes are stored as float64 and int64 if the time series don't all use the same types.
+
+        The metadata is stored as a JSON list under the key `hec.timeseries` in the schema metadata, with each item holding
+        the same metadata as for [`to_arrow()`](#TimeSeries.to_arrow) plus the number of rows and whether the times have a time zone.
+
+        Args:
+            timeseries (List[TimeSeries]): The time series to store
+
+        As for [`to_arrow()`](#TimeSeries.to_arrow), each time series copies its data before it is next modified
+        so later modifications don't change the table.
+
+        Returns:
+            Any: The `pyarrow.Table` object
+        """
+        for ts in timeseries:
+            ts._data_shared = True
+        return TimeSeries._arrow_export_many(timeseries)
+
     def to_irregular(
         self, interval: Union[Interval, str], in_place: bool = False
     ) -> "TimeSeries":
@@ -8483,29 +10350,39 @@ class TimeSeries:
             # ----------------------- #
             # CWMS native time series #
             # ----------------------- #
-            if self.data is None or self.data.empty:
+            if self._data is None or self._data.empty:
                 raise ValueError("No values in time series")
             cwms = hec.shared.import_cwms()
-            copy = self.copy()
+            copy = self._target(False)
             copy.context = CWMS
-            df = (
-                cast(pd.DataFrame, copy.data)
-                .reset_index()
-                .rename(columns={"time": "date-time", "quality": "quality-code"})
+            # ------------------------------------------------------------------ #
+            # build the [milliseconds, value, quality] rows of the values item   #
+            # from the index and column arrays, with missing values set to the   #
+            # CWMS missing value                                                 #
+            # ------------------------------------------------------------------ #
+            data = cast(pd.DataFrame, copy._data)
+            millis = (
+                TimeSeries._index_nanoseconds(cast(pd.DatetimeIndex, data.index))
+                // 1_000_000
             )
-            df["value"] = df["value"].fillna(-3.4028234663852886e38)
-            name = copy.name
-            json = cwms.timeseries_df_to_json(
-                df,
-                name,
-                copy.unit,
-                "" if copy.location.office is None else copy.location.office,
-                None if copy._version_time is None else copy._version_time.datetime(),
-            )
-            for i in range(len(json["values"])):
-                json["values"][i][0] = int(
-                    datetime.fromisoformat(json["values"][i][0]).timestamp() * 1000
-                )
+            values = data["value"].to_numpy(dtype=np.float64)
+            values = np.where(np.isnan(values), -3.4028234663852886e38, values)
+            qualities = data["quality"].to_numpy()
+            json: dict[str, Any] = {
+                "name": copy.name,
+                "office-id": (
+                    "" if copy.location.office is None else copy.location.office
+                ),
+                "units": copy.unit,
+                "values": list(
+                    map(list, zip(millis.tolist(), values.tolist(), qualities.tolist()))
+                ),
+                "version-date": (
+                    None
+                    if copy._version_time is None
+                    else cast(datetime, copy._version_time.datetime()).isoformat()
+                ),
+            }
             json["value-columns"] = [
                 {"name": "date-time", "ordinal": 1, "datatype": "java.sql.Timestamp"},
                 {"name": "value", "ordinal": 2, "datatype": "java.lang.Double"},
@@ -8521,21 +10398,27 @@ class TimeSeries:
                             del vdi["offsets"][i]
                 json["vertical-datum-info"] = vdi
             native_ts = cwms.cwms_types.Data(json)
-            native_ts._df = cwms.cwms_types.Data.to_df(json, selector="values")
+            native_ts._df = pd.DataFrame(
+                {
+                    "date-time": pd.to_datetime(millis, unit="ms", utc=True),
+                    "value": values,
+                    "quality-code": qualities,
+                }
+            )
             return native_ts
         elif isinstance(datastore, DssDataStore):
             # ---------------------- #
             # DSS native time series #
             # ---------------------- #
             hecdss = hec.shared.import_hecdss()
-            copy = self.copy()
+            copy = self._target(False)
             copy.context = DSS
             if copy.interval.is_regular:
                 native_ts = hecdss.RegularTimeSeries()
             else:
                 native_ts = hecdss.IrregularTimeSeries()
             native_ts.id = copy.name
-            data = cast(pd.DataFrame, copy.data)
+            data = cast(pd.DataFrame, copy._data)
             native_ts.times = pd.to_datetime(data.index).to_pydatetime().tolist()
             native_ts.time_zone_name = copy.time_zone if copy.time_zone else ""
             native_ts.values = data["value"].fillna(UNDEFINED).tolist()
@@ -8554,6 +10437,70 @@ class TimeSeries:
                 f"Expected CwmsDataStore or DssDataStore for datastore, got {datastore.__class__.__name__}"
             )
 
+    def to_parquet(self, path: str) -> None:
+        """
+        Writes the data and metadata of this time series to a Parquet file, with the columns and metadata described
+        in [`to_arrow()`](#TimeSeries.to_arrow). Requires the `pyarrow` package.
+
+        Args:
+            path (str): The name of the Parquet file
+        """
+        pa = hec.shared.import_pyarrow()
+        pa.parquet.write_table(self._arrow_export(), path)
+
+    @staticmethod
+    def to_parquet_chunks(chunks: Iterable["TimeSeries"], path: str) -> None:
+        """
+        Writes consecutive chunks of a time series, such as those returned by [`process_chunks()`](#TimeSeries.process_chunks),
+        to a single Parquet file as they are generated, with the columns described in [`to_arrow()`](#TimeSeries.to_arrow) and
+        the metadata of the first chunk. Requires the `pyarrow` package.
+
+        The values and quality codes are always written as float64 and int64 (those of [compact](#TimeSeries.compact) chunks
+        are widened), since the column types are fixed by the first chunk and a later chunk may need float64 values.
+
+        Args:
+            chunks (Iterable[TimeSeries]): The chunks, in increasing time order
+            path (str): The name of the Parquet file
+
+        Raises:
+            TimeSeriesException: If there are no chunks with data
+        """
+        pa = hec.shared.import_pyarrow()
+        writer: Any = None
+        schema: Any = None
+        try:
+            for chunk in chunks:
+                if chunk._data is None or chunk._data.empty:
+                    continue
+                if chunk.compact:
+                    chunk = chunk.copy()
+                    chunk.compact = False
+                table = chunk._arrow_export()
+                if writer is None:
+                    schema = table.schema
+                    writer = pa.parquet.ParquetWriter(path, schema)
+                else:
+                    table = table.cast(schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            raise TimeSeriesException("No chunks with data to write")
+
+    @staticmethod
+    def to_parquet_many(timeseries: List["TimeSeries"], path: str) -> None:
+        """
+        Writes the data and metadata of multiple time series to a single Parquet file, with the columns and metadata described
+        in [`to_arrow_many()`](#TimeSeries.to_arrow_many). Requires the `pyarrow` package.
+
+        Args:
+            timeseries (List[TimeSeries]): The time series to store
+            path (str): The name of the Parquet file
+        """
+        pa = hec.shared.import_pyarrow()
+        pa.parquet.write_table(TimeSeries._arrow_export_many(timeseries), path)
+
     def trim(self, in_place: bool = False) -> "TimeSeries":
         """
         Trims a regular time series (either this one or a copy of this one), removing all missing values from the beginning and
@@ -8739,3 +10686,149 @@ class TimeSeries:
     @watershed.setter
     def watershed(self, value: str) -> None:
         self._watershed = value
+
+
+class LazyTimeSeries:
+    """
+    Records operations on a [TimeSeries](#TimeSeries) object to be performed together. Created by
+    [TimeSeries.lazy()](#TimeSeries.lazy).
+
+    Any TimeSeries method that has an `in_place` parameter (e.g., `estimate_missing_values()`, `olympic_moving_average()`,
+    `screen_with_value_range()`, `to()`) may be called on a LazyTimeSeries object, as may the arithmetic operators. Each
+    call returns a new LazyTimeSeries object with the operation appended, so calls can be chained. Nothing is computed until
+    [collect()](#LazyTimeSeries.collect) is called, which:
+    * copies the time series once (or not at all if collecting in-place)
+    * performs each operation in-place on that copy
+    * performs each run of consecutive arithmetic operations with scalars as a single pass over the values
+    * validates the times against the interval once, after the last operation
+    """
+
+    def __init__(self, source: TimeSeries):
+        """
+        Initializes a LazyTimeSeries object with no operations
+
+        Args:
+            source (TimeSeries): The time series to perform the operations on
+        """
+        self._source = source
+        self._operations: list[
+            tuple[str, tuple[Any, ...], dict[str, Any], Optional[np.ufunc]]
+        ] = []
+
+    def __add__(
+        self, amount: Union[TimeSeries, UnitQuantity, float, int]
+    ) -> "LazyTimeSeries":
+        return self._then_operator("__iadd__", amount, np.add)
+
+    def __floordiv__(
+        self, amount: Union[TimeSeries, UnitQuantity, float, int]
+    ) -> "LazyTimeSeries":
+        return self._then_operator("__ifloordiv__", amount, np.floor_divide)
+
+    def __getattr__(self, name: str) -> Callable[..., "LazyTimeSeries"]:
+        method = None if name.startswith("_") else getattr(TimeSeries, name, None)
+        if (
+            not callable(method)
+            or "in_place" not in (signature := inspect.signature(method)).parameters
+        ):
+            raise AttributeError(
+                f"'{name}' is not a TimeSeries method that can be performed lazily"
+            )
+
+        def record(*args: Any, **kwargs: Any) -> "LazyTimeSeries":
+            bound = signature.bind(self._source, *args, **kwargs)
+            bound.arguments["in_place"] = True
+            return self._then((name, bound.args[1:], bound.kwargs, None))
+
+        return record
+
+    def __mod__(
+        self, amount: Union[TimeSeries, UnitQuantity, float, int]
+    ) -> "LazyTimeSeries":
+        return self._then_operator("__imod__", amount, np.mod)
+
+    def __mul__(
+        self, amount: Union[TimeSeries, UnitQuantity, float, int]
+    ) -> "LazyTimeSeries":
+        return self._then_operator("__imul__", amount, np.multiply)
+
+    def __pow__(
+        self, amount: Union[TimeSeries, UnitQuantity, float, int]
+    ) -> "LazyTimeSeries":
+        return self._then_operator("__ipow__", amount, np.power)
+
+    def __repr__(self) -> str:
+        operations = "".join(f".{operation[0]}(...)" for operation in self._operations)
+        return f"<LazyTimeSeries {self._source.name}{operations}>"
+
+    def __sub__(
+        self, amount: Union[TimeSeries, UnitQuantity, float, int]
+    ) -> "LazyTimeSeries":
+        return self._then_operator("__isub__", amount, np.subtract)
+
+    def __truediv__(
+        self, amount: Union[TimeSeries, UnitQuantity, float, int]
+    ) -> "LazyTimeSeries":
+        return self._then_operator("__itruediv__", amount, np.true_divide)
+
+    def _then(
+        self, operation: tuple[str, tuple[Any, ...], dict[str, Any], Optional[np.ufunc]]
+    ) -> "LazyTimeSeries":
+        other = LazyTimeSeries(self._source)
+        other._operations = self._operations + [operation]
+        return other
+
+    def _then_operator(
+        self,
+        name: str,
+        amount: Union[TimeSeries, UnitQuantity, float, int],
+        ufunc: np.ufunc,
+    ) -> "LazyTimeSeries":
+        # --------------------------------------------------------------- #
+        # only operations with plain scalars can be fused with each other #
+        # --------------------------------------------------------------- #
+        fusable = isinstance(amount, (float, int)) and not isinstance(amount, bool)
+        return self._then((name, (amount,), {}, ufunc if fusable else None))
+
+    def collect(self, in_place: bool = False) -> TimeSeries:
+        """
+        Performs the recorded operations and returns the resulting time series
+
+        Args:
+            in_place (bool, optional): Specifies whether to perform the operations on the source time series (True)
+                or a copy of it (False). Defaults to False.
+
+        Raises:
+            TimeSeriesException: If any of the operations raises it, or if the resulting time series is a regular
+                time series whose times are not consistent with its interval
+
+        Returns:
+            TimeSeries: The resulting time series
+        """
+        target = self._source._target(in_place)
+        operations = self._operations
+        skip_validation = target._skip_validation
+        target._skip_validation = True
+        try:
+            i = 0
+            while i < len(operations):
+                name, args, kwargs, ufunc = operations[i]
+                if ufunc is None or target._data is None or target.has_selection:
+                    getattr(target, name)(*args, **kwargs)
+                    i += 1
+                    continue
+                # ------------------------------------------------------- #
+                # apply a run of scalar arithmetic in one pass, as the    #
+                # in-place operators would with no selection              #
+                # ------------------------------------------------------- #
+                values = target._data["value"].to_numpy(dtype=np.float64, copy=True)
+                with np.errstate(all="ignore"):
+                    while i < len(operations) and operations[i][3] is not None:
+                        _, args, _, ufunc = operations[i]
+                        cast(np.ufunc, ufunc)(values, args[0], out=values)
+                        i += 1
+                target._data["value"] = values
+        finally:
+            target._skip_validation = skip_validation
+        target._validate()
+        return target
@@ -510,5 +510,47 @@ def test_to_from_native_timeseries() -> None:
                 assert eval(f"native_ts.{item} == native_ts2.{item}"), f"{item} equals"
 
 
+def test_cwms_native_values() -> None:
+    if not shared.cwms_imported:
+        return
+    ts = TimeSeries.new_regular_time_series(
+        "SWT.Flow.Inst.1Hour.0.Raw",
+        "2024-11-01T22:00:00",
+        6,
+        "1Hour",
+        values=[1.0, 2.0, np.nan, 4.0, 5.0, 6.0],
+    )
+    ts.location.office = "SWT"
+    ts.ilabel_as_time_zone("US/Central", on_already_set=0)
+    cast(pd.DataFrame, ts.data).loc[:, "quality"] = [0, 3, 5, -2147483645, 0, 0]
+    with CwmsDataStore.open() as db:
+        native_ts = ts.to_native(db)
+        ts2 = TimeSeries.from_native(db, native_ts)
+    millis = [int(t.timestamp() * 1000) for t in cast(pd.DataFrame, ts.data).index]
+    assert native_ts.json["name"] == ts.name
+    assert native_ts.json["office-id"] == "SWT"
+    assert native_ts.json["version-date"] is None
+    assert native_ts.json["values"] == [
+        [millis[0], 1.0, 0],
+        [millis[1], 2.0, 3],
+        [millis[2], -3.4028234663852886e38, 5],
+        [millis[3], 4.0, -2147483645],
+        [millis[4], 5.0, 0],
+        [millis[5], 6.0, 0],
+    ]
+    df = native_ts.df
+    assert list(df.columns) == ["date-time", "value", "quality-code"]
+    assert str(df["date-time"].dtype) == "datetime64[ns, UTC]"
+    assert (
+        df["date-time"].tolist()
+        == cast(pd.DataFrame, ts.convert_to_time_zone("UTC").data).index.tolist()
+    )
+    assert ts2.name == ts.name
+    assert ts2.times == ts.convert_to_time_zone("UTC").times
+    assert ts2.qualities == ts.qualities
+    assert np.allclose(ts2.values[:2] + ts2.values[3:], ts.values[:2] + ts.values[3:])
+
+
 if __name__ == "__main__":
     test_to_from_native_timeseries()
+    test_cwms_native_values()
@@ -529,16 +529,21 @@ def test_local_rating_set_1_ind_param_ts(
     elevations_ts: TimeSeries,
     expected_stors: list[float],
 ) -> None:
-    # ------------------------------------------------ #
-    # test with rating units and native vertical datum #
-    # ------------------------------------------------ #
+    # ------------------------------------------------------------------ #
+    # test with rating units and native vertical datum, leaving the      #
+    # (compact) input time series as it was                              #
+    # ------------------------------------------------------------------ #
+    elevations_ts.compact = True
     rated_stors = rating_set_1_ind_param.rate([elevations_ts], units="ac-ft")
     assert np.allclose(expected_stors, rated_stors.values)
+    assert elevations_ts.compact
     # --------------------------------------------------------------------------------- #
     # perform the reverse rating to make sure it doesn't blow up, but 2-D interpolation #
     # (time and elevation being the dimensions) is not generally inversible             #
     # --------------------------------------------------------------------------------- #
+    rated_stors.compact = True
     reverse_rated_elevs = rating_set_1_ind_param.reverse_rate(rated_stors, units="ft")
+    assert rated_stors.compact
     # --------------------------------------------------- #
     # test with different units and native vertical datum #
     # --------------------------------------------------- #
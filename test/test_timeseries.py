@@ -1,15 +1,18 @@
+import bisect
 import copy
 import math
 import os
 import statistics as stat
 import sys
+import tempfile
 import traceback
 import warnings
 from datetime import datetime, timedelta
 from test.shared import dataset_from_file, random_subset, scriptdir, slow_test_coverage
-from typing import Any, List, Optional, Union, cast
+from typing import Any, Callable, List, Optional, Union, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import pytest
 
@@ -19,7 +22,9 @@ from hec import (
     Duration,
     HecTime,
     Interval,
+    LazyTimeSeries,
     Parameter,
+    ParameterException,
     ParameterType,
 )
 from hec import Quality as Qual
@@ -32,6 +37,19 @@ from hec import (
     TimeSpan,
 )
 from hec import UnitQuantity as UQ
+from hec.const import DSS
+from hec.timeseries import (
+    _RESAMPLE_OP_ACCUMULATE,
+    _RESAMPLE_OP_AVERAGE,
+    _RESAMPLE_OP_COUNT,
+    _RESAMPLE_OP_INTEGRATE,
+    _RESAMPLE_OP_INTERPOLATE,
+    _RESAMPLE_OP_MAXIMUM,
+    _RESAMPLE_OP_MINIMUM,
+    _RESAMPLE_OP_PREVIOUS,
+    _RESAMPLE_OP_VOLUME,
+    _resample_operations,
+)
 
 
 def equal_values(v1: list[float], v2: list[float]) -> bool:
@@ -729,6 +747,52 @@ def test_aggregate_ts() -> None:
         ts.iselect(Select.ALL)
 
 
+def test_aggregate_ts_alignment() -> None:
+    # ------------------------------------------------------------- #
+    # aggregations use only the times common to all the time series #
+    # ------------------------------------------------------------- #
+    timeseries = [
+        TimeSeries.new_regular_time_series(
+            f"Loc{i}.Flow.Inst.1Hour.0.Computed",
+            f"2024-10-10T{i + 1:02d}:00:00",
+            6,
+            "1Hour",
+            values=[float(10 * i + j) for j in range(6)],
+        )
+        for i in range(3)
+    ]
+    cast(pd.DataFrame, timeseries[1]._data).iloc[3, 0] = math.nan
+    expected_times = timeseries[2].times[:4]
+    rows = [[10.0 * i + j + 2 - i for i in range(3)] for j in range(4)]
+    rows[2][1] = math.nan
+    ts = TimeSeries.aggregate_ts("mean", timeseries)
+    assert ts.times == expected_times
+    assert ts.values == [np.nanmean(row) for row in rows]
+    ts = TimeSeries.aggregate_ts(max, timeseries)
+    assert ts.values == [np.nanmax(row) for row in rows]
+    ts = TimeSeries.aggregate_ts("count", timeseries)
+    assert ts.values == [3, 3, 2, 3]
+    ts = TimeSeries.aggregate_ts(stat.fmean, timeseries)
+    assert np.allclose(ts.values, [stat.fmean(row) for row in rows], equal_nan=True)
+    ts = TimeSeries.aggregate_ts(lambda s: s.iloc[2] - s.iloc[0], timeseries)
+    assert ts.values == [row[2] - row[0] for row in rows]
+    ts = TimeSeries.aggregate_ts("size", timeseries)
+    assert cast(pd.DataFrame, ts.data).iloc[:, 0].to_list() == 4 * [3]
+    # ------------------------------------------------------------- #
+    # percentiles skip missing and non-selected values, and a time  #
+    # with no values has a missing percentile                       #
+    # ------------------------------------------------------------- #
+    timeseries[0].selection_state = SelectionState.DURABLE
+    timeseries[0].iselect(lambda tsv: tsv.value.magnitude < 4.0)
+    cast(pd.DataFrame, timeseries[2]._data).iloc[2, 0] = math.nan
+    ts = TimeSeries.percentile_ts(50, timeseries)
+    assert np.allclose(ts.values, [11.0, 12.0, math.nan, 18.5], equal_nan=True)
+    ts = TimeSeries.percentile_ts([0, 100], timeseries)
+    assert np.allclose(cast(list[npt.NDArray[np.float64]], ts.values)[3], [14.0, 23.0])
+    timeseries[0].selection_state = SelectionState.TRANSIENT
+    timeseries[0].iselect(Select.ALL)
+
+
 def test_aggregate_values() -> None:
     start_time = HecTime("2024-10-10T01:00:00")
     intvl = Interval.get_cwms("1Hour")
@@ -1544,6 +1608,120 @@ def test_smoothing() -> None:
     )
 
 
+def test_olympic_average_blocks() -> None:
+    def olympic_average(vals: npt.NDArray[np.float64]) -> float:
+        vals = vals[~np.isnan(vals)]
+        if len(vals) <= 2:
+            return math.nan
+        return float(np.mean(np.sort(vals)[1:-1]))
+
+    rng = np.random.default_rng(1234)
+    values = rng.normal(100.0, 10.0, 500)
+    values[rng.choice(len(values), 100)] = np.nan
+    values[[7, 250]] = np.inf
+    values[300] = -np.inf
+    for window in 3, 7, 11:
+        expected = (
+            pd.Series(values)
+            .rolling(window=window, min_periods=1, center=True)
+            .apply(olympic_average, raw=True)
+            .to_numpy()
+        )
+        for block_size in 1 << 22, 50, 1:
+            assert np.allclose(
+                TimeSeries._olympic_average(values, window, block_size),
+                expected,
+                rtol=1e-12,
+                atol=0,
+                equal_nan=True,
+            )
+
+
+def test_window_average_blocks() -> None:
+    # ------------------------------------------------------------------- #
+    # the block window sums of the moving averages agree with pandas      #
+    # rolling means for any block size (infinite values count as missing) #
+    # ------------------------------------------------------------------- #
+    rng = np.random.default_rng(4321)
+    values = rng.normal(100.0, 10.0, 500)
+    values[rng.choice(len(values), 100)] = np.nan
+    finite = values.copy()
+    values[[7, 250]] = np.inf
+    values[300] = -np.inf
+    finite[[7, 250, 300]] = np.nan
+    for window in 2, 3, 6, 7, 11:
+        for centered in (False, True) if window % 2 else (False,):
+            expected = (
+                pd.Series(finite)
+                .rolling(window=window, min_periods=1, center=centered)
+                .mean()
+                .to_numpy()
+            )
+            for block_size in 1 << 22, 50, 1:
+                assert np.allclose(
+                    TimeSeries._window_average(values, window, centered, block_size),
+                    expected,
+                    rtol=1e-12,
+                    atol=0,
+                    equal_nan=True,
+                ), f"{window} {centered} {block_size}"
+
+
+def test_moving_average_only_valid() -> None:
+    def reference(
+        values: npt.NDArray[np.float64], operation: str, window: int, use_reduced: bool
+    ) -> list[float]:
+        # ------------------------------------------------------------------ #
+        # average each window that contains only valid values, including the #
+        # reduced windows at the ends of the time series if use_reduced      #
+        # ------------------------------------------------------------------ #
+        centered = operation != "forward"
+        before = window // 2 if centered else window - 1
+        after = window // 2 if centered else 0
+        averaged = []
+        for i in range(len(values)):
+            vals = values[max(i - before, 0) : i + after + 1]
+            reduced = i < before or i + after >= len(values)
+            if (
+                np.isnan(vals).any()
+                or (reduced and not use_reduced)
+                or (not centered and i == 0)
+            ):
+                averaged.append(math.nan)
+            elif operation == "olympic":
+                averaged.append(
+                    float(np.mean(np.sort(vals)[1:-1])) if len(vals) > 2 else math.nan
+                )
+            else:
+                averaged.append(float(np.mean(vals)))
+        return averaged
+
+    values = np.arange(1.0, 21.0)
+    values[[0, 9, 19]] = np.nan
+    ts = TimeSeries.from_arrays(
+        "Loc1.Flow.Inst.1Hour.0.Computed",
+        np.arange(20, dtype=np.int64) * 3_600_000_000_000 + 1_730_419_200_000_000_000,
+        values,
+    )
+    # ----------------------------------------------------------------------- #
+    # an invalid value invalidates every window that contains it, including   #
+    # the windows within half a window of the start of the time series        #
+    # ----------------------------------------------------------------------- #
+    assert math.isnan(ts.centered_moving_average(5, True, True).values[2])
+    assert ts.centered_moving_average(5, False, True).values[2] == 3.5
+    for operation, method in (
+        ("forward", ts.forward_moving_average),
+        ("centered", ts.centered_moving_average),
+        ("olympic", ts.olympic_moving_average),
+    ):
+        for window in 3, 5:
+            for use_reduced in False, True:
+                assert equal_values(
+                    method(window, True, use_reduced).values,
+                    reference(values, operation, window, use_reduced),
+                ), f"{operation} window={window} use_reduced={use_reduced}"
+
+
 def test_protected() -> None:
     start_time = HecTime("2024-10-10T01:00:00")
     intvl = Interval.get_cwms("1Hour")
@@ -2443,6 +2621,219 @@ def test_screen_with_duration_magnitude(
             assert tsv.quality == okay_code
 
 
+def screen_with_duration_magnitude_reference(
+    times: list[HecTime],
+    values: list[float],
+    qualities: Optional[list[int]],
+    duration: Duration,
+    min_missing_limit: float,
+    min_reject_limit: float,
+    min_question_limit: float,
+    max_question_limit: float,
+    max_reject_limit: float,
+    max_missing_limit: float,
+    percent_valid_required: float,
+) -> list[int]:
+    # ----------------------------------------------------------------- #
+    # the previous implementation of screen_with_duration_magnitude()   #
+    # over lists (the reference for the array implementation)           #
+    # ----------------------------------------------------------------- #
+    total_count = len(times)
+    if total_count < 2:
+        raise TimeSeriesException("Operation requires a time series of length > 1")
+    if qualities is None:
+        qualities_in = total_count * [0]
+    else:
+        qualities_in = qualities
+    if len(values) != total_count:
+        raise TimeSeriesException(
+            f"Lists of times and values must be of same length, got {total_count} and {len(values)}"
+        )
+    if len(qualities_in) != total_count:
+        raise TimeSeriesException(
+            f"Lists of times and qualities must be of same length, got {total_count} and {len(qualities_in)}"
+        )
+    if (
+        not math.isnan(percent_valid_required)
+        and not 0 <= percent_valid_required <= 100
+    ):
+        raise TimeSeriesException(
+            f"percent_valid_required must be in range 0..100, got {percent_valid_required}"
+        )
+    if duration.is_bop:
+        raise TimeSeriesException(
+            "Method is currently suitable for End-of-Period durations only"
+        )
+    # ----------------- #
+    # set the variables #
+    # ----------------- #
+    qualities_out = total_count * [0]
+    test_min_missing = not math.isnan(min_missing_limit)
+    test_min_reject = not math.isnan(min_reject_limit)
+    test_min_question = not math.isnan(min_question_limit)
+    test_max_question = not math.isnan(max_question_limit)
+    test_max_reject = not math.isnan(max_reject_limit)
+    test_max_missing = not math.isnan(max_missing_limit)
+    quality_text = {
+        "okay": "Screened Okay No_Range Original None None None Unprotected",
+        "missing": "Screened Missing No_Range Modified Automatic Missing Duration_Value Unprotected",
+        "question": "Screened Questionable No_Range Original None None Duration_Value Unprotected",
+        "reject": "Screened Rejected No_Range Original None None Duration_Value Unprotected",
+    }
+    okay_code = Qual(quality_text["okay"].split()).code
+    missing_code = Qual(quality_text["missing"].split()).code
+    question_code = Qual(quality_text["question"].split()).code
+    reject_code = Qual(quality_text["reject"].split()).code
+    base_time = times[0] - (
+        times[1] - times[0]
+    )  # assume the first interval is equal to the second
+
+    # ---------------- #
+    # do the screening #
+    # ---------------- #
+    for last in range(total_count):
+        # --------------------------- #
+        # don't screen invalid values #
+        # --------------------------- #
+        if (
+            math.isnan(values[last])
+            or math.isinf(values[last])
+            or Qual(qualities_in[last]).score == 0
+        ):
+            continue
+        # ---------------------------------------------------------------------------------------------- #
+        # get the times that contribute to the accumulation at this time step for the specified duration #
+        # ---------------------------------------------------------------------------------------------- #
+        if last == 0:
+            # ------------------------------------------------ #
+            # assume the first interval is equal to the second #
+            # ------------------------------------------------ #
+            first = 0
+            minutes = cast(TimeSpan, (times[last] - base_time)).total_seconds() / 60
+        else:
+            for first in range(last + 1)[::-1]:
+                first_time = base_time if first == 0 else times[first - 1]
+                minutes = (
+                    cast(TimeSpan, (times[last] - first_time)).total_seconds() / 60
+                )
+                if minutes >= duration.minutes:
+                    break
+        if minutes < duration.minutes:
+            continue
+        span = range(first, last + 1)
+        if first == last:
+            # ------------------ #
+            # single valid value #
+            # ------------------ #
+            total = values[last]
+        else:
+            # ----------------------------------------------- #
+            # verify we have enough valid contributing values #
+            # ----------------------------------------------- #
+            valid = [
+                i
+                for i in span
+                if not math.isnan(values[i])
+                and not math.isinf(values[i])
+                and Qual(qualities_in[i]).score > 0
+            ]
+            if (
+                100.0 * len(valid) / len(span) < percent_valid_required
+            ):  # will always be False with math.nan
+                continue
+            # -------------------------------------------------- #
+            # enumerate the contributions so we can adjust later #
+            # -------------------------------------------------- #
+            contrib = [
+                (values[i], 0)[
+                    bool(
+                        math.isnan(values[i])
+                        or math.isinf(values[i])
+                        or Qual(qualities_in[i]).score == 0
+                    )
+                ]
+                for i in span
+            ]
+            total = sum(contrib)
+        extra_minutes = minutes % duration.minutes
+        # ----------------------------------------------------------- #
+        # adjust for accumulations that exceed the specified duration #
+        # ----------------------------------------------------------- #
+        if extra_minutes:
+            # ----------------------------------------------------------- #
+            # take all of the extra out of the first value's contribution #
+            # ----------------------------------------------------------- #
+            first_time = base_time if first == 0 else times[first - 1]
+            first_interval = (
+                cast(TimeSpan, (times[first] - first_time)).total_seconds() / 60
+            )
+            total -= contrib[0] * float(extra_minutes) / first_interval
+        # ------------------------- #
+        # set the retuned qualities #
+        # ------------------------- #
+        if (test_min_missing and total < min_missing_limit) or (
+            test_max_missing and total > max_missing_limit
+        ):
+            qualities_out[last] = missing_code
+        elif (test_min_reject and total < min_reject_limit) or (
+            test_max_reject and total > max_reject_limit
+        ):
+            qualities_out[last] = reject_code
+        elif (test_min_question and total < min_question_limit) or (
+            test_max_question and total > max_question_limit
+        ):
+            qualities_out[last] = question_code
+        elif (
+            test_min_missing
+            or test_max_missing
+            or test_min_reject
+            or test_max_reject
+            or test_min_question
+            or test_max_question
+        ):
+            qualities_out[last] = okay_code
+
+    return qualities_out
+
+
+def test_screen_with_duration_magnitude_reference() -> None:
+    # ------------------------------------------------------------------------ #
+    # the vectorized implementation must match the reference implementation on #
+    # irregular times with invalid values and screened qualities               #
+    # ------------------------------------------------------------------------ #
+    rng = np.random.default_rng(1234)
+    count = 40
+    minutes = np.cumsum(rng.integers(10, 50, count))
+    times = pd.DatetimeIndex(
+        pd.Timestamp("2024-10-10T01:00:00") + pd.to_timedelta(minutes, unit="min")
+    )
+    values = np.round(rng.uniform(0, 0.5, count), 2)
+    values[[3, 17, 18, 30]] = np.nan
+    values[25] = np.inf
+    qualities = np.zeros(count, dtype=np.int64)
+    qualities[[8, 21]] = Qual(
+        "Screened Missing No_range Original None None None Unprotected".split()
+    ).code
+    qualities[[12, 33]] = Qual(
+        "Screened Rejected No_range Original None None None Unprotected".split()
+    ).code
+    hec_times = [HecTime(t.to_pydatetime()) for t in times]
+    for duration, limits, pct in (
+        ("2Hours", (0.1, 0.2, 0.3, 1.0, 1.2, 1.5), 0.0),
+        ("2Hours", (math.nan, 0.2, math.nan, 1.0, math.nan, 1.5), 75.0),
+        ("3Hours", (0.1, 0.2, 0.3, 1.0, 1.2, 1.5), math.nan),
+        ("3Hours", (math.nan, math.nan, 0.3, 1.0, math.nan, math.nan), 50.0),
+    ):
+        args = (Duration(duration), *limits, pct)
+        expected = screen_with_duration_magnitude_reference(
+            hec_times, values.tolist(), qualities.tolist(), *args
+        )
+        computed = TimeSeries._screen_with_duration_magnitude_vectorized(
+            TimeSeries._index_nanoseconds(times), values, qualities, *args
+        )
+        assert computed.tolist() == expected
+
+
 def make_test_screen_with_constant_value_data() -> list[list[Any]]:
     data = []
     missing_limit = {2: 0.001, 4: 0.003, 6: 0.0035}
@@ -2641,6 +3032,164 @@ def test_screen_with_constant_value(
             assert tsv.quality == okay_code
 
 
+def screen_with_constant_value_reference(
+    times: list[HecTime],
+    values: list[float],
+    qualities: Optional[list[int]],
+    duration: Duration,
+    missing_limit: float,
+    reject_limit: float,
+    question_limit: float,
+    min_threshold: float,
+    percent_valid_required: float,
+) -> list[int]:
+    # ---------------------------------------------------------------- #
+    # the previous implementation of screen_with_constant_value() over #
+    # lists (the reference for the array implementation)               #
+    # ---------------------------------------------------------------- #
+    total_count = len(times)
+    if total_count < 2:
+        raise TimeSeriesException("Operation requires a time series of length > 1")
+    if qualities is None:
+        qualities_in = total_count * [0]
+    else:
+        qualities_in = qualities
+    if len(values) != total_count:
+        raise TimeSeriesException(
+            f"Lists of times and values must be of same length, got {total_count} and {len(values)}"
+        )
+    if len(qualities_in) != total_count:
+        raise TimeSeriesException(
+            f"Lists of times and qualities must be of same length, got {total_count} and {len(qualities_in)}"
+        )
+    if (
+        not math.isnan(percent_valid_required)
+        and not 0 <= percent_valid_required <= 100
+    ):
+        raise TimeSeriesException(
+            f"percent_valid_required must be in range 0..100, got {percent_valid_required}"
+        )
+    # ----------------- #
+    # set the variables #
+    # ----------------- #
+    qualities_out = total_count * [0]
+    test_missing = not math.isnan(missing_limit)
+    test_reject = not math.isnan(reject_limit)
+    test_question = not math.isnan(question_limit)
+    if test_missing:
+        if test_reject and missing_limit >= reject_limit:
+            raise TimeSeriesException("Missing limit must be less than Reject limit")
+        if test_question and missing_limit >= question_limit:
+            raise TimeSeriesException("Missing limit must be less than Question limit")
+    if test_reject:
+        if test_question and reject_limit >= question_limit:
+            raise TimeSeriesException("Reject limit must be less than Question limit")
+    quality_text = {
+        "okay": "Screened Okay No_Range Original None None None Unprotected",
+        "missing": "Screened Missing No_Range Modified Automatic Missing Duration_Value Unprotected",
+        "question": "Screened Questionable No_Range Original None None Duration_Value Unprotected",
+        "reject": "Screened Rejected No_Range Original None None Duration_Value Unprotected",
+    }
+    okay_code = Qual(quality_text["okay"].split()).code
+    missing_code = Qual(quality_text["missing"].split()).code
+    question_code = Qual(quality_text["question"].split()).code
+    reject_code = Qual(quality_text["reject"].split()).code
+    # ---------------- #
+    # do the screening #
+    # ---------------- #
+    for last in range(1, total_count):
+        # --------------------------- #
+        # don't screen invalid values #
+        # --------------------------- #
+        if (
+            math.isnan(values[last])
+            or math.isinf(values[last])
+            or Qual(qualities_in[last]).score == 0
+        ):
+            continue
+        if values[last] < min_threshold:  # always False if min_threshold is math.nan:
+            continue
+        # ---------------------------------------------------------------------------------------------- #
+        # get the times that contribute to the accumulation at this time step for the specified duration #
+        # ---------------------------------------------------------------------------------------------- #
+        for first in range(last + 1)[::-1]:
+            minutes = cast(TimeSpan, (times[last] - times[first])).total_seconds() / 60
+            if minutes >= duration.minutes:
+                break
+        if minutes < duration.minutes:
+            continue
+        span = range(first, last + 1)
+        # ---------------------------------- #
+        # verify we have enough valid values #
+        # ---------------------------------- #
+        valid = [
+            values[i]
+            for i in span
+            if not math.isnan(values[i])
+            and not math.isinf(values[i])
+            and Qual(qualities_in[i]).score > 0
+        ]
+        if (
+            100.0 * len(valid) / len(span) < percent_valid_required
+        ):  # will always be False with math.nan
+            continue
+        # ---------------------------------- #
+        # get the max change in the duration #
+        # ---------------------------------- #
+        max_change = max(valid) - min(valid)
+        # ------------------------- #
+        # set the retuned qualities #
+        # ------------------------- #
+        if test_missing and max_change < missing_limit:
+            qualities_out[last] = missing_code
+        elif test_reject and max_change < reject_limit:
+            qualities_out[last] = reject_code
+        elif test_question and max_change < question_limit:
+            qualities_out[last] = question_code
+        elif test_missing or test_reject or test_question:
+            qualities_out[last] = okay_code
+
+    return qualities_out
+
+
+def test_screen_with_constant_value_reference() -> None:
+    # ------------------------------------------------------------------------ #
+    # the vectorized implementation must match the reference implementation on #
+    # irregular times with invalid values and screened qualities               #
+    # ------------------------------------------------------------------------ #
+    rng = np.random.default_rng(1234)
+    count = 40
+    minutes = np.cumsum(rng.integers(5, 90, count))
+    times = pd.DatetimeIndex(
+        pd.Timestamp("2024-10-10T01:00:00") + pd.to_timedelta(minutes, unit="min")
+    )
+    values = 613.5 + np.round(rng.normal(0, 0.01, count), 3)
+    values[[3, 17, 18, 30]] = np.nan
+    values[25] = np.inf
+    qualities = np.zeros(count, dtype=np.int64)
+    qualities[[8, 21]] = Qual(
+        "Screened Missing No_range Original None None None Unprotected".split()
+    ).code
+    qualities[[12, 33]] = Qual(
+        "Screened Rejected No_range Original None None None Unprotected".split()
+    ).code
+    hec_times = [HecTime(t.to_pydatetime()) for t in times]
+    for duration, m, r, q, above, pct in (
+        ("2Hours", 0.001, 0.005, 0.01, math.nan, math.nan),
+        ("2Hours", math.nan, 0.005, 0.01, 613.49, 50),
+        ("6Hours", 0.001, 0.005, 0.01, math.nan, 90),
+        ("6Hours", 0.001, math.nan, math.nan, 613.49, math.nan),
+    ):
+        args = (Duration(duration), m, r, q, above, pct)
+        expected = screen_with_constant_value_reference(
+            hec_times, values.tolist(), qualities.tolist(), *args
+        )
+        computed = TimeSeries._screen_with_constant_value_vectorized(
+            TimeSeries._index_nanoseconds(times), values, qualities, *args
+        )
+        assert computed.tolist() == expected
+
+
 def make_test_screen_with_forward_moving_average_data() -> list[list[Any]]:
     data = []
     for window in 3, 5:
@@ -2977,6 +3526,52 @@ def test_estimate_missing_values(
     )
 
 
+def test_estimate_missing_values_accumulation_gaps() -> None:
+    # ------------------------------------------------------------------- #
+    # accumulation gaps at the ends (not estimated), with equal bounds    #
+    # longer than max_missing_count (filled), with decreasing bounds (not #
+    # estimated), longer than max_missing_count (not estimated), and a    #
+    # rejected value - the expected results are those of the previous     #
+    # group-by-group implementation                                       #
+    # ------------------------------------------------------------------- #
+    nan = math.nan
+    values = [nan, nan, 1.0, 2.0, nan, nan, nan, nan, 2.0, 3.0, nan, 5.0]
+    values += [nan, 3.0, 6.0, 99.0, 8.0, nan, nan, nan, 10.0, nan, nan]
+    qualities = len(values) * [0]
+    qualities[15] = 0b1_0001
+    start_time = HecTime("2024-10-10T01:00:00")
+    times = pd.DatetimeIndex(
+        [(start_time + i * TimeSpan("PT1H")).datetime() for i in range(len(values))],
+        name="time",
+    )
+    expected_values = [nan, nan, 1.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 3.0, 4.0, 5.0]
+    expected_values += [nan, 3.0, 6.0, 7.0, 8.0, nan, nan, nan, 10.0, nan, nan]
+    estimated = [4, 5, 6, 7, 10]
+    for estimate_rejected in (False, True):
+        for set_questioned in (False, True):
+            ts = TimeSeries("Loc1.Precip.Inst.1Hour.0.Computed")
+            ts._data = pd.DataFrame(
+                {"value": values, "quality": qualities}, index=times
+            )
+            estimated_ts = ts.estimate_missing_values(
+                2,
+                accumulation=True,
+                estimate_rejected=estimate_rejected,
+                set_questioned=set_questioned,
+            )
+            estimated_code = 2441 if set_questioned else 2435
+            expected_qualities = qualities[:]
+            for i in estimated + ([15] if estimate_rejected else []):
+                expected_qualities[i] = estimated_code
+            expected = expected_values[:]
+            if not estimate_rejected:
+                expected[15] = 99.0
+            assert equal_values(estimated_ts.values, expected)
+            assert [
+                q & 0xFFFFFFFF for q in estimated_ts.qualities
+            ] == expected_qualities
+
+
 def test_expand_collapse_trim() -> None:
     start_time = HecTime("2024-10-15T01:00:00")
     intvl = Interval.get_cwms("1Day")
@@ -3382,6 +3977,409 @@ def test_merge() -> None:
         assert str(tse).find("is not consistent with interval") != -1
 
 
+def test_lazy() -> None:
+    # ----------------------------------------------------------- #
+    # a lazy chain gives the same result as the eager chain, with #
+    # one copy, and leaves the source unchanged                   #
+    # ----------------------------------------------------------- #
+    values = [float(v % 17) for v in range(48)]
+    for i in (5, 6, 7, 20, 30, 31):
+        values[i] = math.nan
+    ts = TimeSeries.new_regular_time_series(
+        "Loc1.Flow.Inst.1Hour.0.Computed",
+        "2024-10-15T01:00:00",
+        len(values),
+        "1Hour",
+        values=values,
+    )
+    eager = (
+        ts.estimate_missing_values(2)
+        .olympic_moving_average(5, False, True)
+        .screen_with_value_range(1.0, 2.0, 14.0, 15.0)
+        * 2
+        + 1.5
+        - 0.5
+    ) / 4
+    lazy = (
+        ts.lazy()
+        .estimate_missing_values(2)
+        .olympic_moving_average(5, False, True)
+        .screen_with_value_range(1.0, 2.0, 14.0, 15.0)
+        * 2
+        + 1.5
+        - 0.5
+    ) / 4
+    assert isinstance(lazy, LazyTimeSeries)
+    result = lazy.collect()
+    assert result is not ts
+    assert result.times == eager.times
+    assert np.allclose(result.values, eager.values, equal_nan=True)
+    assert result.qualities == eager.qualities
+    assert np.allclose(ts.values, values, equal_nan=True)
+    # ---------------------------------------------------------- #
+    # recorded chains can be branched and collected in-place,    #
+    # and selections are honored by the arithmetic operators     #
+    # ---------------------------------------------------------- #
+    base = ts.lazy().estimate_missing_values(2)
+    doubled = (base * 2).collect()
+    assert np.allclose(
+        doubled.values, (ts.estimate_missing_values(2) * 2).values, equal_nan=True
+    )
+    selected = ts.lazy().select(slice(0, 4)) + 100
+    assert selected.collect().values[:5] == [100.0, 101.0, 102.0, 103.0, 4.0]
+    copy = ts.copy()
+    assert copy.lazy().estimate_missing_values(2).collect(in_place=True) is copy
+    assert np.allclose(
+        copy.values, ts.estimate_missing_values(2).values, equal_nan=True
+    )
+    with pytest.raises(AttributeError):
+        ts.lazy().values
+    with pytest.raises(TypeError):
+        ts.lazy().estimate_missing_values()
+
+
+def test_cyclic_analysis_bins() -> None:
+    # ------------------------------------------------------------ #
+    # monthly bins collect one value per year, in year order, and  #
+    # the 2400 value of the last day of a month is in that month   #
+    # ------------------------------------------------------------ #
+    ts = TimeSeries.new_regular_time_series(
+        "Loc1.Flow.Inst.1Month.0.Computed",
+        "2021-01-31T24:00:00",
+        36,
+        "1Month",
+        values=[float(v) for v in range(36)],
+    )
+    results = ts.cyclic_analysis(method="linear")
+    assert len(results) == 14
+    count, max_date, min_date, aver, maximum, minimum = results[:6]
+    assert count.values == 12 * [3.0]
+    assert max_date.values == 12 * [2023.0]
+    assert min_date.values == 12 * [2021.0]
+    assert aver.values == [float(v + 12) for v in range(12)]
+    assert maximum.values == [float(v + 24) for v in range(12)]
+    assert minimum.values == [float(v) for v in range(12)]
+    assert results[9].values == aver.values  # P50
+    assert np.allclose(results[-1].values, 12 * [12.0])  # SD
+    # ------------------------------------------------------------ #
+    # daily bins skip February 29 and leave empty bins missing     #
+    # ------------------------------------------------------------ #
+    ts = TimeSeries.new_regular_time_series(
+        "Loc1.Flow.Inst.1Day.0.Computed",
+        "2024-02-27T24:00:00",
+        5,
+        "1Day",
+        values=[1.0, 2.0, 3.0, 4.0, 5.0],
+    )
+    results = ts.cyclic_analysis(method="linear")
+    assert results[0].values[56:61] == [0.0, 1.0, 1.0, 1.0, 1.0]
+    assert np.allclose(
+        results[3].values[56:61], [math.nan, 1.0, 2.0, 4.0, 5.0], equal_nan=True
+    )
+
+
+def test_copy_on_write() -> None:
+    # --------------------------------------------------------------- #
+    # copies share data buffers and immutable metadata until modified #
+    # --------------------------------------------------------------- #
+    ts = TimeSeries.new_regular_time_series(
+        "Loc1.Flow.Inst.1Hour.0.Computed",
+        "2024-10-15T01:00:00",
+        24,
+        "1Hour",
+        values=[float(v) for v in range(24)],
+    )
+    ts.midnight_as_2400 = True
+    copy = ts.copy()
+    assert copy.name == ts.name
+    assert copy.midnight_as_2400 is False
+    assert copy.interval is ts.interval
+    assert copy.parameter is not ts.parameter
+    data = cast(pd.DataFrame, ts._data)
+    assert np.shares_memory(
+        data["value"].to_numpy(), cast(pd.DataFrame, copy._data)["value"].to_numpy()
+    )
+    copy += 1.0
+    assert ts.values == [float(v) for v in range(24)]
+    assert copy.values == [float(v) + 1.0 for v in range(24)]
+    copy = ts.copy()
+    ts.iselect(slice(0, 12)).iset_value(-1.0)
+    assert copy.values == [float(v) for v in range(24)]
+    assert ts.values == 12 * [-1.0] + [float(v) for v in range(12, 24)]
+    copy.parameter.ito("cms")
+    assert ts.unit == "cfs"
+    assert ts.copy(include_data=False).data is None
+    # ------------------------------------------------------------ #
+    # the sharing doesn't depend on a process-wide pandas option,  #
+    # and selections and in-place writes don't leak between copies #
+    # ------------------------------------------------------------ #
+    assert pd.get_option("mode.copy_on_write") is False
+    ts.selection_state = SelectionState.DURABLE
+    ts.iselect(slice(0, 6))
+    copy = ts.copy()
+    copy.iselect(Select.INVERT)
+    assert ts.selected == 6 * [True] + 18 * [False]
+    assert copy.selected == 6 * [False] + 18 * [True]
+    copy = ts.copy()
+    ts *= 2.0
+    assert copy.values == 12 * [-1.0] + [float(v) for v in range(12, 24)]
+    assert ts.values[:6] == 6 * [-2.0]
+    # ------------------------------------------------------------- #
+    # writes through the data property don't leak between copies in #
+    # either direction                                              #
+    # ------------------------------------------------------------- #
+    values = ts.values
+    copy = ts.copy()
+    cast(pd.DataFrame, copy.data).iloc[0, 0] = 999.0
+    assert ts.values == values
+    assert copy.values == [999.0] + values[1:]
+    copy = ts.copy()
+    cast(pd.DataFrame, ts.data).iloc[2, 0] = -1.0
+    assert copy.values == values
+    assert ts.values == values[:2] + [-1.0] + values[3:]
+    copy = ts.copy()
+    data = cast(pd.DataFrame, copy.data)
+    data.loc[data.index[1], "value"] = 999.0
+    assert copy.values[1] == 999.0
+    assert ts.values == values[:2] + [-1.0] + values[3:]
+    # ---------------------------------------------------------- #
+    # operations that only read the data keep the copies sharing #
+    # ---------------------------------------------------------- #
+    copies = [ts.copy() for _ in range(3)]
+    TimeSeries.aggregate_ts("mean", copies)
+    TimeSeries.percentile_ts(50, copies)
+    data = cast(pd.DataFrame, ts._data)
+    for c in copies:
+        assert np.shares_memory(
+            data["value"].to_numpy(), cast(pd.DataFrame, c._data)["value"].to_numpy()
+        )
+
+
+def test_compact_storage() -> None:
+    times = (
+        np.arange(24, dtype=np.int64) * 3_600_000_000_000 + 1_730_419_200_000_000_000
+    )
+    values = np.arange(24, dtype=np.float64) + 0.25
+    qualities = np.zeros(24, dtype=np.int64)
+    qualities[1] = -2147483645  # screened, okay, protected
+    qualities[2] = 5
+    ts = TimeSeries.from_arrays(
+        "Loc1.Flow.Inst.1Hour.0.Computed", times, values, qualities
+    )
+    assert not ts.compact
+    assert ts.memory_usage() == 24 * (8 + 8 + 8)
+    # ------------------------------------------------------------------ #
+    # compacting keeps the values and qualities and only shrinks storage #
+    # ------------------------------------------------------------------ #
+    ts.compact = True
+    assert ts.compact
+    assert ts.memory_usage() == 24 * (8 + 4 + 4)
+    assert ts.values == values.tolist()
+    assert [q & 0xFFFFFFFF for q in ts.qualities] == (qualities & 0xFFFFFFFF).tolist()
+    assert ts.number_missing_values == 1
+    ts.iselect(slice(0, 6))
+    assert ts.compact
+    assert ts.memory_usage() == 24 * (8 + 4 + 4 + 1)
+    # ---------------------------------------------------------------------- #
+    # modified data (in place or in a copy) is restored to float64 and int64 #
+    # ---------------------------------------------------------------------- #
+    ts2 = ts + 1.0
+    assert ts.compact and not ts2.compact
+    assert ts2.values == (values + (np.arange(24) < 6)).tolist()
+    ts.iselect(slice(0, 6)).iset_value(0.1)
+    assert not ts.compact
+    assert ts.values[:7] == 6 * [0.1] + [6.25]
+    assert [q & 0xFFFFFFFF for q in ts.qualities] == (qualities & 0xFFFFFFFF).tolist()
+    ts.compact = True
+    assert ts.compact and ts.values[0] == 0.1
+    assert ts.memory_usage() == 24 * (8 + 8 + 4)
+    ts.compact = False
+    assert ts.memory_usage() == 24 * (8 + 8 + 8)
+    # ------------------------------------------------------------- #
+    # values that aren't exactly float32 values are kept as float64 #
+    # ------------------------------------------------------------- #
+    for big in (1.0e39, 1.0e6 + 0.1):
+        ts = TimeSeries.from_arrays(
+            "Loc1.Flow.Inst.1Hour.0.Computed", times[:2], np.array([big, 1.0])
+        )
+        ts.compact = True
+        data = cast(pd.DataFrame, ts._data)
+        assert data["value"].dtype == np.float64
+        assert data["quality"].dtype == np.int32
+        assert ts.values == [big, 1.0]
+    # ------------------------------------------------------------------ #
+    # float32 values are an explicit opt-in that rounds decimal values   #
+    # ------------------------------------------------------------------ #
+    ts = TimeSeries.from_arrays(
+        "Loc1.Flow.Inst.1Hour.0.Computed", times, values + 0.1, qualities
+    )
+    ts.compact = True
+    assert ts.memory_usage() == 24 * (8 + 8 + 4)
+    TimeSeries.set_default_compact(False, values="float32")
+    try:
+        ts = TimeSeries.from_arrays(
+            "Loc1.Flow.Inst.1Hour.0.Computed", times, values + 0.1, qualities
+        )
+        ts.compact = True
+        assert ts.memory_usage() == 24 * (8 + 4 + 4)
+        assert ts.values[0] != 0.35
+        assert np.allclose(ts.values, values + 0.1, rtol=1.0e-7)
+    finally:
+        TimeSeries.set_default_compact(False)
+    with pytest.raises(TimeSeriesException, match="float32"):
+        TimeSeries.set_default_compact(values="float16")
+    # -------------------------------------------------------------- #
+    # the float32 opt-in may also be set on individual time series,  #
+    # and copies keep it                                             #
+    # -------------------------------------------------------------- #
+    ts = TimeSeries.from_arrays(
+        "Loc1.Flow.Inst.1Hour.0.Computed", times, values + 0.1, qualities
+    )
+    assert ts.compact_values is None
+    ts.compact = True
+    ts.compact_values = "float32"
+    assert ts.compact and ts.memory_usage() == 24 * (8 + 4 + 4)
+    assert ts.copy().compact_values == "float32"
+    assert np.allclose(ts.values, values + 0.1, rtol=1.0e-7)
+    with pytest.raises(TimeSeriesException, match="float32"):
+        ts.compact_values = "float16"
+    # ------------------------------------------------------------------ #
+    # the data property exposes float64 values and int64 quality codes, #
+    # so writes through it are never narrowed                           #
+    # ------------------------------------------------------------------ #
+    ts = TimeSeries.from_arrays(
+        "Loc1.Flow.Inst.1Hour.0.Computed", times, values, qualities
+    )
+    ts.compact = True
+    data = cast(pd.DataFrame, ts.data)
+    assert not ts.compact
+    assert data["value"].dtype == np.float64
+    assert data["quality"].dtype == np.int64
+    assert data["quality"].iloc[1] == -2147483645
+    data.iloc[0, 0] = 0.1
+    assert ts.values[0] == 0.1
+    # ------------------------------------------------------------------ #
+    # unsigned quality codes are normalized to the signed codes          #
+    # ------------------------------------------------------------------ #
+    ts = TimeSeries.from_arrays(
+        "Loc1.Flow.Inst.1Hour.0.Computed",
+        times[:2],
+        values[:2],
+        np.array([2147483651, 5], dtype=np.int64),
+    )
+    ts.compact = True
+    ts.compact = False
+    assert cast(pd.DataFrame, ts._data)["quality"].tolist() == [-2147483645, 5]
+    # ------------------------------------------------ #
+    # the default applies to newly created time series #
+    # ------------------------------------------------ #
+    TimeSeries.set_default_compact()
+    try:
+        ts = TimeSeries.new_regular_time_series(
+            "Loc1.Flow.Inst.1Hour.0.Computed",
+            "2024-10-15T01:00:00",
+            24,
+            "1Hour",
+            values=1.0,
+        )
+        assert ts.compact
+        assert TimeSeries.from_arrays(
+            "Loc1.Flow.Inst.1Hour.0.Computed", times, values, qualities
+        ).compact
+    finally:
+        TimeSeries.set_default_compact(False)
+    assert not TimeSeries.from_arrays(
+        "Loc1.Flow.Inst.1Hour.0.Computed", times, values, qualities
+    ).compact
+
+
+def test_arithmetic_alignment() -> None:
+    # ------------------------------------------------------------- #
+    # operations on time series with the same times, with different #
+    # times (only the common times remain), and with unit conversion #
+    # ------------------------------------------------------------- #
+    times = pd.date_range("2024-10-15T01:00:00", periods=6, freq="h", name="time")
+    ts1 = TimeSeries("Loc1.Flow.Inst.0.0.Computed")
+    ts1._data = pd.DataFrame(
+        {"value": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0], "quality": 3}, index=times
+    )
+    ts2 = TimeSeries("Loc1.Flow.Inst.0.0.Computed")
+    ts2._data = pd.DataFrame(
+        {"value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0], "quality": 3}, index=times
+    )
+    assert (ts1 + ts2).values == [11.0, 22.0, 33.0, 44.0, 55.0, 66.0]
+    assert (ts1 + ts2).qualities == 6 * [0]
+    assert (ts1 % ts2).values == 6 * [0.0]
+    assert ts1.fmod(ts2).values == 6 * [0.0]
+    ts3 = TimeSeries("Loc1.Flow.Inst.0.0.Computed")
+    ts3._data = pd.DataFrame(
+        {"value": [1.0, 2.0, 3.0, 4.0], "quality": 0}, index=times[[0, 2, 3, 5]]
+    )
+    diff = ts1 - ts3
+    assert diff.times == [ts1.times[i] for i in (0, 2, 3, 5)]
+    assert diff.values == [9.0, 28.0, 37.0, 56.0]
+    ts4 = ts2.to("cms")
+    total = ts1 + ts4
+    assert total.unit == "cfs"
+    assert np.allclose(total.values, (ts1 + ts2).values)
+    in_place = ts1.copy()
+    in_place -= ts4
+    assert np.allclose(in_place.values, [9.0, 18.0, 27.0, 36.0, 45.0, 54.0])
+    # --------------------------------------------- #
+    # only selected values take part in an operation #
+    # --------------------------------------------- #
+    selected = ts1.select(lambda tsv: tsv.value > 35) + ts2
+    assert selected.values == [44.0, 55.0, 66.0]
+    with pytest.raises(ParameterException):
+        ts1**ts2
+
+
+def test_merge_k_way() -> None:
+    # ------------------------------------------------------------ #
+    # merging a list in one pass matches merging one at a time and #
+    # follows the protected/valid precedence at each time          #
+    # ------------------------------------------------------------ #
+    protected = 1 << 31 | 3
+    times = pd.date_range("2024-10-15T01:00:00", periods=8, freq="h", name="time")
+
+    def make(
+        positions: list[int], values: list[float], qualities: list[int]
+    ) -> TimeSeries:
+        ts = TimeSeries("Loc1.Flow.Inst.0.0.Computed")
+        ts._data = pd.DataFrame(
+            {"value": values, "quality": qualities}, index=times[positions]
+        )
+        return ts
+
+    ts1 = make([2, 3, 4, 5], [1.0, math.nan, 3.0, math.nan], [0, 5, 0, protected])
+    ts2 = make(
+        [0, 1, 2, 3, 4], [10.0, math.inf, 12.0, 13.0, 14.0], [0] * 4 + [protected]
+    )
+    ts3 = make([1, 3, 6, 7], [21.0, 23.0, math.nan, 27.0], [protected, 0, 5, 0])
+    merged = ts1.merge([ts2, ts3])
+    expected_values = [10.0, 21.0, 1.0, 13.0, 14.0, math.nan, math.nan, 27.0]
+    expected_qualities = [0, protected, 0, 0, protected, protected, 5, 0]
+    assert len(merged) == 8
+    assert np.allclose(merged.values, expected_values, equal_nan=True)
+    assert [q & 0xFFFFFFFF for q in merged.qualities] == expected_qualities
+    sequential = ts1.merge(ts2).merge(ts3)
+    assert sequential.times == merged.times
+    assert np.allclose(sequential.values, merged.values, equal_nan=True)
+    assert sequential.qualities == merged.qualities
+    # ------------------------------------------------------- #
+    # in-place merging and merging into an empty time series  #
+    # ------------------------------------------------------- #
+    empty = TimeSeries("Loc1.Flow.Inst.0.0.Computed")
+    from_empty = empty.merge([ts1, ts2, ts3])
+    assert from_empty.times == merged.times
+    assert np.allclose(from_empty.values, merged.values, equal_nan=True)
+    assert from_empty.qualities == merged.qualities
+    assert empty.data is None
+    ts1.imerge([ts2, ts3])
+    assert ts1.times == merged.times
+    assert ts1.qualities == merged.qualities
+
+
 def test_to_irregular() -> None:
     start_time = HecTime("2024-10-15T01:00:00")
     intvl = Interval.get_cwms("1Day")
@@ -3529,6 +4527,72 @@ def test_snap_to_regular() -> None:
     expected_qualities = [0, 0, 5, 0, 0, 0]
 
 
+def test_snap_to_regular_precedence() -> None:
+    # ------------------------------------------------------------------ #
+    # protected values are preferred over valid values, which are        #
+    # preferred over the closest value, and ties go to the earlier value #
+    # ------------------------------------------------------------------ #
+    protected = -2147483645  # screened, okay, protected
+    times = pd.DatetimeIndex(
+        [
+            "2024-10-15 00:55",  # 01:10 via backward window
+            "2024-10-15 01:12",  # 01:10 via forward window (closest)
+            "2024-10-15 02:00",  # 02:10 (invalid but closest)
+            "2024-10-15 02:20",  # 02:10 (valid)
+            "2024-10-15 03:05",  # 03:10 (valid, closest)
+            "2024-10-15 03:20",  # 03:10 (invalid, protected)
+            "2024-10-15 04:05",  # 04:10 (tie, earlier)
+            "2024-10-15 04:15",  # 04:10 (tie, later)
+        ],
+        name="time",
+    )
+    ts = TimeSeries("Loc1.Flow.Inst.0.0.Raw")
+    ts._data = pd.DataFrame(
+        {
+            "value": [1.0, 2.0, math.nan, 4.0, 5.0, math.nan, 7.0, 8.0],
+            "quality": [3, 3, 5, 3, 3, protected, 3, 3],
+        },
+        index=times,
+    )
+    ts2 = ts.snap_to_regular("1Hour", "PT10M", "PT15M", "PT10M")
+    assert ts2.times == [
+        "2024-10-15 01:10:00",
+        "2024-10-15 02:10:00",
+        "2024-10-15 03:10:00",
+        "2024-10-15 04:10:00",
+    ]
+    assert np.allclose(ts2.values, [2.0, 4.0, math.nan, 7.0], equal_nan=True)
+    assert [q & 0xFFFFFFFF for q in ts2.qualities] == [
+        3,
+        3,
+        protected & 0xFFFFFFFF,
+        3,
+    ]
+    assert len(ts) == 8
+    # --------------------------------------------------------------- #
+    # values before the offset in an interval snap to the previous    #
+    # interval's offset time, and calendar intervals snap to calendar #
+    # boundaries                                                      #
+    # --------------------------------------------------------------- #
+    ts2 = ts.snap_to_regular("1Hour", "PT50M", None, "PT30M")
+    assert ts2.times[0] == "2024-10-15 00:50:00"
+    assert ts2.values[0] == 1.0
+    ts = TimeSeries("Loc1.Flow.Inst.0.0.Raw")
+    ts._data = pd.DataFrame(
+        {"value": [1.0, 2.0, 3.0], "quality": [0, 0, 0]},
+        index=pd.DatetimeIndex(
+            ["2024-01-31 23:00", "2024-03-01 01:00", "2024-03-31 22:00"], name="time"
+        ),
+    )
+    ts2 = ts.snap_to_regular("1Month", None, "PT2H", "PT2H")
+    assert ts2.times == [
+        "2024-02-01 00:00:00",
+        "2024-03-01 00:00:00",
+        "2024-04-01 00:00:00",
+    ]
+    assert ts2.values == [1.0, 2.0, 3.0]
+
+
 def make_test_new_regluar_time_series_data() -> list[list[Any]]:
     data = []
     time_zone = "US/Pacific"
@@ -3737,6 +4801,338 @@ def test_new_regular_time_series(
         assert ts.qualities == expected_length * [3]
 
 
+def test_from_arrays() -> None:
+    times = (
+        np.arange(24, dtype=np.int64) * 3_600_000_000_000 + 1_730_419_200_000_000_000
+    )
+    values = np.arange(24, dtype=np.float64)
+    qualities = np.full(24, 3, dtype=np.int64)
+    # ------------------------------------------------------------- #
+    # int64 times are UTC nanoseconds and all arrays are used as is #
+    # ------------------------------------------------------------- #
+    ts = TimeSeries.from_arrays(
+        "Loc.Flow.Inst.1Hour.0.Test", times, values, qualities, "US/Central"
+    )
+    data = cast(pd.DataFrame, ts.data)
+    assert ts.time_zone == "US/Central"
+    assert ts.times[:2] == ["2024-10-31 19:00:00-05:00", "2024-10-31 20:00:00-05:00"]
+    assert np.shares_memory(
+        TimeSeries._index_nanoseconds(cast(pd.DatetimeIndex, data.index)), times
+    )
+    assert np.shares_memory(data["value"].to_numpy(), values)
+    assert np.shares_memory(data["quality"].to_numpy(), qualities)
+    assert ts.values == values.tolist()
+    assert ts.qualities == 24 * [3]
+    assert (ts + 1).values == (values + 1).tolist()
+    assert ts.values == values.tolist()
+    assert (
+        TimeSeries.from_arrays("Loc.Flow.Inst.1Hour.0.Test", times, values).time_zone
+        == "UTC"
+    )
+    # -------------------------------------------------------------------- #
+    # datetime64 times are localized and other arrays are converted to the #
+    # time series data types                                               #
+    # -------------------------------------------------------------------- #
+    ts = TimeSeries.from_arrays(
+        "Loc.Flow.Inst.1Hour.0.Test",
+        np.array(["2024-11-03T00:00", "2024-11-03T01:00"], dtype="datetime64[m]"),
+        np.array([1, 2], dtype=np.int32),
+        np.array([0, 5], dtype=np.int32),
+        "UTC",
+    )
+    assert ts.times == ["2024-11-03 00:00:00+00:00", "2024-11-03 01:00:00+00:00"]
+    assert ts.values == [1.0, 2.0]
+    assert ts.qualities == [0, 5]
+    # ------ #
+    # errors #
+    # ------ #
+    with pytest.raises(TimeSeriesException, match="int64 or datetime64"):
+        TimeSeries.from_arrays("Loc.Flow.Inst.1Hour.0.Test", values, values)  # type: ignore
+    with pytest.raises(TimeSeriesException, match="Expected 24 values"):
+        TimeSeries.from_arrays("Loc.Flow.Inst.1Hour.0.Test", times, values[:-1])
+    with pytest.raises(TimeSeriesException, match="not consistent"):
+        TimeSeries.from_arrays(
+            "Loc.Flow.Inst.1Hour.0.Test", times * 2, values, qualities
+        )
+    for unordered in times[::-1].copy(), np.repeat(times[:12], 2):
+        with pytest.raises(TimeSeriesException, match="increasing and unique"):
+            TimeSeries.from_arrays("Loc.Flow.Inst.0.0.Test", unordered, values)
+    ts = TimeSeries.from_arrays(
+        "Loc.Flow.Inst.1Hour.0.Test", times * 2, values, qualities, validate=False
+    )
+    assert len(cast(pd.DataFrame, ts.data)) == 24
+
+
+def test_arrow_parquet() -> None:
+    pa = pytest.importorskip("pyarrow")
+    times = (
+        np.arange(24, dtype=np.int64) * 3_600_000_000_000 + 1_730_419_200_000_000_000
+    )
+    values = np.arange(24, dtype=np.float64) + 0.5
+    values[3] = np.nan
+    qualities = np.zeros(24, dtype=np.int64)
+    qualities[3] = 5
+    qualities[4] = -2147483645
+    ts = TimeSeries.from_arrays(
+        "Loc1.Elev.Inst.1Hour.0.Computed", times, values, qualities, "US/Central"
+    )
+    ts.iset_unit("m")
+    # ------------------------------------------------------------------- #
+    # a single time series round trips its data and metadata, sharing the #
+    # value and quality memory with the Arrow table                       #
+    # ------------------------------------------------------------------- #
+    table = ts.to_arrow()
+    assert table.column_names == ["time", "value", "quality"]
+    assert np.shares_memory(
+        table.column("value").chunk(0).to_numpy(),
+        cast(pd.DataFrame, ts._data)["value"].to_numpy(),
+    )
+    ts2 = TimeSeries.from_arrow(table)
+    assert ts2.name == ts.name
+    assert ts2.unit == "m"
+    assert ts2.time_zone == "US/Central"
+    assert ts2.times == ts.times
+    assert ts2.values[:3] == ts.values[:3] and math.isnan(ts2.values[3])
+    assert [q & 0xFFFFFFFF for q in ts2.qualities] == [
+        q & 0xFFFFFFFF for q in ts.qualities
+    ]
+    assert (
+        cast(ParameterType, ts2.parameter_type).get_raw_name()
+        == cast(ParameterType, ts.parameter_type).get_raw_name()
+    )
+    with pytest.raises(TimeSeriesException, match="metadata"):
+        TimeSeries.from_arrow(pa.table({"time": times}))
+    # ------------------------------------------------------------------ #
+    # modifying either the exported or the imported time series in place #
+    # copies its data first, leaving the (read-only) table unchanged     #
+    # ------------------------------------------------------------------ #
+    exported = table.column("value").to_numpy().copy()
+    ts7 = ts.copy()
+    table = ts7.to_arrow()
+    ts7 += 10.0
+    assert np.array_equal(table.column("value").to_numpy(), exported, equal_nan=True)
+    ts7 = TimeSeries.from_arrow(table)
+    ts7 += 1.0
+    assert ts7.values[0] == exported[0] + 1.0
+    data = cast(pd.DataFrame, ts7.data)
+    data.loc[data.index[1], "value"] = -1.0
+    assert ts7.values[1] == -1.0
+    assert np.array_equal(table.column("value").to_numpy(), exported, equal_nan=True)
+    # ---------------------------------------------------------------- #
+    # vertical datum info round trips with the datum the values are in #
+    # ---------------------------------------------------------------- #
+    ts5 = TimeSeries.from_arrays(
+        "Loc1.Elev.Inst.1Hour.0.Computed", times[:3], np.array([0.0, 1.0, 2.0])
+    )
+    ts5.iset_vertical_datum_info("""<vertical-datum-info office="SWT" unit="ft">
+            <location>Loc1</location>
+            <native-datum>NGVD-29</native-datum>
+            <elevation>615.23</elevation>
+            <offset estimate="true">
+                <to-datum>NAVD-88</to-datum>
+                <value>0.3625</value>
+            </offset>
+        </vertical-datum-info>""")
+    ts5.ito("NAVD-88")
+    ts6 = TimeSeries.from_arrow(ts5.to_arrow())
+    vdi = ts6.vertical_datum_info
+    assert vdi is not None
+    assert vdi.native_datum == "NGVD-29" and vdi.current_datum == "NAVD-88"
+    assert ts6.values == ts5.values
+    assert ts6.to("NAVD-88").values == ts5.values
+    assert np.allclose(ts6.to("NGVD-29").values, [0.0, 1.0, 2.0])
+    # ------------------------------------------------------------------ #
+    # several time series (including empty ones) share one table or file #
+    # ------------------------------------------------------------------ #
+    ts3 = TimeSeries.from_arrays(
+        "Loc2.Flow.Inst.1Hour.0.Computed", times[:3], values[:3] * 10
+    )
+    ts4 = TimeSeries("Loc3.Stage.Inst.1Hour.0.Computed")
+    table = TimeSeries.to_arrow_many([ts, ts3, ts4])
+    assert table.column_names == ["series", "time", "value", "quality"]
+    assert table.num_rows == 27
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ts.to_parquet(os.path.join(tmpdir, "one.parquet"))
+        ts2 = TimeSeries.read_parquet(os.path.join(tmpdir, "one.parquet"))
+        assert ts2.name == ts.name and ts2.times == ts.times
+        ts2 += 1.0
+        data = cast(pd.DataFrame, ts2.data)
+        data.loc[data.index[1], "value"] = -1.0
+        assert ts2.values[:2] == [ts.values[0] + 1.0, -1.0]
+        TimeSeries.to_parquet_many([ts, ts3, ts4], os.path.join(tmpdir, "many.parquet"))
+        many = TimeSeries.read_parquet_many(os.path.join(tmpdir, "many.parquet"))
+    assert [t.name for t in many] == [ts.name, ts3.name, ts4.name]
+    assert many[0].times == ts.times
+    assert many[1].times == ts3.times and many[1].values == ts3.values
+    assert many[1].time_zone == "UTC"
+    assert many[2].data is None
+
+
+def test_process_chunks() -> None:
+    rng = np.random.default_rng(25)
+    count = 2000
+    times = (
+        np.cumsum(rng.integers(1, 3, count)) * 900_000_000_000
+        + 1_577_836_800_000_000_000
+    )
+    values = np.round(np.cumsum(rng.normal(0.0, 1.0, count)) + 100.0, 2)
+    values[rng.random(count) < 0.05] = np.nan
+    values[500:530] = np.nan
+    values[1000:1020] = 100.0
+    qualities = np.zeros(count, dtype=np.int64)
+    qualities[rng.random(count) < 0.03] = 0b1_0001
+    ts = TimeSeries.from_arrays(
+        "Loc.Precip.Inst.0.0.Raw", times, values, qualities, "UTC"
+    )
+
+    def same_data(ts1: TimeSeries, ts2: TimeSeries) -> bool:
+        df1 = cast(pd.DataFrame, ts1.data)
+        df2 = cast(pd.DataFrame, ts2.data)
+        return bool(
+            df1.index.equals(df2.index)
+            and np.array_equal(
+                df1["value"].to_numpy(dtype=np.float64),
+                df2["value"].to_numpy(dtype=np.float64),
+                equal_nan=True,
+            )
+            and np.array_equal(
+                df1["quality"].to_numpy(dtype=np.int64) & 0xFFFFFFFF,
+                df2["quality"].to_numpy(dtype=np.int64) & 0xFFFFFFFF,
+            )
+        )
+
+    # ---------------------------------------------------------------------- #
+    # chunks of rows or of time cover the time series and combine back to it #
+    # ---------------------------------------------------------------------- #
+    chunks = list(ts.iter_chunks(300))
+    assert [len(c) for c in chunks] == 6 * [300] + [200]
+    assert same_data(TimeSeries.from_chunks(chunks), ts)
+    chunks = list(ts.iter_chunks(TimeSpan("P1D")))
+    assert all(
+        (c.data.index[-1] - c.data.index[0]) < timedelta(days=1)  # type: ignore
+        for c in chunks
+    )
+    assert same_data(TimeSeries.from_chunks(chunks), ts)
+    with pytest.raises(TimeSeriesException, match="calendar"):
+        ts.iter_chunks(TimeSpan("P1M"))
+    with pytest.raises(TimeSeriesException, match="order"):
+        TimeSeries.from_chunks(reversed(chunks))
+    # ------------------------------------------------------------------ #
+    # each operation on chunks has the same result as on the entire time #
+    # series, whatever the chunk size (forward and centered averages to  #
+    # the rounding of their window sums)                                 #
+    # ------------------------------------------------------------------ #
+    pattern = TimeSeries.from_arrays(
+        "Loc.Precip.Inst.0.0.Pattern",
+        times[::5] + 600_000_000_000,
+        np.zeros(len(times[::5])),
+    )
+    operations: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = [
+        ("accum", (), {}),
+        ("diff", (), {}),
+        ("time_derivative", (), {}),
+        ("estimate_missing_values", (5,), {}),
+        ("estimate_missing_values", (5, True), {}),
+        ("estimate_missing_values", (40, False, False), {}),
+        ("forward_moving_average", (7, False, False), {}),
+        ("forward_moving_average", (6, True, True), {}),
+        ("centered_moving_average", (5, True, False), {}),
+        ("olympic_moving_average", (9, False, True), {}),
+        ("screen_with_constant_value", ("3Hours", 0.01, 0.1, 0.5), {}),
+        ("screen_with_constant_value", ("1Day", 0.01, 0.1, 0.5, math.nan, 50.0), {}),
+        (
+            "screen_with_duration_magnitude",
+            ("6Hours", 100, 200, 300, 900, 1000, 1100),
+            {"percent_valid_required": 50.0},
+        ),
+        ("screen_with_forward_moving_average", (5, False, True, 2.0), {}),
+        ("screen_with_value_change_rate", (-0.1, -0.05, 0.05, 0.1), {}),
+        ("screen_with_value_range", (90, 95, 110, 120), {}),
+        ("screen_with_value_range_or_change", (90, 120, 2.0), {}),
+        ("resample", ("INTERP", TimeSpan("PT1H")), {}),
+        ("resample", ("AVE", TimeSpan("PT1H")), {}),
+        ("resample", ("MAX", TimeSpan("PT2H")), {"offset": TimeSpan("PT30M")}),
+        (
+            "resample",
+            ("PREV", timedelta(minutes=40)),
+            {"start_time": "2019-12-31 20:00"},
+        ),
+        ("resample", ("COUNT", None), {"offset": TimeSpan("PT5M")}),
+        ("resample", ("INTERP", pattern), {}),
+    ]
+    for operation, args, kwargs in operations:
+        whole = getattr(ts, operation)(*args, **kwargs)
+        for size in (97, TimeSpan("P1D")):
+            chunked = TimeSeries.from_chunks(
+                TimeSeries.process_chunks(
+                    ts.iter_chunks(size), operation, *args, **kwargs
+                )
+            )
+            assert same_data(chunked, whole), f"{operation}{args}{kwargs} {size}"
+    # ------------------------------------------------------------------ #
+    # chunks of one value still see the values before the first new time #
+    # and the values that the screenings require                         #
+    # ------------------------------------------------------------------ #
+    head = TimeSeries.from_arrays(
+        "Loc.Precip.Total.15Minutes.0.Raw",
+        np.arange(60, dtype=np.int64) * 900_000_000_000 + times[0],
+        np.arange(60, 0, -1, dtype=np.float64),
+    )
+    for operation, args, kwargs in (operations[10], operations[12], operations[19]):
+        whole = getattr(head, operation)(*args, **kwargs)
+        chunked = TimeSeries.from_chunks(
+            TimeSeries.process_chunks(head.iter_chunks(1), operation, *args, **kwargs)
+        )
+        assert same_data(chunked, whole), f"{operation}{args}{kwargs}"
+    with pytest.raises(TimeSeriesException, match="cannot be performed in chunks"):
+        TimeSeries.process_chunks(ts.iter_chunks(100), "trim")
+    with pytest.raises(TimeSeriesException, match="in place"):
+        TimeSeries.process_chunks(ts.iter_chunks(100), "diff", True)
+    with pytest.raises(TypeError):
+        TimeSeries.process_chunks(ts.iter_chunks(100), "forward_moving_average", 3)
+    # ------------------------------------------------------------------- #
+    # chunks stream from one Parquet file through an operation to another #
+    # ------------------------------------------------------------------- #
+    pytest.importorskip("pyarrow")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ts.to_parquet(os.path.join(tmpdir, "raw.parquet"))
+        chunks = list(
+            TimeSeries.read_parquet_chunks(os.path.join(tmpdir, "raw.parquet"), 300)
+        )
+        assert len(chunks) == 7 and chunks[0].name == ts.name
+        TimeSeries.to_parquet_chunks(
+            TimeSeries.process_chunks(
+                TimeSeries.read_parquet_chunks(
+                    os.path.join(tmpdir, "raw.parquet"), 300
+                ),
+                "screen_with_value_range",
+                90,
+                95,
+                110,
+                120,
+            ),
+            os.path.join(tmpdir, "screened.parquet"),
+        )
+        screened = TimeSeries.read_parquet(os.path.join(tmpdir, "screened.parquet"))
+        # -------------------------------------------------------------- #
+        # compact chunks are widened, so a later chunk that needs        #
+        # float64 values (or a negative quality code) is written exactly #
+        # -------------------------------------------------------------- #
+        quarters = TimeSeries.from_arrays(
+            ts.name, times, np.round(values * 4) / 4, qualities, "UTC"
+        )
+        chunks = list(quarters.iter_chunks(1000))
+        chunks[1] = chunks[1].select(0).set_value(1.0e6 + 0.1)
+        for chunk in chunks:
+            chunk.compact = True
+        assert cast(pd.DataFrame, chunks[0]._data)["value"].dtype == np.float32
+        TimeSeries.to_parquet_chunks(chunks, os.path.join(tmpdir, "compact.parquet"))
+        widened = TimeSeries.read_parquet(os.path.join(tmpdir, "compact.parquet"))
+    assert same_data(screened, ts.screen_with_value_range(90, 95, 110, 120))
+    assert same_data(widened, TimeSeries.from_chunks(chunks))
+    assert widened.values[1000] == 1.0e6 + 0.1
+
+
 def make_test_resample_data() -> list[list[Any]]:
     data = []
     for param_type in [
@@ -5106,6 +6502,882 @@ def test_resample_large_to_small_non_aligned(
     )
 
 
+def resample_reference(
+    ts: TimeSeries,
+    operation: str,
+    old_tsvs: List[TimeSeriesValue],
+    new_tsvs: List[TimeSeriesValue],
+    before_value: float,
+    after_value: float,
+    is_regular: bool,
+    max_missing_percent: float,
+    entire_interval: Optional[bool],
+) -> None:
+    # ------------------------------------------------------------------ #
+    # the previous resample engine over lists of TimeSeriesValue objects #
+    # (the reference for the array engine) - sets the values of new_tsvs #
+    # in place                                                           #
+    # ------------------------------------------------------------------ #
+    # ----------------------------------------------------------- #
+    # get the bounding indices of the old times for each new time #
+    # ----------------------------------------------------------- #
+    bounds: List[Any] = len(new_tsvs) * [None]
+    for i in range(len(new_tsvs)):
+        prev = bisect.bisect_right(old_tsvs, new_tsvs[i])
+        if prev == 0:
+            # ------------------------------------------------------------------------- #
+            # old time is before first new time  - set value and leave bounds[i] = None #
+            # ------------------------------------------------------------------------- #
+            if math.isfinite(before_value) or math.isnan(before_value):
+                new_tsvs[i].value = UQ(before_value, ts.unit)
+            elif before_value == -math.inf:
+                # RESAMPLE_FIRST
+                new_tsvs[i].value = old_tsvs[0].value
+            else:
+                # RESAMPLE_MISSING
+                new_tsvs[i].value = UQ(math.nan, ts.unit)
+        elif prev == len(old_tsvs):
+            prev -= 1
+            if old_tsvs[prev].time == new_tsvs[i].time:
+                # --------------------------------- #
+                # old time is exactly last new time #
+                # --------------------------------- #
+                bounds[i] = (prev, prev)
+            else:
+                # ----------------------------------------------------------------------------------------- #
+                # old time is after last new time - set remaining values and leave bounds for values = None #
+                # ----------------------------------------------------------------------------------------- #
+                for j in range(i, len(new_tsvs)):
+                    if math.isfinite(after_value) or math.isnan(after_value):
+                        new_tsvs[j].value = UQ(after_value, ts.unit)
+                    elif after_value == -math.inf:
+                        # _RESAMPLE_LAST
+                        new_tsvs[j].value = old_tsvs[-1].value
+                    else:
+                        # _RESAMPLE_MISSING
+                        new_tsvs[j].value = UQ(math.nan, ts.unit)
+                break
+        else:
+            # ----------------------------------------------------------------------------- #
+            # old time is in range of new times - set the bounds to fill in the value later #
+            # ----------------------------------------------------------------------------- #
+            prev -= 1
+            if old_tsvs[prev].time == new_tsvs[i].time:
+                bounds[i] = (prev, prev)
+            else:
+                bounds[i] = (prev, prev + 1)
+    if _resample_operations[operation]:
+        resample_discreet_reference(
+            ts, operation, old_tsvs, new_tsvs, bounds, entire_interval
+        )
+    else:
+        resample_continuous_reference(
+            ts,
+            operation,
+            old_tsvs,
+            new_tsvs,
+            is_regular,
+            bounds,
+            max_missing_percent,
+        )
+
+
+def resample_continuous_reference(
+    ts: TimeSeries,
+    operation: str,
+    old_tsvs: List[TimeSeriesValue],
+    new_tsvs: List[TimeSeriesValue],
+    is_regular: bool,
+    bounds: List[Any],
+    max_missing_percent: float,
+) -> None:
+    new_parameter, new_unit = ts._continuous_resample_units(operation)
+    is_inst = cast(ParameterType, ts.parameter_type).get_raw_name() == "Instantaneous"
+    is_total = cast(ParameterType, ts.parameter_type).get_raw_name() == "Total"
+    is_accum = (
+        cast(ParameterType, ts.parameter_type).name == "INST-CUM"
+        if ts.context == DSS
+        else is_inst and ts.parameter.base_parameter == "Precip"
+    )
+    prev_lo: Optional[int] = None
+    prev_hi: int
+    len_old = len(old_tsvs)
+    lo: int
+    hi: int
+    interpolated: TimeSeriesValue
+    prev_interpolated: Optional[TimeSeriesValue] = None
+    last_valid = 0.0
+    first_boundary = True
+    for i, boundary in [(i, b) for (i, b) in enumerate(bounds) if b is not None]:
+        missing_seconds = 0.0
+        t1, t2 = (0, 1) if i == 0 else (i - 1, i)
+        new_interval_seconds = (
+            cast(datetime, new_tsvs[t2].time.datetime())
+            - cast(datetime, new_tsvs[t1].time.datetime())
+        ).total_seconds()
+        max_missing_seconds = new_interval_seconds * max_missing_percent / 100.0
+        new_val = math.nan
+        if not first_boundary:
+            prev_lo, prev_hi = lo, hi
+            prev_interpolated = interpolated
+        first_boundary = False
+        lo, hi = boundary
+        if lo == hi:
+            t1, t2 = (lo, lo + 1) if lo < len_old - 1 else (hi - 1, hi)
+        else:
+            t1, t2 = (lo, hi)
+        old_interval_seconds = (
+            cast(datetime, old_tsvs[t2].time.datetime())
+            - cast(datetime, old_tsvs[t1].time.datetime())
+        ).total_seconds()
+        # ---------------------------------------------- #
+        # interpolate the value at the new interval time #
+        # ---------------------------------------------- #
+        interpolated = TimeSeriesValue(new_tsvs[i].time, new_tsvs[i].value, 0)
+        for interpolation_iteration in [1]:
+            # ---------------------------------------------------- #
+            # expand the interpolation window to valid value times #
+            # ---------------------------------------------------- #
+            while lo >= 0 and not old_tsvs[lo].is_valid:
+                lo1, lo2 = (0, 1) if lo == 0 else (lo - 1, lo)
+                lo = -1
+                missing_seconds += (
+                    cast(datetime, old_tsvs[lo2].time.datetime())
+                    - cast(datetime, old_tsvs[lo1].time.datetime())
+                ).total_seconds()
+            if lo < 0:
+                # ------------------------------- #
+                # can't interpolate this interval #
+                # ------------------------------- #
+                break
+            while hi < len_old and not old_tsvs[hi].is_valid:
+                hi1, hi2 = (hi - 1, hi) if hi == len_old - 1 else (hi, hi + 1)
+                hi += 1
+                missing_seconds += (
+                    cast(datetime, old_tsvs[hi2].time.datetime())
+                    - cast(datetime, old_tsvs[hi1].time.datetime())
+                ).total_seconds()
+            if hi == len_old:
+                # ------------------------------- #
+                # can't interpolate this interval #
+                # ------------------------------- #
+                break
+            # -------------------------------------------------------------------------- #
+            # can't interpolate this interval if expansion is wider than missing percent #
+            # -------------------------------------------------------------------------- #
+            if missing_seconds > max_missing_seconds:
+                break
+            # ---------------------------------------------- #
+            # can't interpolate decreasing cumulative values #
+            # ---------------------------------------------- #
+            if is_accum and old_tsvs[hi].value.magnitude < old_tsvs[lo].value.magnitude:
+                break
+            # ------------------------ #
+            # perform the intepolation #
+            # ------------------------ #
+            if lo == hi or (not is_inst and not is_total):
+                interpolated.value = old_tsvs[hi].value
+            else:
+                fraction = float(
+                    (
+                        cast(datetime, new_tsvs[i].time.datetime())
+                        - cast(datetime, old_tsvs[lo].time.datetime())
+                    ).total_seconds()
+                ) / float(
+                    (
+                        cast(datetime, old_tsvs[hi].time.datetime())
+                        - cast(datetime, old_tsvs[lo].time.datetime())
+                    ).total_seconds()
+                )
+                if (
+                    is_total
+                    and old_tsvs[lo].time <= new_tsvs[i].time < old_tsvs[hi].time
+                ):
+                    interpolated.value = old_tsvs[hi].value * fraction
+                else:
+                    interpolated.value = old_tsvs[lo].value + fraction * (
+                        old_tsvs[hi].value.magnitude - old_tsvs[lo].value.magnitude
+                    )
+        if operation == _RESAMPLE_OP_INTERPOLATE:
+            new_tsvs[i].value = interpolated.value
+        elif operation == _RESAMPLE_OP_ACCUMULATE and not is_total:
+            if prev_interpolated is not None:
+                val = interpolated.value - prev_interpolated.value
+                if val >= 0 or not is_accum:
+                    new_tsvs[i].value = val
+        else:
+            # ---------------------------------- #
+            # gather the contributing components #
+            # ---------------------------------- #
+            intvl_tsvs: list[TimeSeriesValue] = []
+            partial_first_component = False
+
+            if i == 0:
+                prev_new_time = new_tsvs[0].time - (new_tsvs[1].time - new_tsvs[0].time)
+                prev_interpolated = TimeSeriesValue(
+                    cast(HecTime, prev_new_time).clone(),
+                    UQ(math.nan, ts.unit),
+                    0,
+                )
+                prev_hi = 0
+            if cast(TimeSeriesValue, prev_interpolated).time < old_tsvs[hi].time:
+                intvl_tsvs.append(cast(TimeSeriesValue, prev_interpolated))
+                if i == 0:
+                    if operation == _RESAMPLE_OP_ACCUMULATE and is_total:
+                        prev_new_time = cast(HecTime, intvl_tsvs[0].time.clone())
+                        td = timedelta(seconds=old_interval_seconds)
+                        while prev_new_time + td < old_tsvs[0].time:
+                            prev_new_time = prev_new_time + td
+                        if prev_new_time > intvl_tsvs[0].time:
+                            intvl_tsvs.append(
+                                TimeSeriesValue(
+                                    prev_new_time.clone(),
+                                    UQ(math.nan, ts.unit),
+                                    0,
+                                )
+                            )
+                    elif (
+                        old_tsvs[0].time - timedelta(seconds=old_interval_seconds)
+                        > cast(TimeSeriesValue, prev_interpolated).time
+                    ):
+                        intvl_tsvs.append(
+                            TimeSeriesValue(
+                                old_tsvs[0].time
+                                - timedelta(seconds=old_interval_seconds),
+                                UQ(math.nan, ts.unit),
+                                0,
+                            )
+                        )
+                    intvl_tsvs.sort()
+                    if is_total and is_regular:
+                        first_fraction = True
+                        for j in range(len(intvl_tsvs)):
+                            if math.isnan(intvl_tsvs[j].value.magnitude) and intvl_tsvs[
+                                j
+                            ].time > old_tsvs[0].time - timedelta(
+                                seconds=old_interval_seconds
+                            ):
+                                fraction = (
+                                    1.0
+                                    - (
+                                        cast(datetime, old_tsvs[0].time.datetime())
+                                        - cast(datetime, intvl_tsvs[j].time.datetime())
+                                    ).total_seconds()
+                                    / (
+                                        cast(datetime, old_tsvs[1].time.datetime())
+                                        - cast(datetime, old_tsvs[0].time.datetime())
+                                    ).total_seconds()
+                                )
+                                if first_fraction:
+                                    first_fraction = False
+                                    if 0.0 <= fraction <= 1.0:
+                                        partial_first_component = True
+                                intvl_tsvs[j].value = old_tsvs[0].value * fraction
+                if (
+                    cast(
+                        HecTime,
+                        (
+                            old_tsvs[prev_lo].time
+                            if prev_lo is not None
+                            else old_tsvs[lo].time
+                            - timedelta(seconds=old_interval_seconds)
+                        ),
+                    )
+                    < cast(TimeSeriesValue, prev_interpolated).time
+                ):
+                    partial_first_component = True
+            for j in range(prev_hi, hi + 1):
+                if (
+                    cast(TimeSeriesValue, prev_interpolated).time
+                    < old_tsvs[j].time
+                    < interpolated.time
+                ):
+                    intvl_tsvs.append(old_tsvs[j])
+            if interpolated.time > intvl_tsvs[-1].time:
+                intvl_tsvs.append(interpolated)
+            if (
+                partial_first_component
+                and is_total
+                and (
+                    math.isfinite(intvl_tsvs[0].value.magnitude)
+                    and intvl_tsvs[1].value.magnitude < intvl_tsvs[0].value.magnitude
+                )
+            ):
+                # ---------------------------------------------------------------------------------- #
+                # Zero out the first value to prevent averaging of the first two values in this case #
+                # ---------------------------------------------------------------------------------- #
+                intvl_tsvs[0].value = UQ(0.0, ts.unit)
+            # --------------------------- #
+            # compute the resampled value #
+            # --------------------------- #
+            values: List[float] = []
+            value_seconds: List[float] = []
+            invalid: List[bool] = []
+            if partial_first_component and not math.isnan(
+                intvl_tsvs[0].value.magnitude
+            ):
+                values.append(intvl_tsvs[0].value.magnitude)
+                value_seconds.append(0)
+                invalid.append(False)
+            for j in range(1, len(intvl_tsvs)):
+                seconds = (
+                    cast(datetime, intvl_tsvs[j].time.datetime())
+                    - cast(datetime, intvl_tsvs[j - 1].time.datetime())
+                ).total_seconds()
+                is_invalid = False
+                if operation == _RESAMPLE_OP_ACCUMULATE:
+                    if is_inst:
+                        if not (intvl_tsvs[j - 1].is_valid and intvl_tsvs[j].is_valid):
+                            missing_seconds += seconds
+                            is_invalid = True
+                        value = (
+                            intvl_tsvs[j - 1].value.magnitude
+                            + intvl_tsvs[j].value.magnitude
+                        ) / 2
+                    else:
+                        if not intvl_tsvs[j].is_valid:
+                            missing_seconds += seconds
+                            is_invalid = True
+                        if new_interval_seconds < old_interval_seconds:
+                            value = old_tsvs[hi].value.magnitude
+                        else:
+                            value = intvl_tsvs[j].value.magnitude
+                elif operation == _RESAMPLE_OP_AVERAGE:
+                    if is_inst:
+                        if not (intvl_tsvs[j - 1].is_valid and intvl_tsvs[j].is_valid):
+                            missing_seconds += seconds
+                            is_invalid = True
+                        value = (
+                            intvl_tsvs[j - 1].value.magnitude
+                            + intvl_tsvs[j].value.magnitude
+                        ) / 2
+                    elif is_total:
+                        if j == 1 and (
+                            partial_first_component
+                            or (
+                                new_interval_seconds > old_interval_seconds
+                                and (
+                                    cast(datetime, intvl_tsvs[1].time.datetime())
+                                    - cast(datetime, intvl_tsvs[0].time.datetime())
+                                ).total_seconds()
+                                < old_interval_seconds
+                            )
+                        ):
+                            values.append(intvl_tsvs[0].value.magnitude)
+                            value_seconds.append(0)
+                            invalid.append(not intvl_tsvs[0].is_valid)
+                            value = intvl_tsvs[1].value.magnitude
+                            if not intvl_tsvs[1].is_valid:
+                                missing_seconds += seconds
+                                is_invalid = True
+                        else:
+                            if not intvl_tsvs[j].is_valid:
+                                missing_seconds += seconds
+                                is_invalid = True
+                            value = intvl_tsvs[j].value.magnitude
+                    else:
+                        if not intvl_tsvs[j].is_valid:
+                            missing_seconds += seconds
+                            is_invalid = True
+                        value = intvl_tsvs[j].value.magnitude
+                elif operation in (_RESAMPLE_OP_INTEGRATE, _RESAMPLE_OP_VOLUME):
+                    if is_inst:
+                        if not (intvl_tsvs[j - 1].is_valid and intvl_tsvs[j].is_valid):
+                            missing_seconds += seconds
+                            is_invalid = True
+                        value = (
+                            intvl_tsvs[j - 1].value.magnitude
+                            + intvl_tsvs[j].value.magnitude
+                        ) / 2
+                    elif is_total:
+                        if j == 1 and partial_first_component:
+                            values.append(intvl_tsvs[0].value.magnitude)
+                            value_seconds.append(0)
+                            invalid.append(not intvl_tsvs[0].is_valid)
+                            value = intvl_tsvs[1].value.magnitude
+                            if not intvl_tsvs[1].is_valid:
+                                missing_seconds += seconds
+                                is_invalid = True
+                        else:
+                            if not intvl_tsvs[j].is_valid:
+                                missing_seconds += seconds
+                                is_invalid = True
+                            value = intvl_tsvs[j].value.magnitude / 2
+                    else:
+                        if not intvl_tsvs[j].is_valid:
+                            missing_seconds += seconds
+                            is_invalid = True
+                        value = intvl_tsvs[j].value.magnitude
+                values.append(value)
+                value_seconds.append(seconds)
+                invalid.append(is_invalid)
+            if operation == _RESAMPLE_OP_ACCUMULATE:
+                if (
+                    lo == hi
+                    and len(values) < 2
+                    and seconds == old_interval_seconds == new_interval_seconds
+                ):
+                    if is_inst and hi > 0:
+                        new_val = (
+                            old_tsvs[hi - 1].value.magnitude
+                            + old_tsvs[hi].value.magnitude
+                        ) / 2
+                    else:
+                        new_val = old_tsvs[hi].value.magnitude
+                else:
+                    if missing_seconds > max_missing_seconds:
+                        continue
+                    if is_total:
+                        # ----------------- #
+                        # add up components #
+                        # ----------------- #
+                        if len(intvl_tsvs) == 2:
+                            # ------------ #
+                            # 1 components #
+                            # ------------ #
+                            if not intvl_tsvs[1].is_valid:
+                                new_val = math.nan
+                            elif not intvl_tsvs[0].is_valid:
+                                new_val = intvl_tsvs[1].value.magnitude / (
+                                    old_interval_seconds / new_interval_seconds
+                                )
+                            else:
+                                for j in range(len_old):
+                                    if old_tsvs[j].time >= intvl_tsvs[1].time:
+                                        new_val = (old_tsvs[j].value.magnitude) / (
+                                            old_interval_seconds / new_interval_seconds
+                                        )
+                                        break
+                                else:
+                                    new_val = (intvl_tsvs[1].value.magnitude) / (
+                                        old_interval_seconds / new_interval_seconds
+                                    )
+                        elif len(intvl_tsvs) == 3:
+                            # ------------ #
+                            # 2 components #
+                            # ------------ #
+                            new_val = math.nan
+                            if partial_first_component:
+                                if intvl_tsvs[0].is_valid and intvl_tsvs[1].is_valid:
+                                    new_val = (
+                                        intvl_tsvs[1].value.magnitude
+                                        - intvl_tsvs[0].value.magnitude
+                                    )
+                                    if intvl_tsvs[2].is_valid:
+                                        new_val += intvl_tsvs[2].value.magnitude
+                                else:
+                                    new_val = intvl_tsvs[2].value.magnitude
+                            else:
+                                new_val = intvl_tsvs[2].value.magnitude
+                        else:
+                            # ---------------------- #
+                            # more than 2 components #
+                            # ---------------------- #
+                            if partial_first_component:
+                                if invalid[0] or invalid[1]:
+                                    new_val = 0
+                                else:
+                                    new_val = values[1] - values[0]
+                                new_val += sum(
+                                    [
+                                        values[j]
+                                        for j in range(2, len(values))
+                                        if not invalid[j]
+                                    ]
+                                )
+                            else:
+                                new_val = sum(
+                                    [
+                                        values[j]
+                                        for j in range(len(values))
+                                        if not invalid[j]
+                                    ]
+                                )
+                    else:
+                        # --------------------------------- #
+                        # diff between end and start values #
+                        # --------------------------------- #
+                        new_val = (
+                            intvl_tsvs[-1].value.magnitude
+                            - intvl_tsvs[0].value.magnitude
+                        )
+                        if is_accum and new_val < 0.0:
+                            new_val = math.nan
+            elif operation == _RESAMPLE_OP_AVERAGE:
+                if (
+                    lo == hi
+                    and len(values) < 2
+                    and seconds == old_interval_seconds == new_interval_seconds
+                ):
+                    # ------------------------------------------------------------ #
+                    # single value in interval that represents the exact interval #
+                    # ------------------------------------------------------------ #
+                    if is_inst and hi > 0:
+                        new_val = (
+                            old_tsvs[hi - 1].value.magnitude
+                            + old_tsvs[hi].value.magnitude
+                        ) / 2
+                    elif is_total:
+                        new_val = old_tsvs[hi].value.magnitude / 2
+                    else:
+                        new_val = old_tsvs[hi].value.magnitude
+                else:
+                    if missing_seconds > max_missing_seconds:
+                        continue
+                    if is_total:
+                        new_val = 0.0
+                        for j in range(len(values)):
+                            if invalid[j]:
+                                continue
+                            if (values[j] < last_valid) or (
+                                value_seconds[j] == old_interval_seconds
+                            ):
+                                new_val += values[j] / 2 * value_seconds[j]
+                            else:
+                                if j == 0:
+                                    last_valid = values[j]
+                                    continue
+                                new_val += (
+                                    (values[j - 1] + values[j]) / 2 * value_seconds[j]
+                                )
+                            last_valid = values[j]
+                        new_val /= sum(
+                            [
+                                value_seconds[j]
+                                for j in range(len(value_seconds))
+                                if not invalid[j]
+                            ]
+                        )
+                    else:
+                        # ------------------------------- #
+                        # data type isn't Total (PER-CUM) #
+                        # ------------------------------- #
+                        new_val = sum(
+                            [
+                                values[j] * value_seconds[j]
+                                for j in range(len(values))
+                                if not invalid[j]
+                            ]
+                        ) / sum(
+                            [
+                                value_seconds[j]
+                                for j in range(len(value_seconds))
+                                if not invalid[j]
+                            ]
+                        )
+            elif operation in (_RESAMPLE_OP_INTEGRATE, _RESAMPLE_OP_VOLUME):
+                if (
+                    lo == hi
+                    and len(values) < 2
+                    and seconds == old_interval_seconds == new_interval_seconds
+                ):
+                    if is_inst and hi > 0:
+                        new_val = (
+                            (
+                                old_tsvs[hi - 1].value.magnitude
+                                + old_tsvs[hi].value.magnitude
+                            )
+                            / 2
+                            * new_interval_seconds
+                        )
+                    else:
+                        new_val = old_tsvs[hi].value.magnitude * new_interval_seconds
+                else:
+                    if missing_seconds > max_missing_seconds:
+                        continue
+                    new_val = sum(
+                        [
+                            values[j] * value_seconds[j]
+                            for j in range(len(values))
+                            if not invalid[j]
+                        ]
+                    )
+            new_tsvs[i].value = UQ(new_val, new_unit)
+            if new_parameter:
+                new_tsvs[i].value.ito(new_parameter.unit)
+
+
+def resample_discreet_reference(
+    ts: TimeSeries,
+    operation: str,
+    old_tsvs: List[TimeSeriesValue],
+    new_tsvs: List[TimeSeriesValue],
+    bounds: List[Any],
+    entire_interval: Optional[bool] = None,
+) -> None:
+    is_inst = cast(ParameterType, ts.parameter_type).get_raw_name() == "Instantaneous"
+    require_entire_interval = (
+        entire_interval
+        if entire_interval is not None
+        else not is_inst and operation != _RESAMPLE_OP_PREVIOUS
+    )
+    prev_lo = None
+    prev_hi = None
+    for i, boundary in [(i, b) for (i, b) in enumerate(bounds) if b is not None]:
+        lo, hi = boundary
+        # -------------------------------------------------------- #
+        # get a list of valid indices that end in the new interval #
+        # -------------------------------------------------------- #
+        if prev_hi is None:
+            indices = [
+                j for j in range(hi + 1 if lo == hi else hi) if old_tsvs[j].is_valid
+            ]
+        else:
+            if operation == _RESAMPLE_OP_PREVIOUS and hi == prev_hi:
+                prev_hi -= 1
+            elif prev_hi == prev_lo and operation != _RESAMPLE_OP_PREVIOUS:
+                prev_hi += 1
+            indices = [
+                j
+                for j in range(prev_hi, hi + 1 if lo == hi else hi)
+                if old_tsvs[j].is_valid
+            ]
+        if require_entire_interval and operation != _RESAMPLE_OP_PREVIOUS:
+            # ---------------------------------------------------------- #
+            # reduce the indices to those that start in the new interval #
+            # ---------------------------------------------------------- #
+            new_interval_start = (
+                new_tsvs[i - 1].time
+                if i > 0
+                else (
+                    new_tsvs[0].time - (new_tsvs[1].time - new_tsvs[0].time)
+                    if len(new_tsvs) > 1
+                    else None
+                )
+            )
+            if not new_interval_start:
+                indices = []
+            else:
+                for k in range(len(indices)):
+                    old_interval_start = (
+                        old_tsvs[indices[k] - 1].time
+                        if indices[k] > 0
+                        else (
+                            old_tsvs[0].time - (old_tsvs[1].time - old_tsvs[0].time)
+                            if len(old_tsvs) > 1
+                            else None
+                        )
+                    )
+                    if (
+                        old_interval_start is not None
+                        and old_interval_start >= new_interval_start
+                    ):
+                        indices = indices[k:]
+                        break
+                else:
+                    indices = []
+        if operation == _RESAMPLE_OP_COUNT:
+            # ----------- #
+            # count valid #
+            # ----------- #
+            new_val = float(len(indices))
+        elif operation in (_RESAMPLE_OP_MAXIMUM, _RESAMPLE_OP_MINIMUM):
+            # ------------------ #
+            # maximum or minimum #
+            # ------------------ #
+            vals = [old_tsvs[j].value.magnitude for j in indices]
+            func = max if operation == _RESAMPLE_OP_MAXIMUM else min
+            new_val = func(vals) if vals else math.nan
+        elif operation == _RESAMPLE_OP_PREVIOUS:
+            # -------- #
+            # previous #
+            # -------- #
+            if hi == lo:
+                new_val = (
+                    old_tsvs[indices[-1] - 1].value.magnitude
+                    if indices and indices[-1] != 0
+                    else math.nan
+                )
+            else:
+                new_val = old_tsvs[indices[-1]].value.magnitude if indices else math.nan
+        else:
+            raise TimeSeriesException(
+                f"Unexpected discreet resample operation: {operation}"
+            )
+        new_tsvs[i].value = UQ(new_val, ts.unit)
+        prev_lo = lo
+        prev_hi = hi
+
+
+def test_resample_engine_reference() -> None:
+    # ---------------------------------------------------------------------- #
+    # the array resample engine must match the TimeSeriesValue reference for #
+    # every operation, with invalid values, rejected qualities, and regular  #
+    # and irregular new times. The last value is valid because the reference #
+    # fails past the last valid value (see test_resample_past_last_valid)    #
+    # ---------------------------------------------------------------------- #
+    rng = np.random.default_rng(2025)
+    count = 30
+    rejected = Qual(
+        "Screened Rejected No_range Original None None None Unprotected".split()
+    ).code
+    new_indexes = [
+        pd.date_range("2025-02-01 01:20", periods=60, freq="20min"),
+        pd.date_range("2025-02-01 03:00", periods=12, freq="3h"),
+        pd.DatetimeIndex(
+            pd.Timestamp("2025-02-01 01:00")
+            + pd.to_timedelta(np.cumsum(rng.integers(10, 200, 15)), unit="min")
+        ),
+    ]
+    for name in (
+        "Loc.Flow.Inst.1Hour.0.Test",
+        "Loc.Precip.Inst.1Hour.0.Test",
+        "Loc.Flow.Ave.1Hour.0.Test",
+        "Loc.Precip.Total.1Hour.0.Test",
+        "Loc.Flow.Max.1Hour.0.Test",
+    ):
+        values = np.round(rng.uniform(0, 10, count), 2)
+        if name.startswith("Loc.Precip.Inst"):
+            values = np.cumsum(values)
+        values[rng.choice(count - 1, 4, replace=False)] = np.nan
+        qualities = np.zeros(count, dtype=np.int64)
+        qualities[rng.choice(count - 1, 2, replace=False)] = rejected
+        quality_list = cast(list[Union[Qual, int]], qualities.tolist())
+        ts = TimeSeries.new_regular_time_series(
+            name,
+            "2025-02-01 01:00",
+            count,
+            Interval.get_cwms("1Hour"),
+            0,
+            None,
+            values.tolist(),
+            quality_list,
+        )
+        old_times = TimeSeries._index_nanoseconds(
+            cast(pd.DatetimeIndex, cast(pd.DataFrame, ts.data).index)
+        )
+        valid = ~TimeSeries._unusable_mask(values, qualities)
+        for new_index, is_regular in zip(new_indexes, (True, True, False)):
+            new_times = TimeSeries._index_nanoseconds(new_index)
+            for op, entire_interval in [
+                (op, entire)
+                for op in ("COUNT", "MAXINUM", "MININUM")
+                for entire in (None, True, False)
+            ] + [
+                (op, None)
+                for op in (
+                    "PREVIOUS",
+                    "INTERPOLATE",
+                    "INTEGRATE",
+                    "AVERAGE",
+                    "ACCUMULATE",
+                    "VOLUME",
+                )
+            ]:
+                new_tsvs = [
+                    TimeSeriesValue(HecTime(t.to_pydatetime()), UQ(math.nan, ts.unit))
+                    for t in new_index
+                ]
+                args = (0.0, -math.inf, is_regular, 25.0, entire_interval)
+                engine_args = (
+                    old_times,
+                    values,
+                    valid,
+                    new_times,
+                    TimeSeries._resample_bounds(old_times, new_times),
+                    *args,
+                )
+                try:
+                    resample_reference(ts, op, ts.tsv, new_tsvs, *args)
+                except TimeSeriesException:
+                    with pytest.raises(TimeSeriesException):
+                        ts._resample_values(op, *engine_args)
+                    continue
+                computed = ts._resample_values(op, *engine_args)
+                assert np.allclose(
+                    computed,
+                    [tsv.value.magnitude for tsv in new_tsvs],
+                    equal_nan=True,
+                )
+
+
+def test_resample_past_last_valid() -> None:
+    # ------------------------------------------------------------------- #
+    # new times after the last valid value can't be interpolated and their #
+    # intervals are missing, and an interval with no valid values within  #
+    # the allowed missing time has no average and integrates to zero      #
+    # ------------------------------------------------------------------- #
+    ts = TimeSeries.new_regular_time_series(
+        "Loc.Flow.Inst.1Hour.0.Test",
+        "2025-02-01 01:00",
+        5,
+        Interval.get_cwms("1Hour"),
+        0,
+        None,
+        [2.0, 4.0, 6.0, math.nan, math.nan],
+        0,
+    )
+    nan = math.nan
+    for op, expected in (
+        ("INTERPOLATE", [4.0, 5.0, 6.0, nan, nan, nan]),
+        ("AVERAGE", [nan, 4.5, 5.5, nan, nan, nan]),
+        ("INTEGRATE", [0.0, 8100.0, 9900.0, nan, nan, nan]),
+    ):
+        resampled = ts.resample(
+            op,
+            Interval.get_cwms("30Minutes"),
+            start_time="2025-02-01 02:00",
+            end_time="2025-02-01 04:30",
+            max_missing_percent=100.0,
+        )
+        assert len(resampled) == 6
+        assert np.allclose(resampled.values, expected, equal_nan=True), op
+
+
+def test_resample_dst_change() -> None:
+    # ------------------------------------------------------------------- #
+    # continuous operations weight values by elapsed time, so a new       #
+    # interval that contains a DST change is averaged and integrated over #
+    # its actual length - the average of a ramp that is linear in elapsed #
+    # time is the mean of its end values                                  #
+    # ------------------------------------------------------------------- #
+    index = pd.date_range(
+        "2024-03-09 00:00", "2024-03-12 00:00", freq="h", tz="US/Central"
+    )
+    ts = TimeSeries.from_arrays(
+        "Loc.Flow.Inst.1Hour.0.Test",
+        TimeSeries._index_nanoseconds(index),
+        np.arange(len(index), dtype=np.float64),
+        time_zone="US/Central",
+    )
+    average = ts.resample("Average", Interval.get_cwms("1Day"))
+    integral = ts.resample("Integrate", Interval.get_cwms("1Day"))
+    assert average.times[2] == "2024-03-11 01:00:00-05:00"
+    assert average.values[1:] == [12.0, 36.0]
+    assert integral.unit == "ft3"
+    assert integral.values[1:] == [12.0 * 86400, 36.0 * 86400]
+
+
+def test_resample_many() -> None:
+    # ------------------------------------------------------------------ #
+    # each result must be the same as resampling with just its operation #
+    # ------------------------------------------------------------------ #
+    rng = np.random.default_rng(8)
+    values = rng.uniform(100, 200, 24 * 10)
+    values[rng.choice(len(values), 12, replace=False)] = np.nan
+    ts = TimeSeries.new_regular_time_series(
+        "Loc.Flow.Inst.1Hour.0.Test",
+        "2025-02-01 01:00",
+        len(values),
+        Interval.get_cwms("1Hour"),
+        0,
+        None,
+        values.tolist(),
+    )
+    operations = ["Average", "max", "min", "Count", "Volume", "prev"]
+    for interval in Interval.get_cwms("1Day"), TimeSpan("PT5H"):
+        results = ts.resample_many(operations, interval)
+        assert len(results) == len(operations)
+        for op, ts2 in zip(operations, results):
+            expected = ts.resample(op, interval)
+            assert ts2.name == expected.name
+            assert ts2.unit == expected.unit
+            assert ts2.times == expected.times
+            assert np.allclose(ts2.values, expected.values, equal_nan=True)
+    with pytest.raises(TimeSeriesException):
+        ts.resample_many(["Average", "Accumulate"], Interval.get_cwms("1Day"))
+
+
 test_cyclic_analysis_inputs = [
     [
         "./test/resources/timeseries/CyclicAnalysisData.dss",
@@ -5146,6 +7418,391 @@ def test_cyclic_analysis(dss_filename: str, pathname: str) -> None:
             assert computed.values == expected.values
 
 
+def test_select_positions() -> None:
+    # ----------------------------------------------------------------- #
+    # integer, slice, and time selections must mark the same items as   #
+    # the equivalent function selections, for each combination          #
+    # ----------------------------------------------------------------- #
+    for tz in (None, "US/Central"):
+        ts = TimeSeries("//Loc1/Flow//1Hour/Computed/")
+        ts._data = pd.DataFrame(
+            {"value": np.arange(48.0), "quality": 48 * [0]},
+            index=pd.date_range(
+                "2024-11-02 12:00", periods=48, freq="h", tz=tz, name="time"
+            ),
+        )
+        times = ts.times
+        previous = lambda tsv: tsv.value % 3 == 0
+        cases: list[
+            tuple[
+                Union[int, str, datetime, HecTime, slice],
+                Callable[[TimeSeriesValue], bool],
+            ]
+        ] = [
+            (5, lambda tsv: tsv.value == 5),
+            (-1, lambda tsv: tsv.value == 47),
+            (slice(10, 20), lambda tsv: 10 <= tsv.value < 20),
+            (slice(10, 20, 3), lambda tsv: tsv.value in (10, 13, 16, 19)),
+            (slice(times[40], None), lambda tsv: tsv.value >= 40),
+            (
+                slice(HecTime(times[3]), HecTime(times[7])),
+                lambda tsv: 3 <= tsv.value < 7,
+            ),
+            (times[17], lambda tsv: tsv.value == 17),
+            (HecTime(times[18]), lambda tsv: tsv.value == 18),
+            (
+                cast(datetime, HecTime(times[19]).datetime()),
+                lambda tsv: tsv.value == 19,
+            ),
+        ]
+        for selection, func in cases:
+            for combination in (
+                Combine.REPLACE,
+                Combine.AND,
+                Combine.OR,
+                Combine.XOR,
+            ):
+                for start in (ts, ts.select(previous)):
+                    expected = start.select(func, combination).selected
+                    assert (
+                        start.select(selection, combination).selected == expected
+                    ), f"{tz} {selection} {combination}"
+        try:
+            ts.select(5, Combine.NOOP)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    # ---------------------------------------------------------------- #
+    # time slices of unsorted times select the items within the bounds #
+    # ---------------------------------------------------------------- #
+    ts = TimeSeries(
+        "Loc.Flow.Inst.0.0.Test",
+        [
+            "2024-01-01 03:00",
+            "2024-01-01 01:00",
+            "2024-01-01 02:00",
+            "2024-01-01 05:00",
+            "2024-01-01 04:00",
+        ],
+        [3, 1, 2, 5, 4],
+    )
+    selection = slice("2024-01-01 01:00", "2024-01-01 02:00")
+    assert ts.select(selection).selected == [False, True, False, False, False]
+    ts.slice_stop_exclusive = False
+    assert ts.select(selection).selected == [False, True, True, False, False]
+    assert ts.select(slice("2024-01-01 04:00", None)).selected == [
+        False,
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_select_where() -> None:
+    # ----------------------------------------------------------------- #
+    # array predicates must mark the same items as the equivalent item  #
+    # functions, for each combination                                   #
+    # ----------------------------------------------------------------- #
+    rng = np.random.default_rng(10)
+    ts = TimeSeries("//Loc1/Flow//1Hour/Computed/")
+    ts._data = pd.DataFrame(
+        {
+            "value": rng.uniform(-100, 100, 72),
+            "quality": rng.choice([0, 3, 5, 17], 72),
+        },
+        index=pd.date_range(
+            "2024-11-02 12:00", periods=72, freq="h", tz="US/Central", name="time"
+        ),
+    )
+    cases = [
+        (
+            lambda times, values, qualities: values < 0,
+            lambda tsv: tsv.value.magnitude < 0,
+        ),
+        (
+            lambda times, values, qualities: (qualities & 0x1F) == 5,
+            lambda tsv: (tsv.quality.code & 0x1F) == 5,
+        ),
+        (
+            lambda times, values, qualities: times.hour % 6 == 0,
+            lambda tsv: tsv.time.hour % 6 == 0,
+        ),
+    ]
+    previous = lambda tsv: tsv.value.magnitude > 50
+    for predicate, func in cases:
+        for combination in (Combine.REPLACE, Combine.AND, Combine.OR, Combine.XOR):
+            for start in (ts, ts.select(previous)):
+                assert (
+                    start.select_where(predicate, combination).selected
+                    == start.select(func, combination).selected
+                )
+    values = ts.values
+    ts2 = ts.select_where(cases[0][0])
+    ts2.iset_value_quality(0.0, 0)
+    assert ts2.values == [0.0 if v < 0 else v for v in values]
+    assert ts.values == values
+    ts.iselect_where(lambda times, values, qualities: values > 0)
+    assert ts.selected == [v > 0 for v in values]
+    for predicate in (
+        lambda times, values, qualities: values[1:] > 0,
+        lambda times, values, qualities: values,
+    ):
+        try:
+            ts.select_where(predicate)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    try:
+        ts.select_where(lambda times, values, qualities: values.sort())
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_time_item_lookups_agree() -> None:
+    # ----------------------------------------------------------------- #
+    # index_of(), indexing and select() must resolve a time item to the #
+    # same row, whether the item has no offset or a different offset    #
+    # ----------------------------------------------------------------- #
+    items = [
+        "2024-11-02T14:00:00",
+        "2024-11-02T14:00:00-05:00",
+        "2024-11-02T15:00:00-04:00",
+        "2024-11-02T14:30:00",
+    ]
+    for tz in (None, "US/Central"):
+        ts = TimeSeries("//Loc1/Flow//1Hour/Computed/")
+        ts._data = pd.DataFrame(
+            {"value": np.arange(4.0), "quality": 4 * [0]},
+            index=pd.date_range(
+                "2024-11-02 12:00", periods=4, freq="h", tz=tz, name="time"
+            ),
+        )
+        for item in items:
+            selected = [i for i, s in enumerate(ts.select(item).selected) if s]
+            try:
+                time = ts.index_of(item)
+            except IndexError:
+                assert selected == [], f"{tz} {item}"
+                with pytest.raises(IndexError):
+                    ts[item]
+                continue
+            assert selected == [ts.times.index(time)], f"{tz} {item}"
+            assert ts[item].values == ts[selected[0]].values, f"{tz} {item}"
+        assert ts.select(items[2]).selected == [
+            False,
+            False,
+            tz is not None,
+            tz is None,
+        ]
+
+
+def test_index_of_search() -> None:
+    # ------------------------------------------------------------------ #
+    # binary search lookups must agree with a linear scan of the times   #
+    # ------------------------------------------------------------------ #
+    for tz in (None, "US/Central"):
+        ts = TimeSeries("//Loc1/Flow//1Hour/Computed/")
+        index = pd.date_range(
+            "2024-11-02 12:00", periods=48, freq="90min", tz=tz, name="time"
+        )
+        ts._data = pd.DataFrame(
+            {"value": np.arange(48.0), "quality": 48 * [0]}, index=index
+        )
+        times = list(index)
+        for minutes in range(-120, 48 * 90 + 120, 45):
+            key = index[0] + timedelta(minutes=minutes)
+            later = [i for i in range(len(times)) if times[i] > key]
+            earlier = [i for i in range(len(times)) if times[i] < key]
+            expected: dict[Optional[str], Optional[int]]
+            if key in times:
+                expected = {n: times.index(key) for n in (None, "next", "previous")}
+            else:
+                expected = {
+                    None: None,
+                    "next": later[0] if later else None,
+                    "previous": earlier[-1] if earlier else None,
+                }
+            for not_found, i in expected.items():
+                if i is None:
+                    try:
+                        ts.index_of(key, not_found)
+                        assert False, "expected IndexError"
+                    except IndexError:
+                        pass
+                else:
+                    assert ts.index_of(key, not_found) == ts.times[i]
+                    if HecTime(key).datetime() == key:
+                        assert ts.index_of(HecTime(key), not_found) == ts.times[i]
+            # --------------------------------------------------- #
+            # time slices are exclusive of the stop time by default #
+            # --------------------------------------------------- #
+            assert ts[key:].values == [v for t, v in zip(times, ts.values) if t >= key]
+            assert ts[:key].values == [v for t, v in zip(times, ts.values) if t < key]
+            ts.slice_stop_exclusive = False
+            assert ts[:key].values == [v for t, v in zip(times, ts.values) if t <= key]
+            ts.slice_stop_exclusive = True
+        for i in (0, 5, -1, -48):
+            assert ts.index_of(i) == ts.times[i]
+        assert ts[-3:].values == ts.values[-3:]
+        assert ts[2:-2:3].values == ts.values[2:-2:3]
+        for i in (48, -49):
+            try:
+                ts.index_of(i)
+                assert False, "expected IndexError"
+            except IndexError:
+                pass
+        assert ts.index_of(-5, "next") == ts.times[0]
+        assert ts.index_of(100, "previous") == ts.times[-1]
+    try:
+        ts.index_of(1.5)  # type: ignore
+        assert False, "expected TypeError"
+    except TypeError:
+        pass
+
+
+def test_index_of_unsorted() -> None:
+    # ----------------------------------------------------------------- #
+    # lookups in unsorted times must find the times that are present    #
+    # and slices must contain the items whose times are in the bounds   #
+    # ----------------------------------------------------------------- #
+    ts = TimeSeries(
+        "Loc.Flow.Inst.0.0.Test",
+        [
+            "2024-01-01 03:00",
+            "2024-01-01 01:00",
+            "2024-01-01 02:00",
+            "2024-01-01 05:00",
+            "2024-01-01 04:00",
+        ],
+        [3, 1, 2, 5, 4],
+    )
+    for i, t in enumerate(ts.times):
+        assert ts.index_of(t) == t
+        assert ts[t].values == ts[i].values
+    assert ts.index_of("2024-01-01 01:30", "next") == "2024-01-01 02:00:00"
+    assert ts.index_of("2024-01-01 03:30", "previous") == "2024-01-01 03:00:00"
+    for not_found in (None, "next"):
+        try:
+            ts.index_of("2024-01-01 05:30", not_found)
+            assert False, "expected IndexError"
+        except IndexError:
+            pass
+    assert ts["2024-01-01 01:00":"2024-01-01 02:00"].values == [1.0]
+    assert ts["2024-01-01 02:00":].values == [3.0, 2.0, 5.0, 4.0]
+    assert ts[:"2024-01-01 03:00"].values == [1.0, 2.0]
+    assert ts[1:"2024-01-01 05:00"].values == [1.0, 2.0, 4.0]
+    assert ts["2024-01-01 01:30"::2].values == [3.0, 5.0]
+    ts.slice_stop_exclusive = False
+    assert ts["2024-01-01 01:00":"2024-01-01 02:00"].values == [1.0, 2.0]
+
+
+def test_times_accessors() -> None:
+    # ---------------------------------------------------------------- #
+    # cached times follow changes to the data and the native accessor  #
+    # and has_same_times agree with the times strings                  #
+    # ---------------------------------------------------------------- #
+    for tz in (None, "US/Central"):
+        ts = TimeSeries("//Loc1/Flow//1Hour/Computed/")
+        ts._data = pd.DataFrame(
+            {"value": np.arange(48.0), "quality": 48 * [0]},
+            index=pd.date_range(
+                "2024-11-02 12:00", periods=48, freq="h", tz=tz, name="time"
+            ),
+        )
+        times = ts.times
+        assert times == [t.isoformat(sep=" ") for t in ts._data.index]
+        times.clear()
+        assert ts.times and ts.times is not ts.times
+        times_ns = ts.times_ns
+        assert times_ns.dtype == np.dtype("datetime64[ns]")
+        assert not times_ns.flags.writeable
+        assert np.shares_memory(times_ns, ts._data.index.values)
+        assert (
+            times_ns.astype(np.int64)
+            == np.array(
+                [
+                    (pd.Timestamp(t).tz_convert("UTC") if tz else pd.Timestamp(t)).value
+                    for t in ts._data.index
+                ]
+            )
+        ).all()
+        ts2 = ts.copy()
+        assert ts2.has_same_times(ts) and ts2.times == ts.times
+        data = cast(pd.DataFrame, ts2._data)
+        data.index = data.index + timedelta(hours=1)
+        assert not ts2.has_same_times(ts) and ts2.times != ts.times
+        assert ts2.times[0] == ts.times[1]
+        ts2 = ts.copy()
+        ts2._data = cast(pd.DataFrame, ts2._data).iloc[1:]
+        assert not ts2.has_same_times(ts) and ts2.times == ts.times[1:]
+        if tz:
+            ts2 = ts.copy()
+            ts2._data = cast(pd.DataFrame, ts2._data).tz_convert("US/Eastern")
+            assert not ts2.has_same_times(ts) and ts2.times != ts.times
+            assert (ts2.times_ns == ts.times_ns).all()
+    assert TimeSeries("//Loc1/Flow//1Hour/Computed/").times_ns.size == 0
+
+
+def test_validate_times() -> None:
+    # ---------------------------------------------------------------- #
+    # the vectorized interval check must accept and reject the same    #
+    # times as checking membership in the generated interval times     #
+    # ---------------------------------------------------------------- #
+    def reference(ts: TimeSeries) -> bool:
+        index = cast(pd.DatetimeIndex, ts._data.index)  # type: ignore
+        if ts._timezone:
+            index = index.tz_localize(None).tz_localize(
+                ts._timezone, ambiguous=np.zeros(len(index), dtype=bool)
+            )
+        interval_times = ts.interval.get_datetime_index(
+            start_time=index[0], count=len(index), time_zone=ts.time_zone
+        ).to_list()
+        return all(t in interval_times for t in index)
+
+    rng = np.random.default_rng(13)
+    for name, time_zone, start in [
+        ("//Loc1/Flow//1Hour/Computed/", "US/Central", "2024-11-02 06:00"),
+        ("//Loc1/Flow//15Minute/Computed/", "UTC", "2024-03-09 23:00"),
+        ("//Loc1/Flow//1Day/Computed/", "US/Central", "2024-03-09 23:00"),
+        ("//Loc1/Flow//1Month/Computed/", "US/Central", "2024-01-31 00:00"),
+        ("//Loc1/Flow//Semi-Month/Computed/", "UTC", "2024-01-15 00:00"),
+        ("Loc1.Flow.Inst.~1Day.0.Computed", "US/Central", "2024-03-01 08:00"),
+        ("Loc1.Flow.Inst.~1Hour.0.Computed", "US/Central", "2024-11-02 06:00"),
+    ]:
+        ts = TimeSeries(name)
+        if ts.interval.name.startswith("~"):
+            local_regular = Interval.get_any_cwms(
+                lambda i: i.name == ts.interval.name and i.is_local_regular
+            )
+            assert local_regular is not None
+            ts._interval = local_regular
+        ts._timezone = time_zone
+        index = ts.interval.get_datetime_index(
+            start_time=start, count=24, time_zone=time_zone, name="time"
+        )
+        for case in range(4):
+            times = index
+            if case == 1:
+                times = times[np.sort(rng.choice(24, 20, replace=False))]
+            elif case == 2:
+                times = times.insert(12, times[12] + timedelta(minutes=7))
+            elif case == 3:
+                times = times[:-1].insert(0, times[0] - timedelta(minutes=5))
+            ts._data = pd.DataFrame(
+                {"value": np.arange(len(times), dtype=float), "quality": 0},
+                index=times,
+            )
+            try:
+                ts._validate()
+                valid = True
+            except TimeSeriesException:
+                valid = False
+            assert valid == reference(ts), f"{name} case {case}"
+            assert valid == (case == 0), f"{name} case {case}"
+
+
 def run_test_timed(test_name: str) -> None:
     print(f"Running {test_name}")
     ts1 = datetime.now()
@@ -5171,6 +7828,7 @@ if __name__ == "__main__":
     run_test_timed("test_math_ops_ts")
     run_test_timed("test_selection_and_filter")
     run_test_timed("test_aggregate_ts")
+    run_test_timed("test_aggregate_ts_alignment")
     run_test_timed("test_aggregate_values")
     run_test_timed("test_min_max")
     run_test_timed("test_accum_diff")
@@ -5178,18 +7836,42 @@ if __name__ == "__main__":
     run_test_timed("test_unit")
     run_test_timed("test_roundoff")
     run_test_timed("test_smoothing")
+    run_test_timed("test_olympic_average_blocks")
+    run_test_timed("test_window_average_blocks")
+    run_test_timed("test_moving_average_only_valid")
     run_test_timed("test_protected")
     run_test_timed("test_screen_with_value_range")
     run_test_timed("test_screen_with_value_change_rate")
     run_test_timed("test_screen_with_value_range_or_change_rate")
     run_test_timed("test_screen_with_duration_magnitude")
+    run_test_timed("test_screen_with_duration_magnitude_reference")
     run_test_timed("test_screen_with_constant_value")
+    run_test_timed("test_screen_with_constant_value_reference")
     run_test_timed("test_screen_with_forward_moving_average")
     run_test_timed("test_estimate_missing_values")
+    run_test_timed("test_estimate_missing_values_accumulation_gaps")
     run_test_timed("test_expand_collapse_trim")
     run_test_timed("test_merge")
+    run_test_timed("test_merge_k_way")
+    run_test_timed("test_arithmetic_alignment")
+    run_test_timed("test_copy_on_write")
+    run_test_timed("test_compact_storage")
+    run_test_timed("test_lazy")
     run_test_timed("test_to_irregular")
     run_test_timed("test_snap_to_regular")
+    run_test_timed("test_snap_to_regular_precedence")
     run_test_timed("test_new_regular_time_series")
+    run_test_timed("test_from_arrays")
+    run_test_timed("test_arrow_parquet")
+    run_test_timed("test_process_chunks")
     run_test_timed("test_resample")
+    run_test_timed("test_resample_engine_reference")
+    run_test_timed("test_resample_many")
+    run_test_timed("test_select_positions")
+    run_test_timed("test_select_where")
+    run_test_timed("test_time_item_lookups_agree")
+    run_test_timed("test_index_of_search")
+    run_test_timed("test_times_accessors")
+    run_test_timed("test_validate_times")
     run_test_timed("test_cyclic_analysis")
+    run_test_timed("test_cyclic_analysis_bins")